@@ -0,0 +1,164 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark construction of legacy JSON-RPC builders.
+
+Constructs GetObject, GetCoins and GetMultipleObjects builders decorated with
+the current @sui_builder and with the former decorator, which resolved argument
+types and installed the class properties on every construction and validated
+with an unmemoized issubtype, and reports the best time of each. Run from the
+repository root::
+
+    python -m benchmarks.bench_builders [--count 20000] [--rounds 5]
+"""
+
+import argparse
+import functools
+import inspect
+import time
+import warnings
+from typing import Callable, get_args
+
+import typing_utils
+from pysui.sui.sui_builders import base_builder
+from pysui.sui.sui_builders.get_builders import (
+    GetCoins,
+    GetMultipleObjects,
+    GetObject,
+)
+from pysui.sui.sui_utils import COERCION_FN_MAP
+
+_ADDRESS = f"0x{'ab' * 32}"
+
+
+def _former_sui_builder(func):
+    """The former @sui_builder() wrapper, without includes or excludes."""
+    host_class = func.__qualname__.split(".")[0]
+    spec = inspect.getfullargspec(func)
+
+    def sui_true_type(anno) -> object:
+        if "_name" in anno.__dict__ and anno.__dict__["_name"] == "Optional":
+            return get_args(anno)[0]
+        return anno
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs) -> None:
+        if spec.kwonlyargs:
+            var_map = {x: None for x in spec.kwonlyargs}
+        else:
+            var_map = {x: None for x in spec.args[1:]}
+        var_type_map = var_map.copy()
+        if spec.defaults:
+            for attr, val in zip(reversed(spec.args), reversed(spec.defaults)):
+                var_map[attr] = val
+                var_type_map[attr] = sui_true_type(spec.annotations[attr])
+        for attr, val in zip(spec.args[1:], args):
+            var_map[attr] = val
+            var_type_map[attr] = sui_true_type(spec.annotations[attr])
+        for attr, val in kwargs.items():
+            var_map[attr] = val
+            var_type_map[attr] = sui_true_type(spec.annotations[attr])
+        if spec.kwonlydefaults:
+            for attr, val in spec.kwonlydefaults.items():
+                if not var_map[attr]:
+                    var_map[attr] = val
+                    var_type_map[attr] = sui_true_type(spec.annotations[attr])
+
+        def my_set_lambda(name, coerce, self, val):
+            self.__dict__[name] = coerce(val)
+            return self
+
+        def my_get_lambda(name, self):
+            return self.__dict__[name]
+
+        instance_dict = self.value_type_validator(host_class, var_map, var_type_map)
+        for key, val in instance_dict.items():
+            setattr(self, key, val)
+        myclass = self.__class__
+        for key in instance_dict:
+            coercer = COERCION_FN_MAP.get(var_type_map[key], lambda x: x)
+            setattr(
+                myclass,
+                key,
+                property(
+                    functools.partial(my_get_lambda, key),
+                    functools.partial(my_set_lambda, key, coercer),
+                ),
+            )
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _former(cls: type) -> type:
+    """Subclass of a builder with its __init__ under the former decorator."""
+    return type(
+        cls.__name__,
+        (cls,),
+        {"__init__": _former_sui_builder(cls.__init__.__wrapped__)},
+    )
+
+
+def _constructions(
+    classes: tuple[type, type, type], issubtype: Callable[[type, type], bool]
+) -> Callable[[int], list]:
+    """Construct count of each builder, validating with issubtype."""
+    get_object, get_coins, get_multiple = classes
+
+    def _run(count: int) -> list:
+        current = base_builder._issubtype
+        base_builder._issubtype = issubtype
+        try:
+            return [
+                (
+                    get_object(object_id=_ADDRESS),
+                    get_coins(owner=_ADDRESS, limit=10),
+                    get_multiple(object_ids=[_ADDRESS, _ADDRESS]),
+                )
+                for _ in range(count)
+            ]
+        finally:
+            base_builder._issubtype = current
+
+    return _run
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    """Best wall time of rounds calls."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int, rounds: int) -> None:
+    """Report the construction time with both decorators."""
+    # The builders are deprecated, each construction would warn
+    warnings.simplefilter("ignore", DeprecationWarning)
+    current = _constructions(
+        (GetObject, GetCoins, GetMultipleObjects), base_builder._issubtype
+    )
+    former = _constructions(
+        (_former(GetObject), _former(GetCoins), _former(GetMultipleObjects)),
+        typing_utils.issubtype,
+    )
+    for new, old in zip(current(1)[0], former(1)[0]):
+        assert new.params == old.params, (new.params, old.params)
+    print(f"{'decorator':<12}{'builders':>10}{'ms':>10}")
+    for name, construct in (("former", former), ("current", current)):
+        elapsed = _best(lambda: construct(count), rounds)
+        print(f"{name:<12}{count * 3:>10}{elapsed * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=20_000, help="Builders of each kind"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+    run(args.count, args.rounds)
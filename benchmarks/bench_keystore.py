@@ -0,0 +1,99 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark SuiConfig cold start and keypair lookups on a large keystore.
+
+Creates a temporary configuration holding a keystore of random ed25519 keys and
+reports the load time without and with the address index, and the time of a
+keypair lookup for every address with the linear scan and the hashed index.
+Run from the repository root::
+
+    python -m benchmarks.bench_keystore [--keys 5000]
+"""
+
+import argparse
+import base64
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from pysui import SuiConfig
+from pysui.abstracts import CrefType
+
+
+def _linear_result_for(config: SuiConfig, value: str, vin: CrefType) -> Any:
+    """The former cross reference lookup, a scan of every row."""
+    for index, mrow in enumerate(config._cref_matrix):
+        if value in mrow[vin]:
+            return index
+    return None
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[float, Any]:
+    """Wall time and result of fn."""
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _write_config(folder: Path, keys: int) -> None:
+    """Write client.yaml and a keystore of random ed25519 keys."""
+    keystrings = [
+        base64.b64encode(b"\x00" + os.urandom(32)).decode() for _ in range(keys)
+    ]
+    keystore = folder / "sui.keystore"
+    keystore.write_text(json.dumps(keystrings), encoding="utf8")
+    (folder / "client.yaml").write_text(
+        "\n".join(
+            [
+                "keystore:",
+                f"  File: {keystore}",
+                "envs:",
+                "  - alias: localnet",
+                "    rpc: http://127.0.0.1:9000",
+                "active_env: localnet",
+                f"active_address: '0x{'0' * 64}'",
+            ]
+        ),
+        encoding="utf8",
+    )
+
+
+def run(keys: int) -> None:
+    """Report load and lookup times."""
+    with tempfile.TemporaryDirectory() as folder:
+        _write_config(Path(folder), keys)
+        cold, config = _timed(lambda: SuiConfig.pysui_config(folder))
+        config.write_address_index()
+        indexed, config = _timed(lambda: SuiConfig.pysui_config(folder))
+        addresses = config.addresses
+        scan, _ = _timed(
+            lambda: [
+                _linear_result_for(config, x, CrefType.ADDY) for x in addresses
+            ]
+        )
+        hashed, _ = _timed(
+            lambda: [
+                config._cref_result_for(x, CrefType.ADDY, CrefType.INDEX)
+                for x in addresses
+            ]
+        )
+        derive, _ = _timed(lambda: [config.kp4add(x) for x in addresses])
+    print(f"keys {keys}")
+    print(f"{'load, derive all':<28}{cold * 1e3:>10.1f} ms")
+    print(f"{'load, address index':<28}{indexed * 1e3:>10.1f} ms")
+    print(f"{'lookup all, linear scan':<28}{scan * 1e3:>10.1f} ms")
+    print(f"{'lookup all, hashed':<28}{hashed * 1e3:>10.1f} ms")
+    print(f"{'first kp4add all (derive)':<28}{derive * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=5_000, help="Keystore size")
+    args = parser.parse_args()
+    run(args.keys)
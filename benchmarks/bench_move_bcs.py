@@ -0,0 +1,230 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark object queries with JSON content versus BCS only and local decoding.
+
+Builds GetMultipleObjects response pages for a synthetic struct, once with the
+server rendered JSON content and once with only the object BCS, and reports the
+response payload size and the client time to parse and decode each. Run from
+the repository root::
+
+    python -m benchmarks.bench_move_bcs [--items 5000] [--rounds 5]
+"""
+
+import argparse
+import base64
+import json
+import time
+from typing import Callable
+
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_pgql.pgql_move_bcs import MoveBcsDecoder, MoveLayoutCache
+from benchmarks.bench_pgql_decode import _cursor, _hex_id, _owner
+
+_PACKAGE = _hex_id(0xABC)
+_HERO_TYPE = f"{_PACKAGE}::game::Hero"
+_STRING = {"datatype": {"package": "0x1", "module": "string", "type": "String"}}
+
+
+def _layouts() -> MoveLayoutCache:
+    """Layout cache with the synthetic Hero and Sword structs registered."""
+    layouts = MoveLayoutCache()
+    layouts.register(
+        _PACKAGE,
+        "game",
+        "Hero",
+        [
+            ("id", {"datatype": {"package": "0x2", "module": "object", "type": "UID"}}),
+            ("name", _STRING),
+            ("level", "u64"),
+            ("experience", "u128"),
+            ("guild", "address"),
+            ("titles", {"vector": _STRING}),
+            (
+                "sword",
+                {
+                    "datatype": {
+                        "package": "0x1",
+                        "module": "option",
+                        "type": "Option",
+                        "typeParameters": [
+                            {
+                                "datatype": {
+                                    "package": _PACKAGE,
+                                    "module": "game",
+                                    "type": "Sword",
+                                }
+                            }
+                        ],
+                    }
+                },
+            ),
+        ],
+    )
+    layouts.register(
+        _PACKAGE, "game", "Sword", [("strength", "u64"), ("magic", "u8")]
+    )
+    return layouts
+
+
+def _uleb(value: int) -> bytes:
+    """ULEB128 encoding."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _string(value: str) -> bytes:
+    """BCS string encoding."""
+    raw = value.encode()
+    return _uleb(len(raw)) + raw
+
+
+def _hero(index: int) -> tuple[dict, bytes]:
+    """JSON content and contents BCS of a Hero."""
+    titles = [f"Title {x}" for x in range(index % 4)]
+    sword = {"strength": str(index * 3), "magic": index % 256} if index % 2 else None
+    content = {
+        "id": _hex_id(index),
+        "name": f"Hero number {index}",
+        "level": str(index % 100),
+        "experience": str(index * 1_000_003),
+        "guild": _hex_id(7),
+        "titles": titles,
+        "sword": sword,
+    }
+    contents = b"".join(
+        [
+            bytes.fromhex(_hex_id(index)[2:]),
+            _string(content["name"]),
+            (index % 100).to_bytes(8, "little"),
+            (index * 1_000_003).to_bytes(16, "little"),
+            bytes.fromhex(_hex_id(7)[2:]),
+            _uleb(len(titles)),
+            *[_string(x) for x in titles],
+            (
+                b"\x01" + (index * 3).to_bytes(8, "little") + bytes([index % 256])
+                if sword
+                else b"\x00"
+            ),
+        ]
+    )
+    return content, contents
+
+
+def _object_bcs(index: int, contents: bytes) -> str:
+    """Base64 Object BCS, Data::Move with a struct tag type."""
+    envelope = b"".join(
+        [
+            b"\x00\x00",
+            bytes.fromhex(_PACKAGE[2:]),
+            _string("game"),
+            _string("Hero"),
+            b"\x00\x01",
+            (10 + index).to_bytes(8, "little"),
+            _uleb(len(contents)),
+            contents,
+            # Owner, previous transaction and storage rebate
+            b"\x00" + bytes(32),
+            b"\x20" + bytes(32),
+            (988000).to_bytes(8, "little"),
+        ]
+    )
+    return base64.b64encode(envelope).decode()
+
+
+def hero_pages(items: int) -> tuple[dict, dict]:
+    """GetMultipleObjects pages with JSON content and with BCS only."""
+    with_content: list[dict] = []
+    bcs_only: list[dict] = []
+    for i in range(items):
+        content, contents = _hero(i)
+        as_object = {"object_type_repr": {"object_type": _HERO_TYPE}}
+        base = {
+            "bcs": _object_bcs(i, contents),
+            "version": 10 + i,
+            "object_digest": "Digest" + str(i),
+            "object_id": _hex_id(i),
+            "object_kind": "LIVE",
+            "owner": _owner(i),
+            "storage_rebate": "988000",
+            "prior_transaction": {"previous_transaction_digest": "Tx" + str(i)},
+            "as_move_package": None,
+        }
+        with_content.append(
+            base
+            | {
+                "as_move_content": {
+                    "has_public_transfer": True,
+                    "as_object": as_object | {"content": content},
+                }
+            }
+        )
+        bcs_only.append(
+            base
+            | {
+                "as_move_content": {
+                    "has_public_transfer": True,
+                    "as_object": as_object,
+                }
+            }
+        )
+    return (
+        {"objects": {"cursor": _cursor(), "objects_data": with_content}},
+        {"objects": {"cursor": _cursor(), "objects_data": bcs_only}},
+    )
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    """Best wall time of rounds calls."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(items: int, rounds: int) -> None:
+    """Report payload bytes and parse time of both page forms."""
+    with_content, bcs_only = (json.dumps(x) for x in hero_pages(items))
+    decoder = MoveBcsDecoder(_layouts())
+
+    def _parse_content() -> list:
+        page = pgql_type.ObjectReadsGQL.from_query(json.loads(with_content))
+        return [x.content for x in page.data]
+
+    def _parse_bcs() -> list:
+        page = pgql_type.ObjectReadsGQL.from_query(json.loads(bcs_only))
+        return [decoder.decode_object_read(x) for x in page.data]
+
+    # Local values are typed, the server renders u64/u128 as strings
+    first = _parse_bcs()[1]
+    assert first["level"] == 1 and first["sword"] == {"strength": 3, "magic": 1}
+    content_time = _best(_parse_content, rounds)
+    bcs_time = _best(_parse_bcs, rounds)
+    print(f"{'form':<16}{'items':>8}{'payload KiB':>14}{'parse ms':>11}")
+    for name, payload, elapsed in (
+        ("json content", with_content, content_time),
+        ("bcs + decode", bcs_only, bcs_time),
+    ):
+        print(
+            f"{name:<16}{items:>8}{len(payload) / 1024:>14.1f}{elapsed * 1e3:>11.1f}"
+        )
+    print(f"payload saved {1 - len(bcs_only) / len(with_content):.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5_000, help="Objects per page")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+    run(args.items, args.rounds)
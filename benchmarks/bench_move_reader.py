@@ -0,0 +1,190 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark Move module deserialization with the memoryview and BytesIO readers.
+
+Deserializes compiled modules with the current ModuleReader and with a reader
+over io.BytesIO (the former implementation) and reports the best time of each,
+as well as the time of the reader primitives alone over a uleb128/u32 stream.
+Pass the bytecode_modules folder of a built package, for example the Sui
+framework (``sui move build`` in crates/sui-framework/packages/sui-framework),
+otherwise a synthetic module shaped like a framework module is used. Run from
+the repository root::
+
+    python -m benchmarks.bench_move_reader [--modules DIR] [--rounds 5]
+"""
+
+import argparse
+import dataclasses
+import io
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from pysui.sui_move.bin_reader.module_reader import ModuleReader
+from pysui.sui_move.bin_reader.reader import BinaryReader
+from pysui.sui_move.model.common_types import TableType
+from pysui.sui_move.module.deserialize import Deserialize, deserialize
+from benchmarks.bench_move_bcs import _string, _uleb
+
+
+class _BytesIOReader(BinaryReader):
+    """The former reader, a stream over io.BytesIO."""
+
+    def __init__(self, source: str, data: bytes) -> None:
+        """Wrap data in a stream."""
+        super().__init__(source, data)
+        self.reader = io.BytesIO(data)
+
+    def pos(self) -> int:
+        """Stream position."""
+        return self.reader.tell()
+
+    def move_to(self, location: int, relative_to: int = 0) -> int:
+        """Seek the stream."""
+        current_loc = self.pos()
+        self.reader.seek(location, relative_to)
+        return current_loc
+
+    def read(self, size: int = None) -> bytes:
+        """Read from the stream."""
+        return self.reader.read(size or 1)
+
+    def read_as_int(self, size: int = None) -> int:
+        """Read a little endian int."""
+        return int.from_bytes(self.read(size), "little")
+
+    def read_uleb128(self) -> int:
+        """Collect and decode the uleb128 bytes."""
+        array = bytearray()
+        while True:
+            inb = ord(self.read())
+            array.append(inb)
+            if (inb & 0x80) == 0:
+                break
+        res = 0
+        for i, value in enumerate(array):
+            res = res + ((value & 0x7F) << (i * 7))
+        return res
+
+
+class _BytesIOModuleReader(ModuleReader, _BytesIOReader):
+    """ModuleReader over the former reader."""
+
+
+def synthetic_module(scale: int) -> bytes:
+    """Module bytes with identifier, address, handle and signature tables."""
+    tables: list[tuple[TableType, bytes]] = [
+        (
+            TableType.ModuleHandles,
+            b"".join(_uleb(x % 4) + _uleb(x) for x in range(scale // 4)),
+        ),
+        (
+            TableType.StructHandles,
+            b"".join(
+                _uleb(x % 16) + _uleb(x) + b"\x07" + _uleb(1) + b"\x03\x00"
+                for x in range(scale // 2)
+            ),
+        ),
+        (
+            TableType.Signatures,
+            b"".join(
+                b"\x03\x03" + b"\x06\x08" + _uleb(x) + b"\x0a\x02"
+                for x in range(scale)
+            ),
+        ),
+        (
+            TableType.Identifiers,
+            b"".join(_string(f"identifier_{x}") for x in range(scale)),
+        ),
+        (
+            TableType.AddressIdentifiers,
+            b"".join(x.to_bytes(32, "big") for x in range(1, 5)),
+        ),
+        (
+            TableType.FieldHandles,
+            b"".join(_uleb(x) + _uleb(x * 3) for x in range(scale)),
+        ),
+    ]
+    headers = bytearray()
+    contents = bytearray()
+    for kind, content in tables:
+        headers += bytes([kind]) + _uleb(len(contents)) + _uleb(len(content))
+        contents += content
+    return b"".join(
+        [
+            bytes.fromhex(ModuleReader.MAGIC_WORD),
+            (6).to_bytes(4, "little"),
+            bytes([len(tables)]),
+            headers,
+            contents,
+            b"\x00",
+        ]
+    )
+
+
+def _primitives(reader_cls: type, data: bytes, count: int) -> None:
+    """Read count uleb128 and u32 pairs."""
+    reader = reader_cls("bench", data)
+    for _ in range(count):
+        reader.read_uleb128()
+        reader.read_as_int(4)
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    """Best wall time of rounds calls."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(modules: Path, scale: int, rounds: int) -> None:
+    """Report deserialization time with both readers."""
+    if modules:
+        binaries = [x.read_bytes() for x in sorted(modules.glob("*.mv"))]
+        label = f"{len(binaries)} modules from {modules}"
+    else:
+        binaries = [synthetic_module(scale)]
+        label = f"synthetic module, scale {scale}"
+    size = sum(len(x) for x in binaries)
+
+    def _all(reader_cls: type) -> list:
+        return [
+            deserialize(reader_cls("bench", x), Deserialize.ALL) for x in binaries
+        ]
+
+    def _comparable(contents: list) -> str:
+        return json.dumps(
+            [dataclasses.asdict(x) for x in contents], default=lambda x: vars(x)
+        )
+
+    assert _comparable(_all(ModuleReader)) == _comparable(_all(_BytesIOModuleReader))
+    print(f"{label}, {size / 1024:.1f} KiB")
+    for name, reader_cls in (
+        ("io.BytesIO", _BytesIOModuleReader),
+        ("memoryview", ModuleReader),
+    ):
+        elapsed = _best(lambda: _all(reader_cls), rounds)
+        print(f"{name:<14}{'deserialize':<14}{elapsed * 1e3:>10.1f} ms")
+    pairs = b"".join(_uleb(x * 37) + x.to_bytes(4, "little") for x in range(scale))
+    for name, reader_cls in (
+        ("io.BytesIO", _BytesIOReader),
+        ("memoryview", BinaryReader),
+    ):
+        elapsed = _best(lambda: _primitives(reader_cls, pairs, scale), rounds)
+        print(f"{name:<14}{'primitives':<14}{elapsed * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=Path, help="Folder of .mv files")
+    parser.add_argument("--scale", type=int, default=20_000, help="Synthetic rows")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+    run(args.modules, args.scale, args.rounds)
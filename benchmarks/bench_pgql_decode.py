@@ -0,0 +1,183 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark GraphQL result decoding, dataclasses_json versus generated decoders.
+
+Decodes pages of coins, objects and events shaped as the GraphQL query
+results and reports the time of each path. Run from the repository root::
+
+    python -m benchmarks.bench_pgql_decode [--items 10000] [--rounds 5]
+"""
+
+import argparse
+import copy
+import time
+from typing import Any, Callable
+
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+_ADDRESS = "0x" + "ab" * 32
+_SUI_COIN = "0x2::coin::Coin<0x2::sui::SUI>"
+
+
+def _hex_id(index: int) -> str:
+    """Deterministic object id."""
+    return f"0x{index:064x}"
+
+
+def _owner(index: int) -> dict:
+    """Rotate through the owner kinds."""
+    match index % 4:
+        case 0 | 1:
+            return {
+                "owner": {"address_id": _ADDRESS},
+                "obj_owner_kind": "AddressOwner",
+            }
+        case 2:
+            return {"initial_version": index, "obj_owner_kind": "Shared"}
+        case _:
+            return {"obj_owner_kind": "Immutable"}
+
+
+def _cursor() -> dict:
+    """Page cursor."""
+    return {"hasNextPage": True, "endCursor": "IAAAAAAAAAAAAAAAAA"}
+
+
+def coin_page(items: int) -> dict:
+    """A GetCoins result page."""
+    return {
+        "qres": {
+            "coins": {
+                "cursor": _cursor(),
+                "coin_objects": [
+                    {
+                        "version": 100 + i,
+                        "hasPublicTransfer": True,
+                        "previousTransactionBlock": {
+                            "previous_transaction": "9xyz" + str(i)
+                        },
+                        "owner": _owner(i),
+                        "contents": {"type": {"coin_type": _SUI_COIN}},
+                        "object_digest": "Digest" + str(i),
+                        "balance": str(1_000_000 + i),
+                        "coin_object_id": _hex_id(i),
+                    }
+                    for i in range(items)
+                ],
+            }
+        }
+    }
+
+
+def object_page(items: int) -> dict:
+    """A GetMultipleObjects result page."""
+    return {
+        "objects": {
+            "cursor": _cursor(),
+            "objects_data": [
+                {
+                    "bcs": "AQIDBAUGBwg=",
+                    "version": 10 + i,
+                    "object_digest": "Digest" + str(i),
+                    "object_id": _hex_id(i),
+                    "object_kind": "LIVE",
+                    "owner": _owner(i),
+                    "storage_rebate": "988000",
+                    "prior_transaction": {
+                        "previous_transaction_digest": "Tx" + str(i)
+                    },
+                    "as_move_content": {
+                        "has_public_transfer": True,
+                        "as_object": {
+                            "content": {"id": _hex_id(i), "value": str(i)},
+                            "object_type_repr": {"object_type": "0x2::foo::Bar"},
+                        },
+                    },
+                    "as_move_package": None,
+                }
+                for i in range(items)
+            ],
+        }
+    }
+
+
+def event_page(items: int) -> dict:
+    """A GetEvents result page."""
+    return {
+        "events": {
+            "cursor": _cursor(),
+            "events": [
+                {
+                    "sendingModule": {
+                        "package": {"package_id": _hex_id(2)},
+                        "module_name": "pool",
+                    },
+                    "type": {"event_type": "0x2::pool::Swapped"},
+                    "sender": {"address": _ADDRESS},
+                    "timestamp": "2024-03-01T12:00:00.000Z",
+                    "json": {"amount_in": str(i), "amount_out": str(i * 2)},
+                }
+                for i in range(items)
+            ],
+        }
+    }
+
+
+_PAGES: dict[str, tuple[Callable[[int], dict], Callable[[dict], Any]]] = {
+    "coins": (coin_page, pgql_type.SuiCoinObjectsGQL.from_query),
+    "objects": (object_page, pgql_type.ObjectReadsGQL.from_query),
+    "events": (event_page, pgql_type.EventsGQL.from_query),
+}
+
+
+def _reflective(clz: type, in_data: dict) -> Any:
+    """The dataclasses_json decode path."""
+    return clz.from_dict(in_data)
+
+
+def _timed(decode: Callable[[dict], Any], pages: list[dict]) -> tuple[float, Any]:
+    """Best time decoding each page copy."""
+    best = float("inf")
+    result = None
+    for page in pages:
+        start = time.perf_counter()
+        result = decode(page)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(items: int, rounds: int) -> None:
+    """Run each page decode on both paths and verify equal results."""
+    generated = pgql_type._from_dict
+    print(
+        f"{'page':<10}{'items':>8}{'from_dict s':>14}"
+        f"{'generated s':>14}{'speedup':>10}"
+    )
+    for name, (make_page, decode) in _PAGES.items():
+        page = make_page(items)
+        # from_query consumes its input, each round gets a copy
+        old_pages = [copy.deepcopy(page) for _ in range(rounds)]
+        new_pages = [copy.deepcopy(page) for _ in range(rounds)]
+        pgql_type._from_dict = _reflective
+        try:
+            old_time, old_result = _timed(decode, old_pages)
+        finally:
+            pgql_type._from_dict = generated
+        new_time, new_result = _timed(decode, new_pages)
+        if old_result != new_result:
+            raise AssertionError(f"{name} decoders produced different results")
+        print(
+            f"{name:<10}{items:>8}{old_time:>14.4f}{new_time:>14.4f}"
+            f"{old_time / new_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="Items per page")
+    parser.add_argument("--rounds", type=int, default=5, help="Decodes per path")
+    args = parser.parse_args()
+    run(args.items, args.rounds)
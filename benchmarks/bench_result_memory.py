@@ -0,0 +1,115 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark result object memory, dict backed versus slotted variants.
+
+Reports the bytes retained per decoded result object (including nested owner
+objects, excluding the shared field values) for the GraphQL coin, object and
+event types and a variant of the legacy coin type. Run from the repository root::
+
+    python -m benchmarks.bench_result_memory [--items 10000]
+"""
+
+import argparse
+import copy
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txresults.common import slotted_variant
+import pysui.sui.sui_txresults.single_tx as legacy_type
+from benchmarks.bench_pgql_decode import coin_page, event_page, object_page
+
+
+def _retained(build: Callable[[], list], items: int) -> float:
+    """Bytes per item retained by the list build returns."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    result = build()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == items
+    return (end - start) / items
+
+
+def _legacy_coin(index: int) -> dict:
+    """A sui_getCoins result item."""
+    return {
+        "coinType": "0x2::sui::SUI",
+        "coinObjectId": f"0x{index:064x}",
+        "version": str(index),
+        "digest": f"Digest{index}",
+        "balance": str(1_000_000 + index),
+        "previousTransaction": f"Tx{index}",
+    }
+
+
+def _measure_gql(
+    items: int,
+    make_page: Callable[[int], dict],
+    decode: Callable[[dict], Any],
+    slotted: bool,
+) -> float:
+    """Retained bytes per decoded GraphQL result object.
+
+    Decoding consumes a copy of the page which is released before measuring,
+    field values shared with the original page are not counted.
+    """
+    page = make_page(items)
+    with pgql_type.slotted_results(slotted):
+        # Generate decoders before measuring
+        decode(copy.deepcopy(make_page(1)))
+        return _retained(lambda: decode(copy.deepcopy(page)).data, items)
+
+
+def run(items: int) -> None:
+    """Report bytes per object for each type, original and slotted."""
+    print(
+        f"{'type':<20}{'items':>8}{'dict B/obj':>12}"
+        f"{'slots B/obj':>13}{'saved':>8}"
+    )
+    rows: list[tuple[str, float, float]] = []
+    for name, make_page, decode in (
+        ("SuiCoinObjectGQL", coin_page, pgql_type.SuiCoinObjectsGQL.from_query),
+        ("ObjectReadGQL", object_page, pgql_type.ObjectReadsGQL.from_query),
+        ("EventGQL", event_page, pgql_type.EventsGQL.from_query),
+    ):
+        rows.append(
+            (
+                name,
+                _measure_gql(items, make_page, decode, False),
+                _measure_gql(items, make_page, decode, True),
+            )
+        )
+    coins = [_legacy_coin(i) for i in range(items)]
+    # from_read_object sets owner, which is not a field
+    coin_slotted = slotted_variant(legacy_type.SuiCoinObject, extra_slots=("owner",))
+    rows.append(
+        (
+            "SuiCoinObject",
+            _retained(
+                lambda: [legacy_type.SuiCoinObject.from_dict(x) for x in coins],
+                items,
+            ),
+            _retained(
+                lambda: [coin_slotted.from_dict(x) for x in coins],
+                items,
+            ),
+        )
+    )
+    for name, before, after in rows:
+        print(
+            f"{name:<20}{items:>8}{before:>12.0f}{after:>13.0f}"
+            f"{1 - after / before:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="Objects per type")
+    args = parser.parse_args()
+    run(args.items)
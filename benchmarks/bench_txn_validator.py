@@ -0,0 +1,144 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Benchmark legacy JSON-RPC builder parameter validation.
+
+Validates GetObject and GetMultipleObjects builders against their sui_getObject
+and sui_multiGetObjects API descriptors with the compiled parameter plans and
+with the former schema walk, which also checked the type of every array element
+against each scalar class, and reports the best time of each. Run from the
+repository root::
+
+    python -m benchmarks.bench_txn_validator [--count 50000] [--rounds 5]
+"""
+
+import argparse
+import time
+import warnings
+from typing import Any, Callable
+
+from pysui.sui.sui_apidesc import (
+    SuiApi,
+    SuiApiParam,
+    SuiApiResult,
+    SuiJsonArray,
+    SuiJsonObject,
+    SuiJsonString,
+)
+from pysui.sui.sui_builders.get_builders import GetMultipleObjects, GetObject
+from pysui.sui.sui_excepts import SuiRpcApiInvalidParameter
+from pysui.sui.sui_types import SuiArray
+from pysui.sui.sui_types.scalars import ObjectID, SuiBoolean, SuiInteger
+import pysui.sui.sui_txn_validator as validator
+
+_ADDRESS = f"0x{'ab' * 32}"
+_OBJECT_ID = SuiJsonString("string", ["string"])
+_OPTIONS = SuiJsonObject("object", ["object"])
+
+
+def _api(name: str, params: list[SuiApiParam]) -> SuiApi:
+    """API descriptor of a method."""
+    return SuiApi(name, params, SuiApiResult("result", _OPTIONS))
+
+
+_GET_OBJECT = _api(
+    "sui_getObject",
+    [SuiApiParam("object_id", _OBJECT_ID, True), SuiApiParam("options", _OPTIONS)],
+)
+_MULTI_GET_OBJECTS = _api(
+    "sui_multiGetObjects",
+    [
+        SuiApiParam("object_ids", SuiJsonArray("array", ["array"], _OBJECT_ID), True),
+        SuiApiParam("options", _OPTIONS),
+    ],
+)
+
+
+def _former_parm_array_list(in_array: Any, api_parm_name: str) -> list[Any]:
+    """The former array serialization, isinstance checks for every element."""
+    out_array = []
+    if isinstance(in_array, SuiArray):
+        in_array = in_array.array
+    if not isinstance(in_array, list):
+        raise ValueError(f"{api_parm_name} requires SuiArray")
+    if api_parm_name == "single_transaction_params":
+        return in_array
+    for elem in in_array:
+        if isinstance(elem, (SuiArray, list)):
+            out_array.append(_former_parm_array_list(elem, api_parm_name))
+        elif isinstance(elem, (SuiInteger, SuiBoolean, ObjectID)):
+            out_array.append(elem.value)
+        else:
+            out_array.append(f"{elem}")
+    return out_array
+
+
+def _former_parameter_check(api_method: SuiApi, builder: Any) -> list:
+    """The former validation, walking each API parameter's schema per call."""
+    parmlen = len(api_method.params)
+    build_parms = builder.params
+    if len(build_parms) != parmlen:
+        raise SuiRpcApiInvalidParameter(f"API Expected {parmlen} parameters")
+    results = []
+    index = 0
+    while index < parmlen:
+        api_parm = api_method.params[index]
+        att = getattr(build_parms[index], api_parm.name)
+        match api_parm.schema.type:
+            case "array":
+                att = _former_parm_array_list(att, api_parm.name)
+            case _:
+                pass
+        if att is None and api_parm.required:
+            raise SuiRpcApiInvalidParameter(f"{api_parm.name} is required")
+        results.append(att)
+        index = index + 1
+    return results
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    """Best wall time of rounds calls."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count: int, rounds: int) -> None:
+    """Report validation time of both implementations."""
+    # The builders are deprecated, each construction would warn
+    warnings.simplefilter("ignore", DeprecationWarning)
+    pairs = [
+        (_GET_OBJECT, GetObject(object_id=_ADDRESS)),
+        (_MULTI_GET_OBJECTS, GetMultipleObjects(object_ids=[_ADDRESS] * 10)),
+    ]
+    for api, builder in pairs:
+        assert validator.validate_api(api, builder) == _former_parameter_check(
+            api, builder
+        )
+    print(f"{'validation':<12}{'requests':>10}{'ms':>10}")
+    for name, check in (
+        ("former", _former_parameter_check),
+        ("plan", validator.validate_api),
+    ):
+        elapsed = _best(
+            lambda: [
+                check(api, builder) for _ in range(count) for api, builder in pairs
+            ],
+            rounds,
+        )
+        print(f"{name:<12}{count * len(pairs):>10}{elapsed * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=50_000, help="Requests of each kind"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds")
+    args = parser.parse_args()
+    run(args.count, args.rounds)
@@ -50,20 +50,90 @@ class ClientConfiguration(ABC):
         self._current_alias_file = alias_file
         self._configuration_path = config_path
         self._cref_matrix: list[list[dict]] = []
+        # Hashed cross reference lookups: value to row for each CrefType column
+        self._cref_index: dict[CrefType, dict[str, int]] = {}
+        self._cref_indexed_rows: dict[CrefType, int] = {}
+        self._cref_indexed_matrix: Optional[list[list[dict]]] = None
 
+    @versionadded(version="0.63.0", reason="Hashed cross reference lookups")
+    def _cref_reindex(self, vin: CrefType) -> None:
+        """_cref_reindex Discard the lookup index of a column after rows changed in place.
+
+        :param vin: The column type
+        :type vin: CrefType
+        """
+        self._cref_index.pop(vin, None)
+        self._cref_indexed_rows.pop(vin, None)
+
+    @versionadded(version="0.63.0", reason="Hashed cross reference lookups")
+    def _cref_rows_index(self, vin: CrefType) -> dict[str, int]:
+        """_cref_rows_index Return the column value to row index, indexing appended rows.
+
+        :param vin: The column type
+        :type vin: CrefType
+        :return: Map of column value to the first row holding it
+        :rtype: dict[str, int]
+        """
+        if self._cref_indexed_matrix is not self._cref_matrix:
+            self._cref_index.clear()
+            self._cref_indexed_rows.clear()
+            self._cref_indexed_matrix = self._cref_matrix
+        index = self._cref_index.setdefault(vin, {})
+        for row_index in range(
+            self._cref_indexed_rows.get(vin, 0), len(self._cref_matrix)
+        ):
+            for value in self._cref_matrix[row_index][vin]:
+                index.setdefault(value, row_index)
+        self._cref_indexed_rows[vin] = len(self._cref_matrix)
+        return index
+
+    @versionadded(version="0.63.0", reason="Lazy keypair derivation")
+    def _derive_keypair(self, keystring: str) -> KeyPair:
+        """_derive_keypair Derive the KeyPair of a keystring loaded without one.
+
+        :param keystring: The keystring
+        :type keystring: str
+        :return: The keypair
+        :rtype: KeyPair
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not derive keypairs")
+
+    @versionadded(version="0.63.0", reason="Lazy keypair derivation")
+    def _cref_cell(self, row_index: int, vout: CrefType) -> Any:
+        """_cref_cell Return the value of a cross reference cell, deriving keypairs on first use.
+
+        :param row_index: The _cref_matrix index
+        :type row_index: int
+        :param vout: The column type
+        :type vout: CrefType
+        :return: The cell value
+        :rtype: Any
+        """
+        cell: dict = self._cref_matrix[row_index][vout]
+        key, value = next(iter(cell.items()))
+        if value is None and vout == CrefType.KPAIR:
+            value = cell[key] = self._derive_keypair(key)
+        return value
+
+    @versionchanged(version="0.63.0", reason="Hashed lookup instead of a scan")
     def _cref_result_for(
         self, value: str, vin: CrefType, vout: CrefType
     ) -> Union[int, Any]:
         """."""
-        result = None
-        for index, mrow in enumerate(self._cref_matrix):
-            if value in mrow[vin]:
-                if vout == CrefType.INDEX:
-                    result = index
-                else:
-                    result = list(mrow[vout].values())[0]
-                break
-        return result
+        row_index = self._cref_rows_index(vin).get(value)
+        if (
+            row_index is None
+            or row_index >= len(self._cref_matrix)
+            or value not in self._cref_matrix[row_index][vin]
+        ):
+            # Rows changed or removed in place leave the index stale, rebuild it once
+            self._cref_reindex(vin)
+            row_index = self._cref_rows_index(vin).get(value)
+            if row_index is None:
+                return None
+        if vout == CrefType.INDEX:
+            return row_index
+        return self._cref_cell(row_index, vout)
 
     def _get_cref_value(
         self, value: str, vin: CrefType, vout: CrefType
@@ -142,6 +212,7 @@ class ClientConfiguration(ABC):
                     self._cref_matrix[at_row][CrefType.ALIAS] = {
                         alias_name: pub_key_str
                     }
+                self._cref_reindex(CrefType.ALIAS)
             else:
                 raise ValueError(
                     f"Aliases count {len(aliases)} does not match address/key count {len(self._cref_matrix)}"
@@ -159,6 +230,7 @@ class ClientConfiguration(ABC):
                 at_row[CrefType.ALIAS] = {
                     accumer[index]: next(iter(at_row[CrefType.PKEY]))
                 }
+            self._cref_reindex(CrefType.ALIAS)
 
     def _replace_alias_key(self, row_index: int, new_key: str) -> str:
         """_replace_alias_key Replaces the alias key (rename) at cref row index.
@@ -173,6 +245,7 @@ class ClientConfiguration(ABC):
         cref_row = self._cref_matrix[row_index]
         old_alias = cref_row[CrefType.ALIAS]
         cref_row[CrefType.ALIAS] = {new_key: list(old_alias.values())[0]}
+        self._cref_reindex(CrefType.ALIAS)
         return next(iter(old_alias))
 
     @property
@@ -235,10 +308,10 @@ class ClientConfiguration(ABC):
     def addresses_and_keys(self) -> dict:
         """Get a copy of dictionary of address/keypair."""
         return {
-            next(iter(cref_row[CrefType.ADDY])): list(
-                cref_row[CrefType.KPAIR].values()
-            )[0]
-            for cref_row in self._cref_matrix
+            next(iter(cref_row[CrefType.ADDY])): self._cref_cell(
+                row_index, CrefType.KPAIR
+            )
+            for row_index, cref_row in enumerate(self._cref_matrix)
         }
 
     @property
@@ -0,0 +1,93 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui lazy package attributes (PEP 562).
+
+Package `__init__` modules declare their convenience names instead of importing
+them, the defining module is imported when a name is first accessed and the
+value is then kept in the package globals.
+"""
+
+import sys
+import types
+from typing import Any, Callable, Optional
+
+
+def _exports(module: Any, name: str) -> bool:
+    """Check if a star import of module binds name."""
+    exported = getattr(module, "__all__", None)
+    if exported is not None:
+        return name in exported
+    return not name.startswith("_") and name in vars(module)
+
+
+def _exports_global(name: str, value: Any) -> bool:
+    """Check if a package global is exported, excluding modules and helpers."""
+    return (
+        not name.startswith("_")
+        and not isinstance(value, types.ModuleType)
+        and value is not lazy_attributes
+    )
+
+
+def _import(module_name: str) -> Any:
+    """Import a module, through __import__ so -X importtime reports it."""
+    __import__(module_name)
+    return sys.modules[module_name]
+
+
+def lazy_attributes(
+    namespace: dict[str, Any],
+    attributes: dict[str, tuple[str, str]],
+    star_modules: Optional[list[str]] = None,
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """lazy_attributes Return a package's module `__getattr__` and `__dir__`.
+
+    :param namespace: The package globals, i.e. globals() of the `__init__` module
+    :type namespace: dict[str, Any]
+    :param attributes: Exported name to (defining module, attribute name)
+    :type attributes: dict[str, tuple[str, str]]
+    :param star_modules: Modules whose public names are exported as if star imported, in import order, defaults to None
+    :type star_modules: Optional[list[str]], optional
+    :return: The `__getattr__` and `__dir__` functions
+    :rtype: tuple[Callable[[str], Any], Callable[[], list[str]]]
+    """
+    package = namespace["__name__"]
+    star_modules = star_modules or []
+
+    def _star_names() -> list[str]:
+        """Public names of the star modules, imports them."""
+        names: dict[str, None] = {}
+        for module_name in star_modules:
+            module = _import(module_name)
+            names.update(dict.fromkeys(x for x in vars(module) if _exports(module, x)))
+        return list(names)
+
+    def __getattr__(name: str) -> Any:
+        """Import a package attribute on first access."""
+        if name in attributes:
+            module_name, attr_name = attributes[name]
+            value = getattr(_import(module_name), attr_name)
+        elif name == "__all__":
+            # Names bound by the package itself, e.g. star imported constants
+            own = [x for x, v in namespace.items() if _exports_global(x, v)]
+            value = list(dict.fromkeys(own + list(attributes) + _star_names()))
+        else:
+            # Later star imports shadow earlier ones
+            for module_name in reversed(star_modules):
+                module = _import(module_name)
+                if _exports(module, name):
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """Package names, including those not yet imported."""
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -16,8 +16,15 @@
 
 
 from pysui.sui.sui_constants import *
-from pysui.sui.sui_excepts import SuiInvalidAddress
-from pysui.sui.sui_apidesc import SuiApi, build_api_descriptors
-from pysui.sui.sui_config import SuiConfig
+from pysui.lazy_imports import lazy_attributes
 
-from pysui.sui.sui_txn_validator import validate_api
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "SuiInvalidAddress": ("pysui.sui.sui_excepts", "SuiInvalidAddress"),
+        "SuiApi": ("pysui.sui.sui_apidesc", "SuiApi"),
+        "build_api_descriptors": ("pysui.sui.sui_apidesc", "build_api_descriptors"),
+        "SuiConfig": ("pysui.sui.sui_config", "SuiConfig"),
+        "validate_api": ("pysui.sui.sui_txn_validator", "validate_api"),
+    },
+)
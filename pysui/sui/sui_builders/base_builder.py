@@ -32,6 +32,12 @@ from pysui.sui.sui_utils import (
 )
 
 
+@functools.cache
+def _issubtype(has_type: type, ctype_value: type) -> bool:
+    """Memoized typing_utils.issubtype of an argument type and a builder type."""
+    return typing_utils.issubtype(has_type, ctype_value)
+
+
 class SuiRequestType(IntEnum):
     """SuiRequestType Defines the type of request being made when invoking `sui_executeTransaction`.
 
@@ -207,7 +213,7 @@ class SuiBaseBuilder(Builder):
                 result_dict[ctype_key] = args[ctype_key]
             elif has_type == SuiNullType:
                 result_dict[ctype_key] = args[ctype_key]
-            elif args[ctype_key] and typing_utils.issubtype(
+            elif args[ctype_key] and _issubtype(
                 has_type, ctype_value
             ):  # issubclass(has_type, ctype_value):
                 result_dict[ctype_key] = args[ctype_key]
@@ -235,12 +241,54 @@ class SuiBaseBuilder(Builder):
         return result_dict
 
 
+def _builder_property(name: str, coerce) -> property:
+    """_builder_property Create the getter/setter property of a builder argument.
+
+    :param name: Property Name
+    :type name: str
+    :param coerce: Coercion utility applied to set values
+    :type coerce: Callable
+    :return: The property
+    :rtype: property
+    """
+
+    def my_get_lambda(self):
+        """my_get_lambda Return the value of propery.
+
+        :return: The value of the named property
+        :rtype: Any
+        """
+        return self.__dict__[name]
+
+    def my_set_lambda(self, val):
+        """my_set_lambda Setter for property on builder.
+
+        :param val: The value to set to the property name
+        :type val: Any
+        :return: self
+        :rtype: SuiBaseBuilder
+        """
+        self.__dict__[name] = coerce(val)
+        return self
+
+    return property(my_get_lambda, my_set_lambda)
+
+
+@versionchanged(
+    version="0.63.0",
+    reason="Argument types and properties are resolved once at decoration, not per instance",
+)
 def sui_builder(*includes, **kwargs):
     """sui_builder Decorator to use in Builders."""
 
     def _autoargs(func):
         """_autoargs Function that wraps decorator behavior.
 
+        The argument spec, argument types and the property (getter, setter) of
+        each argument are resolved once here. The properties are installed on a
+        builder class when it is first constructed, each construction then only
+        coerces the argument values.
+
         :param func: Function that is being wrapped
         :type func: CallOnce
         :raises ValueError: If function being wrapped is not __init__
@@ -286,19 +334,35 @@ def sui_builder(*includes, **kwargs):
                 return get_args(anno)[0]
             return anno
 
-        def track_map() -> dict:
-            """track_map Setup the mapping of arguments and types.
-
-            :return: Dict of arg_name and none
-            :rtype: dict
-            """
-            var_map: dict = {}
-            if spec.kwonlyargs:
-                var_map = {x: None for x in spec.kwonlyargs}
-            else:
-                var_map = {x: None for x in spec.args[1:]}
-
-            return var_map
+        # Setup the mapping of arguments and types
+        arg_names: list[str] = spec.kwonlyargs or spec.args[1:]
+        kept: frozenset[str] = frozenset(
+            x for x in spec.args[1:] + spec.kwonlyargs if sieve(x)
+        )
+        true_types: dict = {
+            x: sui_true_type(spec.annotations[x])
+            for x in kept
+            if x in spec.annotations
+        }
+        # Initial values and types, with positional defaults
+        base_vars: dict = {x: None for x in arg_names}
+        base_types: dict = base_vars.copy()
+        if spec.defaults:
+            for attr, val in zip(reversed(spec.args), reversed(spec.defaults)):
+                if attr in kept:
+                    base_vars[attr] = val
+                    base_types[attr] = true_types[attr]
+        positional_attrs = spec.args[1:]
+        kwonly_defaults: dict = {
+            x: y for x, y in (spec.kwonlydefaults or {}).items() if x in kept
+        }
+        properties: dict[str, property] = {
+            x: _builder_property(
+                x, COERCION_FN_MAP.get(true_types.get(x), lambda x: x)
+            )
+            for x in arg_names
+        }
+        installed: set[type] = set()
 
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs) -> None:
@@ -307,82 +371,34 @@ def sui_builder(*includes, **kwargs):
             :return: The constructed object
             :rtype: Builder
             """
-            __var_map = track_map()
-            __var_type_map = __var_map.copy()
-            # handle default values
-            if spec.defaults:
-                # if defaults:
-                for attr, val in zip(reversed(spec.args), reversed(spec.defaults)):
-                    if sieve(attr):
-                        __var_map[attr] = val
-                        __var_type_map[attr] = sui_true_type(spec.annotations[attr])
-            # # handle positional arguments
-            positional_attrs = spec.args[1:]
+            __var_map = base_vars.copy()
+            __var_type_map = base_types.copy()
+            # handle positional arguments
             for attr, val in zip(positional_attrs, args):
-                if sieve(attr):
+                if attr in kept:
                     __var_map[attr] = val
-                    __var_type_map[attr] = sui_true_type(spec.annotations[attr])
-                    # __var_type_map[attr] = spec.annotations[attr]
-
+                    __var_type_map[attr] = true_types[attr]
             # handle keyword args
-            if kwargs:
-                for attr, val in kwargs.items():
-                    if sieve(attr):
-                        __var_map[attr] = val
-                        __var_type_map[attr] = sui_true_type(spec.annotations[attr])
-                        # __var_type_map[attr] = spec.annotations[attr]
-
+            for attr, val in kwargs.items():
+                if attr in kept:
+                    __var_map[attr] = val
+                    __var_type_map[attr] = true_types[attr]
             # handle keywords with defaults:
-            if spec.kwonlydefaults:
-                for attr, val in spec.kwonlydefaults.items():
-                    if not __var_map[attr] and sieve(attr):
-                        __var_map[attr] = val
-                        __var_type_map[attr] = sui_true_type(spec.annotations[attr])
-                        # __var_type_map[attr] = spec.annotations[attr]
-
-            def my_set_lambda(name, coerce, self, val):
-                """my_set_lambda Setter for property on builder.
-
-                :param name: Property Name
-                :type name: Any
-                :param coerce: Coercion utility
-                :type coerce: CallOne
-                :param val: The value to set to the property name
-                :type val: Any
-                :return: self
-                :rtype: SuiBaseBuilder
-                """
-                self.__dict__[name] = coerce(val)
-                return self
-
-            def my_get_lambda(name, self):
-                """my_get_lambda Return the value of propery.
-
-                :param name: The name of the property
-                :type name: Any
-                :return: The value of the named property
-                :rtype: Any
-                """
-                return self.__dict__[name]
+            for attr, val in kwonly_defaults.items():
+                if not __var_map[attr]:
+                    __var_map[attr] = val
+                    __var_type_map[attr] = true_types[attr]
 
             # Setup the initializing values
-            _instance_dict = self.value_type_validator(
-                __host_class, __var_map, __var_type_map
+            self.__dict__.update(
+                self.value_type_validator(__host_class, __var_map, __var_type_map)
             )
-            for _new_key, _new_val in _instance_dict.items():
-                setattr(self, _new_key, _new_val)
-            # Setup the properties (getter, setter)
+            # Setup the properties (getter, setter) once per class
             myclass = self.__class__
-            for _new_key, _new_val in _instance_dict.items():
-                coercer = COERCION_FN_MAP.get(__var_type_map[_new_key], lambda x: x)
-                setattr(
-                    myclass,
-                    _new_key,
-                    property(
-                        functools.partial(my_get_lambda, _new_key),
-                        functools.partial(my_set_lambda, _new_key, coercer),
-                    ),
-                )
+            if myclass not in installed:
+                for _new_key, _new_prop in properties.items():
+                    setattr(myclass, _new_key, _new_prop)
+                installed.add(myclass)
 
             # Call the underlying __host_class __init__ function
             return func(self, *args, **kwargs)
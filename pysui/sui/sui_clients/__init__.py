@@ -13,4 +13,8 @@
 
 """Sui Client package."""
 
-from pysui.sui.sui_clients.common import SuiRpcResult
+from pysui.lazy_imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(), {"SuiRpcResult": ("pysui.sui.sui_clients.common", "SuiRpcResult")}
+)
@@ -13,6 +13,7 @@
 
 """Sui Client common classes module."""
 
+import copy
 import os
 import sys
 import json
@@ -55,8 +56,14 @@ class SuiRpcResult(RpcResult):
     Captures information returned from simple and complex RPC API calls
     """
 
+    @versionchanged(version="0.63.0", reason="Added lazy decoding with decode_fn")
     def __init__(
-        self, result_status: bool, result_string: str, result_data: Any = None
+        self,
+        result_status: bool,
+        result_string: str,
+        result_data: Any = None,
+        *,
+        decode_fn: Optional[Callable[[Any], Any]] = None,
     ) -> None:
         """__init__ SuiRpcResult constructor.
 
@@ -66,11 +73,19 @@ class SuiRpcResult(RpcResult):
         :type result_string: str
         :param result_data: If success, contains data realized by RPC result, defaults to None
         :type result_data: Any, optional
+        :param decode_fn: If set, result_data is the raw payload decoded by decode_fn on first access, defaults to None
+        :type decode_fn: Optional[Callable[[Any], Any]], optional
         """
         super().__init__()
         self._status: bool = result_status
         self._result_str: str = result_string
         self._data: Any = result_data
+        self._raw: Any = None
+        self._decode_fn: Optional[Callable[[Any], Any]] = decode_fn
+        self._decode_error: Optional[Exception] = None
+        if decode_fn:
+            self._raw = result_data
+            self._data = None
 
     def is_ok(self) -> bool:
         """Ease of use status."""
@@ -82,9 +97,47 @@ class SuiRpcResult(RpcResult):
 
     @property
     def result_data(self) -> Any:
-        """Get result data."""
+        """Get result data, decoding the raw payload on first access if lazy.
+
+        An error raised by decoding propagates to the caller, marks the result
+        as failed and is raised again on every later access. The raw payload is
+        kept until decoding succeeds.
+        """
+        if self._decode_fn:
+            if self._decode_error is not None:
+                raise self._decode_error
+            try:
+                # Decoders may consume their input
+                self._data = self._decode_fn(copy.deepcopy(self._raw))
+            except Exception as exc:
+                self._decode_error = exc
+                self._status = False
+                self._result_str = f"{exc.__class__.__name__} decoding result"
+                raise
+            self._decode_fn = self._raw = None
         return self._data
 
+    @property
+    @versionadded(version="0.63.0", reason="Access to the undecoded payload")
+    def raw_data(self) -> Any:
+        """Get the undecoded payload of a lazy result.
+
+        None when the result was decoded eagerly or has been decoded by
+        accessing result_data. A payload that failed to decode is kept.
+        """
+        return self._raw
+
+    @versionadded(version="0.63.0", reason="Lazy result decoding")
+    def is_decoded(self) -> bool:
+        """Check if result_data is available without decoding."""
+        return self._decode_fn is None
+
+    @property
+    @versionadded(version="0.63.0", reason="Lazy result decoding")
+    def decode_error(self) -> Optional[Exception]:
+        """Get the error raised decoding a lazy result, if any."""
+        return self._decode_error
+
     @property
     def result_string(self) -> str:
         """Get result string."""
@@ -14,11 +14,18 @@
 """Sui Asynchronous subscription module."""
 
 import asyncio
+import collections
+import dataclasses
 import logging
 import ssl
 import json
 import inspect
-from typing import Any, Callable, Optional, Union
+import itertools
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Any, Callable, Coroutine, Optional, Union
 import warnings
 from deprecated.sphinx import versionadded, versionchanged
 from websockets.client import connect as ws_connect
@@ -69,6 +76,390 @@ class EventData:
         return self._name
 
 
+@versionadded(version="0.63.0", reason="Back-pressured subscription dispatch")
+class DispatchOverflow(IntEnum):
+    """What the receiver does when the dispatch queue is full."""
+
+    # Wait for room, back-pressuring the socket
+    BLOCK = 0
+    # Discard the oldest queued event
+    DROP_OLDEST = 1
+    # Append to a spill file drained in order once the queue has room
+    SPILL = 2
+
+
+@versionadded(version="0.63.0", reason="Back-pressured subscription dispatch")
+@dataclasses.dataclass
+class DispatchOptions:
+    """Queued dispatch of received events to handlers.
+
+    Events are parsed and handled by `concurrency` worker tasks. Sync handlers
+    run on the event loop unless `handler_threads` sets a thread pool size.
+    With concurrency above 1 handlers may complete out of receive order, the
+    event counter passed to the handler is the receive index.
+
+    On a multiplexed connection (`multiplex_connections`) a full BLOCK queue
+    back-pressures the shared connection, pausing the other subscriptions on it.
+    """
+
+    queue_size: int = 1000
+    concurrency: int = 1
+    overflow: DispatchOverflow = DispatchOverflow.BLOCK
+    handler_threads: int = 0
+    spill_dir: Optional[str] = None
+
+
+@versionadded(version="0.63.0", reason="Back-pressured subscription dispatch")
+@dataclasses.dataclass
+class DispatchMetrics:
+    """Dispatch queue counters."""
+
+    received: int = 0
+    handled: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    depth: int = 0
+    max_depth: int = 0
+
+
+class _SpillFile:
+    """FIFO of queued events in a temporary file."""
+
+    def __init__(self, spill_dir: Optional[str]):
+        """Create the temporary file in spill_dir."""
+        self._file = tempfile.TemporaryFile(dir=spill_dir)
+        self._read_pos = 0
+        self.pending = 0
+
+    def write(self, item: tuple) -> None:
+        """Append an item."""
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(json.dumps(item).encode() + b"\n")
+        self.pending += 1
+
+    def read(self, count: int) -> list[tuple]:
+        """Read up to count items in write order."""
+        self._file.seek(self._read_pos)
+        items = [
+            tuple(json.loads(self._file.readline()))
+            for _ in range(min(count, self.pending))
+        ]
+        self._read_pos = self._file.tell()
+        self.pending -= len(items)
+        if not self.pending:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = 0
+        return items
+
+    def close(self) -> None:
+        """Close and remove the file."""
+        self._file.close()
+
+
+class _Dispatcher:
+    """Bounded queue between a subscription receiver and handler workers."""
+
+    def __init__(
+        self,
+        options: DispatchOptions,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        handler: Callable[[Any, int, int], Any],
+        result_data: EventData,
+    ):
+        """Initialize and start the workers."""
+        self._options = options
+        self._builder = builder
+        self._handler = handler
+        self._is_async = inspect.iscoroutinefunction(handler)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if options.handler_threads and not self._is_async:
+            self._executor = ThreadPoolExecutor(options.handler_threads)
+        self._spill: Optional[_SpillFile] = None
+        if options.overflow == DispatchOverflow.SPILL:
+            self._spill = _SpillFile(options.spill_dir)
+        self._queue: collections.deque = collections.deque()
+        self._ready = asyncio.Condition()
+        self._result_data = result_data
+        self._index = 0
+        self.subscription_id: Optional[int] = None
+        self.metrics = DispatchMetrics()
+        self.stopped = asyncio.Event()
+        self.failure: Optional[SuiRpcResult] = None
+        self._workers = [
+            asyncio.create_task(self._work())
+            for _ in range(max(1, options.concurrency))
+        ]
+
+    def _depth(self) -> int:
+        """Count of queued events, in memory and spilled."""
+        depth = len(self._queue) + (self._spill.pending if self._spill else 0)
+        self.metrics.depth = depth
+        self.metrics.max_depth = max(self.metrics.max_depth, depth)
+        return depth
+
+    async def put(self, message: Union[str, dict]) -> None:
+        """Queue a received message applying the overflow policy."""
+        self.metrics.received += 1
+        item = (self._index, self.subscription_id, message)
+        self._index += 1
+        async with self._ready:
+            if (self._spill and self._spill.pending) or len(
+                self._queue
+            ) >= self._options.queue_size:
+                match self._options.overflow:
+                    case DispatchOverflow.BLOCK:
+                        await self._ready.wait_for(
+                            lambda: len(self._queue) < self._options.queue_size
+                            or self.stopped.is_set()
+                        )
+                        if self.stopped.is_set():
+                            return
+                    case DispatchOverflow.DROP_OLDEST:
+                        self._queue.popleft()
+                        self.metrics.dropped += 1
+                    case DispatchOverflow.SPILL:
+                        self._spill.write(item)
+                        self.metrics.spilled += 1
+                        self._depth()
+                        self._ready.notify_all()
+                        return
+            self._queue.append(item)
+            self._depth()
+            self._ready.notify_all()
+
+    async def _next(self) -> Optional[tuple]:
+        """Take the next queued item, None when stopped."""
+        async with self._ready:
+            await self._ready.wait_for(
+                lambda: self._queue
+                or (self._spill and self._spill.pending)
+                or self.stopped.is_set()
+            )
+            if self.stopped.is_set():
+                return None
+            if not self._queue:
+                self._queue.extend(self._spill.read(self._options.queue_size))
+            item = self._queue.popleft()
+            self._depth()
+            self._ready.notify_all()
+            return item
+
+    async def _stop(self, failure: Optional[SuiRpcResult] = None) -> None:
+        """Stop receiving and handling."""
+        async with self._ready:
+            if failure and not self.failure:
+                self.failure = failure
+            self.stopped.set()
+            self._ready.notify_all()
+
+    async def _work(self) -> None:
+        """Parse and handle queued events until stopped."""
+        while item := await self._next():
+            event_counter, subscription_id, message = item
+            try:
+                event = self._builder.handle_return(
+                    json.loads(message) if isinstance(message, str) else message
+                )
+                if self._is_async:
+                    keep_running = await self._handler(
+                        event, subscription_id, event_counter
+                    )
+                elif self._executor:
+                    keep_running = await asyncio.get_running_loop().run_in_executor(
+                        self._executor,
+                        self._handler,
+                        event,
+                        subscription_id,
+                        event_counter,
+                    )
+                else:
+                    keep_running = self._handler(event, subscription_id, event_counter)
+            except KeyError as kex:
+                await self._stop(
+                    SuiRpcResult(False, f"KeyError on {kex}", self._result_data)
+                )
+                return
+            except Exception as axc:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Subscription dispatch Exception {axc.args}")
+                await self._stop(
+                    SuiRpcResult(False, f"Exception on {axc}", self._result_data)
+                )
+                return
+            self.metrics.handled += 1
+            if keep_running:
+                if not isinstance(keep_running, bool):
+                    self._result_data.add_entry(event_counter, keep_running)
+            else:
+                logger.warning(
+                    "Subscription dispatch Handler requested exit from subscription events."
+                )
+                await self._stop()
+
+    async def close(self) -> None:
+        """Stop the workers, discarding queued events."""
+        await self._stop()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+        if self._spill:
+            self._spill.close()
+
+
+# Received messages a multiplexed subscription handling inline may queue
+_MUX_QUEUE_SIZE: int = 1000
+
+
+class _MuxSubscription:
+    """A subscription routed over a multiplexed connection."""
+
+    __slots__ = ("method", "params", "queue", "subscription_id")
+
+    def __init__(self, method: str, params: list, queue_size: int):
+        """Initialize with the subscribe method, params and queue bound."""
+        self.method = method
+        self.params = params
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.subscription_id: Optional[int] = None
+
+
+class _SubscriptionMux:
+    """Run many subscriptions over one websocket connection.
+
+    Notifications are routed to the subscription queues by subscription id,
+    routing waits while the queue of the notified subscription is full. The
+    connection is opened with the first subscription, re-established with all
+    subscriptions resubscribed when it drops and closed with the last.
+    """
+
+    def __init__(self, client: "SuiClient", index: int):
+        """Initialize for client."""
+        self._client = client
+        self._name = f"pysui-subscription-mux-{index}"
+        self._subs: set[_MuxSubscription] = set()
+        self._sent: set[_MuxSubscription] = set()
+        self._by_id: dict[int, _MuxSubscription] = {}
+        self._pending: dict[int, _MuxSubscription] = {}
+        self._request_ids = itertools.count(1)
+        self._websock: Optional[WebSocketClientProtocol] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        """Count of subscriptions on this connection."""
+        return len(self._subs)
+
+    async def _send_subscribe(self, sub: _MuxSubscription) -> None:
+        """Send the subscribe request of sub once per connection."""
+        if self._websock is None or sub in self._sent:
+            return
+        self._sent.add(sub)
+        request_id = next(self._request_ids)
+        self._pending[request_id] = sub
+        await self._websock.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": sub.method,
+                    "params": sub.params,
+                }
+            )
+        )
+
+    async def subscribe(self, sub: _MuxSubscription) -> None:
+        """Add a subscription, connecting if needed."""
+        self._subs.add(sub)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=self._name)
+        try:
+            await self._send_subscribe(sub)
+        except (ConnectionClosed, ConnectionClosedError):
+            # Resubscribed on reconnect
+            pass
+
+    async def unsubscribe(self, sub: _MuxSubscription) -> None:
+        """Remove a subscription, closing the connection after the last."""
+        self._subs.discard(sub)
+        self._sent.discard(sub)
+        if sub.subscription_id is not None:
+            self._by_id.pop(sub.subscription_id, None)
+        # Release routing waiting on the queue of the removed subscription
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        websock = self._websock
+        if websock is None:
+            return
+        try:
+            if not self._subs:
+                await websock.close()
+            elif sub.subscription_id is not None:
+                await self._send_unsubscribe(sub.method, sub.subscription_id)
+        except (ConnectionClosed, ConnectionClosedError):
+            pass
+
+    async def _send_unsubscribe(self, method: str, subscription_id: int) -> None:
+        """Send the unsubscribe request of a subscription id."""
+        await self._websock.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": next(self._request_ids),
+                    "method": method.replace("subscribe", "unsubscribe"),
+                    "params": [subscription_id],
+                }
+            )
+        )
+
+    async def _route(self, message: dict) -> None:
+        """Route a subscribe response or notification."""
+        if "id" in message:
+            sub = self._pending.pop(message["id"], None)
+            if sub is None:
+                return
+            if sub not in self._subs:
+                # Removed while subscribing, end it on the server
+                if "result" in message:
+                    await self._send_unsubscribe(sub.method, message["result"])
+                return
+            if "error" in message:
+                await sub.queue.put(message)
+            else:
+                sub.subscription_id = message["result"]
+                self._by_id[sub.subscription_id] = sub
+            return
+        sub = self._by_id.get(message.get("params", {}).get("subscription"))
+        if sub:
+            await sub.queue.put(message)
+        else:
+            logger.debug("Subscription mux dropped unrouted notification")
+
+    async def _run(self) -> None:
+        """Connect, (re)subscribe and route until no subscriptions remain."""
+        extras: dict = {"extra_headers": SuiClient._ADDITIONL_HEADER}
+        if self._client.config.socket_url.startswith("wss:"):
+            warnings.simplefilter("ignore")
+            extras["ssl"] = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        async for websock in ws_connect(self._client.config.socket_url, **extras):
+            self._websock = websock
+            self._sent.clear()
+            self._pending.clear()
+            self._by_id.clear()
+            try:
+                for sub in list(self._subs):
+                    await self._send_subscribe(sub)
+                async for raw_message in websock:
+                    await self._route(json.loads(raw_message))
+            except (ConnectionClosed, ConnectionClosedError) as ws_cc:
+                logger.warning(f"Subscription mux {type(ws_cc).__name__}")
+            finally:
+                self._websock = None
+            if not self._subs:
+                break
+            logger.warning("Subscription mux connection lost... reconnecting")
+
+
 class SuiClient(Provider):
     """A provider for managing subscriptions of Events or Transactions."""
 
@@ -84,16 +475,59 @@ class SuiClient(Provider):
     @versionchanged(
         version="0.20.0", reason="Added transaction subscription management."
     )
-    def __init__(self, config: SuiConfig):
+    @versionchanged(version="0.63.0", reason="Added multiplex_connections.")
+    def __init__(self, config: SuiConfig, *, multiplex_connections: int = 0):
         """__init__ Client initializer.
 
         :param config: An instance of SuiConfig
         :type config: SuiConfig
+        :param multiplex_connections: Shared websocket connections subscriptions are multiplexed over, defaults to 0 (a connection per subscription)
+        :type multiplex_connections: int, optional
         """
         super().__init__(config)
         self._event_subscriptions: dict[str, asyncio.Task] = {}
         self._txn_subscriptions: dict[str, asyncio.Task] = {}
         self._in_shutdown = False
+        self._muxes: list[_SubscriptionMux] = [
+            _SubscriptionMux(self, index) for index in range(multiplex_connections)
+        ]
+        self._dispatch_metrics: dict[str, DispatchMetrics] = {}
+
+    @versionadded(version="0.63.0", reason="Back-pressured subscription dispatch")
+    def dispatch_metrics(self, task_name: str) -> Optional[DispatchMetrics]:
+        """dispatch_metrics Return the live dispatch queue counters of a subscription task.
+
+        :param task_name: The subscription task name
+        :type task_name: str
+        :return: The counters, None if the subscription does not use dispatch
+        :rtype: Optional[DispatchMetrics]
+        """
+        return self._dispatch_metrics.get(task_name)
+
+    @staticmethod
+    def _subscription_params(
+        builder: Union[SubscribeEvent, SubscribeTransaction]
+    ) -> Optional[list]:
+        """Return the subscribe call params of the builder filter, None if invalid."""
+        parm_arg = builder.params["filter"]
+        if isinstance(parm_arg, SuiString):
+            return [parm_arg.value]
+        if isinstance(parm_arg, SuiMap):
+            return [parm_arg.filter]
+        return None
+
+    @staticmethod
+    async def _call_handler(
+        handler: Callable[[Any, int, int], Any],
+        is_async: bool,
+        event: Any,
+        subscription_id: int,
+        event_counter: int,
+    ) -> Any:
+        """Call the sync or async handler."""
+        if is_async:
+            return await handler(event, subscription_id, event_counter)
+        return handler(event, subscription_id, event_counter)
 
     @versionchanged(
         version="0.20.0", reason="Added transaction subscription management."
@@ -102,6 +536,7 @@ class SuiClient(Provider):
         version="0.26.1",
         reason="Detect if handler is sync or async and invoke accordingly.",
     )
+    @versionchanged(version="0.63.0", reason="Added queued dispatch.")
     async def _subscription_drive(
         self,
         payload_msg: dict,
@@ -111,6 +546,7 @@ class SuiClient(Provider):
             Callable[[SubscribedEvent, int, int], Any],
             Callable[[SubscribedTransaction, int, int], Any],
         ],
+        dispatch: Optional[DispatchOptions] = None,
     ) -> SuiRpcResult:
         """_subscription_drive Iterate receiving events and calling handler function.
 
@@ -122,17 +558,17 @@ class SuiClient(Provider):
         :type websock: WebSocketClientProtocol
         :param handler: The function called for each received event.
         :type handler: Union[Callable[[SubscribedEvent, int, int], Any], Callable[[SubscribedTransaction, int, int], Any]]
+        :param dispatch: Queue events to handler workers, defaults to None (handle inline)
+        :type dispatch: Optional[DispatchOptions], optional
         :return: _description_
         :rtype: SuiRpcResult
         """
         payload_msg["method"] = builder.method
-        parm_arg = builder.params["filter"]
-        if isinstance(parm_arg, SuiString):
-            payload_msg["params"] = [parm_arg.value]
-        elif isinstance(parm_arg, SuiMap):
-            payload_msg["params"] = [parm_arg.filter]
-        else:
-            return SuiRpcResult(False, f"{parm_arg} not an accepted type")
+        payload_msg["params"] = self._subscription_params(builder)
+        if payload_msg["params"] is None:
+            return SuiRpcResult(
+                False, f"{builder.params['filter']} not an accepted type"
+            )
 
         _is_asynch_handler = inspect.iscoroutinefunction(handler)
         logger.info(f"Handler is async -> {_is_asynch_handler}")
@@ -143,6 +579,10 @@ class SuiClient(Provider):
         if "error" in response:
             return SuiRpcResult(False, response["error"], response)
         subscription_id: int = response["result"]
+        if dispatch:
+            return await self._dispatch_drive(
+                websock.recv, builder, handler, dispatch, lambda: subscription_id
+            )
         keep_running = True
         event_counter = 0
         result_data: EventData = EventData(asyncio.current_task().get_name())
@@ -153,18 +593,13 @@ class SuiClient(Provider):
                 logger.debug("Subscription driver RECEIVED event")
 
                 try:
-                    if _is_asynch_handler:
-                        keep_running = await handler(
-                            builder.handle_return(json.loads(the_event)),
-                            subscription_id,
-                            event_counter,
-                        )
-                    else:
-                        keep_running = handler(
-                            builder.handle_return(json.loads(the_event)),
-                            subscription_id,
-                            event_counter,
-                        )
+                    keep_running = await self._call_handler(
+                        handler,
+                        _is_asynch_handler,
+                        builder.handle_return(json.loads(the_event)),
+                        subscription_id,
+                        event_counter,
+                    )
                 # Indicative of deserialization error
                 # exit with result data
                 except KeyError as kex:
@@ -215,6 +650,7 @@ class SuiClient(Provider):
             Callable[[SubscribedTransaction, int, int], Any],
         ],
         continue_on_close: Optional[bool] = False,
+        dispatch: Optional[DispatchOptions] = None,
     ) -> SuiRpcResult:
         """_subscription_listener Sets up websocket subscription and calls _subscription_drive.
 
@@ -239,6 +675,7 @@ class SuiClient(Provider):
                         builder,
                         websock,
                         handler,
+                        dispatch,
                     )
                     logger.info(
                         f"Subscription listener returning in shutdown: {self._in_shutdown}"
@@ -274,6 +711,7 @@ class SuiClient(Provider):
                         builder,
                         websock,
                         handler,
+                        dispatch,
                     )
                     logger.info(
                         f"Subscription listener returning in shutdown: {self._in_shutdown}"
@@ -298,12 +736,170 @@ class SuiClient(Provider):
                     )
                     return SuiRpcResult(False, e_name, exc)
 
+    @versionadded(version="0.63.0", reason="Back-pressured subscription dispatch")
+    async def _dispatch_drive(
+        self,
+        receive: Callable[[], Coroutine[Any, Any, Union[str, dict]]],
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        handler: Callable[[Any, int, int], Any],
+        dispatch: DispatchOptions,
+        subscription_id: Callable[[], int],
+    ) -> SuiRpcResult:
+        """_dispatch_drive Receive events into a bounded queue drained by handler workers.
+
+        :param receive: Returns the next received message
+        :type receive: Callable[[], Coroutine[Any, Any, Union[str, dict]]]
+        :param builder: The subscription builder submitted for creating subscription filters.
+        :type builder: Union[SubscribeEvent, SubscribeTransaction]
+        :param handler: The function called for each received event.
+        :type handler: Callable[[Any, int, int], Any]
+        :param dispatch: The dispatch options
+        :type dispatch: DispatchOptions
+        :param subscription_id: Returns the current subscription id
+        :type subscription_id: Callable[[], int]
+        :return: Result of subscription event handling.
+        :rtype: SuiRpcResult
+        """
+        task_name = asyncio.current_task().get_name()
+        result_data: EventData = EventData(task_name)
+        dispatcher = _Dispatcher(dispatch, builder, handler, result_data)
+        self._dispatch_metrics[task_name] = dispatcher.metrics
+        stopped = asyncio.create_task(dispatcher.stopped.wait())
+        received: Optional[asyncio.Task] = None
+        try:
+            while True:
+                received = asyncio.create_task(receive())
+                await asyncio.wait(
+                    {received, stopped}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not received.done():
+                    break
+                message = received.result()
+                if isinstance(message, dict) and "error" in message:
+                    return SuiRpcResult(False, message["error"], message)
+                dispatcher.subscription_id = subscription_id()
+                await dispatcher.put(message)
+        except asyncio.CancelledError:
+            logger.warning(
+                f"Subscription cancelled for shutdown -> {self._in_shutdown}"
+            )
+            return SuiRpcResult(True, "Cancelled", result_data)
+        finally:
+            stopped.cancel()
+            if received and not received.done():
+                received.cancel()
+            await dispatcher.close()
+        return dispatcher.failure or SuiRpcResult(True, None, result_data)
+
+    @versionadded(version="0.63.0", reason="Multiplexed subscriptions")
+    async def _multiplexed_drive(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        handler: Union[
+            Callable[[SubscribedEvent, int, int], Any],
+            Callable[[SubscribedTransaction, int, int], Any],
+        ],
+        dispatch: Optional[DispatchOptions] = None,
+    ) -> SuiRpcResult:
+        """_multiplexed_drive Subscribe on the least used shared connection and call handler.
+
+        :param builder: The subscription builder submitted for creating subscription filters.
+        :type builder: Union[SubscribeEvent, SubscribeTransaction]
+        :param handler: The function called for each received event.
+        :type handler: Union[Callable[[SubscribedEvent, int, int], Any], Callable[[SubscribedTransaction, int, int], Any]]
+        :param dispatch: Queue events to handler workers, defaults to None (handle inline)
+        :type dispatch: Optional[DispatchOptions], optional
+        :return: Result of subscription event handling.
+        :rtype: SuiRpcResult
+        """
+        params = self._subscription_params(builder)
+        if params is None:
+            return SuiRpcResult(
+                False, f"{builder.params['filter']} not an accepted type"
+            )
+        _is_asynch_handler = inspect.iscoroutinefunction(handler)
+        mux = min(self._muxes, key=len)
+        # Dispatch applies the overflow policy, its subscription queue is a handoff
+        sub = _MuxSubscription(
+            builder.method, params, 1 if dispatch else _MUX_QUEUE_SIZE
+        )
+        keep_running = True
+        event_counter = 0
+        result_data: EventData = EventData(asyncio.current_task().get_name())
+        await mux.subscribe(sub)
+        if dispatch:
+            try:
+                return await self._dispatch_drive(
+                    sub.queue.get,
+                    builder,
+                    handler,
+                    dispatch,
+                    lambda: sub.subscription_id,
+                )
+            finally:
+                await mux.unsubscribe(sub)
+        try:
+            while keep_running:
+                the_event: dict = await sub.queue.get()
+                if "error" in the_event:
+                    return SuiRpcResult(False, the_event["error"], the_event)
+                try:
+                    keep_running = await self._call_handler(
+                        handler,
+                        _is_asynch_handler,
+                        builder.handle_return(the_event),
+                        sub.subscription_id,
+                        event_counter,
+                    )
+                except KeyError as kex:
+                    logger.warning(
+                        f"Subscription driver KeyError occured for shutdown -> {self._in_shutdown}"
+                    )
+                    return SuiRpcResult(False, f"KeyError on {kex}", result_data)
+                except Exception as axc:
+                    logger.warning(
+                        f"Subscription driver Exception occured for shutdown -> {self._in_shutdown} {axc.args}"
+                    )
+                    return SuiRpcResult(False, f"Exception on {axc}", result_data)
+                if keep_running:
+                    if not isinstance(keep_running, bool):
+                        result_data.add_entry(event_counter, keep_running)
+                        event_counter += 1
+                else:
+                    logger.warning(
+                        "Subscription driver Handler rquested exit from subscription events."
+                    )
+        except asyncio.CancelledError:
+            logger.warning(
+                f"Subscription cancelled for shutdown -> {self._in_shutdown}"
+            )
+            return SuiRpcResult(True, "Cancelled", result_data)
+        finally:
+            await mux.unsubscribe(sub)
+        return SuiRpcResult(True, None, result_data)
+
+    def _listener_for(
+        self,
+        builder: Union[SubscribeEvent, SubscribeTransaction],
+        handler: Callable[[Any, int, int], Any],
+        continue_on_close: bool,
+        dispatch: Optional[DispatchOptions],
+    ) -> Coroutine[Any, Any, SuiRpcResult]:
+        """Multiplexed when configured, else a dedicated connection listener."""
+        if self._muxes:
+            return self._multiplexed_drive(builder, handler, dispatch)
+        return self._subscription_listener(
+            builder, handler, continue_on_close, dispatch
+        )
+
+    @versionchanged(version="0.63.0", reason="Added dispatch option.")
     async def new_event_subscription(
         self,
         sbuilder: SubscribeEvent,
         handler: Callable[[SubscribedEvent, int, int], Any],
         task_name: str = None,
         continue_on_close: Optional[bool] = False,
+        dispatch: Optional[DispatchOptions] = None,
     ) -> SuiRpcResult:
         """new_event_subscription Initiate and run a move event subscription feed.
 
@@ -313,6 +909,8 @@ class SuiClient(Provider):
         :type handler: Callable[[SubscribedEvent, int], Any]
         :param task_name: A name to assign to the listener task, defaults to None
         :type task_name: str, optional
+        :param dispatch: Queue received events to concurrent handler workers, defaults to None (handle inline)
+        :type dispatch: Optional[DispatchOptions], optional
         :return: Result of subscribed move event handling
         :rtype: SuiRpcResult
         """
@@ -320,7 +918,9 @@ class SuiClient(Provider):
         async with self._ACCESS_LOCK:
             if not self._in_shutdown:
                 new_task: asyncio.Task = asyncio.create_task(
-                    self._subscription_listener(sbuilder, handler, continue_on_close),
+                    self._listener_for(
+                        sbuilder, handler, continue_on_close, dispatch
+                    ),
                     name=task_name,
                 )
                 _task_name = new_task.get_name()
@@ -335,12 +935,14 @@ class SuiClient(Provider):
         return _sui_result
 
     @versionadded(version="0.20.0", reason="Transaction Effects Subscription")
+    @versionchanged(version="0.63.0", reason="Added dispatch option.")
     async def new_transaction_subscription(
         self,
         sbuilder: SubscribeTransaction,
         handler: Callable[[SubscribedTransaction, int, int], Any],
         task_name: str = None,
         continue_on_close: Optional[bool] = False,
+        dispatch: Optional[DispatchOptions] = None,
     ) -> SuiRpcResult:
         """new_event_subscription Initiate and run a move event subscription feed.
 
@@ -350,6 +952,8 @@ class SuiClient(Provider):
         :type handler: Callable[[SubscribedTransaction, int], Any]
         :param task_name: A name to assign to the listener task, defaults to None
         :type task_name: str, optional
+        :param dispatch: Queue received events to concurrent handler workers, defaults to None (handle inline)
+        :type dispatch: Optional[DispatchOptions], optional
         :return: Result of subscribed transaction event handling
         :rtype: SuiRpcResult
         """
@@ -357,7 +961,9 @@ class SuiClient(Provider):
         async with self._ACCESS_LOCK:
             if not self._in_shutdown:
                 new_task: asyncio.Task = asyncio.create_task(
-                    self._subscription_listener(sbuilder, handler, continue_on_close),
+                    self._listener_for(
+                        sbuilder, handler, continue_on_close, dispatch
+                    ),
                     name=task_name,
                 )
                 _task_name = new_task.get_name()
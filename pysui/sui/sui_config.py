@@ -55,7 +55,9 @@ from pysui.sui.sui_crypto import (
     as_keystrings,
     create_new_address,
     emphemeral_keys_and_addresses,
+    SuiKeyPair,
     keypair_from_keystring,
+    keystring_digest,
     load_keys_and_addresses,
     recover_key_and_address,
     gen_mnemonic_phrase,
@@ -135,7 +137,9 @@ class SuiConfig(ClientConfiguration):
                 self._socket_url = socket_url if socket_url else MAINNET_SOCKET_URL
             case _:
                 self._socket_url = socket_url
-        self._cref_matrix = load_keys_and_addresses(self.keystore_file)
+        self._cref_matrix = load_keys_and_addresses(
+            self.keystore_file, self._read_address_index()
+        )
         # Setup aliases
         if self.alias_file:
             try:
@@ -144,6 +148,52 @@ class SuiConfig(ClientConfiguration):
             except FileNotFoundError:
                 self._alias_assocation({})
 
+    @versionadded(version="0.63.0", reason="Lazy keypair derivation")
+    def _derive_keypair(self, keystring: str) -> SuiKeyPair:
+        """Derive the KeyPair of a keystring loaded from the address index."""
+        return keypair_from_keystring(keystring)
+
+    @versionadded(version="0.63.0", reason="Precomputed keystore address index")
+    @property
+    def address_index_file(self) -> str:
+        """Get the address index filename, alongside the keystore."""
+        return f"{self.keystore_file}.index"
+
+    def _read_address_index(self) -> Optional[dict[str, list[str]]]:
+        """Read the address index if present."""
+        index_path = Path(self.address_index_file)
+        if index_path.exists():
+            logger.debug(f"Loading address index {index_path}")
+            return json.loads(index_path.read_text(encoding="utf8"))
+        return None
+
+    @versionadded(version="0.63.0", reason="Precomputed keystore address index")
+    def write_address_index(self, file_path: Optional[str] = None) -> str:
+        """write_address_index Write the address index of the keystore.
+
+        With the index present SuiConfig loads without deriving keypairs, each
+        is derived when first used. The index maps the sha256 digest of each
+        keystring (see keystring_digest) to its public key string and address,
+        it holds no private key material.
+
+        :param file_path: Index file path, defaults to None (address_index_file)
+        :type file_path: Optional[str], optional
+        :return: The written file path
+        :rtype: str
+        """
+        index_path = Path(file_path or self.address_index_file)
+        address_index = {
+            keystring_digest(next(iter(cref_row[CrefType.KPAIR]))): [
+                next(iter(cref_row[CrefType.PKEY])),
+                next(iter(cref_row[CrefType.ADDY])),
+            ]
+            for cref_row in self._cref_matrix
+        }
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        temp_path.write_text(json.dumps(address_index), encoding="utf8")
+        os.replace(temp_path, index_path)
+        return str(index_path)
+
     @versionadded(version="0.41.0", reason="Support aliases.")
     def _write_aliases(self):
         """Write alias file."""
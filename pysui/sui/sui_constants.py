@@ -146,3 +146,9 @@ SECP256R1_PUBLICKEY_BYTES_LEN: int = 33
 """Length of SECP256R1 public key bytes."""
 SECP256R1_PRIVATEKEY_BYTES_LEN: int = PRIVATE_KEY_BYTE_LEN
 """Length of SECP256R1 private key bytes."""
+
+# Transaction digest
+TRANSACTION_DATA_DIGEST_PREFIX: bytes = b"TransactionData::"
+"""Type name prefix hashed with TransactionData BCS bytes to produce the transaction digest."""
+TRANSACTION_DIGEST_BYTES_LEN: int = 32
+"""Length of the blake2b transaction digest bytes."""
@@ -48,7 +48,7 @@ from pysui.sui.sui_types.bcs import (
     MsSecp256r1PublicKey,
     MultiSignature,
 )
-from pysui.sui.sui_types.scalars import SuiTxBytes
+from pysui.sui.sui_types.scalars import SuiTxBytes, TxBytes
 
 
 class SuiPublicKey(PublicKey):
@@ -64,20 +64,21 @@ class SuiPublicKey(PublicKey):
 class SuiPrivateKey(PrivateKey):
     """SuiPrivateKey Sui Basic private/signing key."""
 
-    def sign_secure(self, tx_data: str) -> list:
+    @versionchanged(version="0.63.0", reason="Accepts TxBytes")
+    def sign_secure(self, tx_data: Union[str, TxBytes]) -> list:
         """sign_secure Sign transaction intent.
 
         :param public_key: PublicKey from signer/private key
         :type public_key: SuiPublicKey
-        :param tx_data: Transaction bytes being signed
-        :type tx_data: str
+        :param tx_data: Transaction bytes being signed, base64 str or TxBytes
+        :type tx_data: Union[str, TxBytes]
         :return: Singed transaction as list of u8 bytes
         :rtype: list
         """
         return pfc.sign_digest(
             self.scheme,
             self.key_bytes,
-            tx_data,
+            tx_data if isinstance(tx_data, str) else tx_data.value,
             [0, 0, 0],
         )
 
@@ -113,7 +114,8 @@ class SuiKeyPair(KeyPair):
         return self._scheme
 
     @versionchanged(version="0.33.0", reason="Changes to SuiPrivateKey")
-    def new_sign_secure(self, tx_data: str) -> SuiSignature:
+    @versionchanged(version="0.63.0", reason="Accepts TxBytes")
+    def new_sign_secure(self, tx_data: Union[str, TxBytes]) -> SuiSignature:
         """New secure sign with intent."""
         assert self.private_key, "Can not sign with invalid private key"
         sig = bytearray(self.private_key.sign_secure(tx_data))
@@ -412,7 +414,7 @@ class MultiSig(BaseMultiSig):
 
     @versionadded(version="0.21.1", reason="Support for inline multisig signing")
     def _compressed_signatures(
-        self, tx_bytes: str, key_indices: list[int]
+        self, tx_bytes: Union[str, TxBytes], key_indices: list[int]
     ) -> list[MsCompressedSig]:
         """Creates compressed signatures from each of the signing keys present."""
         compressed: list[MsCompressedSig] = []
@@ -431,16 +433,21 @@ class MultiSig(BaseMultiSig):
         version="0.31.0",
         reason="Roaring bitmap no longer required in Sui 1.4.x and above.",
     )
+    @versionchanged(version="0.63.0", reason="Accepts TxBytes")
     def sign(
-        self, tx_bytes: Union[str, SuiTxBytes], pub_keys: list[SuiPublicKey]
+        self,
+        tx_bytes: Union[str, SuiTxBytes, TxBytes],
+        pub_keys: list[SuiPublicKey],
     ) -> SuiSignature:
         """sign Signs transaction bytes for operation that changes objects owned by MultiSig address."""
         # Validate the pub_keys alignment with self._keys
         # key_indices = self._validate_signers(pub_keys)
         # Generate BCS compressed signatures for the subset of keys
-        tx_bytes = tx_bytes if isinstance(tx_bytes, str) else tx_bytes.value  # type: ignore
+        # TxBytes is passed through so each key reuses the one base64 encoding
+        if isinstance(tx_bytes, SuiTxBytes):
+            tx_bytes = tx_bytes.value  # type: ignore
         compressed_sigs: list[MsCompressedSig] = self._compressed_signatures(
-            str(tx_bytes), self.validate_signers(pub_keys)
+            tx_bytes, self.validate_signers(pub_keys)
         )
         return self._signature(pub_keys, compressed_sigs)
 
@@ -633,20 +640,42 @@ def keypair_from_keystring(keystring: str) -> SuiKeyPair:
     return SuiKeyPair.from_b64(keystring)
 
 
+@versionadded(version="0.63.0", reason="Precomputed keystore address index")
+def keystring_digest(keystring: str) -> str:
+    """keystring_digest Return the address index key of a keystring.
+
+    :param keystring: The keystring
+    :type keystring: str
+    :return: The hex sha256 digest of the keystring
+    :rtype: str
+    """
+    return hashlib.sha256(keystring.encode()).hexdigest()
+
+
 @versionchanged(
     version="0.41.0",
     reason="Replace cross-reference matrix instead of individual dicts on return",
 )
+@versionchanged(
+    version="0.63.0",
+    reason="Keystrings in address_index are loaded without deriving their keypair",
+)
 def load_keys_and_addresses(
     keystore_file: str,
+    address_index: Optional[dict[str, list[str]]] = None,
 ) -> Union[
     list[list[dict]],
     Exception,
 ]:
     """load_keys_and_addresses Load keys and addresses.
 
+    Keystrings found in the address index get their public key and address from
+    it, their KeyPair is left None to be derived on first use.
+
     :param keystore_file: The current in use keystore file path
     :type keystore_file: str
+    :param address_index: Map of keystring_digest to [public key string, address], defaults to None
+    :type address_index: Optional[dict[str, list[str]]], optional
     :raises SuiNoKeyPairs: If empty
     :raises SuiKeystoreFileError: If error reading file
     :raises SuiKeystoreAddressError: JSON error loading keyfile
@@ -660,8 +689,21 @@ def load_keys_and_addresses(
                 _keystrings = json.load(keyfile)
                 _cref_matrix: list[list[dict]] = []
                 if len(_keystrings) > 0:
+                    address_index = address_index or {}
                     for keystr in _keystrings:
                         crm_entry = [{}]
+                        indexed = address_index.get(keystring_digest(keystr))
+                        if indexed:
+                            puks, addy_str = indexed
+                            crm_entry.extend(
+                                [
+                                    {keystr: None},
+                                    {puks: keystr},
+                                    {addy_str: SuiAddress(addy_str)},
+                                ]
+                            )
+                            _cref_matrix.append(crm_entry)
+                            continue
                         kpair = keypair_from_keystring(keystr)
                         puks = base64.b64encode(
                             kpair.public_key.scheme_and_key()
@@ -31,6 +31,7 @@ from pysui import SuiConfig, SuiRpcResult
 from pysui.sui.sui_pgql.pgql_validators import TypeValidator
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 from pysui.sui.sui_pgql.pgql_configs import pgql_config, SuiConfigGQL
+from pysui.sui.sui_pgql.pgql_objref_cache import ObjectRefCache
 import pysui.sui.sui_constants as cnst
 
 # Standard library logging setup
@@ -150,6 +151,8 @@ class BaseSuiGQLClient:
         rpc_config: SuiConfigGQL,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        object_cache: Optional[ObjectRefCache] = None,
+        lazy_decode: Optional[bool] = False,
     ):
         """."""
 
@@ -161,6 +164,8 @@ class BaseSuiGQLClient:
         self._schema: DSLSchema = schema
         self._rpc_config: SuiConfigGQL = rpc_config
         self._default_header = default_header if default_header else {"headers": None}
+        self._object_cache: Optional[ObjectRefCache] = object_cache
+        self._lazy_decode: bool = bool(lazy_decode)
         # Schema persist
         if write_schema:
             fname = f"./{self._rpc_config.gqlEnvironment}_schema-{version}.graphql"
@@ -172,6 +177,26 @@ class BaseSuiGQLClient:
         """Fetch the graphql client."""
         return self._sui_config
 
+    @property
+    def object_cache(self) -> Union[ObjectRefCache, None]:
+        """Fetch the object reference cache, if enabled."""
+        return self._object_cache
+
+    @property
+    def lazy_decode(self) -> bool:
+        """Fetch whether results are decoded on first access of result_data."""
+        return self._lazy_decode
+
+    def _result_for(
+        self, sres: dict, encode_fn: Optional[Callable[[dict], Any]]
+    ) -> SuiRpcResult:
+        """Wrap a successful response, decoding now or on first access."""
+        if not encode_fn:
+            return SuiRpcResult(True, None, sres)
+        if self._lazy_decode:
+            return SuiRpcResult(True, None, sres, decode_fn=encode_fn)
+        return SuiRpcResult(True, None, encode_fn(sres))
+
     @property
     def current_gas_price(self) -> int:
         """Fetch the current epoch gas price."""
@@ -275,6 +300,8 @@ class SuiGQLClient(BaseSuiGQLClient):
         schema_version: Optional[str] = None,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        object_cache: Optional[ObjectRefCache] = None,
+        lazy_decode: Optional[bool] = False,
     ):
         """Sui GraphQL Client initializer."""
         # Resolve GraphQL URL
@@ -304,6 +331,8 @@ class SuiGQLClient(BaseSuiGQLClient):
             rpc_config=_rpc_config,
             write_schema=write_schema,
             default_header=default_header,
+            object_cache=object_cache,
+            lazy_decode=lazy_decode,
         )
 
     @versionadded(
@@ -334,7 +363,7 @@ class SuiGQLClient(BaseSuiGQLClient):
             hdr = self.client_headers
             hdr = hdr if not with_headers else hdr.update(with_headers)
             sres = self.client.execute(node, extra_args=hdr)
-            return SuiRpcResult(True, None, sres if not encode_fn else encode_fn(sres))
+            return self._result_for(sres, encode_fn)
 
         except texc.TransportQueryError as gte:
             return SuiRpcResult(
@@ -418,7 +447,12 @@ class SuiGQLClient(BaseSuiGQLClient):
             if isinstance(qdoc_node, PGQL_NoOp):
                 return SuiRpcResult(True, None, pgql_type.NoopGQL.from_query())
             encode_fn = encode_fn or with_node.encode_fn()
-            return self._execute(qdoc_node, schema_constraint, with_headers, encode_fn)
+            result = self._execute(
+                qdoc_node, schema_constraint, with_headers, encode_fn
+            )
+            if self._object_cache is not None:
+                self._object_cache.observe(result, encode_fn)
+            return result
         except ValueError as ve:
             return SuiRpcResult(
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
@@ -435,6 +469,8 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
         schema_version: Optional[str] = None,
         write_schema: Optional[bool] = False,
         default_header: Optional[dict] = None,
+        object_cache: Optional[ObjectRefCache] = None,
+        lazy_decode: Optional[bool] = False,
     ):
         """Async Sui GraphQL Client initializer."""
         gurl, genv = BaseSuiGQLClient._resolve_url(config, schema_version)
@@ -472,6 +508,8 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             rpc_config=_rpc_config,
             write_schema=write_schema,
             default_header=default_header,
+            object_cache=object_cache,
+            lazy_decode=lazy_decode,
         )
         self._session = None
         self._slock = asyncio.Semaphore()
@@ -511,15 +549,18 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
         :rtype: SuiRpcResult
         """
         try:
-            async with self._slock:
-                if not self.session:
-                    self._session = await self.client.connect_async(reconnecting=True)
-                hdr = self.client_headers
-                hdr = hdr if not with_headers else hdr.update(with_headers)
-                sres = await self.session.execute(node, extra_args=hdr)
-                return SuiRpcResult(
-                    True, None, sres if not encode_fn else encode_fn(sres)
-                )
+            # Only establishing the session is serialized, requests on
+            # an established session may run concurrently
+            if not self.session:
+                async with self._slock:
+                    if not self.session:
+                        self._session = await self.client.connect_async(
+                            reconnecting=True
+                        )
+            hdr = self.client_headers
+            hdr = hdr if not with_headers else hdr.update(with_headers)
+            sres = await self.session.execute(node, extra_args=hdr)
+            return self._result_for(sres, encode_fn)
             # async with self.client as aclient:
             #     sres = await aclient.execute(node, extra_args=hdr)
             #     return SuiRpcResult(
@@ -608,9 +649,12 @@ class AsyncSuiGQLClient(BaseSuiGQLClient):
             if isinstance(qdoc_node, PGQL_NoOp):
                 return SuiRpcResult(True, None, pgql_type.NoopGQL.from_query())
             encode_fn = encode_fn or with_node.encode_fn()
-            return await self._execute(
+            result = await self._execute(
                 qdoc_node, schema_constraint, with_headers, encode_fn
             )
+            if self._object_cache is not None:
+                self._object_cache.observe(result, encode_fn)
+            return result
         except ValueError as ve:
             return SuiRpcResult(
                 False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
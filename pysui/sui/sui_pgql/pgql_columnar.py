@@ -0,0 +1,498 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui columnar accumulation of paginated GraphQL query results.
+
+Rows are appended from the raw query results into typed column buffers without
+constructing the result dataclasses. Integer columns (balances, versions,
+sequence numbers and timestamps as epoch milliseconds) are `array.array`
+buffers, repeated strings (types, modules, senders, statuses) are interned as
+integer codes into a per column category list and other strings are kept as
+lists. When NumPy is installed the columns can be exported as NumPy arrays or
+a single structured array.
+"""
+
+from abc import ABC, abstractmethod
+import array
+import calendar
+import copy
+import re
+from typing import Any, Callable, Optional, Union
+
+from deprecated.sphinx import versionadded
+
+from pysui.sui.sui_pgql.pgql_clients import (
+    AsyncSuiGQLClient,
+    PGQL_QueryNode,
+    SuiGQLClient,
+)
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _raw(in_data: dict) -> dict:
+    """Leave the query result undecoded."""
+    return in_data
+
+
+# ISO 8601 date and time, any count of fraction digits and an optional offset
+_ISO_TIMESTAMP = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+
+def _epoch_ms(timestamp: Optional[str]) -> int:
+    """Convert an ISO 8601 timestamp to epoch milliseconds, 0 if absent.
+
+    Unlike `datetime.fromisoformat` before Python 3.11 the 'Z' suffix and
+    fractions of any digit count (e.g. '12.5Z') are accepted. Timestamps
+    without an offset are UTC.
+    """
+    if not timestamp:
+        return 0
+    parts = _ISO_TIMESTAMP.match(timestamp)
+    if parts is None:
+        raise ValueError(f"Invalid ISO 8601 timestamp {timestamp}")
+    *date_time, fraction, offset = parts.groups()
+    seconds = calendar.timegm(tuple(int(x) for x in date_time))
+    if offset and offset != "Z":
+        offset = offset.replace(":", "")
+        sign = -1 if offset[0] == "-" else 1
+        seconds -= sign * (int(offset[1:3]) * 3600 + int(offset[3:5]) * 60)
+    return seconds * 1000 + int((fraction or "0")[:3].ljust(3, "0"))
+
+
+class _IntColumn:
+    """Integer column in an array.array buffer."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, typecode: str):
+        """Initialize with the array typecode."""
+        self.values = array.array(typecode)
+
+    def append(self, value: Any) -> None:
+        """Append a value, None appends 0."""
+        self.values.append(int(value) if value is not None else 0)
+
+    def export(self, use_numpy: bool) -> Any:
+        """Column data, as a NumPy array if requested."""
+        if use_numpy:
+            # Copied, a buffer export would prevent the array from growing
+            return np.frombuffer(self.values, dtype=self.values.typecode).copy()
+        return self.values
+
+
+class _TimeColumn(_IntColumn):
+    """Timestamps as epoch milliseconds."""
+
+    __slots__ = ("_last",)
+
+    def __init__(self):
+        """Initialize an int64 column."""
+        super().__init__("q")
+        self._last: tuple[Optional[str], int] = (None, 0)
+
+    def append(self, value: Any) -> None:
+        """Append a timestamp string, consecutive repeats are parsed once."""
+        if value != self._last[0]:
+            self._last = (value, _epoch_ms(value))
+        self.values.append(self._last[1])
+
+
+class _InternedColumn:
+    """Repeated strings as uint32 codes into a category list."""
+
+    __slots__ = ("values", "categories", "_codes")
+
+    def __init__(self):
+        """Initialize empty codes and categories."""
+        self.values = array.array("I")
+        self.categories: list[Optional[str]] = []
+        self._codes: dict[Optional[str], int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        """Append the code of value, adding a category if new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        self.values.append(code)
+
+    def export(self, use_numpy: bool) -> Any:
+        """Column codes, as a NumPy array if requested."""
+        if use_numpy:
+            # Copied, a buffer export would prevent the array from growing
+            return np.frombuffer(self.values, dtype=self.values.typecode).copy()
+        return self.values
+
+
+class _ObjectColumn:
+    """Column of arbitrary values."""
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        """Initialize an empty column."""
+        self.values: list = []
+
+    def append(self, value: Any) -> None:
+        """Append a value."""
+        self.values.append(value)
+
+    def export(self, use_numpy: bool) -> Any:
+        """Column values, a NumPy object array if requested."""
+        if use_numpy:
+            result = np.empty(len(self.values), dtype=object)
+            result[:] = self.values
+            return result
+        return self.values
+
+
+def _column_for(kind: str) -> Union[_IntColumn, _InternedColumn, _ObjectColumn]:
+    """Create a column for a schema kind."""
+    match kind:
+        case "u64":
+            return _IntColumn("Q")
+        case "u32":
+            return _IntColumn("I")
+        case "time":
+            return _TimeColumn()
+        case "interned":
+            return _InternedColumn()
+        case _:
+            return _ObjectColumn()
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+class ColumnarPages(ABC):
+    """Base accumulator of paginated query results into column buffers.
+
+    Subclasses declare the column schema as (name, kind, getter) tuples where
+    kind is one of 'u64', 'u32', 'time' (epoch milliseconds), 'interned' or
+    'object' and getter extracts the value from a raw result node.
+    """
+
+    _SCHEMA: tuple[tuple[str, str, Callable[[dict], Any]], ...] = ()
+
+    def __init__(self):
+        """__init__ Initialize empty columns."""
+        self._columns: dict[str, Any] = {}
+        self._appenders: list[tuple[Callable, Callable]] = []
+        self._rows = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        """Create empty columns of the schema."""
+        self._columns = {name: _column_for(kind) for name, kind, _ in self._SCHEMA}
+        self._appenders = [
+            (self._columns[name].append, getter) for name, _, getter in self._SCHEMA
+        ]
+        self._rows = 0
+
+    def __len__(self) -> int:
+        """Count of rows accumulated."""
+        return self._rows
+
+    @staticmethod
+    @abstractmethod
+    def _page(in_data: dict) -> tuple[dict, list[dict]]:
+        """Return the page cursor and nodes of a raw query result."""
+
+    def add_page(self, in_data: dict) -> pgql_type.PagingCursor:
+        """add_page Append the rows of a raw query result page.
+
+        :param in_data: The undecoded query result
+        :type in_data: dict
+        :return: The page cursor
+        :rtype: pgql_type.PagingCursor
+        """
+        cursor, nodes = self._page(in_data)
+        appenders = self._appenders
+        for node in nodes:
+            for append, getter in appenders:
+                append(getter(node))
+        self._rows += len(nodes)
+        return pgql_type._from_dict(pgql_type.PagingCursor, cursor or {})
+
+    def categories(self, name: str) -> list[Optional[str]]:
+        """categories Return the strings the codes of an interned column index.
+
+        :param name: The interned column name
+        :type name: str
+        :return: Category strings in code order
+        :rtype: list[Optional[str]]
+        """
+        return self._columns[name].categories
+
+    def columns(
+        self, *, use_numpy: Optional[bool] = None
+    ) -> dict[str, Union[array.array, list, Any]]:
+        """columns Return the column data by name.
+
+        Interned columns are returned as codes, see `categories`.
+
+        :param use_numpy: Return NumPy arrays, defaults to True if NumPy is installed
+        :type use_numpy: Optional[bool], optional
+        :return: Column name to array.array or list, or to NumPy array
+        :rtype: dict[str, Union[array.array, list, Any]]
+        """
+        use_numpy = np is not None if use_numpy is None else use_numpy
+        if use_numpy and np is None:
+            raise ImportError("numpy is required for use_numpy")
+        return {
+            name: column.export(use_numpy) for name, column in self._columns.items()
+        }
+
+    def to_numpy(self) -> Any:
+        """to_numpy Return the rows as a NumPy structured array.
+
+        Interned columns hold uint32 codes, see `categories`.
+
+        :return: Structured array with a field per column
+        :rtype: numpy.ndarray
+        """
+        if np is None:
+            raise ImportError("numpy is required for to_numpy")
+        arrays = self.columns(use_numpy=True)
+        result = np.empty(
+            self._rows, dtype=[(name, arr.dtype) for name, arr in arrays.items()]
+        )
+        for name, arr in arrays.items():
+            result[name] = arr
+        return result
+
+    def clear(self) -> None:
+        """clear Drop all rows and categories."""
+        self._reset()
+
+
+def _nested(*keys: str) -> Callable[[dict], Any]:
+    """Getter of a nested value, None if any level is absent."""
+
+    def _get(node: dict) -> Any:
+        for key in keys:
+            node = node.get(key) if node else None
+        return node
+
+    return _get
+
+
+def _owner_address(node: dict) -> Optional[str]:
+    """Address of an AddressOwner, parent id of a Parent owner."""
+    owner: dict = node.get("owner") or {}
+    inner: dict = owner.get("owner") or {}
+    return inner.get("address_id") or inner.get("parent_id")
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+class EventColumns(ColumnarPages):
+    """Columns of `GetEvents` pages.
+
+    The event json is kept only if `include_json` is set.
+    """
+
+    _SCHEMA = (
+        ("timestamp", "time", _nested("timestamp")),
+        (
+            "package_id",
+            "interned",
+            _nested("sendingModule", "package", "package_id"),
+        ),
+        ("module_name", "interned", _nested("sendingModule", "module_name")),
+        ("event_type", "interned", _nested("type", "event_type")),
+        ("sender", "interned", _nested("sender", "address")),
+    )
+
+    def __init__(self, *, include_json: Optional[bool] = False):
+        """__init__ Initialize empty columns.
+
+        :param include_json: Add the event json column, defaults to False
+        :type include_json: Optional[bool], optional
+        """
+        if include_json:
+            self._SCHEMA = EventColumns._SCHEMA + (
+                ("json", "object", _nested("json")),
+            )
+        super().__init__()
+
+    @staticmethod
+    def _page(in_data: dict) -> tuple[dict, list[dict]]:
+        """Return the page cursor and nodes of a raw query result."""
+        events = in_data.get("events") or {}
+        return events.get("cursor"), events.get("events") or []
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+class TransactionColumns(ColumnarPages):
+    """Columns of `GetFilteredTx` pages."""
+
+    _SCHEMA = (
+        ("digest", "object", _nested("digest")),
+        ("tx_kind", "interned", _nested("kind", "tx_kind")),
+        ("status", "interned", _nested("effects", "status")),
+        ("timestamp", "time", _nested("effects", "timestamp")),
+    )
+
+    @staticmethod
+    def _page(in_data: dict) -> tuple[dict, list[dict]]:
+        """Return the page cursor and nodes of a raw query result."""
+        tx_blocks = in_data.get("transactionBlocks") or {}
+        return tx_blocks.get("cursor"), tx_blocks.get("tx_blocks") or []
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+class CoinColumns(ColumnarPages):
+    """Columns of `GetCoins` pages."""
+
+    _SCHEMA = (
+        ("coin_object_id", "object", _nested("coin_object_id")),
+        ("version", "u64", _nested("version")),
+        ("balance", "u64", _nested("balance")),
+        ("coin_type", "interned", _nested("contents", "type", "coin_type")),
+        ("owner_kind", "interned", _nested("owner", "obj_owner_kind")),
+        ("owner", "interned", _owner_address),
+        ("object_digest", "object", _nested("object_digest")),
+        (
+            "previous_transaction",
+            "object",
+            _nested("previousTransactionBlock", "previous_transaction"),
+        ),
+    )
+
+    @staticmethod
+    def _page(in_data: dict) -> tuple[dict, list[dict]]:
+        """Return the page cursor and nodes of a raw query result."""
+        coins = _nested("qres", "coins")(in_data) or {}
+        return coins.get("cursor"), coins.get("coin_objects") or []
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+class CheckpointColumns(ColumnarPages):
+    """Columns of `GetCheckpoints` pages.
+
+    The checkpoint transaction blocks are paged separately from the checkpoint,
+    per checkpoint counts are taken from `network_total_transactions`, see
+    `transaction_counts`.
+    """
+
+    _SCHEMA = (
+        ("sequence_number", "u64", _nested("sequenceNumber")),
+        ("digest", "object", _nested("digest")),
+        ("timestamp", "time", _nested("timestamp")),
+        ("network_total_transactions", "u64", _nested("networkTotalTransactions")),
+        ("previous_checkpoint_digest", "object", _nested("previousCheckpointDigest")),
+    )
+
+    def transaction_counts(self) -> dict[int, int]:
+        """transaction_counts Return the transaction count of checkpoints.
+
+        A checkpoint's count is its network total less that of the preceding
+        checkpoint, so only checkpoints whose predecessor is also accumulated
+        have a count.
+
+        :return: Checkpoint sequence number to count of transactions
+        :rtype: dict[int, int]
+        """
+        totals = dict(
+            zip(
+                self._columns["sequence_number"].values,
+                self._columns["network_total_transactions"].values,
+            )
+        )
+        return {
+            seq: total - totals[seq - 1]
+            for seq, total in sorted(totals.items())
+            if seq - 1 in totals
+        }
+
+    @staticmethod
+    def _page(in_data: dict) -> tuple[dict, list[dict]]:
+        """Return the page cursor and nodes of a raw query result."""
+        checkpoints = in_data.get("checkpoints") or {}
+        return checkpoints.get("cursor"), checkpoints.get("checkpoints") or []
+
+
+def _next_node(
+    columns: ColumnarPages,
+    node: PGQL_QueryNode,
+    result: Any,
+    pages: int,
+    max_pages: Optional[int],
+) -> Optional[PGQL_QueryNode]:
+    """Accumulate a result page and return the query node of the next page."""
+    if result.is_err():
+        raise ValueError(f"Query failed {result.result_string}: {result.result_data}")
+    cursor = columns.add_page(result.result_data)
+    if not cursor.hasNextPage or (max_pages and pages >= max_pages):
+        return None
+    node = copy.copy(node)
+    node.next_page = cursor
+    return node
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+def fetch_columns(
+    client: SuiGQLClient,
+    node: PGQL_QueryNode,
+    columns: ColumnarPages,
+    *,
+    max_pages: Optional[int] = None,
+) -> ColumnarPages:
+    """fetch_columns Page through a query appending each page to columns.
+
+    :param client: The synchronous GraphQL client
+    :type client: SuiGQLClient
+    :param node: A paged query node (GetEvents, GetFilteredTx, GetCoins or GetCheckpoints)
+    :type node: PGQL_QueryNode
+    :param columns: The accumulator matching the query node
+    :type columns: ColumnarPages
+    :param max_pages: Stop after this many pages, defaults to None (all pages)
+    :type max_pages: Optional[int], optional
+    :raises ValueError: If a query fails
+    :return: The columns argument
+    :rtype: ColumnarPages
+    """
+    pages = 0
+    while node:
+        result = client.execute_query_node(with_node=node, encode_fn=_raw)
+        pages += 1
+        node = _next_node(columns, node, result, pages, max_pages)
+    return columns
+
+
+@versionadded(version="0.63.0", reason="Columnar export of paginated results")
+async def async_fetch_columns(
+    client: AsyncSuiGQLClient,
+    node: PGQL_QueryNode,
+    columns: ColumnarPages,
+    *,
+    max_pages: Optional[int] = None,
+) -> ColumnarPages:
+    """async_fetch_columns Page through a query appending each page to columns.
+
+    :param client: The asynchronous GraphQL client
+    :type client: AsyncSuiGQLClient
+    :param node: A paged query node (GetEvents, GetFilteredTx, GetCoins or GetCheckpoints)
+    :type node: PGQL_QueryNode
+    :param columns: The accumulator matching the query node
+    :type columns: ColumnarPages
+    :param max_pages: Stop after this many pages, defaults to None (all pages)
+    :type max_pages: Optional[int], optional
+    :raises ValueError: If a query fails
+    :return: The columns argument
+    :rtype: ColumnarPages
+    """
+    pages = 0
+    while node:
+        result = await client.execute_query_node(with_node=node, encode_fn=_raw)
+        pages += 1
+        node = _next_node(columns, node, result, pages, max_pages)
+    return columns
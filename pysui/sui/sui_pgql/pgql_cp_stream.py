@@ -0,0 +1,296 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui checkpoint ingestion stream that leverages Sui GraphQL.
+
+Checkpoint ranges are fetched in parallel by worker tasks, each claiming the
+next window of sequence numbers and fetching it with one `GetCheckpointRange`
+query. Fetched checkpoints are reordered and delivered strictly in sequence
+order. Workers do not claim windows beyond `max_buffered` checkpoints ahead of
+delivery so memory stays bounded when the consumer is slower than the fetch.
+The last processed sequence number is saved to a progress store to resume from.
+"""
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import AsyncGenerator, AsyncIterator, Optional, Union
+
+from deprecated.sphinx import versionadded
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Standard library logging setup
+logger = logging.getLogger("pysui.pgql_cp_stream")
+if not logging.getLogger().handlers:
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+
+@versionadded(version="0.63.0", reason="Checkpoint ingestion")
+class CheckpointProgress:
+    """In memory store of the last processed checkpoint sequence number.
+
+    Subclass and override `load` and `save` to persist elsewhere.
+    """
+
+    def __init__(self):
+        """__init__ CheckpointProgress initializer."""
+        self._last: Optional[int] = None
+
+    def load(self) -> Optional[int]:
+        """load Return the last processed sequence number.
+
+        :return: The sequence number, None if nothing was processed
+        :rtype: Optional[int]
+        """
+        return self._last
+
+    def save(self, sequence_number: int) -> None:
+        """save Record the last processed sequence number.
+
+        :param sequence_number: The sequence number
+        :type sequence_number: int
+        """
+        self._last = sequence_number
+
+
+@versionadded(version="0.63.0", reason="Checkpoint ingestion")
+class FileCheckpointProgress(CheckpointProgress):
+    """Last processed checkpoint sequence number kept in a file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """__init__ FileCheckpointProgress initializer.
+
+        :param path: The progress file path
+        :type path: Union[str, Path]
+        """
+        super().__init__()
+        self._path = Path(path)
+
+    def load(self) -> Optional[int]:
+        """load Return the last processed sequence number from the file.
+
+        :return: The sequence number, None if the file does not exist
+        :rtype: Optional[int]
+        """
+        if self._path.exists():
+            return int(self._path.read_text(encoding="utf8").strip())
+        return None
+
+    def save(self, sequence_number: int) -> None:
+        """save Atomically write the last processed sequence number to the file.
+
+        :param sequence_number: The sequence number
+        :type sequence_number: int
+        """
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_text(str(sequence_number), encoding="utf8")
+        os.replace(temp_path, self._path)
+
+
+@versionadded(version="0.63.0", reason="Checkpoint ingestion")
+class AsyncCheckpointStream:
+    """Ordered stream of checkpoints fetched in parallel windows.
+
+    Iterate with `async for`. A checkpoint is considered processed when the
+    next one is requested, progress is saved every `save_every` processed
+    checkpoints and when the iteration ends so a resumed stream delivers the
+    unprocessed checkpoint again. Without an `end` the stream follows the
+    chain, polling for new checkpoints.
+
+    Leaving the loop early does not end the iteration, use `aclose` (e.g.
+    ``async with contextlib.aclosing(stream)``) to stop the workers and save.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSuiGQLClient,
+        *,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        workers: Optional[int] = 4,
+        batch_size: Optional[int] = 10,
+        max_buffered: Optional[int] = None,
+        progress: Optional[CheckpointProgress] = None,
+        save_every: Optional[int] = 100,
+        poll_interval: Optional[float] = 1.0,
+        retries: Optional[int] = 3,
+    ):
+        """__init__ AsyncCheckpointStream initializer.
+
+        :param client: The asynchronous GraphQL client
+        :type client: AsyncSuiGQLClient
+        :param start: First sequence number when progress has none saved, defaults to None (latest checkpoint)
+        :type start: Optional[int], optional
+        :param end: Last sequence number (inclusive), defaults to None (follow the chain)
+        :type end: Optional[int], optional
+        :param workers: Number of concurrent fetch workers, defaults to 4
+        :type workers: Optional[int], optional
+        :param batch_size: Checkpoints per window (one query), defaults to 10
+        :type batch_size: Optional[int], optional
+        :param max_buffered: Maximum checkpoints fetched ahead of delivery, defaults to None (2 * workers * batch_size)
+        :type max_buffered: Optional[int], optional
+        :param progress: Store of the last processed sequence number, defaults to None (in memory)
+        :type progress: Optional[CheckpointProgress], optional
+        :param save_every: Processed checkpoints between progress saves, defaults to 100
+        :type save_every: Optional[int], optional
+        :param poll_interval: Seconds between polls at the chain head and base retry delay, defaults to 1.0
+        :type poll_interval: Optional[float], optional
+        :param retries: Retries of a failed window query, defaults to 3
+        :type retries: Optional[int], optional
+        """
+        self._client = client
+        self._start = start
+        self._end = end
+        self._workers = max(1, workers)
+        self._batch_size = max(1, batch_size)
+        self._max_buffered = max(
+            max_buffered or 2 * self._workers * self._batch_size, self._batch_size
+        )
+        self._progress = progress or CheckpointProgress()
+        self._save_every = max(1, save_every)
+        self._poll_interval = poll_interval
+        self._retries = retries
+        self._cond = asyncio.Condition()
+        self._buffer: dict[int, pgql_type.CheckpointGQL] = {}
+        self._next_window: int = 0
+        self._next_seq: int = 0
+        self._error: Optional[Exception] = None
+        self._iterator: Optional[AsyncGenerator] = None
+
+    @property
+    def progress(self) -> CheckpointProgress:
+        """Return the progress store."""
+        return self._progress
+
+    @property
+    def next_sequence(self) -> int:
+        """Return the sequence number of the next checkpoint to deliver."""
+        return self._next_seq
+
+    @property
+    def buffered(self) -> int:
+        """Return the count of fetched checkpoints awaiting delivery."""
+        return len(self._buffer)
+
+    async def _first_sequence(self) -> int:
+        """Resume after saved progress, else start, else the latest checkpoint."""
+        last = self._progress.load()
+        if last is not None:
+            return last + 1
+        if self._start is not None:
+            return self._start
+        result = await self._client.execute_query_node(
+            with_node=qn.GetLatestCheckpointSequence()
+        )
+        if result.is_err():
+            raise ValueError(f"Latest checkpoint failed: {result.result_string}")
+        return result.result_data.sequence_number
+
+    async def _fetch(self, start: int, count: int) -> list[pgql_type.CheckpointGQL]:
+        """Fetch a range of checkpoints, retrying with backoff on failure."""
+        for attempt in range(self._retries + 1):
+            result = await self._client.execute_query_node(
+                with_node=qn.GetCheckpointRange(start=start, count=count)
+            )
+            if result.is_ok():
+                return result.result_data.data
+            logger.warning(
+                f"Checkpoints {start}+{count} attempt {attempt + 1} failed: "
+                f"{result.result_string}"
+            )
+            await asyncio.sleep(self._poll_interval * 2**attempt)
+        raise ValueError(f"Checkpoints {start}+{count} failed: {result.result_string}")
+
+    async def _fetch_window(self, start: int, count: int) -> None:
+        """Fetch a window into the buffer, polling for any not yet produced."""
+        while count:
+            fetched = {x.sequence_number: x for x in await self._fetch(start, count)}
+            async with self._cond:
+                self._buffer.update(fetched)
+                self._cond.notify_all()
+            # Checkpoints beyond the chain head are absent, retry from the first
+            while count and start in fetched:
+                start += 1
+                count -= 1
+            if count:
+                await asyncio.sleep(self._poll_interval)
+
+    def _can_claim(self) -> bool:
+        """Check if the next window is within end and the buffer bound."""
+        if self._end is not None and self._next_window > self._end:
+            return True
+        return self._next_window + self._batch_size <= (
+            self._next_seq + self._max_buffered
+        )
+
+    async def _worker(self) -> None:
+        """Claim and fetch windows until end is reached."""
+        try:
+            while True:
+                async with self._cond:
+                    await self._cond.wait_for(self._can_claim)
+                    start = self._next_window
+                    if self._end is not None and start > self._end:
+                        return
+                    count = self._batch_size
+                    if self._end is not None:
+                        count = min(count, self._end - start + 1)
+                    self._next_window += count
+                await self._fetch_window(start, count)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            async with self._cond:
+                self._error = exc
+                self._cond.notify_all()
+
+    def _save(self, sequence_number: int) -> None:
+        """Save progress."""
+        self._progress.save(sequence_number)
+        logger.debug(f"Saved checkpoint progress {sequence_number}")
+
+    async def _stream(self) -> AsyncGenerator[pgql_type.CheckpointGQL, None]:
+        """Deliver checkpoints in order while workers fetch ahead."""
+        self._next_seq = self._next_window = await self._first_sequence()
+        self._buffer.clear()
+        self._error = None
+        tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+        processed: Optional[int] = None
+        saved: Optional[int] = self._progress.load()
+        try:
+            while self._end is None or self._next_seq <= self._end:
+                async with self._cond:
+                    await self._cond.wait_for(
+                        lambda: self._next_seq in self._buffer or self._error
+                    )
+                    if self._error:
+                        raise self._error
+                    checkpoint = self._buffer.pop(self._next_seq)
+                    self._next_seq += 1
+                    self._cond.notify_all()
+                yield checkpoint
+                processed = checkpoint.sequence_number
+                if saved is None or processed - saved >= self._save_every:
+                    self._save(processed)
+                    saved = processed
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if processed is not None and processed != saved:
+                self._save(processed)
+
+    def __aiter__(self) -> AsyncIterator[pgql_type.CheckpointGQL]:
+        """Iterate the ordered checkpoints."""
+        self._iterator = self._stream()
+        return self._iterator
+
+    async def aclose(self) -> None:
+        """aclose End the iteration, stopping the workers and saving progress."""
+        if self._iterator is not None:
+            await self._iterator.aclose()
+            self._iterator = None
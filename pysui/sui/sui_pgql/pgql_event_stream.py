@@ -0,0 +1,349 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui resumable event stream that leverages Sui GraphQL.
+
+Events matching a filter are polled with `GetEvents` and handed to a handler.
+Polling is immediate while pages are full (more pending), at the minimum
+interval after a partial page and backs off to the maximum interval while no
+new events arrive or queries fail. The position (the cursor of the last handled
+event) is saved to a progress store after each handled event, so a restarted
+stream resumes after it. Delivery is at least once, only the event being
+handled when the stream stopped abnormally is redelivered.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from deprecated.sphinx import versionadded
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient, SuiGQLClient
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Standard library logging setup
+logger = logging.getLogger("pysui.pgql_event_stream")
+if not logging.getLogger().handlers:
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+
+@versionadded(version="0.63.0", reason="Resumable event streaming")
+class EventStreamProgress:
+    """In memory store of an event stream position.
+
+    The state is a dict with the "cursor" of the last handled event. Subclass
+    and override `load` and `save` to persist elsewhere.
+    """
+
+    def __init__(self):
+        """__init__ EventStreamProgress initializer."""
+        self._state: Optional[dict] = None
+
+    def load(self) -> Optional[dict]:
+        """load Return the saved state.
+
+        :return: The state, None if nothing was saved
+        :rtype: Optional[dict]
+        """
+        return self._state
+
+    def save(self, state: dict) -> None:
+        """save Record the state.
+
+        :param state: The state
+        :type state: dict
+        """
+        self._state = state
+
+
+@versionadded(version="0.63.0", reason="Resumable event streaming")
+class FileEventStreamProgress(EventStreamProgress):
+    """Event stream position kept in a JSON file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """__init__ FileEventStreamProgress initializer.
+
+        :param path: The progress file path
+        :type path: Union[str, Path]
+        """
+        super().__init__()
+        self._path = Path(path)
+
+    def load(self) -> Optional[dict]:
+        """load Return the state from the file.
+
+        :return: The state, None if the file does not exist
+        :rtype: Optional[dict]
+        """
+        if self._path.exists():
+            return json.loads(self._path.read_text(encoding="utf8"))
+        return None
+
+    def save(self, state: dict) -> None:
+        """save Atomically write the state to the file.
+
+        :param state: The state
+        :type state: dict
+        """
+        temp_path = self._path.with_name(self._path.name + ".tmp")
+        temp_path.write_text(json.dumps(state), encoding="utf8")
+        os.replace(temp_path, self._path)
+
+
+class _EventStreamBase:
+    """Polling and position state shared by the sync and async streams."""
+
+    def __init__(
+        self,
+        *,
+        event_filter: dict,
+        progress: Optional[EventStreamProgress],
+        start_cursor: Optional[str],
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+        max_errors: Optional[int],
+    ):
+        """Initialize from saved progress, else start_cursor."""
+        self._event_filter = event_filter
+        self._progress = progress or EventStreamProgress()
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_errors = max_errors
+        self._errors = 0
+        self._interval = min_interval
+        self._stopped = False
+        state = self._progress.load() or {}
+        self._cursor: Optional[str] = state.get("cursor", start_cursor)
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """Return the cursor of the last handled event."""
+        return self._cursor
+
+    @property
+    def interval(self) -> float:
+        """Return the current poll interval in seconds."""
+        return self._interval
+
+    def stop(self) -> None:
+        """stop Stop the stream after the current event."""
+        self._stopped = True
+
+    def _node(self) -> qn.GetEvents:
+        """Query the events after the current position."""
+        return qn.GetEvents(
+            event_filter=self._event_filter,
+            next_page=(
+                pgql_type.PagingCursor(True, self._cursor) if self._cursor else None
+            ),
+            with_event_cursors=True,
+        )
+
+    def _back_off(self) -> None:
+        """Lengthen the interval, up to the maximum."""
+        self._interval = min(
+            max(self._interval, self._min_interval) * self._backoff,
+            self._max_interval,
+        )
+
+    def _page(self, result: Any) -> list[pgql_type.EventGQL]:
+        """Return the page events, adapting the interval to how full it was.
+
+        Failed queries are retried after backing off, the stream ends after
+        max_errors consecutive failures.
+        """
+        if result.is_err():
+            self._errors += 1
+            if self._max_errors is not None and self._errors >= self._max_errors:
+                raise ValueError(f"GetEvents failed: {result.result_string}")
+            logger.warning(
+                f"GetEvents failed ({self._errors}), retrying: {result.result_string}"
+            )
+            self._back_off()
+            return []
+        self._errors = 0
+        page: pgql_type.EventsGQL = result.result_data
+        if page.next_cursor.hasNextPage:
+            self._interval = 0.0
+        elif page.data:
+            self._interval = self._min_interval
+        else:
+            self._back_off()
+        return page.data
+
+    def _handled(self, event: pgql_type.EventGQL) -> None:
+        """Advance and save the position past a handled event."""
+        self._cursor = event.event_cursor
+        self._progress.save({"cursor": self._cursor})
+
+
+@versionadded(version="0.63.0", reason="Resumable event streaming")
+class EventStream(_EventStreamBase):
+    """Resumable event stream polled with the synchronous client."""
+
+    def __init__(
+        self,
+        client: SuiGQLClient,
+        *,
+        event_filter: dict,
+        progress: Optional[EventStreamProgress] = None,
+        start_cursor: Optional[str] = None,
+        min_interval: Optional[float] = 0.5,
+        max_interval: Optional[float] = 30.0,
+        backoff: Optional[float] = 2.0,
+        max_errors: Optional[int] = 10,
+    ):
+        """__init__ EventStream initializer.
+
+        :param client: The synchronous GraphQL client
+        :type client: SuiGQLClient
+        :param event_filter: Filter key/values aligned to Sui GraphQL schema's EventFilter
+        :type event_filter: dict
+        :param progress: Store of the stream position, defaults to None (in memory)
+        :type progress: Optional[EventStreamProgress], optional
+        :param start_cursor: Event cursor to start after when progress has none saved, defaults to None (first event)
+        :type start_cursor: Optional[str], optional
+        :param min_interval: Seconds between polls after a partial page, defaults to 0.5
+        :type min_interval: Optional[float], optional
+        :param max_interval: Maximum seconds between polls while idle, defaults to 30.0
+        :type max_interval: Optional[float], optional
+        :param backoff: Interval multiplier after each empty or failed poll, defaults to 2.0
+        :type backoff: Optional[float], optional
+        :param max_errors: Consecutive failed polls that end the stream, None retries forever, defaults to 10
+        :type max_errors: Optional[int], optional
+        """
+        super().__init__(
+            event_filter=event_filter,
+            progress=progress,
+            start_cursor=start_cursor,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            max_errors=max_errors,
+        )
+        self._client = client
+
+    def run(
+        self,
+        handler: Callable[[pgql_type.EventGQL], Any],
+        *,
+        max_polls: Optional[int] = None,
+    ) -> None:
+        """run Poll and handle events until stopped.
+
+        The stream stops when the handler returns False, `stop` is called or
+        after max_polls. A handler exception ends the stream, the event is
+        redelivered on resume.
+
+        :param handler: Called with each new event
+        :type handler: Callable[[pgql_type.EventGQL], Any]
+        :param max_polls: Stop after this many polls, defaults to None (unbounded)
+        :type max_polls: Optional[int], optional
+        """
+        self._stopped = False
+        polls = 0
+        while not self._stopped and (max_polls is None or polls < max_polls):
+            events = self._page(
+                self._client.execute_query_node(with_node=self._node())
+            )
+            polls += 1
+            for event in events:
+                if handler(event) is False:
+                    self._stopped = True
+                self._handled(event)
+                if self._stopped:
+                    break
+            if not self._stopped and self._interval:
+                time.sleep(self._interval)
+
+
+@versionadded(version="0.63.0", reason="Resumable event streaming")
+class AsyncEventStream(_EventStreamBase):
+    """Resumable event stream polled with the asynchronous client."""
+
+    def __init__(
+        self,
+        client: AsyncSuiGQLClient,
+        *,
+        event_filter: dict,
+        progress: Optional[EventStreamProgress] = None,
+        start_cursor: Optional[str] = None,
+        min_interval: Optional[float] = 0.5,
+        max_interval: Optional[float] = 30.0,
+        backoff: Optional[float] = 2.0,
+        max_errors: Optional[int] = 10,
+    ):
+        """__init__ AsyncEventStream initializer.
+
+        :param client: The asynchronous GraphQL client
+        :type client: AsyncSuiGQLClient
+        :param event_filter: Filter key/values aligned to Sui GraphQL schema's EventFilter
+        :type event_filter: dict
+        :param progress: Store of the stream position, defaults to None (in memory)
+        :type progress: Optional[EventStreamProgress], optional
+        :param start_cursor: Event cursor to start after when progress has none saved, defaults to None (first event)
+        :type start_cursor: Optional[str], optional
+        :param min_interval: Seconds between polls after a partial page, defaults to 0.5
+        :type min_interval: Optional[float], optional
+        :param max_interval: Maximum seconds between polls while idle, defaults to 30.0
+        :type max_interval: Optional[float], optional
+        :param backoff: Interval multiplier after each empty or failed poll, defaults to 2.0
+        :type backoff: Optional[float], optional
+        :param max_errors: Consecutive failed polls that end the stream, None retries forever, defaults to 10
+        :type max_errors: Optional[int], optional
+        """
+        super().__init__(
+            event_filter=event_filter,
+            progress=progress,
+            start_cursor=start_cursor,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            max_errors=max_errors,
+        )
+        self._client = client
+
+    async def run(
+        self,
+        handler: Callable[[pgql_type.EventGQL], Any],
+        *,
+        max_polls: Optional[int] = None,
+    ) -> None:
+        """run Poll and handle events until stopped.
+
+        The stream stops when the (sync or async) handler returns False, `stop`
+        is called or after max_polls. A handler exception ends the stream, the
+        event is redelivered on resume.
+
+        :param handler: Called with each new event
+        :type handler: Callable[[pgql_type.EventGQL], Any]
+        :param max_polls: Stop after this many polls, defaults to None (unbounded)
+        :type max_polls: Optional[int], optional
+        """
+        is_async = inspect.iscoroutinefunction(handler)
+        self._stopped = False
+        polls = 0
+        while not self._stopped and (max_polls is None or polls < max_polls):
+            events = self._page(
+                await self._client.execute_query_node(with_node=self._node())
+            )
+            polls += 1
+            for event in events:
+                keep_running = await handler(event) if is_async else handler(event)
+                if keep_running is False:
+                    self._stopped = True
+                self._handled(event)
+                if self._stopped:
+                    break
+            if not self._stopped and self._interval:
+                await asyncio.sleep(self._interval)
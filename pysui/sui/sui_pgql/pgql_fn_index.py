@@ -0,0 +1,320 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui offline function signature index built from compiled Move modules.
+
+Function handles, signatures and struct handles are read from local module
+bytecode (e.g. the `bytecode_modules` of a package build) and converted to the
+`MoveFunctionGQL` form returned by `GetFunction`, so targets of locally known
+packages resolve to the same `MoveArgSummary` without querying the chain. The
+legacy `SuiMoveFunction` form is derived from it for the JSON RPC transactions.
+"""
+
+import base64
+from pathlib import Path
+from typing import Optional, Union
+
+from deprecated.sphinx import versionadded
+from pysui.sui.sui_txresults.package_meta import SuiMoveFunction
+from pysui.sui.sui_utils import CompiledPackage
+from pysui.sui_move.bin_reader.module_reader import ModuleReader
+from pysui.sui_move.model.common_types import Ability, SignatureType, Visibility
+from pysui.sui_move.module.deserialize import (
+    Deserialize,
+    LazyModuleContent,
+    deserialize,
+)
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Signature tokens that are primitives, by their GraphQL signature name
+_PRIMITIVES: dict[SignatureType, str] = {
+    SignatureType.boolean: "bool",
+    SignatureType.u8: "u8",
+    SignatureType.u16: "u16",
+    SignatureType.u32: "u32",
+    SignatureType.u64: "u64",
+    SignatureType.u128: "u128",
+    SignatureType.u256: "u256",
+    SignatureType.Address: "address",
+    SignatureType.Signer: "signer",
+}
+_REFERENCES: dict[SignatureType, str] = {
+    SignatureType.Reference: "&",
+    SignatureType.MutableReference: "&mut",
+}
+_VISIBILITY: dict[Visibility, str] = {
+    Visibility.Public: "PUBLIC",
+    Visibility.Private: "PRIVATE",
+    Visibility.FriendPrivate: "FRIEND",
+}
+# GraphQL ability order
+_ABILITIES: list[Ability] = [Ability.Copy, Ability.Drop, Ability.Store, Ability.Key]
+# GraphQL reference to the JSON RPC normalized reference
+_NORMALIZED_REFERENCES: dict[str, str] = {"&": "Reference", "&mut": "MutableReference"}
+
+
+def _long_address(address: str) -> str:
+    """Normalize an address to 0x prefixed 64 hex digits."""
+    return f"0x{int(address, 16):064x}"
+
+
+def _normalized_body(body: Union[str, dict]) -> Union[str, dict]:
+    """JSON RPC normalized type of a GraphQL signature body."""
+    if isinstance(body, str):
+        return body.capitalize()
+    if "vector" in body:
+        return {"Vector": _normalized_body(body["vector"])}
+    if "typeParameter" in body:
+        return {"TypeParameter": body["typeParameter"]}
+    datatype = body["datatype"]
+    return {
+        "Struct": {
+            "address": datatype["package"],
+            "module": datatype["module"],
+            "name": datatype["type"],
+            "typeArguments": [_normalized_body(x) for x in datatype["typeParameters"]],
+        }
+    }
+
+
+def _normalized_signature(signature: dict) -> Union[str, dict]:
+    """JSON RPC normalized type of a GraphQL signature."""
+    body = _normalized_body(signature["signature"]["body"])
+    ref = signature["signature"].get("ref")
+    return {_NORMALIZED_REFERENCES[ref]: body} if ref else body
+
+
+class _ModuleSignatures:
+    """Converts the signatures of one module to GraphQL signature form."""
+
+    def __init__(self, content: LazyModuleContent, package: Optional[str]):
+        """Resolve the module self address, replaced by package if provided."""
+        self._content = content
+        self_handle = content.module_handles[content.module_self]
+        self._self_address = self._address(self_handle.address_index)
+        self.package = _long_address(package) if package else self._self_address
+        self.module_name = self._identifier(self_handle.identifier_index)
+
+    def _identifier(self, index: int) -> str:
+        """Identifier at index."""
+        return self._content.identifiers[index].identifier
+
+    def _address(self, index: int) -> str:
+        """Address at index, long form."""
+        return _long_address(self._content.addresses[index].address)
+
+    def _datatype(self, handle_index: int, type_parameters: list) -> dict:
+        """GraphQL datatype of a struct handle."""
+        handle = self._content.structure_handles[handle_index]
+        module = self._content.module_handles[handle.module_handle_index]
+        package = self._address(module.address_index)
+        return {
+            "datatype": {
+                "package": (
+                    self.package if package == self._self_address else package
+                ),
+                "module": self._identifier(module.identifier_index),
+                "type": self._identifier(handle.identifier_index),
+                "typeParameters": [self.body(x) for x in type_parameters],
+            }
+        }
+
+    def body(self, token: list) -> Union[str, dict]:
+        """GraphQL signature body of a signature token."""
+        sig_type = token[0]
+        if sig_type in _PRIMITIVES:
+            return _PRIMITIVES[sig_type]
+        match sig_type:
+            case SignatureType.Vector:
+                return {"vector": self.body(token[1])}
+            case SignatureType.Struct:
+                return self._datatype(token[1], [])
+            case SignatureType.StructInstantiation:
+                return self._datatype(token[1], token[2:])
+            case SignatureType.TypeParameter:
+                return {"typeParameter": token[1]}
+            case _:
+                raise ValueError(f"Unexpected signature token {sig_type.name}")
+
+    def signatures(self, index: int) -> list[dict]:
+        """GraphQL signatures of a signature table entry."""
+        result: list[dict] = []
+        for token in self._content.signatures[index].sig_tokens:
+            if token[0] in _REFERENCES:
+                result.append(
+                    {
+                        "signature": {
+                            "ref": _REFERENCES[token[0]],
+                            "body": self.body(token[1]),
+                        }
+                    }
+                )
+            else:
+                result.append({"signature": {"body": self.body(token)}})
+        return result
+
+    def functions(self) -> list[pgql_type.MoveFunctionGQL]:
+        """The module's function definitions as MoveFunctionGQL."""
+        funcs: list[pgql_type.MoveFunctionGQL] = []
+        for fdef in self._content.function_definitions:
+            handle = self._content.function_handles[fdef.function_handle_index]
+            funcs.append(
+                pgql_type.MoveFunctionGQL(
+                    function_name=self._identifier(handle.identifier_index),
+                    is_entry=bool(fdef.flag.is_entry()),
+                    visibility=_VISIBILITY.get(
+                        fdef.visibility, fdef.visibility.name.upper()
+                    ),
+                    type_parameters=[
+                        {
+                            "constraints": [
+                                x.name.upper() for x in _ABILITIES if constraint & x
+                            ]
+                        }
+                        for constraint in (handle.type_params or b"")
+                    ],
+                    parameters=self.signatures(handle.parameters_signature_index),
+                    returns=self.signatures(handle.returns_signature_index),
+                )
+            )
+        return funcs
+
+
+@versionadded(version="0.63.0", reason="Offline function signature resolution")
+class FunctionIndex:
+    """Index of function signatures read from local compiled Move modules.
+
+    Modules are added from readers, files, bytecode folders or a
+    `CompiledPackage` and their functions are looked up by target
+    (``package::module::function``). Only the tables describing signatures are
+    deserialized, function code is skipped.
+    """
+
+    def __init__(self):
+        """__init__ FunctionIndex initializer."""
+        self._functions: dict[tuple[str, str, str], pgql_type.MoveFunctionGQL] = {}
+
+    def __len__(self) -> int:
+        """Return the count of indexed functions."""
+        return len(self._functions)
+
+    def __contains__(self, target: str) -> bool:
+        """Check if a target is indexed."""
+        return self._key(target) in self._functions
+
+    @staticmethod
+    def _key(target: str) -> tuple[str, str, str]:
+        """Index key of a target triplet."""
+        package, module, function = target.split("::")
+        return _long_address(package), module, function
+
+    def add_module(
+        self,
+        module: Union[ModuleReader, bytes, str, Path],
+        package: Optional[str] = None,
+    ) -> str:
+        """add_module Index the functions of a compiled module.
+
+        :param module: Module reader, bytes or .mv file path
+        :type module: Union[ModuleReader, bytes, str, Path]
+        :param package: Package id replacing the module self address (e.g. 0x0 of unpublished builds), defaults to None
+        :type package: Optional[str], optional
+        :raises ValueError: If the module is not valid Move bytecode
+        :return: The module name
+        :rtype: str
+        """
+        if isinstance(module, (str, Path)):
+            module = ModuleReader.read_from_file(str(module))
+        elif not isinstance(module, ModuleReader):
+            module = ModuleReader("bytes", module)
+        signatures = _ModuleSignatures(deserialize(module, Deserialize.LAZY), package)
+        for func in signatures.functions():
+            key = (signatures.package, signatures.module_name, func.function_name)
+            self._functions[key] = func
+        return signatures.module_name
+
+    def add_package(
+        self, bytecode_modules: Union[str, Path], package: Optional[str] = None
+    ) -> list[str]:
+        """add_package Index the functions of every module in a bytecode folder.
+
+        :param bytecode_modules: Folder containing the .mv files, e.g. build/<name>/bytecode_modules
+        :type bytecode_modules: Union[str, Path]
+        :param package: Package id replacing the modules self address, defaults to None
+        :type package: Optional[str], optional
+        :return: The module names
+        :rtype: list[str]
+        """
+        return [
+            self.add_module(x, package)
+            for x in sorted(Path(bytecode_modules).expanduser().glob("*.mv"))
+        ]
+
+    def add_compiled_package(
+        self, compiled: CompiledPackage, package: Optional[str] = None
+    ) -> list[str]:
+        """add_compiled_package Index the functions of a CompiledPackage (e.g. from publish_build).
+
+        :param compiled: The compiled package
+        :type compiled: CompiledPackage
+        :param package: Package id replacing the modules self address, defaults to None
+        :type package: Optional[str], optional
+        :return: The module names
+        :rtype: list[str]
+        """
+        return [
+            self.add_module(
+                base64.b64decode(x if isinstance(x, str) else x.value), package
+            )
+            for x in compiled.compiled_modules
+        ]
+
+    def function(self, target: str) -> Optional[pgql_type.MoveFunctionGQL]:
+        """function Return the indexed function of a target.
+
+        :param target: The ``package::module::function`` target
+        :type target: str
+        :return: The function, None if not indexed
+        :rtype: Optional[pgql_type.MoveFunctionGQL]
+        """
+        return self._functions.get(self._key(target))
+
+    def arg_summary(self, target: str) -> Optional[pgql_type.MoveArgSummary]:
+        """arg_summary Return the argument summary of a target.
+
+        :param target: The ``package::module::function`` target
+        :type target: str
+        :return: The summary, None if not indexed
+        :rtype: Optional[pgql_type.MoveArgSummary]
+        """
+        func = self.function(target)
+        return func.arg_summary() if func else None
+
+    def normalized_function(self, target: str) -> Optional[SuiMoveFunction]:
+        """normalized_function Return the indexed function of a target in JSON RPC form.
+
+        The form `GetFunction` of the JSON RPC builders returns, used by the
+        legacy `SuiTransactionAsync`.
+
+        :param target: The ``package::module::function`` target
+        :type target: str
+        :return: The function, None if not indexed
+        :rtype: Optional[SuiMoveFunction]
+        """
+        func = self.function(target)
+        if not func:
+            return None
+        return SuiMoveFunction.from_dict(
+            {
+                "visibility": func.visibility.capitalize(),
+                "isEntry": func.is_entry,
+                "typeParameters": [
+                    {"abilities": [x.capitalize() for x in y["constraints"]]}
+                    for y in func.type_parameters
+                ],
+                "parameters": [_normalized_signature(x) for x in func.parameters],
+                "return": [_normalized_signature(x) for x in func.returns or []],
+            }
+        )
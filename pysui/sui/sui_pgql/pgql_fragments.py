@@ -6,6 +6,7 @@
 """QueryNode generators."""
 
 from functools import cache
+from typing import Optional
 from pysui.sui.sui_pgql.pgql_clients import PGQL_Fragment
 from gql.dsl import DSLFragment, DSLInlineFragment, DSLMetaField, DSLSchema
 
@@ -121,9 +122,24 @@ class BaseObject(PGQL_Fragment):
 class StandardObject(PGQL_Fragment):
     """StandardObject reusable fragment."""
 
+    def __init__(self, with_content: Optional[bool] = True):
+        """Fragment initializer.
+
+        :param with_content: Include the server rendered content json, defaults to True
+        :type with_content: Optional[bool], optional
+        """
+        self.with_content = with_content
+
     @cache
     def fragment(self, schema: DSLSchema) -> DSLFragment:
         base_object = BaseObject()
+        contents = {
+            "object_type_repr": schema.MoveValue.type.select(
+                object_type=schema.MoveType.repr
+            )
+        }
+        if self.with_content:
+            contents["content"] = schema.MoveValue.json
         return (
             DSLFragment("ObjectStandard")
             .on(schema.Object)
@@ -163,12 +179,7 @@ class StandardObject(PGQL_Fragment):
                 ),
                 as_move_content=schema.Object.asMoveObject.select(
                     has_public_transfer=schema.MoveObject.hasPublicTransfer,
-                    as_object=schema.MoveObject.contents.select(
-                        content=schema.MoveValue.json,
-                        object_type_repr=schema.MoveValue.type.select(
-                            object_type=schema.MoveType.repr
-                        ),
-                    ),
+                    as_object=schema.MoveObject.contents.select(**contents),
                 ),
                 as_move_package=schema.Object.asMovePackage.select(
                     bcs=schema.MovePackage.bcs
@@ -0,0 +1,502 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui local BCS decoding of Move object and event contents.
+
+Struct layouts are fetched once with `GetStructure`, or registered, and cached
+by type. Objects queried with `with_content=False` carry only their BCS which
+`MoveBcsDecoder` turns into Python values, as do events queried with
+`GetEvents(with_bcs=True)`:
+
+- integers as int, bool as bool, address as 0x prefixed hex string
+- vector<u8> as bytes, other vectors as lists
+- 0x1::string::String and 0x1::ascii::String as str
+- 0x2::object::UID and 0x2::object::ID as the 0x prefixed id string
+- 0x1::option::Option<T> as None or the T value
+- other structs as dict of field name to value
+"""
+
+import base64
+import re
+from typing import Any, Callable, Optional, Union
+
+from deprecated.sphinx import versionadded
+
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient, SuiGQLClient
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Primitive name, ("vector", element) or ("struct", address, module, name, type_args)
+MoveType = Union[str, tuple]
+StructKey = tuple[str, str, str]
+
+_PRIMITIVES: set[str] = {
+    "bool",
+    "u8",
+    "u16",
+    "u32",
+    "u64",
+    "u128",
+    "u256",
+    "address",
+    "signer",
+}
+# BCS TypeTag variant index to primitive, 6 is vector and 7 struct
+_TYPE_TAGS: tuple[Optional[str], ...] = (
+    "bool",
+    "u8",
+    "u64",
+    "u128",
+    "address",
+    "signer",
+    None,
+    None,
+    "u16",
+    "u32",
+    "u256",
+)
+_TYPE_TOKENS = re.compile(r"::|<|>|,|[^\s<>,:]+")
+_INT_SIZES: dict[str, int] = {
+    "u8": 1,
+    "u16": 2,
+    "u32": 4,
+    "u64": 8,
+    "u128": 16,
+    "u256": 32,
+}
+
+_STD = f"0x{'1'.zfill(64)}"
+_SUI = f"0x{'2'.zfill(64)}"
+_SYSTEM = f"0x{'3'.zfill(64)}"
+_STRINGS: set[StructKey] = {(_STD, "string", "String"), (_STD, "ascii", "String")}
+_IDS: set[StructKey] = {(_SUI, "object", "UID"), (_SUI, "object", "ID")}
+_OPTION: StructKey = (_STD, "option", "Option")
+_SUI_COIN: MoveType = ("struct", _SUI, "sui", "SUI", ())
+
+
+def _normalize_address(address: str) -> str:
+    """Full length lower case 0x prefixed address."""
+    return f"0x{address.removeprefix('0x').lower().zfill(64)}"
+
+
+def parse_type(type_str: str) -> MoveType:
+    """parse_type Parse a Move type string (e.g. 0x2::coin::Coin<0x2::sui::SUI>).
+
+    :param type_str: The type string
+    :type type_str: str
+    :raises ValueError: If the type string is malformed
+    :return: The Move type
+    :rtype: MoveType
+    """
+    tokens = _TYPE_TOKENS.findall(type_str)
+
+    def _expect(pos: int, token: str) -> int:
+        if pos >= len(tokens) or tokens[pos] != token:
+            raise ValueError(f"Expected '{token}' at token {pos} of {type_str}")
+        return pos + 1
+
+    def _parse(pos: int) -> tuple[MoveType, int]:
+        if pos >= len(tokens):
+            raise ValueError(f"Unexpected end of {type_str}")
+        token = tokens[pos]
+        pos += 1
+        if token in _PRIMITIVES:
+            return token, pos
+        if token == "vector":
+            element, pos = _parse(_expect(pos, "<"))
+            return ("vector", element), _expect(pos, ">")
+        pos = _expect(pos, "::")
+        module = tokens[pos]
+        pos = _expect(pos + 1, "::")
+        name = tokens[pos]
+        pos += 1
+        type_args: list[MoveType] = []
+        if pos < len(tokens) and tokens[pos] == "<":
+            while True:
+                type_arg, pos = _parse(pos + 1)
+                type_args.append(type_arg)
+                if tokens[pos] != ",":
+                    break
+            pos = _expect(pos, ">")
+        address = _normalize_address(token)
+        return ("struct", address, module, name, tuple(type_args)), pos
+
+    move_type, pos = _parse(0)
+    if pos != len(tokens):
+        raise ValueError(f"Unexpected trailing tokens in {type_str}")
+    return move_type
+
+
+def format_type(move_type: MoveType) -> str:
+    """format_type Format a Move type as a type string with full addresses.
+
+    :param move_type: The Move type
+    :type move_type: MoveType
+    :return: The type string
+    :rtype: str
+    """
+    if isinstance(move_type, str):
+        return move_type
+    if move_type[0] == "vector":
+        return f"vector<{format_type(move_type[1])}>"
+    _, address, module, name, type_args = move_type
+    if type_args:
+        return f"{address}::{module}::{name}<{', '.join(map(format_type, type_args))}>"
+    return f"{address}::{module}::{name}"
+
+
+def _resolve(body: Any, type_args: tuple) -> MoveType:
+    """Resolve an OpenMoveType signature body with the type arguments."""
+    if isinstance(body, str):
+        return body.lower()
+    if "vector" in body:
+        return ("vector", _resolve(body["vector"], type_args))
+    if "typeParameter" in body:
+        return type_args[body["typeParameter"]]
+    datatype: dict = body.get("datatype") or body["struct"]
+    return (
+        "struct",
+        _normalize_address(datatype["package"]),
+        datatype["module"],
+        datatype["type"],
+        tuple(_resolve(x, type_args) for x in datatype.get("typeParameters") or []),
+    )
+
+
+class _Reader:
+    """BCS reader over a byte string."""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes):
+        """Initialize at the start of data."""
+        self.data = data
+        self.pos = 0
+
+    def read(self, count: int) -> bytes:
+        """Read count bytes."""
+        end = self.pos + count
+        if end > len(self.data):
+            raise ValueError("Unexpected end of BCS data")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def uleb(self) -> int:
+        """Read a ULEB128 length or variant index."""
+        value = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def uint(self, size: int) -> int:
+        """Read a little endian unsigned integer of size bytes."""
+        return int.from_bytes(self.read(size), "little")
+
+    def address(self) -> str:
+        """Read a 32 byte address."""
+        return "0x" + self.read(32).hex()
+
+    def string(self) -> str:
+        """Read a length prefixed utf-8 string."""
+        return self.read(self.uleb()).decode()
+
+    def type_tag(self) -> MoveType:
+        """Read a TypeTag."""
+        index = self.uleb()
+        if index == 6:
+            return ("vector", self.type_tag())
+        if index == 7:
+            return self.struct_tag()
+        return _TYPE_TAGS[index]
+
+    def struct_tag(self) -> MoveType:
+        """Read a StructTag."""
+        address = self.address()
+        module = self.string()
+        name = self.string()
+        type_args = tuple(self.type_tag() for _ in range(self.uleb()))
+        return ("struct", address, module, name, type_args)
+
+
+def _primitive_reader(name: str) -> Callable[[_Reader], Any]:
+    """Reader function of a primitive type."""
+    if name == "bool":
+        return lambda reader: reader.read(1) != b"\x00"
+    if name in ("address", "signer"):
+        return _Reader.address
+    size = _INT_SIZES[name]
+    return lambda reader: reader.uint(size)
+
+
+@versionadded(version="0.63.0", reason="Local BCS decoding of Move values")
+class MoveLayoutCache:
+    """Move struct field layouts cached by defining package, module and name.
+
+    Layouts missing from the cache are fetched with `GetStructure` when a
+    synchronous client is set, `prefetch_async` loads them with an async client.
+    """
+
+    def __init__(self, client: Optional[SuiGQLClient] = None):
+        """__init__ MoveLayoutCache initializer.
+
+        :param client: Client to fetch missing layouts with, defaults to None
+        :type client: Optional[SuiGQLClient], optional
+        """
+        self._client = client
+        self._layouts: dict[StructKey, tuple[tuple[str, Any], ...]] = {}
+
+    def __len__(self) -> int:
+        """Count of cached layouts."""
+        return len(self._layouts)
+
+    def __contains__(self, key: StructKey) -> bool:
+        """Check if the layout of (package, module, name) is cached."""
+        return (_normalize_address(key[0]), key[1], key[2]) in self._layouts
+
+    def register(
+        self, package: str, module: str, name: str, fields: list[tuple[str, Any]]
+    ) -> None:
+        """register Cache a struct layout.
+
+        :param package: The defining package id
+        :type package: str
+        :param module: The module name
+        :type module: str
+        :param name: The struct name
+        :type name: str
+        :param fields: Field names and OpenMoveType signature bodies, in declared order
+        :type fields: list[tuple[str, Any]]
+        """
+        self._layouts[(_normalize_address(package), module, name)] = tuple(fields)
+
+    def register_structure(
+        self, package: str, module: str, structure: pgql_type.MoveStructureGQL
+    ) -> None:
+        """register_structure Cache the layout of a GetStructure(s) result.
+
+        :param package: The defining package id
+        :type package: str
+        :param module: The module name
+        :type module: str
+        :param structure: The structure result
+        :type structure: pgql_type.MoveStructureGQL
+        """
+        self.register(
+            package,
+            module,
+            structure.struct_name,
+            [
+                (field["field_name"], field["field_type"]["signature"]["body"])
+                for field in structure.fields
+            ],
+        )
+
+    def _register_result(self, key: StructKey, result: Any) -> None:
+        """Cache the layout from a GetStructure result."""
+        if result.is_err() or not isinstance(
+            result.result_data, pgql_type.MoveStructureGQL
+        ):
+            raise ValueError(f"Could not fetch layout of {'::'.join(key)}")
+        self.register_structure(key[0], key[1], result.result_data)
+
+    def _node_for(self, key: StructKey) -> qn.GetStructure:
+        """Query node fetching a layout."""
+        return qn.GetStructure(
+            package=key[0], module_name=key[1], structure_name=key[2]
+        )
+
+    def fields(
+        self, package: str, module: str, name: str
+    ) -> tuple[tuple[str, Any], ...]:
+        """fields Return the field layout of a struct, fetching it if needed.
+
+        :param package: The defining package id
+        :type package: str
+        :param module: The module name
+        :type module: str
+        :param name: The struct name
+        :type name: str
+        :raises ValueError: If not cached and no client set or the fetch fails
+        :return: Field names and signature bodies
+        :rtype: tuple[tuple[str, Any], ...]
+        """
+        key = (_normalize_address(package), module, name)
+        layout = self._layouts.get(key)
+        if layout is None:
+            if self._client is None:
+                raise ValueError(f"No layout for {'::'.join(key)}")
+            result = self._client.execute_query_node(with_node=self._node_for(key))
+            self._register_result(key, result)
+            layout = self._layouts[key]
+        return layout
+
+    def _unresolved(self, move_types: list[MoveType]) -> tuple[set[StructKey], list]:
+        """Walk types, returning missing layouts and the types blocked on them."""
+        missing: set[StructKey] = set()
+        blocked: list[MoveType] = []
+        pending = list(move_types)
+        seen: set = set()
+        while pending:
+            move_type = pending.pop()
+            if isinstance(move_type, str) or move_type in seen:
+                continue
+            seen.add(move_type)
+            if move_type[0] == "vector":
+                pending.append(move_type[1])
+                continue
+            key = move_type[1:4]
+            pending.extend(move_type[4])
+            if key in _STRINGS or key in _IDS or key == _OPTION:
+                continue
+            layout = self._layouts.get(key)
+            if layout is None:
+                missing.add(key)
+                blocked.append(move_type)
+            else:
+                pending.extend(_resolve(body, move_type[4]) for _, body in layout)
+        return missing, blocked
+
+    async def prefetch_async(
+        self, client: AsyncSuiGQLClient, move_types: list[Union[str, MoveType]]
+    ) -> None:
+        """prefetch_async Fetch the layouts needed to decode the types.
+
+        :param client: The asynchronous GraphQL client
+        :type client: AsyncSuiGQLClient
+        :param move_types: Type strings or Move types
+        :type move_types: list[Union[str, MoveType]]
+        :raises ValueError: If a fetch fails
+        """
+        pending = [parse_type(x) if isinstance(x, str) else x for x in move_types]
+        while pending:
+            missing, pending = self._unresolved(pending)
+            for key in missing:
+                result = await client.execute_query_node(with_node=self._node_for(key))
+                self._register_result(key, result)
+
+
+@versionadded(version="0.63.0", reason="Local BCS decoding of Move values")
+class MoveBcsDecoder:
+    """Decode Move values from BCS using cached struct layouts."""
+
+    def __init__(self, layouts: MoveLayoutCache):
+        """__init__ MoveBcsDecoder initializer.
+
+        :param layouts: The struct layout cache
+        :type layouts: MoveLayoutCache
+        """
+        self._layouts = layouts
+        self._readers: dict[MoveType, Callable[[_Reader], Any]] = {}
+
+    def _reader_for(self, move_type: MoveType) -> Callable[[_Reader], Any]:
+        """Get the reader function of a type, compiled on first use."""
+        read_fn = self._readers.get(move_type)
+        if read_fn is not None:
+            return read_fn
+        if isinstance(move_type, str):
+            read_fn = _primitive_reader(move_type)
+        elif move_type[0] == "vector":
+            if move_type[1] == "u8":
+                read_fn = lambda reader: reader.read(reader.uleb())
+            else:
+                element = self._reader_for(move_type[1])
+                read_fn = lambda reader: [
+                    element(reader) for _ in range(reader.uleb())
+                ]
+        else:
+            read_fn = self._struct_reader(move_type)
+        self._readers[move_type] = read_fn
+        return read_fn
+
+    def _struct_reader(self, move_type: tuple) -> Callable[[_Reader], Any]:
+        """Compile the reader function of a struct type."""
+        _, address, module, name, type_args = move_type
+        key = (address, module, name)
+        if key in _STRINGS:
+            return _Reader.string
+        if key in _IDS:
+            return _Reader.address
+        if key == _OPTION:
+            inner = self._reader_for(type_args[0])
+            return lambda reader: inner(reader) if reader.uleb() else None
+        fields = [
+            (field_name, self._reader_for(_resolve(body, type_args)))
+            for field_name, body in self._layouts.fields(address, module, name)
+        ]
+        return lambda reader: {
+            field_name: read_fn(reader) for field_name, read_fn in fields
+        }
+
+    @staticmethod
+    def _as_bytes(data: Union[bytes, str]) -> bytes:
+        """Base64 decode strings."""
+        return base64.b64decode(data) if isinstance(data, str) else bytes(data)
+
+    def decode(self, move_type: Union[str, MoveType], data: Union[bytes, str]) -> Any:
+        """decode Decode the BCS of a Move value.
+
+        :param move_type: The type string or Move type of the value
+        :type move_type: Union[str, MoveType]
+        :param data: The BCS bytes or base64 string
+        :type data: Union[bytes, str]
+        :return: The Python value
+        :rtype: Any
+        """
+        if isinstance(move_type, str):
+            move_type = parse_type(move_type)
+        return self._reader_for(move_type)(_Reader(self._as_bytes(data)))
+
+    def decode_object(self, object_bcs: Union[bytes, str]) -> tuple[str, Any]:
+        """decode_object Decode the Move contents of an object's BCS.
+
+        :param object_bcs: The object BCS (e.g. ObjectReadGQL.bcs)
+        :type object_bcs: Union[bytes, str]
+        :raises ValueError: If the object is a package
+        :return: The object type string and contents value
+        :rtype: tuple[str, Any]
+        """
+        reader = _Reader(self._as_bytes(object_bcs))
+        if reader.uleb() != 0:
+            raise ValueError("Package objects have no Move contents")
+        match reader.uleb():
+            case 0:
+                move_type = reader.struct_tag()
+            case 1:
+                move_type = ("struct", _SUI, "coin", "Coin", (_SUI_COIN,))
+            case 2:
+                move_type = ("struct", _SYSTEM, "staking_pool", "StakedSui", ())
+            case _:
+                move_type = ("struct", _SUI, "coin", "Coin", (reader.type_tag(),))
+        # has_public_transfer and version precede the contents
+        reader.read(9)
+        contents = reader.read(reader.uleb())
+        return format_type(move_type), self._reader_for(move_type)(_Reader(contents))
+
+    def decode_object_read(self, object_read: pgql_type.ObjectReadGQL) -> Any:
+        """decode_object_read Decode the contents of an object read result.
+
+        :param object_read: The object read with bcs
+        :type object_read: pgql_type.ObjectReadGQL
+        :return: The contents value
+        :rtype: Any
+        """
+        return self.decode_object(object_read.bcs)[1]
+
+    def decode_event(self, event_type: str, event_bcs: Union[bytes, str]) -> Any:
+        """decode_event Decode the BCS of an event.
+
+        :param event_type: The event type string
+        :type event_type: str
+        :param event_bcs: The event contents BCS bytes or base64 string, e.g. EventGQL.bcs of GetEvents(with_bcs=True)
+        :type event_bcs: Union[bytes, str]
+        :return: The event value
+        :rtype: Any
+        """
+        return self.decode(event_type, event_bcs)
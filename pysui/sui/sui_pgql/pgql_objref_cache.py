@@ -0,0 +1,210 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui client side object reference cache populated from transaction effects."""
+
+import re
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
+
+from deprecated.sphinx import versionadded
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+# Owner kinds whose objects are referenced by version and digest
+_OWNED_KINDS: set[str] = {"AddressOwner", "Immutable", "Parent"}
+_OBJECT_ID_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+# Result types the cache learns from, others are not decoded for observation
+_OBSERVED_TYPES: frozenset[type] = frozenset(
+    {
+        pgql_type.ExecutionResultGQL,
+        pgql_type.DryRunResultGQL,
+        pgql_type.ObjectReadGQL,
+    }
+)
+
+
+class ObjectRefEntry(NamedTuple):
+    """Cached owned object reference."""
+
+    object_id: str
+    version: int
+    object_digest: str
+    owner_kind: str
+
+
+@versionadded(version="0.63.0", reason="Effects driven object reference cache")
+class ObjectRefCache:
+    """Owned object references learned from effects and object reads.
+
+    When set on a GraphQL client the cache is updated from the results of
+    `ExecuteTransaction` with `with_changes` (output states of mutated and created
+    objects, deleted and wrapped objects are dropped), dry-runs (input states of
+    the objects the transaction would consume) and object reads made while
+    building transactions. Transaction argument resolution uses the cache before
+    querying the object. Results of other queries are not inspected, so lazily
+    decoded results stay undecoded.
+
+    An execution without `with_changes` leaves the versions of its objects
+    unknown and clears the cache.
+
+    Entries for objects named in a failed request, for example a stale version
+    rejected at execution, are invalidated and fetched again on next use.
+    """
+
+    def __init__(self, *, max_entries: Optional[int] = 10_000):
+        """__init__ ObjectRefCache initializer.
+
+        :param max_entries: Maximum entries retained, least recently updated are dropped, defaults to 10_000
+        :type max_entries: Optional[int], optional
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, ObjectRefEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Count of cached references."""
+        return len(self._entries)
+
+    def __contains__(self, object_id: str) -> bool:
+        """Check if object reference is cached."""
+        return object_id in self._entries
+
+    def get(self, object_id: str) -> Optional[ObjectRefEntry]:
+        """get Return the cached reference of an object.
+
+        :param object_id: The object id
+        :type object_id: str
+        :return: The cached reference or None if not cached
+        :rtype: Optional[ObjectRefEntry]
+        """
+        entry = self._entries.get(object_id)
+        if entry is None and len(object_id) != 66:
+            entry = self._entries.get(
+                f"0x{object_id.removeprefix('0x').lower().zfill(64)}"
+            )
+        return entry
+
+    def put(
+        self, object_id: str, version: int, object_digest: str, owner_kind: str
+    ) -> None:
+        """put Cache an object reference, objects not owned are ignored.
+
+        :param object_id: The object id
+        :type object_id: str
+        :param version: The object version
+        :type version: int
+        :param object_digest: The object digest
+        :type object_digest: str
+        :param owner_kind: The object owner kind (e.g. AddressOwner)
+        :type owner_kind: str
+        """
+        if owner_kind not in _OWNED_KINDS:
+            self._entries.pop(object_id, None)
+            return
+        self._entries[object_id] = ObjectRefEntry(
+            object_id, int(version), object_digest, owner_kind
+        )
+        self._entries.move_to_end(object_id)
+        if self._max_entries and len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, object_id: str) -> None:
+        """invalidate Remove an object reference.
+
+        :param object_id: The object id
+        :type object_id: str
+        """
+        self._entries.pop(object_id, None)
+
+    def clear(self) -> None:
+        """clear Remove all object references."""
+        self._entries.clear()
+
+    def put_object(self, object_def: pgql_type.ObjectReadGQL) -> None:
+        """put_object Cache the reference of an object read.
+
+        :param object_def: The object read result
+        :type object_def: pgql_type.ObjectReadGQL
+        """
+        self.put(
+            object_def.object_id,
+            object_def.version,
+            object_def.object_digest,
+            object_def.object_owner.obj_owner_kind,
+        )
+
+    def _put_state(self, state: dict) -> None:
+        """Cache an object state from effects object changes."""
+        owner: dict = state.get("owner") or {}
+        owner_kind: Optional[str] = owner.get("obj_owner_kind")
+        if owner_kind is None:
+            # Owner not selected, only refresh a reference already cached
+            entry = self._entries.get(state["object_id"])
+            if entry is None:
+                return
+            owner_kind = entry.owner_kind
+        self.put(
+            state["object_id"], state["version"], state["object_digest"], owner_kind
+        )
+
+    def update_from_changes(
+        self, object_changes: list[dict], *, committed: bool = True
+    ) -> None:
+        """update_from_changes Apply effects object changes to the cache.
+
+        States without an owner refresh the version and digest of a cached
+        reference and are otherwise ignored.
+
+        :param object_changes: The objectChanges nodes of transaction effects
+        :type object_changes: list[dict]
+        :param committed: True if effects were committed (execution), False for dry-run, defaults to True
+        :type committed: bool, optional
+        """
+        for change in object_changes:
+            if committed:
+                out_state: dict = change.get("output_state")
+                if out_state:
+                    self._put_state(out_state)
+                else:
+                    self.invalidate(change["address"])
+            elif change.get("input_state"):
+                self._put_state(change["input_state"])
+
+    def _invalidate_named(self, errors: Any) -> None:
+        """Invalidate cached objects whose ids appear in errors."""
+        if self._entries:
+            for object_id in _OBJECT_ID_RE.findall(str(errors)):
+                self.invalidate(object_id)
+
+    def observe(
+        self, result: Any, encode_fn: Optional[Callable[[dict], Any]] = None
+    ) -> None:
+        """observe Update the cache from a query result.
+
+        Called by the GraphQL clients for every query node executed.
+
+        :param result: The SuiRpcResult of the query
+        :type result: SuiRpcResult
+        :param encode_fn: The function the result is decoded with, results of other than the observed types are skipped, defaults to None
+        :type encode_fn: Optional[Callable[[dict], Any]], optional
+        """
+        if result.is_err():
+            self._invalidate_named(result.result_data)
+            return
+        if encode_fn and getattr(encode_fn, "__self__", None) not in _OBSERVED_TYPES:
+            return
+        rdata = result.result_data
+        if isinstance(rdata, pgql_type.ExecutionResultGQL):
+            if rdata.errors:
+                self._invalidate_named(rdata.errors)
+            if rdata.object_changes is None:
+                # Changes not selected, any cached object may have changed
+                self.clear()
+            else:
+                self.update_from_changes(rdata.object_changes)
+        elif isinstance(rdata, pgql_type.DryRunResultGQL):
+            obj_changes = rdata.transaction_block.effects.get("objectChanges") or {}
+            self.update_from_changes(obj_changes.get("nodes") or [], committed=False)
+        elif isinstance(rdata, pgql_type.ObjectReadGQL):
+            self.put_object(rdata)
@@ -6,6 +6,7 @@
 """QueryNode generators."""
 
 from typing import Optional, Callable, Union, Any
+from deprecated.sphinx import versionadded, versionchanged
 from gql import gql
 from gql.dsl import (
     DSLQuery,
@@ -21,6 +22,7 @@ from pysui.sui.sui_pgql.pgql_clients import PGQL_QueryNode, PGQL_NoOp
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_fragments as frag
 from pysui.sui.sui_pgql.pgql_validators import TypeValidator
+from pysui.sui.sui_types.scalars import TxBytes
 
 
 class GetCoinMetaData(PGQL_QueryNode):
@@ -228,17 +230,21 @@ class GetLatestSuiSystemState(PGQL_QueryNode):
 class GetObject(PGQL_QueryNode):
     """Returns a specific object's data."""
 
-    def __init__(self, *, object_id: str):
+    @versionchanged(version="0.63.0", reason="Added with_content")
+    def __init__(self, *, object_id: str, with_content: Optional[bool] = True):
         """QueryNode initializer.
 
         :param object_id: The object id hex string with 0x prefix
         :type object_id: str
+        :param with_content: Include the content json, False for bcs only (see pgql_move_bcs), defaults to True
+        :type with_content: Optional[bool], optional
         """
         self.object_id = TypeValidator.check_object_id(object_id)
+        self.with_content = with_content
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode"""
-        std_object = frag.StandardObject()
+        std_object = frag.StandardObject(self.with_content)
         base_object = frag.BaseObject()
         return dsl_gql(
             std_object.fragment(schema),
@@ -259,8 +265,13 @@ class GetObject(PGQL_QueryNode):
 class GetObjectsOwnedByAddress(PGQL_QueryNode):
     """Returns data for all objects by owner."""
 
+    @versionchanged(version="0.63.0", reason="Added with_content")
     def __init__(
-        self, *, owner: str, next_page: Optional[pgql_type.PagingCursor] = None
+        self,
+        *,
+        owner: str,
+        next_page: Optional[pgql_type.PagingCursor] = None,
+        with_content: Optional[bool] = True,
     ):
         """QueryNode initializer.
 
@@ -268,9 +279,12 @@ class GetObjectsOwnedByAddress(PGQL_QueryNode):
         :type owner: str
         :param next_page: pgql_type.PagingCursor to advance query, defaults to None
         :type next_page: pgql_type.PagingCursor
+        :param with_content: Include the content json, False for bcs only (see pgql_move_bcs), defaults to True
+        :type with_content: Optional[bool], optional
         """
         self.owner = owner
         self.next_page = next_page
+        self.with_content = with_content
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode."""
@@ -281,7 +295,7 @@ class GetObjectsOwnedByAddress(PGQL_QueryNode):
         if self.next_page:
             qres(after=self.next_page.endCursor)
 
-        std_object = frag.StandardObject().fragment(schema)
+        std_object = frag.StandardObject(self.with_content).fragment(schema)
         base_object = frag.BaseObject().fragment(schema)
         pg_cursor = frag.PageCursor().fragment(schema)
         qres.select(
@@ -359,11 +373,13 @@ class GetMultipleGasObjects(PGQL_QueryNode):
 class GetMultipleObjects(PGQL_QueryNode):
     """Returns object data for list of object ids."""
 
+    @versionchanged(version="0.63.0", reason="Added with_content")
     def __init__(
         self,
         *,
         object_ids: list[str],
         next_page: Optional[pgql_type.PagingCursor] = None,
+        with_content: Optional[bool] = True,
     ):
         """QueryNode initializer.
 
@@ -371,9 +387,12 @@ class GetMultipleObjects(PGQL_QueryNode):
         :type object_ids: list[str]
         :param next_page: pgql_type.PagingCursor to advance query, defaults to None
         :type next_page: pgql_type.PagingCursor
+        :param with_content: Include the content json, False for bcs only (see pgql_move_bcs), defaults to True
+        :type with_content: Optional[bool], optional
         """
         self.object_ids = TypeValidator.check_object_ids(object_ids)
         self.next_page = next_page
+        self.with_content = with_content
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode."""
@@ -384,7 +403,7 @@ class GetMultipleObjects(PGQL_QueryNode):
         if self.next_page:
             qres(after=self.next_page.endCursor)
 
-        std_object = frag.StandardObject().fragment(schema)
+        std_object = frag.StandardObject(self.with_content).fragment(schema)
         base_object = frag.BaseObject().fragment(schema)
         pg_cursor = frag.PageCursor().fragment(schema)
         qres.select(
@@ -565,11 +584,14 @@ class GetDynamicFields(PGQL_QueryNode):
 class GetEvents(PGQL_QueryNode):
     """GetEvents When executed, return list of events for a specified transaction block."""
 
+    @versionchanged(version="0.63.0", reason="Added with_event_cursors and with_bcs")
     def __init__(
         self,
         *,
         event_filter: dict,
         next_page: Optional[pgql_type.PagingCursor] = None,
+        with_event_cursors: Optional[bool] = False,
+        with_bcs: Optional[bool] = False,
     ) -> None:
         """QueryNode initializer to query chain events emitted by modules.
 
@@ -577,9 +599,15 @@ class GetEvents(PGQL_QueryNode):
         :type event_filter: str
         :param next_page: pgql_type.PagingCursor to advance query, defaults to None
         :type next_page: pgql_type.PagingCursor
+        :param with_event_cursors: Set each EventGQL event_cursor, the event position to page after, defaults to False
+        :type with_event_cursors: Optional[bool], optional
+        :param with_bcs: Set each EventGQL bcs, the event contents BCS (see pgql_move_bcs), defaults to False
+        :type with_bcs: Optional[bool], optional
         """
         self.event_filter = event_filter or {}
         self.next_page = next_page
+        self.with_event_cursors = with_event_cursors
+        self.with_bcs = with_bcs
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """Build DocumentNode."""
@@ -592,10 +620,19 @@ class GetEvents(PGQL_QueryNode):
         if self.next_page:
             qres(after=self.next_page.endCursor)
 
+        events = schema.EventConnection.nodes.select(std_event.fragment(schema))
+        if self.with_bcs:
+            events.select(schema.Event.bcs)
         qres.select(
             cursor=schema.EventConnection.pageInfo.select(pg_cursor.fragment(schema)),
-            events=schema.EventConnection.nodes.select(std_event.fragment(schema)),
+            events=events,
         )
+        if self.with_event_cursors:
+            qres.select(
+                event_cursors=schema.EventConnection.edges.select(
+                    schema.EventEdge.cursor
+                )
+            )
         return dsl_gql(
             pg_cursor.fragment(schema), std_event.fragment(schema), DSLQuery(qres)
         )
@@ -973,6 +1010,44 @@ class GetCheckpoints(PGQL_QueryNode):
         return pgql_type.CheckpointsGQL.from_query
 
 
+@versionadded(version="0.63.0", reason="Checkpoint range fetch for ingestion")
+class GetCheckpointRange(PGQL_QueryNode):
+    """GetCheckpointRange return the checkpoints of a sequence number range.
+
+    Each checkpoint is an aliased field of one query, checkpoints not yet
+    produced are absent from the result.
+    """
+
+    def __init__(self, *, start: int, count: int):
+        """__init__ QueryNode initializer.
+
+        :param start: First checkpoint sequence number
+        :type start: int
+        :param count: Number of consecutive checkpoints
+        :type count: int
+        """
+        self.start = start
+        self.count = count
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        std_checkpoint = frag.StandardCheckpoint()
+        pg_cursor = frag.PageCursor()
+        qres = [
+            schema.Query.checkpoint(id={"sequenceNumber": seq})
+            .alias(f"cp_{seq}")
+            .select(std_checkpoint.fragment(schema))
+            for seq in range(self.start, self.start + self.count)
+        ]
+        return dsl_gql(
+            pg_cursor.fragment(schema), std_checkpoint.fragment(schema), DSLQuery(*qres)
+        )
+
+    @staticmethod
+    def encode_fn() -> Union[Callable[[dict], pgql_type.CheckpointsGQL], None]:
+        """Return the serializer to CheckpointsGQL function."""
+        return pgql_type.CheckpointsGQL.from_range
+
+
 class GetProtocolConfig(PGQL_QueryNode):
     """Return the protocol config table for the given version number."""
 
@@ -1428,7 +1503,7 @@ class DryRunTransactionKind(PGQL_QueryNode):
     def __init__(
         self,
         *,
-        tx_bytestr: str,
+        tx_bytestr: Union[str, TxBytes],
         tx_meta: Optional[dict] = None,
         skip_checks: Optional[bool] = True,
     ) -> None:
@@ -1448,7 +1523,7 @@ class DryRunTransactionKind(PGQL_QueryNode):
             gasSponsor: The Sui address string of the sponsor, defaults to the sender
         }
         """
-        self.tx_data = tx_bytestr
+        self.tx_data = str(tx_bytestr)
         self.tx_meta = tx_meta if tx_meta else {}
         self.tx_skipchecks = skip_checks
 
@@ -1490,9 +1565,9 @@ class DryRunTransactionKind(PGQL_QueryNode):
 class DryRunTransaction(PGQL_QueryNode):
     """."""
 
-    def __init__(self, *, tx_bytestr) -> None:
+    def __init__(self, *, tx_bytestr: Union[str, TxBytes]) -> None:
         """__init__ Initialize DryRunTransaction object."""
-        self.tx_data = tx_bytestr
+        self.tx_data = str(tx_bytestr)
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """."""
@@ -1528,29 +1603,130 @@ class DryRunTransaction(PGQL_QueryNode):
 class ExecuteTransaction(PGQL_QueryNode):
     """."""
 
-    def __init__(self, *, tx_bytestr: str, sig_array: list[str]) -> None:
-        """__init__ Initialize ExecuteTransaction object."""
-        self.tx_data: str = tx_bytestr
+    def __init__(
+        self,
+        *,
+        tx_bytestr: Union[str, TxBytes],
+        sig_array: list[str],
+        with_changes: Optional[bool] = False,
+    ) -> None:
+        """__init__ Initialize ExecuteTransaction object.
+
+        :param tx_bytestr: The transaction bytes, base64 string or TxBytes
+        :type tx_bytestr: Union[str, TxBytes]
+        :param sig_array: The transaction signatures
+        :type sig_array: list[str]
+        :param with_changes: Include the gas effects and first page of object changes, defaults to False
+        :type with_changes: Optional[bool], optional
+        """
+        self.tx_data: str = str(tx_bytestr)
         self.sigs: list[str] = sig_array
+        self.with_changes = with_changes
 
     def as_document_node(self, schema: DSLSchema) -> DocumentNode:
         """."""
+        effects = [
+            schema.TransactionBlockEffects.status,
+            schema.TransactionBlockEffects.lamportVersion,
+            schema.TransactionBlockEffects.transactionBlock.select(
+                schema.TransactionBlock.digest
+            ),
+        ]
+        fragments = []
+        if self.with_changes:
+            base_obj = frag.BaseObject().fragment(schema)
+            gas_cost = frag.GasCost().fragment(schema)
+            pg_cursor = frag.PageCursor().fragment(schema)
+            fragments = [base_obj, gas_cost, pg_cursor]
+            effects += [
+                schema.TransactionBlockEffects.gasEffects.select(
+                    schema.GasEffects.gasObject.select(
+                        gas_object_id=schema.Object.address,
+                    ),
+                    schema.GasEffects.gasSummary.select(gas_cost),
+                ),
+                schema.TransactionBlockEffects.objectChanges.select(
+                    cursor=schema.ObjectChangeConnection.pageInfo.select(pg_cursor),
+                    nodes=schema.ObjectChangeConnection.nodes.select(
+                        address=schema.ObjectChange.address,
+                        deleted=schema.ObjectChange.idDeleted,
+                        created=schema.ObjectChange.idCreated,
+                        output_state=schema.ObjectChange.outputState.select(
+                            base_obj,
+                            schema.Object.owner.select(
+                                obj_owner_kind=DSLMetaField("__typename")
+                            ),
+                        ),
+                    ),
+                ),
+            ]
 
         qres = schema.Mutation.executeTransactionBlock(
             txBytes=self.tx_data, signatures=self.sigs
         ).select(
             schema.ExecutionResult.errors,
-            schema.ExecutionResult.effects.select(
-                schema.TransactionBlockEffects.status,
-                schema.TransactionBlockEffects.lamportVersion,
-                schema.TransactionBlockEffects.transactionBlock.select(
-                    schema.TransactionBlock.digest
-                ),
-            ),
+            schema.ExecutionResult.effects.select(*effects),
         )
-        return dsl_gql(DSLMutation(qres))
+        return dsl_gql(*fragments, DSLMutation(qres))
 
     @staticmethod
     def encode_fn() -> Union[Callable[[dict], pgql_type.ExecutionResultGQL], None]:
         """Return the serialization Execution result function."""
         return pgql_type.ExecutionResultGQL.from_query
+
+
+@versionadded(version="0.63.0", reason="Paging transaction object changes")
+class GetTxObjectChanges(PGQL_QueryNode):
+    """GetTxObjectChanges returns the object changes of a transaction and is controlled by paging."""
+
+    def __init__(
+        self, *, digest: str, next_page: Optional[pgql_type.PagingCursor] = None
+    ) -> None:
+        """QueryNode initializer to fetch the object changes of a transaction.
+
+        :param digest: The transaction digest
+        :type digest: str
+        :param next_page: Pagination cursor, defaults to None
+        :type next_page: Optional[pgql_type.PagingCursor], optional
+        """
+        self.digest = digest
+        self.next_page = next_page
+
+    def as_document_node(self, schema: DSLSchema) -> DocumentNode:
+        """Builds the GQL DocumentNode
+
+        :return: The object changes query DocumentNode
+        :rtype: DocumentNode
+        """
+        if self.next_page and not self.next_page.hasNextPage:
+            return PGQL_NoOp
+
+        base_obj = frag.BaseObject().fragment(schema)
+        pg_cursor = frag.PageCursor().fragment(schema)
+        changes = schema.TransactionBlockEffects.objectChanges
+        if self.next_page:
+            changes(after=self.next_page.endCursor)
+        qres = schema.Query.transactionBlock(digest=self.digest).select(
+            schema.TransactionBlock.effects.select(
+                changes.select(
+                    cursor=schema.ObjectChangeConnection.pageInfo.select(pg_cursor),
+                    changes=schema.ObjectChangeConnection.nodes.select(
+                        address=schema.ObjectChange.address,
+                        deleted=schema.ObjectChange.idDeleted,
+                        created=schema.ObjectChange.idCreated,
+                        output_state=schema.ObjectChange.outputState.select(
+                            base_obj,
+                            schema.Object.owner.select(
+                                obj_owner_kind=DSLMetaField("__typename")
+                            ),
+                        ),
+                    ),
+                )
+            )
+        )
+        return dsl_gql(base_obj, pg_cursor, DSLQuery(qres))
+
+    @staticmethod
+    def encode_fn() -> Union[Callable[[dict], pgql_type.ObjectChangesGQL], None]:
+        """Return the serializer to ObjectChangesGQL function."""
+        return pgql_type.ObjectChangesGQL.from_query
@@ -5,9 +5,9 @@
 
 """Pysui Transaction builder that leverages Sui GraphQL."""
 
-import base64
 from typing import Any, Callable, Optional, Union
 from functools import cache
+from deprecated.sphinx import versionadded
 from pysui.sui.sui_pgql.pgql_txb_signing import SignerBlock
 from pysui.sui.sui_txn.transaction import _SuiTransactionBase
 from pysui.sui.sui_types import bcs
@@ -17,7 +17,8 @@ import pysui.sui.sui_pgql.pgql_validators as tv
 import pysui.sui.sui_pgql.pgql_query as qn
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_txn_argb as ab
-from pysui.sui.sui_types.scalars import SuiU64
+from pysui.sui.sui_pgql.pgql_fn_index import FunctionIndex
+from pysui.sui.sui_types.scalars import SuiU64, TxBytes
 
 # Well known parameter constructs
 
@@ -142,7 +143,17 @@ class SuiTransaction(_SuiTransactionBase):
         :type merge_gas_budget: bool, optional
         :param deserialize_from: Will rehydrate SuiTransaction state from serialized base64 str or bytes, defaults to None
         :type deserialize_from: Union[str, bytes], optional
+        :param gas_selection: Strategy for selecting gas coins, defaults to GasSelection.BEST_FIT
+        :type gas_selection: gd.GasSelection, optional
+        :param function_index: Local function signatures resolving move call targets without queries, defaults to None
+        :type function_index: FunctionIndex, optional
         """
+        self._gas_selection: gd.GasSelection = kwargs.pop(
+            "gas_selection", gd.GasSelection.BEST_FIT
+        )
+        self._function_index: Optional[FunctionIndex] = kwargs.pop(
+            "function_index", None
+        )
         super().__init__(**kwargs)
         # Force new signer block
         self._sig_block = SignerBlock(
@@ -158,12 +169,29 @@ class SuiTransaction(_SuiTransactionBase):
         self._SPLIT_AND_KEEP_TUPLE = self._function_meta_args(self._SPLIT_AND_KEEP)
         self._SPLIT_AND_RETURN_TUPLE = self._function_meta_args(self._SPLIT_AND_RETURN)
 
+    @property
+    def gas_selection(self) -> gd.GasSelection:
+        """Returns the gas coin selection strategy."""
+        return self._gas_selection
+
+    @gas_selection.setter
+    def gas_selection(self, strategy: gd.GasSelection):
+        """Set the gas coin selection strategy."""
+        self._gas_selection = strategy
+
+    @property
+    def function_index(self) -> Optional[FunctionIndex]:
+        """Returns the local function signature index."""
+        return self._function_index
+
     @cache
     def _function_meta_args(
         self, target: str
     ) -> tuple[bcs.Address, str, str, int, pgql_type.MoveArgSummary]:
         """_function_meta_args Returns the argument summary of a target sui move function
 
+        Targets in the function index are resolved locally, others are queried.
+
         :param target: The triplet target string
         :type target: str
         :return: The meta function argument summary
@@ -172,6 +200,18 @@ class SuiTransaction(_SuiTransactionBase):
         package, package_module, package_function = (
             tv.TypeValidator.check_target_triplet(target)
         )
+        if self._function_index:
+            mfunc = self._function_index.function(
+                f"{package}::{package_module}::{package_function}"
+            )
+            if mfunc:
+                return (
+                    bcs.Address.from_str(package),
+                    package_module,
+                    package_function,
+                    len(mfunc.returns),
+                    mfunc.arg_summary(),
+                )
         result = self.client.execute_query_node(
             with_node=qn.GetFunction(
                 package=package,
@@ -206,6 +246,7 @@ class SuiTransaction(_SuiTransactionBase):
             objects_in_use=obj_in_use,
             active_gas_price=self.gas_price,
             tx_kind=tx_kind,
+            selection=self._gas_selection,
         )
         return bcs.TransactionData(
             "V1",
@@ -239,6 +280,31 @@ class SuiTransaction(_SuiTransactionBase):
         """
         return self._build_txn_data(gas_budget, use_gas_objects)
 
+    @versionadded(version="0.63.0", reason="Transaction bytes without base64 encoding")
+    def build_tx_bytes(
+        self,
+        *,
+        gas_budget: Optional[str] = None,
+        use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
+    ) -> TxBytes:
+        """build_tx_bytes After creating the BCS TransactionData, serialize and return the transaction bytes.
+
+        The result holds the raw bytes and produces the base64 string (`str(result)` or
+        `result.value`) once, on first use. It can be passed directly to signing, verification
+        and the DryRunTransaction/ExecuteTransaction query nodes.
+
+        :param gas_budget: Specify the amount of gas for the transaction budget, defaults to None
+        :type gas_budget: Optional[str], optional
+        :param use_gas_objects: Specify gas object(s) (by ID or SuiCoinObjectGQL), defaults to None
+        :type use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]], optional
+        :return: The serialized transaction bytes
+        :rtype: TxBytes
+        """
+        txn_data = self.transaction_data(
+            gas_budget=gas_budget, use_gas_objects=use_gas_objects
+        )
+        return TxBytes(txn_data.serialize())
+
     def build(
         self,
         *,
@@ -254,10 +320,9 @@ class SuiTransaction(_SuiTransactionBase):
         :return: Base64 encoded transaction bytes
         :rtype: str
         """
-        txn_data = self.transaction_data(
+        return self.build_tx_bytes(
             gas_budget=gas_budget, use_gas_objects=use_gas_objects
-        )
-        return base64.b64encode(txn_data.serialize()).decode()
+        ).value
 
     def build_and_sign(
         self,
@@ -265,7 +330,7 @@ class SuiTransaction(_SuiTransactionBase):
         gas_budget: Optional[str] = None,
         use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
     ) -> tuple[str, list[str]]:
-        """build After creating the BCS TransactionKind, serialize to base64 string, create signatures and return.
+        """build After creating the BCS TransactionData, serialize to base64 string, create signatures and return.
 
         :param gas_budget: Specify the amount of gas for the transaction budget, defaults to None
         :type gas_budget: Optional[str], optional
@@ -274,13 +339,13 @@ class SuiTransaction(_SuiTransactionBase):
         :return: Tuple of tx_bytes (base64) and list of signatures
         :rtype: tuple[str, list[str]]
         """
-        txn_kind = self.transaction_data(
+        tx_bytes = self.build_tx_bytes(
             gas_budget=gas_budget, use_gas_objects=use_gas_objects
         )
-        tx_bytes = base64.b64encode(txn_kind.serialize()).decode()
         sig_block: SignerBlock = self.signer_block
         sigs = sig_block.get_signatures(config=self.client.config, tx_bytes=tx_bytes)
-        return tx_bytes, sigs
+        # Signing encoded the bytes, the base64 form is not computed again
+        return tx_bytes.value, sigs
 
     def split_coin(
         self,
@@ -0,0 +1,593 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui pipelined transaction executor that leverages Sui GraphQL.
+
+Bulk payouts and coin compaction are planned by the `TransactionPlanner` and
+executed here, as `PipelinedExecutor` methods, to run their transactions
+concurrently.
+"""
+
+import asyncio
+from collections import OrderedDict
+import dataclasses
+import functools
+import logging
+from typing import Iterable, Optional
+
+from deprecated.sphinx import versionadded
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_clients import AsyncSuiGQLClient
+from pysui.sui.sui_pgql.pgql_sync_txn import SuiTransaction
+from pysui.sui.sui_pgql.pgql_txb_planner import TransactionPlanner
+import pysui.sui.sui_pgql.pgql_txb_gas as gd
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_types import bcs
+
+# Standard library logging setup
+logger = logging.getLogger("pysui.pgql_txb_exec")
+if not logging.getLogger().handlers:
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+# Object input kinds that are sequenced by the owner and not by consensus
+_OWNED_KINDS: set[str] = {"ImmOrOwnedObject", "Receiving"}
+
+
+def _owned_object_ids(txn: SuiTransaction) -> set[str]:
+    """Return the ids of owned objects used as inputs to the transaction."""
+    return {
+        oid
+        for oid, kind in txn.builder.objects_registry.items()
+        if kind in _OWNED_KINDS
+    }
+
+
+def _uses_gas_coin(txn: SuiTransaction) -> bool:
+    """Check if any command uses the gas coin as an argument."""
+    for cmd in txn.builder.commands:
+        command = cmd.value
+        for field_name, field_type in command._fields:
+            if field_type is bcs.Argument:
+                arguments = [getattr(command, field_name)]
+            elif field_type == [bcs.Argument]:
+                arguments = getattr(command, field_name)
+            else:
+                continue
+            if any(x.enum_name == "GasCoin" for x in arguments):
+                return True
+    return False
+
+
+def _effects_object_refs(
+    object_changes: list[dict],
+) -> tuple[dict[str, tuple[int, str]], set[str]]:
+    """Split effect object changes into live object references and removed ids.
+
+    Works with the `objectChanges` nodes of both execution and dry-run effects.
+
+    :param object_changes: The object change nodes
+    :type object_changes: list[dict]
+    :return: Map of object id to (version, digest) and set of deleted or wrapped ids
+    :rtype: tuple[dict[str, tuple[int, str]], set[str]]
+    """
+    live: dict[str, tuple[int, str]] = {}
+    removed: set[str] = set()
+    for change in object_changes:
+        out_state: dict = change.get("output_state")
+        if out_state:
+            live[change["address"]] = (
+                int(out_state["version"]),
+                out_state["object_digest"],
+            )
+        else:
+            removed.add(change["address"])
+    return live, removed
+
+
+def _apply_object_refs(
+    builder_inputs: dict[bcs.BuilderArg, bcs.CallArg],
+    object_refs: dict[str, tuple[int, str]],
+) -> int:
+    """Update owned object input references with known versions and digests.
+
+    :param builder_inputs: The transaction builder inputs
+    :type builder_inputs: dict[bcs.BuilderArg, bcs.CallArg]
+    :param object_refs: Map of object id to (version, digest)
+    :type object_refs: dict[str, tuple[int, str]]
+    :return: Count of input references updated
+    :rtype: int
+    """
+    updated: int = 0
+    for call_arg in builder_inputs.values():
+        if call_arg.enum_name != "Object":
+            continue
+        obj_arg: bcs.ObjectArg = call_arg.value
+        if obj_arg.enum_name not in _OWNED_KINDS:
+            continue
+        ref: bcs.ObjectReference = obj_arg.value
+        known = object_refs.get(ref.ObjectID.to_address_str())
+        if known and known[0] != ref.SequenceNumber:
+            ref.SequenceNumber = known[0]
+            ref.ObjectDigest = bcs.Digest.from_str(known[1])
+            updated += 1
+    return updated
+
+
+@dataclasses.dataclass
+class PayoutResult:
+    """Outcome of paying one recipient."""
+
+    recipient: str
+    amount: int
+    success: bool
+    digest: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _succeeded(result: SuiRpcResult) -> bool:
+    """Check if a transaction executed with a SUCCESS effects status."""
+    return (
+        result.is_ok()
+        and isinstance(result.result_data, pgql_type.ExecutionResultGQL)
+        and result.result_data.status == "SUCCESS"
+    )
+
+
+def _gas_used(gas_effects: dict) -> int:
+    """Net gas charged to the gas coin."""
+    summary: dict = gas_effects["gasSummary"]
+    return (
+        int(summary["computationCost"])
+        + int(summary["storageCost"])
+        - int(summary["storageRebate"])
+    )
+
+
+@versionadded(version="0.63.0", reason="Pipelined transaction execution")
+class PipelinedExecutor:
+    """Execute a stream of transactions with owned object conflict scheduling.
+
+    Transactions that share no owned objects (including the gas coin) are
+    executed concurrently on the asynchronous client. Transactions that share
+    an owned object are executed in submission order, each one having its
+    owned input references updated from the effects of its predecessor.
+
+    Transactions are built with their own (synchronous) client, builds are
+    serialized while executions overlap. Each transaction is paid with a single
+    gas coin from the payer's coins that is not in use by another in-flight
+    transaction. Coins used as transaction inputs are never selected for gas.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncSuiGQLClient,
+        max_in_flight: Optional[int] = 8,
+        gas_budget: Optional[str] = None,
+        max_object_refs: Optional[int] = 10_000,
+    ):
+        """__init__ PipelinedExecutor initializer.
+
+        :param client: The asynchronous client used for execution
+        :type client: AsyncSuiGQLClient
+        :param max_in_flight: Maximum concurrent transactions, defaults to 8
+        :type max_in_flight: Optional[int], optional
+        :param gas_budget: Budget for every transaction, defaults to None (dry-run per transaction)
+        :type gas_budget: Optional[str], optional
+        :param max_object_refs: Maximum object references retained, least recently updated are dropped, defaults to 10_000
+        :type max_object_refs: Optional[int], optional
+        """
+        self._client = client
+        self._gas_budget = gas_budget
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._build_lock = asyncio.Lock()
+        self._gas_cond = asyncio.Condition()
+        # Payer address -> coin id -> coin
+        self._gas_pools: dict[str, dict[str, pgql_type.SuiCoinObjectGQL]] = {}
+        self._gas_busy: set[str] = set()
+        self._gas_holder: dict[str, asyncio.Task] = {}
+        self._gas_stale: set[str] = set()
+        self._reserved: set[str] = set()
+        self._last_user: dict[str, asyncio.Task] = {}
+        self._max_object_refs = max_object_refs
+        self._object_refs: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def object_refs(self) -> dict[str, tuple[int, str]]:
+        """Return the latest known (version, digest) of objects seen in effects."""
+        return dict(self._object_refs)
+
+    def submit(
+        self, txn: SuiTransaction, *, reserve: Optional[int] = 0
+    ) -> asyncio.Task:
+        """submit Schedule a transaction for execution.
+
+        Must be called from within a running event loop.
+
+        :param txn: The transaction to execute
+        :type txn: SuiTransaction
+        :param reserve: Balance the gas coin must hold beyond the budget, for
+            transactions spending from the gas coin, defaults to 0
+        :type reserve: Optional[int], optional
+        :return: Task whose result is the SuiRpcResult of execution
+        :rtype: asyncio.Task
+        """
+        keys = _owned_object_ids(txn)
+        deps: set[asyncio.Task] = set()
+        for key in keys:
+            if key in self._last_user:
+                deps.add(self._last_user[key])
+            if key in self._gas_holder:
+                deps.add(self._gas_holder[key])
+        self._reserved |= keys
+        task = asyncio.ensure_future(self._run(txn, keys, deps, reserve))
+        for key in keys:
+            self._last_user[key] = task
+        task.add_done_callback(functools.partial(self._release_keys, keys))
+        self._tasks.append(task)
+        return task
+
+    def _release_keys(self, keys: set[str], task: asyncio.Task) -> None:
+        """Release the objects of a finished task no later submission uses."""
+        for key in keys:
+            if self._last_user.get(key) is task:
+                del self._last_user[key]
+                self._reserved.discard(key)
+
+    async def wait(self) -> list[SuiRpcResult]:
+        """wait Wait for all submitted transactions to complete.
+
+        :return: The results in submission order
+        :rtype: list[SuiRpcResult]
+        """
+        tasks = self._tasks
+        self._tasks = []
+        return list(await asyncio.gather(*tasks))
+
+    async def execute_all(
+        self, transactions: Iterable[SuiTransaction]
+    ) -> list[SuiRpcResult]:
+        """execute_all Submit transactions and wait for all to complete.
+
+        :param transactions: The transactions to execute
+        :type transactions: Iterable[SuiTransaction]
+        :return: The results in submission order
+        :rtype: list[SuiRpcResult]
+        """
+        for txn in transactions:
+            self.submit(txn)
+        return await self.wait()
+
+    async def bulk_pay(
+        self,
+        recipients: list[tuple[str, int]],
+        *,
+        planner: TransactionPlanner,
+        coin_type: Optional[str] = "0x2::sui::SUI",
+        max_amount: Optional[int] = None,
+    ) -> list[PayoutResult]:
+        """bulk_pay Pay many recipients with the fewest transactions executed concurrently.
+
+        The planner packs recipients into transactions that each split all of their
+        amounts with one SplitCoins. SUI payouts are split from the gas coin of each
+        transaction and are assigned gas coins holding the payout amount beyond the
+        budget, use max_amount to keep transaction amounts within the gas coin
+        balances. Other coin types use distinct source coins per transaction.
+
+        .. code-block:: python
+
+            planner = TransactionPlanner(client=sync_client)
+            executor = PipelinedExecutor(client=async_client, gas_budget="50000000")
+            results = await executor.bulk_pay(payouts, planner=planner)
+            failed = [x for x in results if not x.success]
+
+        :param recipients: List of (address, amount) to pay
+        :type recipients: list[tuple[str, int]]
+        :param planner: The planner used to build the payout transactions
+        :type planner: TransactionPlanner
+        :param coin_type: The coin type to pay with, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :param max_amount: Maximum total amount of a transaction, defaults to None
+        :type max_amount: Optional[int], optional
+        :return: The result for each recipient, in the order given
+        :rtype: list[PayoutResult]
+        """
+        chunks = await asyncio.to_thread(
+            planner.plan_payouts,
+            recipients,
+            coin_type=coin_type,
+            max_amount=max_amount,
+        )
+        tasks = [
+            self.submit(x.transaction, reserve=0 if x.coins else x.amount)
+            for x in chunks
+        ]
+        outcomes: list[PayoutResult] = []
+        for chunk, result in zip(chunks, await asyncio.gather(*tasks)):
+            digest = error = None
+            success = False
+            if result.is_ok():
+                exec_result: pgql_type.ExecutionResultGQL = result.result_data
+                digest = exec_result.digest
+                success = exec_result.status == "SUCCESS"
+                error = None if success else str(exec_result.errors)
+            else:
+                error = f"{result.result_string}: {result.result_data}"
+            outcomes.extend(
+                PayoutResult(recipient, amount, success, digest, error)
+                for recipient, amount in chunk.recipients
+            )
+        return outcomes
+
+    async def compact_coins(
+        self,
+        *,
+        planner: TransactionPlanner,
+        coin_type: Optional[str] = "0x2::sui::SUI",
+        target_count: Optional[int] = 1,
+        max_rounds: Optional[int] = 8,
+    ) -> list[SuiRpcResult]:
+        """compact_coins Merge the sender coins of a type down to a target count.
+
+        Each round merges independent groups of coins concurrently, rounds are
+        repeated until the target is reached, a round has no successful merge
+        or max_rounds have run.
+
+        :param planner: The planner used to build the merge transactions
+        :type planner: TransactionPlanner
+        :param coin_type: The coin type to compact, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :param target_count: The maximum number of coins wanted, defaults to 1
+        :type target_count: Optional[int], optional
+        :param max_rounds: The maximum number of merge rounds, defaults to 8
+        :type max_rounds: Optional[int], optional
+        :return: The results of all merge transactions
+        :rtype: list[SuiRpcResult]
+        """
+        results: list[SuiRpcResult] = []
+        rounds: int = 0
+        while True:
+            txns = await asyncio.to_thread(
+                planner.plan_compaction, coin_type=coin_type, target_count=target_count
+            )
+            if not txns:
+                break
+            if rounds == max_rounds:
+                logger.warning(
+                    f"Coin compaction of {coin_type} stopped at {rounds} rounds"
+                )
+                break
+            rounds += 1
+            round_results = await self.execute_all(txns)
+            results.extend(round_results)
+            if not any(_succeeded(x) for x in round_results):
+                logger.warning(f"Coin compaction of {coin_type} made no progress")
+                break
+        return results
+
+    async def compact_when(
+        self,
+        *,
+        planner: TransactionPlanner,
+        coin_type: Optional[str] = "0x2::sui::SUI",
+        threshold: int,
+        target_count: Optional[int] = 1,
+        interval: Optional[float] = 60.0,
+    ) -> None:
+        """compact_when Background loop compacting coins when their count passes a threshold.
+
+        Runs until cancelled, typically as `asyncio.create_task(executor.compact_when(...))`.
+
+        :param planner: The planner used to build the merge transactions
+        :type planner: TransactionPlanner
+        :param coin_type: The coin type to compact, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :param threshold: Compact when the coin count is greater than this
+        :type threshold: int
+        :param target_count: The maximum number of coins wanted, defaults to 1
+        :type target_count: Optional[int], optional
+        :param interval: Seconds between coin count checks, defaults to 60.0
+        :type interval: Optional[float], optional
+        """
+        while True:
+            try:
+                count = await asyncio.to_thread(
+                    planner.coin_count, coin_type=coin_type
+                )
+                if count > threshold:
+                    logger.info(f"Compacting {count} coins of {coin_type}")
+                    await self.compact_coins(
+                        planner=planner, coin_type=coin_type, target_count=target_count
+                    )
+            except ValueError as ve:
+                logger.warning(f"Coin compaction of {coin_type} failed: {ve}")
+            await asyncio.sleep(interval)
+
+    async def _load_gas(self, txn: SuiTransaction) -> str:
+        """Load the payer coin pool."""
+        signer = txn.signer_block
+        payer = signer.payer_address
+        if payer not in self._gas_pools:
+            coins = await asyncio.to_thread(
+                gd._get_all_gas_objects, signer, txn.client
+            )
+            self._gas_pools[payer] = {x.coin_object_id: x for x in coins}
+        return payer
+
+    async def _refresh_gas(self, txn: SuiTransaction, payer: str) -> None:
+        """Refresh the payer coins with unknown balance that are not in use.
+
+        Called holding the gas condition, which is released while the coins are
+        fetched so releases and other acquirers are not held up.
+        """
+        pool = self._gas_pools[payer]
+        stale = [
+            x for x in self._gas_stale if x in pool and x not in self._gas_busy
+        ]
+        if not stale:
+            return
+        # Busy while fetched, neither taken nor refreshed by other acquirers
+        self._gas_busy.update(stale)
+        self._gas_cond.release()
+        try:
+            coins = await asyncio.to_thread(gd._get_gas_objects, txn.client, stale)
+        finally:
+            await self._gas_cond.acquire()
+            self._gas_busy.difference_update(stale)
+            self._gas_cond.notify_all()
+        self._gas_stale.difference_update(stale)
+        for coin_id in stale:
+            pool.pop(coin_id, None)
+        pool.update({x.coin_object_id: x for x in coins})
+
+    async def _acquire_gas(
+        self, txn: SuiTransaction, payer: str, reserve: int
+    ) -> pgql_type.SuiCoinObjectGQL:
+        """Take a free gas coin from the payer pool, waiting if all are in use."""
+        budget = (int(self._gas_budget) if self._gas_budget else 0) + reserve
+        async with self._gas_cond:
+            while True:
+                # Coins released while waiting may have unknown balances
+                await self._refresh_gas(txn, payer)
+                pool = self._gas_pools[payer]
+                free = [
+                    x
+                    for x in pool.values()
+                    if x.coin_object_id not in self._gas_busy
+                    and x.coin_object_id not in self._reserved
+                    and x.coin_object_id not in self._gas_stale
+                    and int(x.balance) > budget
+                ]
+                if free:
+                    coin = max(free, key=lambda x: int(x.balance))
+                    self._gas_busy.add(coin.coin_object_id)
+                    self._gas_holder[coin.coin_object_id] = asyncio.current_task()
+                    return coin
+                if not any(x in self._gas_busy for x in pool):
+                    raise ValueError(
+                        f"No gas coin with balance over {budget} for payer {payer}"
+                    )
+                await self._gas_cond.wait()
+
+    async def _release_gas(self, coin: pgql_type.SuiCoinObjectGQL) -> None:
+        """Return a gas coin to the pool."""
+        async with self._gas_cond:
+            self._gas_busy.discard(coin.coin_object_id)
+            self._gas_holder.pop(coin.coin_object_id, None)
+            self._gas_cond.notify_all()
+
+    async def _object_changes(
+        self, result: pgql_type.ExecutionResultGQL
+    ) -> tuple[list[dict], bool]:
+        """Return the object changes of an execution, paging past the first.
+
+        :return: The object changes and whether all of them were fetched
+        :rtype: tuple[list[dict], bool]
+        """
+        changes: list[dict] = list(result.object_changes or [])
+        cursor = result.object_changes_cursor
+        while cursor and cursor.hasNextPage:
+            page = await self._client.execute_query_node(
+                with_node=qn.GetTxObjectChanges(digest=result.digest, next_page=cursor)
+            )
+            if not page.is_ok() or not isinstance(
+                page.result_data, pgql_type.ObjectChangesGQL
+            ):
+                logger.warning(f"Object changes of {result.digest} are incomplete")
+                return changes, False
+            changes.extend(page.result_data.data)
+            cursor = page.result_data.next_cursor
+        return changes, True
+
+    def _apply_effects(
+        self,
+        payer: str,
+        coin: pgql_type.SuiCoinObjectGQL,
+        keys: set[str],
+        object_changes: tuple[list[dict], bool],
+        gas_effects: Optional[dict],
+        gas_in_commands: bool,
+    ) -> None:
+        """Track object versions and the gas coin state from execution effects."""
+        changes, complete = object_changes
+        live, removed = _effects_object_refs(changes)
+        for oid, ref in live.items():
+            self._object_refs[oid] = ref
+            self._object_refs.move_to_end(oid)
+        if not complete:
+            # Inputs missing from the changes have unknown versions
+            removed |= keys.difference(live)
+        for oid in removed:
+            self._object_refs.pop(oid, None)
+        while self._max_object_refs and len(self._object_refs) > self._max_object_refs:
+            self._object_refs.popitem(last=False)
+        coin_id = coin.coin_object_id
+        if coin_id in live:
+            coin.version, coin.object_digest = live[coin_id]
+            if gas_in_commands or not gas_effects:
+                self._gas_stale.add(coin_id)
+            else:
+                coin.balance = str(int(coin.balance) - _gas_used(gas_effects))
+        elif coin_id in removed:
+            self._gas_pools[payer].pop(coin_id, None)
+        else:
+            self._gas_stale.add(coin_id)
+
+    async def _run(
+        self,
+        txn: SuiTransaction,
+        keys: set[str],
+        deps: set[asyncio.Task],
+        reserve: int,
+    ) -> SuiRpcResult:
+        """Wait for conflicting predecessors then build, sign and execute."""
+        if deps:
+            await asyncio.wait(deps)
+        async with self._slots:
+            try:
+                async with self._build_lock:
+                    payer = await self._load_gas(txn)
+                coin = await self._acquire_gas(txn, payer, reserve)
+            except ValueError as ve:
+                return SuiRpcResult(
+                    False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                )
+            try:
+                async with self._build_lock:
+                    if _apply_object_refs(txn.builder.inputs, self._object_refs):
+                        logger.debug(f"Updated input references for {keys}")
+                    tx_bytes, sigs = await asyncio.to_thread(
+                        txn.build_and_sign,
+                        gas_budget=self._gas_budget,
+                        use_gas_objects=[coin],
+                    )
+                result = await self._client.execute_query_node(
+                    with_node=qn.ExecuteTransaction(
+                        tx_bytestr=tx_bytes, sig_array=sigs, with_changes=True
+                    )
+                )
+                if result.is_ok() and isinstance(
+                    result.result_data, pgql_type.ExecutionResultGQL
+                ):
+                    self._apply_effects(
+                        payer,
+                        coin,
+                        keys,
+                        await self._object_changes(result.result_data),
+                        result.result_data.gas_effects,
+                        _uses_gas_coin(txn),
+                    )
+                else:
+                    self._gas_stale.add(coin.coin_object_id)
+                return result
+            except ValueError as ve:
+                return SuiRpcResult(
+                    False, "ValueError", pgql_type.ErrorGQL.from_query(ve.args)
+                )
+            finally:
+                await self._release_gas(coin)
@@ -3,13 +3,17 @@
 
 # -*- coding: utf-8 -*-
 
-import base64
+import bisect
+import time
+from enum import IntEnum
 from typing import Optional, Union
+from deprecated.sphinx import versionadded, versionchanged
 from pysui.sui.sui_pgql.pgql_txb_signing import SignerBlock
 from pysui.sui.sui_pgql.pgql_clients import BaseSuiGQLClient
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 import pysui.sui.sui_pgql.pgql_query as qn
 from pysui.sui.sui_types import bcs
+from pysui.sui.sui_types.scalars import TxBytes
 
 
 def _get_gas_objects(
@@ -51,7 +55,7 @@ def _get_all_gas_objects(
 def _dry_run_for_budget(
     signing: SignerBlock,
     client: BaseSuiGQLClient,
-    tx_bytes: str,
+    tx_bytes: TxBytes,
     active_gas_price: int,
 ) -> int:
     """Perform a dry run when no budget specified."""
@@ -84,30 +88,134 @@ def _dry_run_for_budget(
         )
 
 
+# Sui limit of gas payment coins
+_MAX_GAS_COINS: int = 256
+# Seconds a coin selected for gas is considered contended
+_CONTENTION_WINDOW: float = 10.0
+# Coin id to the time it was last selected for gas
+_RECENT_GAS: dict[str, float] = {}
+
+
+@versionadded(version="0.63.0", reason="Gas coin selection strategies")
+class GasSelection(IntEnum):
+    """Gas coin selection strategies."""
+
+    # Smallest coin covering the budget, else largest coins and best fit remainder
+    BEST_FIT = 0
+    # Largest coins first
+    FEWEST_COINS = 1
+    # Lowest version coins first, consolidating old coins
+    OLDEST_FIRST = 2
+    # Best fit among coins not selected by recent builds
+    LEAST_CONTENDED = 3
+
+
+@versionadded(version="0.63.0", reason="Gas coin selection strategies")
+class GasCoinIndex:
+    """Gas coins indexed by integer balance, built once per coin list."""
+
+    __slots__ = ("coins", "balances")
+
+    def __init__(self, coins: list[pgql_type.SuiCoinObjectGQL]):
+        """__init__ Sort coins by balance.
+
+        :param coins: The candidate gas coins
+        :type coins: list[pgql_type.SuiCoinObjectGQL]
+        """
+        self.coins: list[pgql_type.SuiCoinObjectGQL] = sorted(
+            coins, key=lambda x: int(x.balance)
+        )
+        self.balances: list[int] = [int(x.balance) for x in self.coins]
+
+    def _accumulate(
+        self, ordered: list[int], budget: int
+    ) -> list[pgql_type.SuiCoinObjectGQL]:
+        """Take coins, by index order, until their total covers the budget."""
+        accum: int = 0
+        selected: list[pgql_type.SuiCoinObjectGQL] = []
+        for index in ordered[:_MAX_GAS_COINS]:
+            selected.append(self.coins[index])
+            accum += self.balances[index]
+            if accum >= budget:
+                return selected
+        raise ValueError(f"Total gas available {accum}, transaction requires {budget}")
+
+    def _best_fit(self, budget: int) -> list[pgql_type.SuiCoinObjectGQL]:
+        """Smallest covering coin, else largest coins then the best fit for the rest."""
+        balances = self.balances
+        high = len(balances)
+        selected: list[pgql_type.SuiCoinObjectGQL] = []
+        remaining = budget
+        while high and len(selected) < _MAX_GAS_COINS:
+            index = bisect.bisect_left(balances, remaining, 0, high)
+            if index < high:
+                selected.append(self.coins[index])
+                return selected
+            high -= 1
+            selected.append(self.coins[high])
+            remaining -= balances[high]
+        accum = budget - remaining
+        raise ValueError(f"Total gas available {accum}, transaction requires {budget}")
+
+    def _least_contended(self, budget: int) -> list[pgql_type.SuiCoinObjectGQL]:
+        """First covering coin, in balance order, not recently selected."""
+        horizon = time.monotonic() - _CONTENTION_WINDOW
+        for index in range(bisect.bisect_left(self.balances, budget), len(self.coins)):
+            if _RECENT_GAS.get(self.coins[index].coin_object_id, 0.0) < horizon:
+                return [self.coins[index]]
+        return self._best_fit(budget)
+
+    def select(
+        self, budget: int, strategy: Optional[GasSelection] = GasSelection.BEST_FIT
+    ) -> list[pgql_type.SuiCoinObjectGQL]:
+        """select Select coins covering the budget.
+
+        :param budget: The transaction gas budget
+        :type budget: int
+        :param strategy: The selection strategy, defaults to GasSelection.BEST_FIT
+        :type strategy: Optional[GasSelection], optional
+        :raises ValueError: If the coins do not cover the budget
+        :return: The selected coins
+        :rtype: list[pgql_type.SuiCoinObjectGQL]
+        """
+        match strategy:
+            case GasSelection.FEWEST_COINS:
+                selected = self._accumulate(
+                    list(range(len(self.coins) - 1, -1, -1)), budget
+                )
+            case GasSelection.OLDEST_FIRST:
+                selected = self._accumulate(
+                    sorted(range(len(self.coins)), key=lambda x: self.coins[x].version),
+                    budget,
+                )
+            case GasSelection.LEAST_CONTENDED:
+                selected = self._least_contended(budget)
+            case _:
+                selected = self._best_fit(budget)
+        now = time.monotonic()
+        for coin in selected:
+            _RECENT_GAS[coin.coin_object_id] = now
+        if len(_RECENT_GAS) > 4 * _MAX_GAS_COINS:
+            horizon = now - _CONTENTION_WINDOW
+            for coin_id in [x for x, y in _RECENT_GAS.items() if y < horizon]:
+                _RECENT_GAS.pop(coin_id, None)
+        return selected
+
+
+@versionchanged(version="0.63.0", reason="Selection strategies over a balance index")
 def _coins_for_budget(
-    coins: list[pgql_type.SuiCoinObjectGQL], budget: int
+    coins: list[pgql_type.SuiCoinObjectGQL],
+    budget: int,
+    strategy: Optional[GasSelection] = GasSelection.BEST_FIT,
 ) -> list[bcs.ObjectReference]:
-    """."""
-    _coin_fit = [x for x in coins if int(x.balance) > budget]
-    if _coin_fit:
-        _coin_fit = [_coin_fit[0]]
-    else:
-        _accum: int = 0
-        _accum_coin: list = []
-        for _coin in coins:
-            if _accum >= budget:
-                break
-            else:
-                _accum_coin.append(_coin)
-                _accum += int(_coin.balance)
-        if _accum < budget:
-            raise ValueError(
-                f"Total gas available {_accum}, transaction requires {budget}"
-            )
-        _coin_fit = _accum_coin
-    return [bcs.ObjectReference.from_gql_ref(x) for x in _coin_fit]
+    """Select gas coins covering the budget."""
+    return [
+        bcs.ObjectReference.from_gql_ref(x)
+        for x in GasCoinIndex(coins).select(budget, strategy)
+    ]
 
 
+@versionchanged(version="0.63.0", reason="Added gas coin selection strategy")
 def get_gas_data(
     *,
     signing: SignerBlock,
@@ -117,6 +225,7 @@ def get_gas_data(
     objects_in_use: set[str],
     active_gas_price: int,
     tx_kind: bcs.TransactionKind,
+    selection: Optional[GasSelection] = GasSelection.BEST_FIT,
 ) -> bcs.GasData:
     """get_gas_data Builds the GasData BCS structure for the transaction data.
 
@@ -134,6 +243,8 @@ def get_gas_data(
     :type budget: Optional[int], optional
     :param use_coins: Gas coins to use for paying transactions, defaults to None
     :type use_coins: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]], optional
+    :param selection: Gas coin selection strategy, defaults to GasSelection.BEST_FIT
+    :type selection: Optional[GasSelection], optional
     :raises ValueError: If use_coins are not either strings or SuiCoinObjectGQL objects
     :raises ValueError: If not gas coins provided and none found
     :return: _description_
@@ -152,7 +263,7 @@ def get_gas_data(
         budget = _dry_run_for_budget(
             signing,
             client,
-            base64.b64encode(tx_kind.serialize()).decode(),
+            TxBytes(tx_kind.serialize()),
             active_gas_price,
         )
     # Remove conflicts with objects in use
@@ -161,7 +272,7 @@ def get_gas_data(
     if use_coins:
         # Return constructs for createing bcs.GasData
         return bcs.GasData(
-            _coins_for_budget(use_coins, budget),
+            _coins_for_budget(use_coins, budget, selection),
             bcs.Address.from_str(signing.payer_address),
             active_gas_price,
             budget,
@@ -0,0 +1,632 @@
+#    Copyright Frank V. Castellucci
+#    SPDX-License-Identifier: Apache-2.0
+
+# -*- coding: utf-8 -*-
+
+"""Pysui planner packing independent operations into constraint valid transactions."""
+
+import bisect
+import dataclasses
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional, Union
+
+from deprecated.sphinx import versionadded
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_clients import SuiGQLClient
+from pysui.sui.sui_pgql.pgql_sync_txn import SuiTransaction
+import pysui.sui.sui_pgql.pgql_query as qn
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txn.transaction_builder import PureInput
+from pysui.sui.sui_types import bcs
+from pysui.sui.sui_types.scalars import SuiU64
+
+# An operation adds its commands to the transaction it is given
+TxnOperation = Callable[[SuiTransaction], Any]
+
+_FAUX_DIGEST: str = "ByumsdYUAQWJfwYgowsme7hm5vE8d2mXik3rGaNC9R4W"
+_SUI_COIN_TYPE: str = "0x2::sui::SUI"
+
+
+def _uleb_len(value: int) -> int:
+    """Number of bytes of value when ULEB128 encoded."""
+    length = 1
+    while value >= 0x80:
+        value >>= 7
+        length += 1
+    return length
+
+
+def _is_sui_coin(coin_type: str) -> bool:
+    """Check if a coin type is SUI, with short or long form address."""
+    address, _, name = coin_type.partition("::")
+    return name == "sui::SUI" and address.removeprefix("0x").lstrip("0") == "2"
+
+
+def _command_args(command: bcs.Command) -> tuple[int, int]:
+    """Return the argument and type argument counts of a command.
+
+    Counted the same way as `verify_transaction`.
+    """
+    match command.enum_name:
+        case "MoveCall":
+            return len(command.value.Arguments), len(command.value.Type_Arguments)
+        case "TransferObjects":
+            return len(command.value.Objects), 0
+        case "MergeCoins":
+            return len(command.value.FromCoins), 0
+        case "SplitCoin":
+            return len(command.value.Amount), 0
+        case "MakeMoveVec":
+            return len(command.value.Vector), 0
+        case "Publish" | "Upgrade":
+            return len(command.value.Modules), 0
+        case _:
+            return 0, 0
+
+
+def _get_all_coins(
+    client: SuiGQLClient, owner: str, coin_type: str
+) -> list[pgql_type.SuiCoinObjectGQL]:
+    """Retreive all coins of a type for owner."""
+    coin_list: list[pgql_type.SuiCoinObjectGQL] = []
+    result = client.execute_query_node(
+        with_node=qn.GetCoins(owner=owner, coin_type=coin_type)
+    )
+    while True:
+        if result.is_ok():
+            coin_list.extend(result.result_data.data)
+            if result.result_data.next_cursor.hasNextPage:
+                result = client.execute_query_node(
+                    with_node=qn.GetCoins(
+                        owner=owner,
+                        coin_type=coin_type,
+                        next_page=result.result_data.next_cursor,
+                    )
+                )
+            else:
+                break
+        else:
+            raise ValueError(f"Execute query error: {result.result_string}")
+    return coin_list
+
+
+@dataclasses.dataclass
+class PayoutChunk:
+    """A payout transaction and the recipients it pays."""
+
+    transaction: SuiTransaction
+    recipients: list[tuple[str, int]]
+    # Total amount of the chunk
+    amount: int
+    # Source coins, empty when paying SUI from the gas coin
+    coins: list[pgql_type.SuiCoinObjectGQL] = dataclasses.field(default_factory=list)
+
+
+class _CoinPool:
+    """Coins available to fund payouts, ordered by balance."""
+
+    def __init__(self, coins: list[pgql_type.SuiCoinObjectGQL]):
+        """Initialize the balance index."""
+        self._coins = sorted(coins, key=lambda x: int(x.balance))
+        self._balances = [int(x.balance) for x in self._coins]
+
+    def select(self, amount: int, max_coins: int) -> list[pgql_type.SuiCoinObjectGQL]:
+        """Smallest single coin covering amount, else largest coins accumulated."""
+        index = bisect.bisect_left(self._balances, amount)
+        if index < len(self._coins):
+            return [self._coins[index]]
+        selected: list[pgql_type.SuiCoinObjectGQL] = []
+        accum: int = 0
+        for coin in reversed(self._coins[-max_coins:]):
+            selected.append(coin)
+            accum += int(coin.balance)
+            if accum >= amount:
+                return selected
+        raise ValueError(f"Total coin balance available {accum}, requires {amount}")
+
+    def remove(self, coins: list[pgql_type.SuiCoinObjectGQL]) -> None:
+        """Remove coins that have been committed to a payout."""
+        for coin in coins:
+            index = self._coins.index(coin)
+            del self._coins[index]
+            del self._balances[index]
+
+
+class _TxnTally:
+    """Running totals of a transaction being packed."""
+
+    def __init__(self, txn: SuiTransaction, fixed_size: int, gas_objects: int):
+        """Initialize with an empty transaction."""
+        self.txn = txn
+        self.operations: int = 0
+        self.fixed_size: int = fixed_size
+        self.inputs_size: int = 0
+        self.commands_size: int = 0
+        # Gas payment coins are input objects
+        self.object_inputs: int = gas_objects
+        self.total_args: int = 0
+
+    def size(self, input_count: int, command_count: int) -> int:
+        """Serialized TransactionData size for the given input and command counts."""
+        return (
+            self.fixed_size
+            + _uleb_len(input_count)
+            + self.inputs_size
+            + _uleb_len(command_count)
+            + self.commands_size
+        )
+
+
+@versionadded(version="0.63.0", reason="Pack operations into constraint valid PTBs")
+class TransactionPlanner:
+    """Pack independent operations into the fewest transactions valid under protocol constraints.
+
+    Each operation is a callable that adds its commands to the SuiTransaction it is
+    given, for example `lambda txn: txn.transfer_objects(transfers=[obj], recipient=to)`.
+    Operations must not use results of other operations.
+
+    Operations are applied in order to the current transaction. After each one the
+    command, input object, argument and pure size counts and the serialized size
+    are updated from only the inputs and commands the operation added. If a limit is
+    exceeded the operation is rolled back from the builder and applied to a new
+    transaction.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: SuiGQLClient,
+        gas_coin_slots: Optional[int] = 1,
+        **txn_kwargs,
+    ):
+        """__init__ TransactionPlanner initializer.
+
+        :param client: The synchronous client used to construct transactions
+        :type client: SuiGQLClient
+        :param gas_coin_slots: Gas payment coins to reserve size and input objects for, defaults to 1
+        :type gas_coin_slots: Optional[int], optional
+        :param txn_kwargs: Additional SuiTransaction arguments (e.g. initial_sender)
+        """
+        self._client = client
+        self._txn_kwargs = txn_kwargs
+        self._constraints: pgql_type.TransactionConstraints = (
+            client.protocol.transaction_constraints
+        )
+        self._gas_coin_slots = gas_coin_slots
+        self._fixed_size = self._empty_txn_size(gas_coin_slots)
+
+    def _empty_txn_size(self, gas_coin_slots: int) -> int:
+        """Serialized size of TransactionData less its empty input and command vectors."""
+        faux_addy = bcs.Address.from_str("0x0")
+        faux_ref = bcs.ObjectReference(
+            faux_addy, 0, bcs.Digest.from_str(_FAUX_DIGEST)
+        )
+        txdata = bcs.TransactionData(
+            "V1",
+            bcs.TransactionDataV1(
+                bcs.TransactionKind(
+                    "ProgrammableTransaction", bcs.ProgrammableTransaction([], [])
+                ),
+                faux_addy,
+                bcs.GasData(
+                    [faux_ref] * gas_coin_slots,
+                    faux_addy,
+                    self._client.current_gas_price,
+                    self._constraints.max_tx_gas,
+                ),
+                bcs.TransactionExpiration("None"),
+            ),
+        )
+        return len(txdata.serialize()) - 2
+
+    def _new_tally(self) -> _TxnTally:
+        """Start a new transaction."""
+        return _TxnTally(
+            SuiTransaction(client=self._client, **self._txn_kwargs),
+            self._fixed_size,
+            self._gas_coin_slots,
+        )
+
+    def _try_add(
+        self, tally: _TxnTally, operation: TxnOperation, keep: bool = True
+    ) -> Union[str, None]:
+        """Apply an operation, rolling it back if any constraint would be exceeded.
+
+        :return: None if applied, else the name of the first constraint exceeded
+        """
+        builder = tally.txn.builder
+        limits = self._constraints
+        in_mark = len(builder.inputs)
+        cmd_mark = len(builder.commands)
+        registry_mark = builder.objects_registry.copy()
+        frequency_mark = builder.command_frequency.copy()
+        try:
+            operation(tally.txn)
+        except Exception:
+            self._rollback(tally, in_mark, cmd_mark, registry_mark, frequency_mark)
+            raise
+
+        inputs_size = objects = 0
+        for key, call_arg in islice(builder.inputs.items(), in_mark, None):
+            inputs_size += len(call_arg.serialize())
+            if key.enum_name == "Pure":
+                # Same bound as verify_transaction
+                if len(key.value) >= limits.max_pure_argument_size:
+                    violation = "max_pure_argument_size"
+                    break
+            else:
+                objects += 1
+        else:
+            violation = None
+        commands_size = args = 0
+        for command in islice(builder.commands, cmd_mark, None):
+            if violation:
+                break
+            commands_size += len(command.serialize())
+            cargs, targs = _command_args(command)
+            if cargs > limits.max_arguments:
+                violation = "max_arguments"
+            elif targs > limits.max_type_arguments:
+                violation = "max_type_arguments"
+            args += cargs
+            if command.enum_name == "MoveCall":
+                objects += 1
+
+        if not violation:
+            if len(builder.commands) > limits.max_programmable_tx_commands:
+                violation = "max_programmable_tx_commands"
+            elif tally.object_inputs + objects > limits.max_input_objects:
+                violation = "max_input_objects"
+            elif (
+                tally.total_args + args > limits.max_num_transferred_move_object_ids
+            ):
+                violation = "max_num_transferred_move_object_ids"
+            elif (
+                tally.size(len(builder.inputs), len(builder.commands))
+                + inputs_size
+                + commands_size
+                > limits.max_tx_size_bytes
+            ):
+                violation = "max_tx_size_bytes"
+        if violation or not keep:
+            self._rollback(tally, in_mark, cmd_mark, registry_mark, frequency_mark)
+            return violation
+        tally.inputs_size += inputs_size
+        tally.commands_size += commands_size
+        tally.object_inputs += objects
+        tally.total_args += args
+        tally.operations += 1
+        return None
+
+    @staticmethod
+    def _rollback(
+        tally: _TxnTally,
+        in_mark: int,
+        cmd_mark: int,
+        registry_mark: dict[str, str],
+        frequency_mark: dict[str, int],
+    ) -> None:
+        """Restore the builder to the state before an operation was applied."""
+        builder = tally.txn.builder
+        for key in list(islice(builder.inputs.keys(), in_mark, None)):
+            del builder.inputs[key]
+        del builder.commands[cmd_mark:]
+        builder.objects_registry = registry_mark
+        builder.command_frequency = frequency_mark
+
+    def plan(self, operations: Iterable[TxnOperation]) -> list[SuiTransaction]:
+        """plan Pack operations into transactions.
+
+        :param operations: The independent operations
+        :type operations: Iterable[TxnOperation]
+        :raises ValueError: If an operation alone exceeds a constraint
+        :return: The transactions, ready to build
+        :rtype: list[SuiTransaction]
+        """
+        packed: list[SuiTransaction] = []
+        tally: _TxnTally = None
+        for operation in operations:
+            if tally:
+                violation = self._try_add(tally, operation)
+                if not violation:
+                    continue
+                packed.append(tally.txn)
+            tally = self._new_tally()
+            violation = self._try_add(tally, operation)
+            if violation:
+                raise ValueError(f"Operation alone exceeds {violation} constraint")
+        if tally and tally.operations:
+            packed.append(tally.txn)
+        return packed
+
+    @staticmethod
+    def _payout_operation(
+        recipients: list[tuple[str, int]], coins: list[pgql_type.SuiCoinObjectGQL]
+    ) -> TxnOperation:
+        """Single multi-amount split with the results transferred to recipients."""
+
+        def _payout(txn: SuiTransaction) -> None:
+            builder = txn.builder
+            if coins:
+                from_coin = builder.input_obj_from_objarg(
+                    bcs.ObjectArg(
+                        "ImmOrOwnedObject", bcs.ObjectReference.from_gql_ref(coins[0])
+                    )
+                )
+                if len(coins) > 1:
+                    builder.merge_coins(
+                        from_coin,
+                        [
+                            bcs.ObjectArg(
+                                "ImmOrOwnedObject", bcs.ObjectReference.from_gql_ref(x)
+                            )
+                            for x in coins[1:]
+                        ],
+                    )
+            else:
+                from_coin = txn.gas
+            splits = builder.split_coin(
+                from_coin,
+                [PureInput.as_input(SuiU64(amount)) for _, amount in recipients],
+            )
+            if not isinstance(splits, list):
+                splits = [splits]
+            for (recipient, _), split in zip(recipients, splits):
+                builder.transfer_objects(
+                    PureInput.as_input(bcs.Address.from_str(recipient)), [split]
+                )
+
+        return _payout
+
+    def _fit_largest(
+        self,
+        tally: _TxnTally,
+        count: int,
+        make_operation: Callable[[int], TxnOperation],
+    ) -> int:
+        """Add the operation over the most items, up to count, that fits the transaction.
+
+        :param tally: The transaction being packed
+        :type tally: _TxnTally
+        :param count: The maximum number of items
+        :type count: int
+        :param make_operation: Returns the operation over the first n items, raises
+            ValueError when it can not be made for n items
+        :type make_operation: Callable[[int], TxnOperation]
+        :return: The number of items added, 0 if not even one fits
+        :rtype: int
+        """
+
+        def _fits(items: int, keep: bool) -> bool:
+            try:
+                operation = make_operation(items)
+            except ValueError:
+                return False
+            return not self._try_add(tally, operation, keep=keep)
+
+        if _fits(count, True):
+            return count
+        low, high = 0, count - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if _fits(mid, False):
+                low = mid
+            else:
+                high = mid - 1
+        if low:
+            self._try_add(tally, make_operation(low))
+        return low
+
+    def _payout_batch(
+        self,
+        recipients: list[tuple[str, int]],
+        start: int,
+        count: int,
+        pool: _CoinPool,
+        max_amount: Optional[int] = None,
+    ) -> tuple[list[tuple[str, int]], int, list[pgql_type.SuiCoinObjectGQL]]:
+        """Recipients, total amount and source coins of a payout batch."""
+        batch = recipients[start : start + count]
+        amount = sum(x[1] for x in batch)
+        if max_amount is not None and amount > max_amount:
+            raise ValueError(f"Payout amount {amount} exceeds {max_amount}")
+        max_coins = self._constraints.max_input_objects - self._gas_coin_slots
+        coins = pool.select(amount, max_coins) if pool else []
+        return batch, amount, coins
+
+    def plan_payouts(
+        self,
+        recipients: list[tuple[str, int]],
+        *,
+        coin_type: Optional[str] = _SUI_COIN_TYPE,
+        max_amount: Optional[int] = None,
+    ) -> list[PayoutChunk]:
+        """plan_payouts Pack recipient payments into the fewest transactions.
+
+        Each transaction does one multi-amount SplitCoins and transfers each split to
+        its recipient. SUI is split from the gas coin, other coin types from coins of
+        the sender selected per transaction (best single fit, else the largest coins
+        merged) so transactions do not share coins.
+
+        The gas coin of a SUI payout transaction must hold the chunk amount plus the
+        gas budget. Set max_amount to what the gas coins can spare beyond the budget
+        to keep each chunk fundable; without it chunks are bounded only by the
+        protocol constraints.
+
+        :param recipients: List of (address, amount) to pay
+        :type recipients: list[tuple[str, int]]
+        :param coin_type: The coin type to pay with, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :param max_amount: Maximum total amount of a transaction, defaults to None
+        :type max_amount: Optional[int], optional
+        :raises ValueError: If the sender coins can not cover a transaction or a
+            single payout exceeds max_amount
+        :return: The payout transactions with the recipients each pays
+        :rtype: list[PayoutChunk]
+        """
+        limits = self._constraints
+        # One split amount and one transfer command per recipient
+        chunk_max = max(
+            1,
+            min(
+                limits.max_arguments,
+                limits.max_programmable_tx_commands - 2,
+                limits.max_num_transferred_move_object_ids // 2,
+            ),
+        )
+        pool: _CoinPool = None
+        chunks: list[PayoutChunk] = []
+        start: int = 0
+        while start < len(recipients):
+            tally = self._new_tally()
+            if not _is_sui_coin(coin_type) and pool is None:
+                pool = _CoinPool(
+                    _get_all_coins(
+                        self._client, tally.txn.signer_block.sender_str, coin_type
+                    )
+                )
+
+            def _operation(count: int) -> TxnOperation:
+                batch, _, coins = self._payout_batch(
+                    recipients, start, count, pool, max_amount
+                )
+                return self._payout_operation(batch, coins)
+
+            # Amounts and coins differ per chunk, each may fit more than the last
+            count = self._fit_largest(
+                tally, min(chunk_max, len(recipients) - start), _operation
+            )
+            if not count:
+                raise ValueError(f"Payout {recipients[start]} exceeds constraints")
+            batch, amount, coins = self._payout_batch(recipients, start, count, pool)
+            if pool:
+                pool.remove(coins)
+            chunks.append(PayoutChunk(tally.txn, batch, amount, coins))
+            start += count
+        return chunks
+
+    def _merge_operation(
+        self, coins: list[pgql_type.SuiCoinObjectGQL], into_gas: bool
+    ) -> TxnOperation:
+        """Merge coins into the first coin, or into the gas coin."""
+
+        def _merge(txn: SuiTransaction) -> None:
+            builder = txn.builder
+            refs = [
+                bcs.ObjectArg("ImmOrOwnedObject", bcs.ObjectReference.from_gql_ref(x))
+                for x in coins
+            ]
+            if into_gas:
+                to_coin = txn.gas
+            else:
+                to_coin = builder.input_obj_from_objarg(refs.pop(0))
+            step = self._constraints.max_arguments
+            for index in range(0, len(refs), step):
+                builder.merge_coins(to_coin, refs[index : index + step])
+
+        return _merge
+
+    def coin_count(self, *, coin_type: Optional[str] = _SUI_COIN_TYPE) -> int:
+        """coin_count Return the number of coins of a type owned by the sender.
+
+        :param coin_type: The coin type, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :return: The number of coins
+        :rtype: int
+        """
+        sender = self._new_tally().txn.signer_block.sender_str
+        return len(_get_all_coins(self._client, sender, coin_type))
+
+    def plan_compaction(
+        self,
+        *,
+        coin_type: Optional[str] = _SUI_COIN_TYPE,
+        target_count: Optional[int] = 1,
+    ) -> list[SuiTransaction]:
+        """plan_compaction Plan one round of merges reducing the sender coins of a type.
+
+        Coins are taken smallest first into groups, one transaction per group, sized
+        by `max_input_objects` and the transaction size limit. Groups do not share
+        coins so the transactions of a round are independent. SUI groups are merged
+        into the gas coin of their transaction and the largest SUI coins, one per
+        transaction, are left out of the groups to pay for gas.
+
+        A round may not reach the target, plan and execute rounds until this returns
+        no transactions.
+
+        :param coin_type: The coin type to compact, defaults to "0x2::sui::SUI"
+        :type coin_type: Optional[str], optional
+        :param target_count: The maximum number of coins wanted, defaults to 1
+        :type target_count: Optional[int], optional
+        :return: The merge transactions for the round
+        :rtype: list[SuiTransaction]
+        """
+        tally = self._new_tally()
+        coins = sorted(
+            _get_all_coins(self._client, tally.txn.signer_block.sender_str, coin_type),
+            key=lambda x: int(x.balance),
+        )
+        into_gas = _is_sui_coin(coin_type)
+        # Fewest coins a merge group must have to reduce the count
+        min_group = 1 if into_gas else 2
+        excess = len(coins) - max(target_count, 1)
+        packed: list[SuiTransaction] = []
+        start: int = 0
+        while excess > 0:
+            available = len(coins) - start
+            if into_gas:
+                # Keep a gas coin for each transaction
+                available -= len(packed) + 1
+            count = min(
+                available,
+                excess + min_group - 1,
+                self._constraints.max_input_objects - self._gas_coin_slots,
+            )
+            if count < min_group:
+                break
+            count = self._fit_largest(
+                tally,
+                count,
+                lambda n: self._merge_operation(coins[start : start + n], into_gas),
+            )
+            if count < min_group:
+                raise ValueError("Coin merge exceeds transaction constraints")
+            packed.append(tally.txn)
+            start += count
+            excess -= count - min_group + 1
+            if excess > 0:
+                tally = self._new_tally()
+        return packed
+
+    def execute(
+        self,
+        operations: Iterable[TxnOperation],
+        *,
+        gas_budget: Optional[str] = None,
+        use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]] = None,
+    ) -> list[SuiRpcResult]:
+        """execute Pack operations into transactions then build, sign and execute each.
+
+        Transactions are executed in order. For concurrent execution pass the
+        result of `plan` to a `PipelinedExecutor`.
+
+        :param operations: The independent operations
+        :type operations: Iterable[TxnOperation]
+        :param gas_budget: Specify the amount of gas for each transaction budget, defaults to None
+        :type gas_budget: Optional[str], optional
+        :param use_gas_objects: Specify gas object(s) (by ID or SuiCoinObjectGQL), defaults to None
+        :type use_gas_objects: Optional[list[Union[str, pgql_type.SuiCoinObjectGQL]]], optional
+        :return: Execution result of each transaction
+        :rtype: list[SuiRpcResult]
+        """
+        results: list[SuiRpcResult] = []
+        for txn in self.plan(operations):
+            tx_bytes, sigs = txn.build_and_sign(
+                gas_budget=gas_budget, use_gas_objects=use_gas_objects
+            )
+            results.append(
+                self._client.execute_query_node(
+                    with_node=qn.ExecuteTransaction(tx_bytestr=tx_bytes, sig_array=sigs)
+                )
+            )
+        return results
@@ -8,6 +8,7 @@
 from typing import Optional, Union
 from pysui.sui.sui_config import SuiConfig
 from pysui.sui.sui_crypto import MultiSig, BaseMultiSig, SuiPublicKey
+from pysui.sui.sui_types.scalars import TxBytes
 
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 
@@ -123,8 +124,20 @@ class SignerBlock:
             result_list.append(self._sponsor)
         return result_list
 
-    def get_signatures(self, *, config: SuiConfig, tx_bytes: str) -> list[str]:
-        """Get all the signatures needed for the transaction."""
+    def get_signatures(
+        self, *, config: SuiConfig, tx_bytes: Union[str, bytes, TxBytes]
+    ) -> list[str]:
+        """get_signatures Get all the signatures needed for the transaction.
+
+        :param config: The configuration holding signer keys
+        :type config: SuiConfig
+        :param tx_bytes: The TransactionData bytes as TxBytes, raw bytes or base64 str
+        :type tx_bytes: Union[str, bytes, TxBytes]
+        :return: The list of base64 signatures
+        :rtype: list[str]
+        """
+        # All signers share the one TxBytes so encoding is done once
+        tx_bytes = TxBytes.as_tx_bytes(tx_bytes)
         sig_list: list[str] = []
         for signer in self._get_potential_signatures():
             if isinstance(signer, str):
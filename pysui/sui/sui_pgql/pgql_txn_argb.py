@@ -85,6 +85,18 @@ def _fetch_or_transpose_object(
 ) -> bcs.ObjectArg:
     """Fetches and prepares an object reference to ObjectArg for BCS."""
     object_def: pgql_type.ObjectReadGQL = arg
+    if isinstance(arg, str) and client.object_cache is not None:
+        cached = client.object_cache.get(arg)
+        if cached:
+            obj_ref = bcs.ObjectReference(
+                bcs.Address.from_str(cached.object_id),
+                cached.version,
+                bcs.Digest.from_str(cached.object_digest),
+            )
+            return bcs.ObjectArg(
+                "Receiving" if expected_type.is_receiving else "ImmOrOwnedObject",
+                obj_ref,
+            )
     if isinstance(arg, str):
         result = client.execute_query_node(with_node=qn.GetObject(object_id=arg))
         if result.is_ok():
@@ -6,11 +6,16 @@
 """Pysui data classes for GraphQL results."""
 from abc import ABC, abstractmethod
 
+import contextlib
+import contextvars
 import dataclasses
-from enum import IntEnum
-from typing import Any, Optional, Union, Callable
+from enum import Enum, IntEnum
+import typing
+from typing import Any, Iterator, Optional, Union, Callable
 import dataclasses_json
 import json
+from deprecated.sphinx import versionadded
+from pysui.sui.sui_txresults.common import slotted_variant
 
 
 def _fast_flat(in_dict: dict, out_dict: dict):
@@ -23,9 +28,228 @@ def _fast_flat(in_dict: dict, out_dict: dict):
             out_dict[i_key] = i_value
 
 
+# Generated decoders keyed by dataclass and whether they construct slotted variants
+_DECODERS: dict[tuple[type, bool], Callable[[dict], Any]] = {}
+# Scalar types dataclasses_json coerces when the value type differs
+_COERCED: tuple[type, ...] = (int, float, str, bool)
+# Whether results are decoded as their slotted variants, see set_slotted_results
+_SLOTTED_RESULTS: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "pysui_slotted_results", default=False
+)
+_VARIANT_CACHE: dict[type, type] = {}
+
+
+class _DecodeUnsupported(Exception):
+    """Raised when a field type requires the dataclasses_json decoder."""
+
+
+def _union_converter(options: list[type], slotted: bool) -> Callable[[Any], Any]:
+    """Decode a dict as the first dataclass option that accepts it."""
+    decoders = [_decoder_for(x, slotted) for x in options]
+
+    def _convert(value: Any) -> Any:
+        if value.__class__ is dict:
+            for decoder in decoders:
+                try:
+                    return decoder(value)
+                except (KeyError, ValueError, AttributeError):
+                    continue
+        return value
+
+    return _convert
+
+
+def _field_converter(
+    ftype: Any, slotted: bool
+) -> tuple[str, Optional[Callable[[Any], Any]]]:
+    """Return how a field value is converted and the converter, if any.
+
+    Kinds are 'pass', 'coerce', 'dataclass', 'list' and 'union'.
+    """
+    if ftype is Any or ftype in (dict, list):
+        return "pass", None
+    if isinstance(ftype, type) and issubclass(ftype, Enum):
+        raise _DecodeUnsupported(ftype)
+    if ftype in _COERCED:
+        return "coerce", ftype
+    if dataclasses.is_dataclass(ftype):
+        return "dataclass", _decoder_for(ftype, slotted)
+    origin = typing.get_origin(ftype)
+    args = typing.get_args(ftype)
+    if origin is Union:
+        options = [x for x in args if x is not type(None)]
+        if len(options) < len(args) and len(options) == 1:
+            # Optional, None is passed through by the generated decoder
+            return _field_converter(options[0], slotted)
+        if all(dataclasses.is_dataclass(x) for x in options):
+            return "union", _union_converter(options, slotted)
+        raise _DecodeUnsupported(ftype)
+    if origin is dict:
+        return "pass", None
+    if origin is list:
+        kind, item_conv = (
+            _field_converter(args[0], slotted) if args else ("pass", None)
+        )
+        if kind in ("pass", "coerce"):
+            # dataclasses_json leaves scalar list items as is
+            return "pass", None
+        if kind == "list":
+            raise _DecodeUnsupported(ftype)
+        return "list", item_conv
+    raise _DecodeUnsupported(ftype)
+
+
+def _generate_decoder(clz: type, slotted: bool) -> Callable[[dict], Any]:
+    """Generate a decoder for a dataclass_json dataclass.
+
+    The decoder accepts the same input as ``clz.from_dict``: keys in either
+    the field name or its letter cased form, unknown keys ignored, missing
+    fields taking the field default and scalar values coerced to the field
+    type. Dataclasses with field types not handled here use ``from_dict``.
+    When slotted, it and its nested decoders construct slotted variants.
+    """
+    class_case = (getattr(clz, "dataclass_json_config", None) or {}).get(
+        "letter_case"
+    )
+    hints = typing.get_type_hints(clz)
+    namespace: dict[str, Any] = {"_clz": _result_type(clz, slotted)}
+    lines: list[str] = [
+        "def _decode(d):",
+        "    if d.__class__ is _clz:",
+        "        return d",
+    ]
+    kwargs: list[str] = []
+    for index, field in enumerate(dataclasses.fields(clz)):
+        if not field.init:
+            continue
+        kind, conv = _field_converter(hints[field.name], slotted)
+        field_case = field.metadata.get("dataclasses_json", {})
+        if "decoder" in field_case:
+            raise _DecodeUnsupported(field.name)
+        case_fn = field_case.get("letter_case", class_case)
+        cased = case_fn(field.name) if case_fn else field.name
+        if field.default is not dataclasses.MISSING:
+            namespace[f"_d{index}"] = field.default
+            missing = f"d.get({cased!r}, _d{index})"
+        elif field.default_factory is not dataclasses.MISSING:
+            namespace[f"_d{index}"] = field.default_factory
+            missing = f"(d[{cased!r}] if {cased!r} in d else _d{index}())"
+        else:
+            missing = f"d[{cased!r}]"
+        if cased == field.name:
+            lines.append(f"    v{index} = {missing}")
+        else:
+            lines.append(
+                f"    v{index} = d[{field.name!r}] if {field.name!r} in d"
+                f" else {missing}"
+            )
+        namespace[f"_c{index}"] = conv
+        match kind:
+            case "coerce":
+                lines.append(
+                    f"    if v{index} is not None"
+                    f" and not isinstance(v{index}, _c{index}):"
+                )
+                lines.append(f"        v{index} = _c{index}(v{index})")
+            case "dataclass":
+                lines.append(f"    if v{index}.__class__ is dict:")
+                lines.append(f"        v{index} = _c{index}(v{index})")
+            case "union":
+                lines.append(f"    if v{index} is not None:")
+                lines.append(f"        v{index} = _c{index}(v{index})")
+            case "list":
+                lines.append(f"    if v{index} is not None:")
+                lines.append(
+                    f"        v{index} = [x if x.__class__ is not dict"
+                    f" else _c{index}(x) for x in v{index}]"
+                )
+        kwargs.append(f"{field.name}=v{index}")
+    lines.append(f"    return _clz({', '.join(kwargs)})")
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["_decode"]
+
+
+def _decoder_for(clz: type, slotted: Optional[bool] = None) -> Callable[[dict], Any]:
+    """Get the decoder of a dataclass_json dataclass, generated on first use.
+
+    Unless given, slotted is the setting of the current context.
+    """
+    if slotted is None:
+        slotted = _SLOTTED_RESULTS.get()
+    decoder = _DECODERS.get((clz, slotted))
+    if decoder is None:
+        try:
+            decoder = _generate_decoder(clz, slotted)
+        except _DecodeUnsupported:
+            decoder = clz.from_dict
+        _DECODERS[(clz, slotted)] = decoder
+    return decoder
+
+
+def _from_dict(clz: type, in_data: dict) -> Any:
+    """Decode a dictionary to a dataclass, equivalent to ``clz.from_dict``."""
+    return _decoder_for(clz)(in_data)
+
+
+def _result_type(clz: type, slotted: bool) -> type:
+    """Get the type results of clz are constructed as."""
+    if not slotted or clz not in (
+        SuiCoinObjectGQL,
+        ObjectReadGQL,
+        EventGQL,
+        TransactionSummaryGQL,
+    ):
+        return clz
+    variant = _VARIANT_CACHE.get(clz)
+    if variant is None:
+        variant = _VARIANT_CACHE[clz] = slotted_variant(clz)
+    return variant
+
+
+@versionadded(version="0.63.0", reason="Compact result types for high volume queries")
+def set_slotted_results(enable: bool = True) -> None:
+    """set_slotted_results Decode high volume result types as slotted variants.
+
+    Applies to SuiCoinObjectGQL, ObjectReadGQL, EventGQL and
+    TransactionSummaryGQL, the generated decoders construct the variant in place
+    of the type. Variants have the same attributes, pass `isinstance` checks of
+    and compare equal to the original types, see `slotted_variant`. Variants are
+    not frozen as results are updated in place, e.g. gas coins by
+    `PipelinedExecutor`. Results decoded before the call are unchanged.
+
+    The setting is held in a context variable, it applies to the calling thread
+    or asyncio task and the tasks it creates afterwards. Use `slotted_results`
+    to apply it to a block.
+
+    :param enable: Decode to slotted variants, False restores the original types, defaults to True
+    :type enable: bool, optional
+    """
+    _SLOTTED_RESULTS.set(enable)
+
+
+@versionadded(version="0.63.0", reason="Compact result types for high volume queries")
+@contextlib.contextmanager
+def slotted_results(enable: bool = True) -> Iterator[None]:
+    """slotted_results Decode as slotted variants within a with block.
+
+    The previous setting of the context is restored on exit, see
+    `set_slotted_results`.
+
+    :param enable: Decode to slotted variants, defaults to True
+    :type enable: bool, optional
+    """
+    token = _SLOTTED_RESULTS.set(enable)
+    try:
+        yield
+    finally:
+        _SLOTTED_RESULTS.reset(token)
+
+
 class PGQL_Type(ABC):
     """Base GraphQL to pysui data representation class."""
 
+    __slots__ = ()
+
     @abstractmethod
     def from_query(self) -> "PGQL_Type":
         """Converts raw GraphQL result to dataclass type.
@@ -154,7 +378,7 @@ class SuiCoinObjectGQL(PGQL_Type):
                     owner_kind, owner["owner"]["address_id"]
                 )
             case "Shared":
-                ser_dict["object_owner"] = SuiObjectOwnedShared.from_dict(owner)
+                ser_dict["object_owner"] = _from_dict(SuiObjectOwnedShared, owner)
             case "Parent":
                 ser_dict["object_owner"] = SuiObjectOwnedParent(
                     owner_kind, owner["owner"]["parent_id"]
@@ -162,7 +386,7 @@ class SuiCoinObjectGQL(PGQL_Type):
             case "Immutable":
                 ser_dict["object_owner"] = SuiObjectOwnedImmutable(owner_kind)
         # ser_dict = ser_dict | res_dict
-        return clz.from_dict(ser_dict)
+        return _from_dict(clz, ser_dict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -186,8 +410,8 @@ class SuiCoinFromObjectsGQL(PGQL_Type):
                     mid_list.append(ser_dict)
                 elif ser_dict.get("object_kind") == "WRAPPED_OR_DELETED":
                     ser_dict.pop("amo")
-                    mid_list.append(ObjectReadDeletedGQL.from_dict(ser_dict))
-            return clz.from_dict({"data": mid_list})
+                    mid_list.append(_from_dict(ObjectReadDeletedGQL, ser_dict))
+            return _from_dict(clz, {"data": mid_list})
         return NoopGQL.from_query()
 
 
@@ -207,7 +431,7 @@ class SuiCoinObjectsGQL(PGQL_Type):
         """
         # Get cursor
         in_data = in_data.pop("qres").pop("coins")
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         dlist: list[SuiCoinObjectGQL] = [
             SuiCoinObjectGQL.from_query(i_coin) for i_coin in in_data["coin_objects"]
         ]
@@ -243,7 +467,7 @@ class SuiStakedCoinGQL:
                     f"{owners_dict['obj_owner_kind']} for StakedSui not supported"
                 )
             in_data["object_owner"] = owners_dict
-            return SuiStakedCoinGQL.from_dict(in_data)
+            return _from_dict(SuiStakedCoinGQL, in_data)
         return NoopGQL.from_query()
 
 
@@ -269,12 +493,13 @@ class SuiStakedCoinsGQL(PGQL_Type):
                 SuiStakedCoinGQL.from_query(x)
                 for x in in_data["stakedSuis"].pop("staked_coin")
             ]
-            return SuiStakedCoinsGQL.from_dict(
+            return _from_dict(
+                SuiStakedCoinsGQL,
                 {
                     "owner": in_data["address"],
                     "stakedCoins": staked_coins,
                     "nextCursor": next_cursor,
-                }
+                },
             )
         return NoopGQL.from_query()
 
@@ -318,7 +543,9 @@ class ObjectReadGQL(PGQL_Type):
             if owner:
                 owner_kind = owner["obj_owner_kind"]
                 if in_data.get("as_move_content"):
-                    contents = in_data["as_move_content"]["as_object"].pop("content")
+                    contents = in_data["as_move_content"]["as_object"].pop(
+                        "content", None
+                    )
                 else:
                     contents = None
                     if in_data.get("as_move_package"):
@@ -334,7 +561,9 @@ class ObjectReadGQL(PGQL_Type):
                             owner_kind, owner["owner"]["address_id"]
                         )
                     case "Shared":
-                        res_dict["object_owner"] = SuiObjectOwnedShared.from_dict(owner)
+                        res_dict["object_owner"] = _from_dict(
+                            SuiObjectOwnedShared, owner
+                        )
                     case "Parent":
                         res_dict["object_owner"] = SuiObjectOwnedParent(
                             owner_kind, owner["owner"]["parent_id"]
@@ -342,9 +571,9 @@ class ObjectReadGQL(PGQL_Type):
                     case "Immutable":
                         res_dict["object_owner"] = SuiObjectOwnedImmutable(owner_kind)
                 # Flatten dictionary
-                return ObjectReadGQL.from_dict(res_dict)
+                return _from_dict(ObjectReadGQL, res_dict)
             else:
-                return ObjectReadDeletedGQL.from_dict(in_data)
+                return _from_dict(ObjectReadDeletedGQL, in_data)
         return NoopGQL.from_query()
 
 
@@ -364,7 +593,7 @@ class ObjectReadsGQL(PGQL_Type):
         """
         in_data = in_data.pop("objects")
         # Get cursor
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         dlist: list[ObjectReadGQL] = [
             ObjectReadGQL.from_query(i_obj) for i_obj in in_data["objects_data"]
         ]
@@ -382,6 +611,8 @@ class EventGQL(PGQL_Type):
     timestamp: str
     json: str
     sender: Optional[str]
+    event_cursor: Optional[str] = None
+    bcs: Optional[str] = None
 
     @classmethod
     def from_query(clz, in_data: dict) -> "EventGQL":
@@ -393,7 +624,7 @@ class EventGQL(PGQL_Type):
         in_data["json"] = json.dumps(in_data["json"])
         in_data["event_type"] = in_data.pop("type")["event_type"]
         # in_data["sender"] = [x["address"] for x in in_data["sender"]]
-        return EventGQL.from_dict(in_data)
+        return _from_dict(EventGQL, in_data)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -412,10 +643,13 @@ class EventsGQL(PGQL_Type):
 
         in_data = in_data.pop("events")
         # Get cursor
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         dlist: list[ObjectReadGQL] = [
             EventGQL.from_query(i_obj) for i_obj in in_data["events"]
         ]
+        # Edge cursors, when queried, are the position of each event
+        for i_obj, i_edge in zip(dlist, in_data.get("event_cursors", [])):
+            i_obj.event_cursor = i_edge["cursor"]
         return EventsGQL(dlist, ncurs)
 
 
@@ -430,7 +664,7 @@ class TxBlockListGQL(PGQL_Type):
     @classmethod
     def from_query(clz, in_data: dict) -> "TxBlockListGQL":
         """Serializes query result of tx blocks in checkpoint."""
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         dlist: list[str] = [t_digest["digest"] for t_digest in in_data["tx_digests"]]
         return TxBlockListGQL(dlist, ncurs)
 
@@ -454,7 +688,7 @@ class CheckpointGQL(PGQL_Type):
         in_data["transaction_blocks"] = TxBlockListGQL.from_query(
             in_data["transaction_blocks"]
         )
-        return CheckpointGQL.from_dict(in_data)
+        return _from_dict(CheckpointGQL, in_data)
 
     @classmethod
     def from_last_checkpoint(clz, in_data: dict) -> "CheckpointGQL":
@@ -464,7 +698,7 @@ class CheckpointGQL(PGQL_Type):
         in_data["transaction_blocks"] = TxBlockListGQL.from_query(
             in_data["transaction_blocks"]
         )
-        return CheckpointGQL.from_dict(in_data)
+        return _from_dict(CheckpointGQL, in_data)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -479,12 +713,22 @@ class CheckpointsGQL(PGQL_Type):
     def from_query(clz, in_data: dict) -> "CheckpointsGQL":
         """."""
         in_data = in_data.pop("checkpoints")
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         ndata: list[CheckpointGQL] = [
             CheckpointGQL.from_query(i_cp) for i_cp in in_data["checkpoints"]
         ]
         return CheckpointsGQL(ndata, ncurs)
 
+    @classmethod
+    @versionadded(version="0.63.0", reason="Checkpoint range fetch for ingestion")
+    def from_range(clz, in_data: dict) -> "CheckpointsGQL":
+        """Serializes GetCheckpointRange result in sequence order, omitting absent."""
+        ndata: list[CheckpointGQL] = sorted(
+            (CheckpointGQL.from_query(i_cp) for i_cp in in_data.values() if i_cp),
+            key=lambda x: x.sequence_number,
+        )
+        return CheckpointsGQL(ndata, PagingCursor())
+
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
 @dataclasses.dataclass
@@ -505,7 +749,7 @@ class BalanceGQL(PGQL_Type):
         res_dict: dict = {}
         # Flatten dictionary
         _fast_flat(in_data, res_dict)
-        return BalanceGQL.from_dict(res_dict)
+        return _from_dict(BalanceGQL, res_dict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -528,7 +772,7 @@ class BalancesGQL(PGQL_Type):
         # Get cursor
         owner = in_data.pop("owner_address")
         balances = in_data.pop("balances")
-        ncurs: PagingCursor = PagingCursor.from_dict(balances["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, balances["cursor"])
         dlist: list[BalanceGQL] = [
             BalanceGQL.from_query(i_obj) for i_obj in balances["type_balances"]
         ]
@@ -554,7 +798,7 @@ class SuiCoinMetadataGQL(PGQL_Type):
         res_dict: dict = {}
         # Flatten dictionary
         _fast_flat(in_data, res_dict)
-        return SuiCoinMetadataGQL.from_dict(res_dict)
+        return _from_dict(SuiCoinMetadataGQL, res_dict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -575,7 +819,7 @@ class TransactionResultGQL(PGQL_Type):
         if in_data.get("transactionBlock"):
             txblock = in_data.pop("transactionBlock")
             txblock["transaction_kind"] = txblock.pop("kind")["tx_kind"]
-            return TransactionResultGQL.from_dict(txblock)
+            return _from_dict(TransactionResultGQL, txblock)
         return NoopGQL.from_query()
 
 
@@ -597,8 +841,9 @@ class DryRunResultGQL(PGQL_Type):
                 dr_err = in_data.pop("error")
                 dr_res = in_data.pop("results")
                 tblock = TransactionResultGQL.from_query(in_data)
-                return DryRunResultGQL.from_dict(
-                    {"error": dr_err, "results": dr_res, "transaction_block": tblock}
+                return _from_dict(
+                    DryRunResultGQL,
+                    {"error": dr_err, "results": dr_res, "transaction_block": tblock},
                 )
         return NoopGQL.from_query()
 
@@ -612,6 +857,9 @@ class ExecutionResultGQL(PGQL_Type):
     lamport_version: int
     digest: str
     errors: Optional[list[str]] = None
+    gas_effects: Optional[dict] = None
+    object_changes: Optional[list[dict]] = None
+    object_changes_cursor: Optional[PagingCursor] = None
 
     @classmethod
     def from_query(clz, in_data: dict) -> "ExecutionResultGQL":
@@ -619,9 +867,38 @@ class ExecutionResultGQL(PGQL_Type):
         if in_data:
             in_data = in_data.get("executeTransactionBlock")
             if in_data:
+                effects: dict = in_data.get("effects") or {}
+                gas_effects = effects.pop("gasEffects", None)
+                obj_changes = effects.pop("objectChanges", None)
                 fdict: dict = {}
                 _fast_flat(in_data, fdict)
-                return ExecutionResultGQL.from_dict(fdict)
+                fdict["gasEffects"] = gas_effects
+                fdict["objectChanges"] = (
+                    obj_changes.get("nodes") if obj_changes else None
+                )
+                fdict["objectChangesCursor"] = (
+                    obj_changes.get("cursor") if obj_changes else None
+                )
+                return _from_dict(ExecutionResultGQL, fdict)
+        return NoopGQL.from_query()
+
+
+@dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
+@dataclasses.dataclass
+class ObjectChangesGQL(PGQL_Type):
+    """Page of the object changes of a transaction."""
+
+    data: list[dict]
+    next_cursor: PagingCursor
+
+    @classmethod
+    def from_query(clz, in_data: dict) -> "ObjectChangesGQL":
+        """Serializes query result of transaction object changes."""
+        tx_block: dict = in_data.get("transactionBlock") if in_data else None
+        if tx_block and tx_block.get("effects"):
+            in_data = tx_block["effects"]["objectChanges"]
+            ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
+            return ObjectChangesGQL(in_data["changes"], ncurs)
         return NoopGQL.from_query()
 
 
@@ -639,7 +916,7 @@ class TransactionSummaryGQL(PGQL_Type):
         """."""
         fdict: dict = {}
         _fast_flat(in_data, fdict)
-        return TransactionSummaryGQL.from_dict(fdict)
+        return _from_dict(TransactionSummaryGQL, fdict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -654,7 +931,7 @@ class TransactionSummariesGQL(PGQL_Type):
     def from_query(clz, in_data: dict) -> "TransactionSummariesGQL":
         """."""
         in_data = in_data.pop("transactionBlocks")
-        ncurs: PagingCursor = PagingCursor.from_dict(in_data["cursor"])
+        ncurs: PagingCursor = _from_dict(PagingCursor, in_data["cursor"])
         tsummary = [
             TransactionSummaryGQL.from_query(x) for x in in_data.pop("tx_blocks")
         ]
@@ -885,7 +1162,7 @@ class TransactionKindGQL(PGQL_Type):
                     pass
                 case _:
                     raise ValueError(f"{tx_type} not handled in data model.")
-            return TransactionKindGQL.from_dict(tx_block)
+            return _from_dict(TransactionKindGQL, tx_block)
         return NoopGQL.from_query()
 
 
@@ -915,7 +1192,7 @@ class ValidatorGQL(PGQL_Type):
     def from_query(clz, in_data: dict) -> "ValidatorGQL":
         """."""
         in_data["validatorAddress"] = in_data["address"]["validatorAddress"]
-        return ValidatorGQL.from_dict(in_data)
+        return _from_dict(ValidatorGQL, in_data)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -937,7 +1214,7 @@ class ValidatorSetGQL(PGQL_Type):
             ValidatorGQL.from_query(v_obj)
             for v_obj in in_data["validators"]["validators"]
         ]
-        return ValidatorSetGQL.from_dict(in_data)
+        return _from_dict(ValidatorSetGQL, in_data)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -950,7 +1227,7 @@ class ReferenceGasPriceGQL(PGQL_Type):
     @classmethod
     def from_query(clz, in_data: dict) -> "ReferenceGasPriceGQL":
         in_data = in_data.pop("epoch", in_data)
-        return ReferenceGasPriceGQL.from_dict(in_data)
+        return _from_dict(ReferenceGasPriceGQL, in_data)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -972,7 +1249,7 @@ class SystemStateSummaryGQL(PGQL_Type):
         rgp = {"referenceGasPrice": in_data.pop("referenceGasPrice")}
         in_data["referenceGasPrice"] = ReferenceGasPriceGQL.from_query(rgp)
         in_data["validatorSet"] = ValidatorSetGQL.from_query(in_data["validatorSet"])
-        return SystemStateSummaryGQL.from_dict(in_data)
+        return _from_dict(SystemStateSummaryGQL, in_data)
 
 
 @dataclasses_json.dataclass_json
@@ -1038,7 +1315,9 @@ class ProtocolConfigGQL:
         for cnst_key in cnst_dict.keys():
             if cnst_key in cfg_dict:
                 cnst_dict[cnst_key] = cfg_dict[cnst_key]
-        self.transaction_constraints = TransactionConstraints.from_dict(cnst_dict)
+        self.transaction_constraints = _from_dict(
+            TransactionConstraints, cnst_dict
+        )
         self.transaction_constraints.protocol_version = self.protocolVersion
 
         # Set appropriate features
@@ -1047,7 +1326,7 @@ class ProtocolConfigGQL:
 
     @classmethod
     def from_query(clz, in_data: dict) -> "ProtocolConfigGQL":
-        return ProtocolConfigGQL.from_dict(in_data.pop("protocolConfig"))
+        return _from_dict(ProtocolConfigGQL, in_data.pop("protocolConfig"))
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -1065,7 +1344,7 @@ class MoveStructureGQL:
             in_data = in_data.get("object", in_data)
             fdict: dict = {}
             _fast_flat(in_data, fdict)
-            return MoveStructureGQL.from_dict(fdict)
+            return _from_dict(MoveStructureGQL, fdict)
         return NoopGQL.from_query()
 
 
@@ -1093,7 +1372,7 @@ class MoveStructuresGQL:
             fdict["structures"] = [
                 MoveStructureGQL.from_query(x) for x in fdict["nodes"]
             ]
-            return MoveStructuresGQL.from_dict(fdict)
+            return _from_dict(MoveStructuresGQL, fdict)
             # return MoveStructuresGQL.from_dict(
             #     {"structures": [MoveStructureGQL.from_query(x) for x in fdict["nodes"]]}
             # )
@@ -1282,7 +1561,7 @@ class MoveFunctionGQL:
         if in_data.get("object") or in_data.get("function_name"):
             fdict: dict = {}
             _fast_flat(in_data, fdict)
-            return MoveFunctionGQL.from_dict(fdict)
+            return _from_dict(MoveFunctionGQL, fdict)
         return NoopGQL.from_query()
 
     def arg_summary(self) -> MoveArgSummary:
@@ -1337,7 +1616,7 @@ class MoveFunctionsGQL:
                 fdict["functions"] = [
                     MoveFunctionGQL.from_query(x) for x in fdict["nodes"]
                 ]
-                return MoveFunctionsGQL.from_dict(fdict)
+                return _from_dict(MoveFunctionsGQL, fdict)
         return NoopGQL.from_query()
 
 
@@ -1367,7 +1646,7 @@ class MoveModuleGQL:
                 {"nodes": fdict["module_functions"]}
             )
 
-            return MoveModuleGQL.from_dict(fdict)
+            return _from_dict(MoveModuleGQL, fdict)
         return NoopGQL.from_query()
 
 
@@ -1391,7 +1670,7 @@ class MovePackageGQL:
             )
             fdict["modules"] = [MoveModuleGQL.from_query(x) for x in fdict["nodes"]]
             fdict.pop("nodes")
-            return MovePackageGQL.from_dict(fdict)
+            return _from_dict(MovePackageGQL, fdict)
         return NoopGQL.from_query()
 
 
@@ -1435,7 +1714,7 @@ class ValidatorFullGQL:
         # if "exchangeRate" in fdict:
         #     fdict["exchange_rates_address"] = None
         #     fdict.pop("exchangeRate")
-        return ValidatorFullGQL.from_dict(fdict)
+        return _from_dict(ValidatorFullGQL, fdict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -1464,7 +1743,7 @@ class ValidatorSetsGQL:
         fdict["validators"] = [
             ValidatorFullGQL.from_query(x) for x in fdict["validators"]
         ]
-        return ValidatorSetsGQL.from_dict(fdict)
+        return _from_dict(ValidatorSetsGQL, fdict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -1491,7 +1770,7 @@ class ValidatorApysGQL:
         fdict["next_cursor"] = PagingCursor(
             fdict.pop("hasNextPage"), fdict.pop("endCursor")
         )
-        return ValidatorApysGQL.from_dict(fdict)
+        return _from_dict(ValidatorApysGQL, fdict)
 
 
 @dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
@@ -1522,5 +1801,5 @@ class DynamicFieldsGQL:
             fdict["next_cursor"] = PagingCursor(
                 fdict.pop("hasNextPage"), fdict.pop("endCursor")
             )
-            return DynamicFieldsGQL.from_dict(fdict)
+            return _from_dict(DynamicFieldsGQL, fdict)
         return NoopGQL.from_query()
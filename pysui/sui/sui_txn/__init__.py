@@ -13,10 +13,17 @@
 
 """Sui Transactions (sync, async) package."""
 
-from pysui.sui.sui_txn.sync_transaction import (
-    SuiTransaction as SyncTransaction,
-)
-from pysui.sui.sui_txn.async_transaction import (
-    SuiTransactionAsync as AsyncTransaction,
+from pysui.lazy_imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {
+        "SyncTransaction": ("pysui.sui.sui_txn.sync_transaction", "SuiTransaction"),
+        "AsyncTransaction": (
+            "pysui.sui.sui_txn.async_transaction",
+            "SuiTransactionAsync",
+        ),
+        "SignerBlock": ("pysui.sui.sui_txn.signing_ms", "SignerBlock"),
+        "SigningMultiSig": ("pysui.sui.sui_txn.signing_ms", "SigningMultiSig"),
+    },
 )
-from pysui.sui.sui_txn.signing_ms import SignerBlock, SigningMultiSig
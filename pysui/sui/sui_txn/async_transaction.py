@@ -15,7 +15,6 @@
 """Sui asynchronous Transaction for building Programmable Transactions."""
 
 import logging
-import base64
 from typing import Optional, Union, Any, Callable, Awaitable
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 
@@ -27,10 +26,11 @@ from pysui import (
 )
 from pysui.sui.sui_builders.base_builder import SuiRequestType
 from pysui.sui.sui_builders.get_builders import GetFunction
+from pysui.sui.sui_pgql.pgql_fn_index import FunctionIndex
 from pysui.sui.sui_txresults.common import GenericRef
 from pysui.sui.sui_types.collections import SuiArray
 from pysui.sui.sui_types.scalars import SuiString
-from pysui.sui.sui_types.scalars import SuiInteger, SuiString, SuiU64, SuiU8
+from pysui.sui.sui_types.scalars import SuiInteger, SuiString, SuiU64, SuiU8, TxBytes
 from pysui.sui.sui_txn.signing_ms import SigningMultiSig
 from pysui.sui.sui_txn.transaction import _SuiTransactionBase
 import pysui.sui.sui_txn.transaction_builder as tx_builder
@@ -74,6 +74,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
     @versionchanged(version="0.33.0", reason="Added deserialize_from optional argument")
     @versionchanged(version="0.39.0", reason="Added compress_inputs option")
     @versionchanged(version="0.39.0", reason="keyword arguments")
+    @versionchanged(version="0.63.0", reason="Added function_index option")
     def __init__(
         self,
         **kwargs,
@@ -90,9 +91,19 @@ class SuiTransactionAsync(_SuiTransactionBase):
         :type compress_inputs: bool,optional
         :param deserialize_from: Will rehydrate SuiTransaction state from serialized base64 str or bytes, defaults to None
         :type deserialize_from: Union[str, bytes], optional
+        :param function_index: Local function signatures resolving move call targets without queries, defaults to None
+        :type function_index: FunctionIndex, optional
         """
+        self._function_index: Optional[FunctionIndex] = kwargs.pop(
+            "function_index", None
+        )
         super().__init__(**kwargs)
 
+    @property
+    def function_index(self) -> Optional[FunctionIndex]:
+        """Returns the local function signature index."""
+        return self._function_index
+
     @versionchanged(
         version="0.28.0",
         reason="Added optional 'use_gas_object'.",
@@ -157,9 +168,7 @@ class SuiTransactionAsync(_SuiTransactionBase):
                 ),
             )
             result = await self.client.execute(
-                DryRunTransaction(
-                    tx_bytes=base64.b64encode(tx_data.serialize()).decode()
-                )
+                DryRunTransaction(tx_bytes=TxBytes(tx_data.serialize()).value)
             )
             if (
                 result.is_ok()
@@ -284,19 +293,17 @@ class SuiTransactionAsync(_SuiTransactionBase):
         assert not self._executed, "Transaction already executed"
 
         txn_data = await self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        tx_bytes = TxBytes(txn_data.serialize())
         if run_verification:
-            _, failed_verification = self.verify_transaction(ser_data)
+            _, failed_verification = self.verify_transaction(tx_bytes)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
 
-        # To base64
-        tx_b64 = base64.b64encode(ser_data).decode()
-        # To execution
+        # To execution, base64 encoded once and shared by signing
         exec_tx = ExecuteTransaction(
-            tx_bytes=tx_b64,
+            tx_bytes=tx_bytes.value,
             signatures=self.signer_block.get_signatures(
-                client=self.client, tx_bytes=tx_b64
+                client=self.client, tx_bytes=tx_bytes
             ),
             options=options,
             request_type=SuiRequestType.WAITFORLOCALEXECUTION,
@@ -330,13 +337,13 @@ class SuiTransactionAsync(_SuiTransactionBase):
         """
         assert not self._executed, "Transaction already executed"
         txn_data = await self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        tx_bytes = TxBytes(txn_data.serialize())
         if run_verification:
-            _, failed_verification = self.verify_transaction(ser_data)
+            _, failed_verification = self.verify_transaction(tx_bytes)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
         self._executed = True
-        return base64.b64encode(ser_data).decode()
+        return tx_bytes.value
 
     @versionchanged(
         version="0.16.1",
@@ -436,17 +443,29 @@ class SuiTransactionAsync(_SuiTransactionBase):
     @versionchanged(
         version="0.20.2", reason="Capture function argument meta data as well"
     )
+    @versionchanged(version="0.63.0", reason="Resolve from the function index")
     async def _move_call_target_cache(
         self, target: str
     ) -> tuple[bcs.Address, str, str, list, int]:
         """Used to resolve information regarding a move call target.
 
         This caches the result of a GetFunction meta-data information essention to setting up
-        the proper command return types.
+        the proper command return types. Targets in the function index are resolved
+        locally and, as the cache is shared by all transactions, not cached.
         """
+        package_id, module_id, function_id = target.split("::")
+        if self._function_index:
+            mfunc = self._function_index.normalized_function(target)
+            if mfunc:
+                return (
+                    bcs.Address.from_str(package_id),
+                    module_id,
+                    function_id,
+                    mfunc.parameters,
+                    len(mfunc.returns),
+                )
         if target in self._MC_RESULT_CACHE:
             return self._MC_RESULT_CACHE[target]
-        package_id, module_id, function_id = target.split("::")
         result = await self.client.execute(
             GetFunction(
                 package=package_id,
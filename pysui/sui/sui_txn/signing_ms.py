@@ -23,7 +23,7 @@ from pysui.sui.sui_builders.exec_builders import _MoveCallTransactionBuilder
 from pysui.sui.sui_crypto import MultiSig, SuiPublicKey, BaseMultiSig
 from pysui.sui.sui_txresults.single_tx import SuiCoinObject
 from pysui.sui.sui_types.collections import SuiArray
-from pysui.sui.sui_types.scalars import SuiSignature, SuiString
+from pysui.sui.sui_types.scalars import SuiSignature, SuiString, TxBytes
 
 from pysui.sui.sui_types import bcs
 
@@ -134,10 +134,13 @@ class _SignerBlockBase:
         return result_list
 
     @versionchanged(version="0.21.2", reason="Fix regression on MultiSig signing.")
+    @versionchanged(version="0.63.0", reason="Accepts TxBytes")
     def get_signatures(
-        self, *, client: SyncClient, tx_bytes: str
+        self, *, client: SyncClient, tx_bytes: Union[str, bytes, TxBytes]
     ) -> SuiArray[SuiSignature]:
         """Get all the signatures needed for the transaction."""
+        # All signers share the one TxBytes so encoding is done once
+        tx_bytes = TxBytes.as_tx_bytes(tx_bytes)
         sig_list: list[SuiSignature] = []
         for signer in self._get_potential_signatures():
             if isinstance(signer, SuiAddress):
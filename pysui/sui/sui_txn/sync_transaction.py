@@ -16,7 +16,6 @@
 
 from typing import Any, Optional, Union, Callable
 import logging
-import base64
 from deprecated.sphinx import versionadded, versionchanged, deprecated
 
 from pysui import SyncClient, SuiAddress, SuiRpcResult, ObjectID
@@ -33,7 +32,7 @@ from pysui.sui.sui_txresults.complex_tx import (
     TxInspectionResult,
 )
 from pysui.sui.sui_types.collections import SuiArray
-from pysui.sui.sui_types.scalars import SuiInteger, SuiString, SuiU64, SuiU8
+from pysui.sui.sui_types.scalars import SuiInteger, SuiString, SuiU64, SuiU8, TxBytes
 import pysui.sui.sui_txn.transaction_builder as tx_builder
 from pysui.sui.sui_txn.transaction import (
     _DebugInspectTransaction,
@@ -218,9 +217,7 @@ class SuiTransaction(_SuiTransactionBase):
                 ),
             )
             result = self.client.execute(
-                DryRunTransaction(
-                    tx_bytes=base64.b64encode(tx_data.serialize()).decode()
-                )
+                DryRunTransaction(tx_bytes=TxBytes(tx_data.serialize()).value)
             )
             if (
                 result.is_ok()
@@ -347,18 +344,17 @@ class SuiTransaction(_SuiTransactionBase):
         """
         assert not self._executed, "Transaction already executed"
         txn_data = self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        tx_bytes = TxBytes(txn_data.serialize())
         if run_verification:
-            _, failed_verification = self.verify_transaction(ser_data)
+            _, failed_verification = self.verify_transaction(tx_bytes)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
 
-        tx_b64 = base64.b64encode(ser_data).decode()
-
+        # Base64 encoded once and shared by signing
         exec_tx = ExecuteTransaction(
-            tx_bytes=tx_b64,
+            tx_bytes=tx_bytes.value,
             signatures=self.signer_block.get_signatures(
-                client=self.client, tx_bytes=tx_b64
+                client=self.client, tx_bytes=tx_bytes
             ),
             options=options,
             request_type=SuiRequestType.WAITFORLOCALEXECUTION,
@@ -392,14 +388,14 @@ class SuiTransaction(_SuiTransactionBase):
         """
         assert not self._executed, "Transaction already executed"
         txn_data = self._build_for_execute(gas_budget, use_gas_object)
-        ser_data = txn_data.serialize()
+        tx_bytes = TxBytes(txn_data.serialize())
         if run_verification:
-            _, failed_verification = self.verify_transaction(ser_data)
+            _, failed_verification = self.verify_transaction(tx_bytes)
             if failed_verification:
                 return SuiRpcResult(False, "Failed validation", failed_verification)
 
         self._executed = True
-        return base64.b64encode(ser_data).decode()
+        return tx_bytes.value
 
     # Argument resolution to lower level types
     @versionadded(version="0.18.0", reason="Reuse for argument nested list recursion.")
@@ -52,6 +52,7 @@ from pysui.sui.sui_types.collections import SuiArray, SuiMap
 from pysui.sui.sui_types.scalars import (
     SuiNullType,
     SuiString,
+    TxBytes,
 )
 from pysui.sui.sui_utils import publish_build
 
@@ -232,11 +233,14 @@ class _SuiTransactionBase:
     @versionadded(version="0.30.0", reason="Observing Sui ProtocolConfig constraints")
     @versionchanged(version="0.31.0", reason="Validating against all PTB constraints")
     @versionchanged(version="0.34.0", reason="Fixed Command argument evaluation")
+    @versionchanged(version="0.63.0", reason="Accepts TxBytes")
     def verify_transaction(
-        self, ser_kind: Optional[bytes] = None
+        self, ser_kind: Optional[Union[bytes, TxBytes]] = None
     ) -> tuple[TransactionConstraints, Union[dict, None]]:
         """verify_transaction Verify TransactionKind values against protocol constraints.
 
+        :param ser_kind: The serialized TransactionData to check size of, defaults to None
+        :type ser_kind: Optional[Union[bytes, TxBytes]], optional
         :return: Returns the current constraints thresholds and violation dictionary (if any)
         :rtype: tuple[TransactionConstraints, Union[dict, None]]
         """
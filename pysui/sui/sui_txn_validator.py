@@ -14,8 +14,10 @@
 
 """Sui Transaction validator."""
 
+import functools
+import operator
 import re
-from typing import Any, Union
+from typing import Any, Callable, Union
 from deprecated.sphinx import versionchanged
 from pysui.abstracts import Builder
 
@@ -31,6 +33,22 @@ __fullstring_pattern: re.Pattern = re.compile(r"0[xX][0-9a-fA-F]{64}")
 # __fullstring_pattern = re.compile(r"0[xX][0-9a-fA-F]{40}")
 
 
+# Array element serialization kinds
+_NESTED_ELEMENT: int = 0
+_VALUE_ELEMENT: int = 1
+_STRING_ELEMENT: int = 2
+
+
+@functools.cache
+def __element_kind(elem_type: type) -> int:
+    """Classify an array element type, resolved once per type."""
+    if issubclass(elem_type, (SuiArray, list)):
+        return _NESTED_ELEMENT
+    if issubclass(elem_type, (SuiInteger, SuiBoolean, ObjectID)):
+        return _VALUE_ELEMENT
+    return _STRING_ELEMENT
+
+
 def __parm_array_list(in_array: Any, api_parm_name: str) -> list[Any]:
     """."""
     out_array = []
@@ -39,17 +57,13 @@ def __parm_array_list(in_array: Any, api_parm_name: str) -> list[Any]:
     if isinstance(in_array, list):
         if api_parm_name != "single_transaction_params":
             for elem in in_array:
-                if isinstance(elem, (SuiArray, list)):
+                kind = __element_kind(type(elem))
+                if kind == _NESTED_ELEMENT:
                     out_array.append(__parm_array_list(elem, api_parm_name))
+                elif kind == _VALUE_ELEMENT:
+                    out_array.append(elem.value)
                 else:
-                    if isinstance(elem, SuiInteger):
-                        out_array.append(elem.value)
-                    elif isinstance(elem, SuiBoolean):
-                        out_array.append(elem.value)
-                    elif isinstance(elem, ObjectID):
-                        out_array.append(elem.value)
-                    else:
-                        out_array.append(f"{elem}")
+                    out_array.append(f"{elem}")
         else:
             out_array = in_array
     else:
@@ -57,24 +71,43 @@ def __parm_array_list(in_array: Any, api_parm_name: str) -> list[Any]:
     return out_array
 
 
-@versionchanged(version="0.24.0", reason="Moved from list to dict for RPC params")
-def __validate_parameter(
-    build_parm: Any, api_parm: SuiApiParam
-) -> Union[str, SuiRpcApiInvalidParameter]:
-    """Validate the specific parameter."""
-    att = getattr(build_parm, api_parm.name)
-    match api_parm.schema.type:
-        case "array":
-            att = __parm_array_list(att, api_parm.name)
-        case _:
-            pass
-
-    # print(f"att {api_parm.name} = {att}")
-    if att is None and api_parm.required:
-        raise SuiRpcApiInvalidParameter(
-            f"builder {build_parm} does not have attribute {api_parm.name}"
-        )
-    return att
+# Compiled parameter plans by (RPC method, builder class) and their SuiApi
+_PARAMETER_PLANS: dict[tuple[str, type], tuple[SuiApi, list[Callable[[Any], Any]]]] = {}
+
+
+def __parameter_step(api_parm: SuiApiParam) -> Callable[[Any], Any]:
+    """Compile the validation and serialization of a builder parameter."""
+    name = api_parm.name
+    getter = operator.attrgetter(name)
+    if api_parm.schema.type == "array":
+
+        def _array_step(build_parm: Any) -> list[Any]:
+            """Validate the array parameter."""
+            return __parm_array_list(getter(build_parm), name)
+
+        return _array_step
+    if api_parm.required:
+
+        def _required_step(build_parm: Any) -> Any:
+            """Validate the required parameter."""
+            att = getter(build_parm)
+            if att is None:
+                raise SuiRpcApiInvalidParameter(
+                    f"builder {build_parm} does not have attribute {name}"
+                )
+            return att
+
+        return _required_step
+    return getter
+
+
+def __parameter_plan(
+    api_method: SuiApi, builder: Builder
+) -> tuple[SuiApi, list[Callable[[Any], Any]]]:
+    """Compile and cache the parameter steps of a method and builder class."""
+    plan = (api_method, [__parameter_step(x) for x in api_method.params])
+    _PARAMETER_PLANS[(api_method.name, type(builder))] = plan
+    return plan
 
 
 # def _parameter_check(api_method: SuiApi, builder: Builder) -> Union[tuple[str, str], SuiRpcApiInvalidParameter]:
@@ -103,25 +136,26 @@ def __validate_parameter(
 @versionchanged(
     version="0.59.0", reason="Sui stopped supporting JSON dicts, reverting back to list"
 )
+@versionchanged(
+    version="0.63.0",
+    reason="Parameters are checked with a plan compiled once per method and builder",
+)
 def _parameter_check(
     api_method: SuiApi, builder: Builder
 ) -> Union[tuple[str, str], SuiRpcApiInvalidParameter]:
     """Perform parameter validations."""
     # All calls take at least 1 parameter
-    parmlen = len(api_method.params)
+    plan = _PARAMETER_PLANS.get((api_method.name, type(builder)))
+    # Rebuilt when the client's API descriptors are reloaded
+    if plan is None or plan[0] is not api_method:
+        plan = __parameter_plan(api_method, builder)
+    steps = plan[1]
     build_parms = builder.params
-    if len(build_parms) != parmlen:
+    if len(build_parms) != len(steps):
         raise SuiRpcApiInvalidParameter(
-            f"API Expected {parmlen} parameters for {builder.method} but found {len(build_parms)}"
+            f"API Expected {len(steps)} parameters for {builder.method} but found {len(build_parms)}"
         )
-
-    results = []
-    index = 0
-    while index < parmlen:
-        vres = __validate_parameter(build_parms[index], api_method.params[index])
-        results.append(vres)
-        index = index + 1
-    return results
+    return [step(parm) for step, parm in zip(steps, build_parms)]
 
 
 def validate_api(
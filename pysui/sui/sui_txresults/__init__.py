@@ -13,7 +13,15 @@
 
 """Sui Transaction Result Types package."""
 
-from pysui.sui.sui_txresults.common import *
-from pysui.sui.sui_txresults.single_tx import *
-from pysui.sui.sui_txresults.complex_tx import *
-from pysui.sui.sui_txresults.package_meta import *
+from pysui.lazy_imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {},
+    [
+        "pysui.sui.sui_txresults.common",
+        "pysui.sui.sui_txresults.single_tx",
+        "pysui.sui.sui_txresults.complex_tx",
+        "pysui.sui.sui_txresults.package_meta",
+    ],
+)
@@ -15,9 +15,110 @@
 
 
 from abc import ABC
+import dataclasses
 from dataclasses import dataclass, field
 from typing import Union
-from dataclasses_json import DataClassJsonMixin, LetterCase, config
+from dataclasses_json import DataClassJsonMixin, LetterCase, config, dataclass_json
+from deprecated.sphinx import versionadded
+
+# Class attributes generated by dataclass or bound to the class itself
+_GENERATED_ATTRIBUTES: set[str] = {
+    "__dict__",
+    "__weakref__",
+    "__init__",
+    "__repr__",
+    "__eq__",
+    "__hash__",
+    "__setattr__",
+    "__delattr__",
+    "__getstate__",
+    "__setstate__",
+    "__match_args__",
+    "__dataclass_fields__",
+    "__dataclass_params__",
+    "__abstractmethods__",
+    "_abc_impl",
+}
+
+
+@versionadded(version="0.63.0", reason="Compact result types for high volume queries")
+def slotted_variant(
+    clz: type, *, frozen: bool = False, extra_slots: tuple[str, ...] = ()
+) -> type:
+    """slotted_variant Create a __slots__ variant of a result dataclass.
+
+    The variant has the same fields, defaults, methods and properties as the
+    original but instances carry no attribute dictionary, which roughly halves
+    their size. Attributes not declared as fields can not be set on instances
+    unless named in extra_slots (e.g. attributes set by a constructor classmethod)
+    and frozen variants reject assignment, including from `__post_init__`.
+
+    The variant is registered as a virtual subclass of the original so
+    `isinstance` checks against the original type hold, and instances of the
+    variant and the original with equal fields compare equal.
+
+    :param clz: The dataclass (dataclasses_json) result type
+    :type clz: type
+    :param frozen: Make instances immutable, defaults to False
+    :type frozen: bool, optional
+    :param extra_slots: Attributes that are not fields but are set on instances, defaults to ()
+    :type extra_slots: tuple[str, ...], optional
+    :return: The slotted dataclass
+    :rtype: type
+    """
+    namespace: dict = {
+        key: value
+        for key, value in clz.__dict__.items()
+        if key not in _GENERATED_ATTRIBUTES
+    }
+    for cfield in dataclasses.fields(clz):
+        namespace[cfield.name] = field(
+            default=cfield.default,
+            default_factory=cfield.default_factory,
+            init=cfield.init,
+            repr=cfield.repr,
+            hash=cfield.hash,
+            compare=cfield.compare,
+            metadata=cfield.metadata,
+            kw_only=cfield.kw_only,
+        )
+    params = clz.__dataclass_params__
+    if params.eq:
+        compared = tuple(x.name for x in dataclasses.fields(clz) if x.compare)
+
+        def __eq__(self, other):
+            if other.__class__ is self.__class__ or isinstance(other, clz):
+                return all(getattr(self, x) == getattr(other, x) for x in compared)
+            return NotImplemented
+
+        # dataclass keeps an __eq__ defined by the class
+        namespace["__eq__"] = __eq__
+    suffix = "Frozen" if frozen else "Slotted"
+    namespace["__qualname__"] = f"{clz.__qualname__}{suffix}"
+    # A mixin base without __slots__ would reintroduce the attribute dictionary
+    bases = tuple(x for x in clz.__bases__ if x is not DataClassJsonMixin)
+    if extra_slots:
+        # dataclass(slots=True) only declares the fields, a base holds the others
+        bases = (
+            type(clz)(
+                f"_{clz.__name__}ExtraSlots",
+                bases or (object,),
+                {"__slots__": extra_slots},
+            ),
+        )
+    variant = dataclass(
+        slots=True,
+        frozen=frozen,
+        eq=params.eq,
+        order=params.order,
+        unsafe_hash=params.unsafe_hash,
+    )(type(clz)(f"{clz.__name__}{suffix}", bases or (object,), namespace))
+    if DataClassJsonMixin in clz.__bases__:
+        # Restores the mixin methods and registers the variant with the mixin
+        variant = dataclass_json(variant)
+    if hasattr(clz, "register"):
+        clz.register(variant)
+    return variant
 
 
 @dataclass
@@ -13,6 +13,14 @@
 
 """Sui Types package."""
 
-from pysui.sui.sui_types.address import *
-from pysui.sui.sui_types.scalars import *
-from pysui.sui.sui_types.collections import *
+from pysui.lazy_imports import lazy_attributes
+
+__getattr__, __dir__ = lazy_attributes(
+    globals(),
+    {},
+    [
+        "pysui.sui.sui_types.address",
+        "pysui.sui.sui_types.scalars",
+        "pysui.sui.sui_types.collections",
+    ],
+)
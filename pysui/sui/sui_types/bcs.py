@@ -24,7 +24,12 @@ from pysui.abstracts.client_keypair import PublicKey, SignatureScheme
 from pysui.sui.sui_txresults.common import GenericRef
 from pysui.sui.sui_txresults.single_tx import ObjectRead
 from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_utils import b58str_to_list, hexstring_to_list, hexstring_to_sui_id
+from pysui.sui.sui_utils import (
+    b58str_to_list,
+    hexstring_to_list,
+    hexstring_to_sui_id,
+    transaction_digest,
+)
 import pysui.sui.sui_pgql.pgql_types as pgql_type
 
 _ADDRESS_LENGTH: int = 32
@@ -754,6 +759,15 @@ class TransactionData(canoser.RustEnum):
         """."""
         return cls.deserialize(in_data)
 
+    @versionadded(version="0.63.0", reason="Local transaction digest computation")
+    def digest(self) -> str:
+        """digest Compute the transaction digest without submitting the transaction.
+
+        :return: The base58 transaction digest
+        :rtype: str
+        """
+        return transaction_digest(self.serialize())
+
 
 # Multi-signature legacy
 @versionadded(version="0.20.4", reason="Added to support in-code MultiSig signing.")
@@ -13,8 +13,9 @@
 
 """Sui Scalar Types."""
 
+import base64
 import math
-from typing import Union
+from typing import Any, Union
 from pysui.abstracts import SuiScalarType
 
 
@@ -227,6 +228,108 @@ class SuiTxBytes(SuiString):
         return str(self)
 
 
+class TxBytes:
+    """Serialized transaction bytes carried raw, with the base64 form computed on demand.
+
+    Build, dry-run, signing, verification and execution accept a TxBytes so the
+    same transaction is base64 encoded at most once.
+    """
+
+    __slots__ = ("_raw", "_b64")
+
+    def __init__(self, raw: Union[bytes, bytearray, memoryview]):
+        """__init__ Initialize with raw BCS serialized bytes.
+
+        :param raw: The BCS serialized TransactionData or TransactionKind bytes
+        :type raw: Union[bytes, bytearray, memoryview]
+        """
+        self._raw: Union[bytes, None] = bytes(raw)
+        self._b64: Union[str, None] = None
+
+    @classmethod
+    def from_b64(cls, b64_str: str) -> "TxBytes":
+        """from_b64 Initialize from a base64 string, the raw bytes are decoded on demand.
+
+        :param b64_str: Base64 encoded transaction bytes
+        :type b64_str: str
+        :return: The TxBytes instance
+        :rtype: TxBytes
+        """
+        txb = cls.__new__(cls)
+        txb._raw = None
+        txb._b64 = b64_str
+        return txb
+
+    @classmethod
+    def as_tx_bytes(
+        cls, tx_bytes: Union["TxBytes", str, bytes, bytearray, SuiTxBytes]
+    ) -> "TxBytes":
+        """as_tx_bytes Coerce supported transaction byte forms to TxBytes.
+
+        :param tx_bytes: TxBytes, raw bytes or base64 string forms
+        :type tx_bytes: Union[TxBytes, str, bytes, bytearray, SuiTxBytes]
+        :raises ValueError: If the type is not supported
+        :return: The TxBytes instance
+        :rtype: TxBytes
+        """
+        if isinstance(tx_bytes, TxBytes):
+            return tx_bytes
+        if isinstance(tx_bytes, str):
+            return cls.from_b64(tx_bytes)
+        if isinstance(tx_bytes, SuiTxBytes):
+            return cls.from_b64(tx_bytes.value)
+        if isinstance(tx_bytes, (bytes, bytearray, memoryview)):
+            return cls(tx_bytes)
+        raise ValueError(f"Can not convert {tx_bytes.__class__.__name__} to TxBytes")
+
+    @property
+    def raw(self) -> bytes:
+        """Return the raw serialized bytes."""
+        if self._raw is None:
+            self._raw = base64.b64decode(self._b64)
+        return self._raw
+
+    @property
+    def value(self) -> str:
+        """Return the base64 encoded string, encoding once on first use."""
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self._raw).decode()
+        return self._b64
+
+    @property
+    def tx_bytes(self) -> str:
+        """Alias for transactions."""
+        return self.value
+
+    def __bytes__(self) -> bytes:
+        """Return the raw serialized bytes."""
+        return self.raw
+
+    def __len__(self) -> int:
+        """Return the length of the raw serialized bytes."""
+        return len(self.raw)
+
+    def __str__(self) -> str:
+        """Return the base64 encoded string."""
+        return self.value
+
+    def __eq__(self, other: Any) -> bool:
+        """Equality check against TxBytes or base64 strings."""
+        if isinstance(other, TxBytes):
+            return self.raw == other.raw
+        if isinstance(other, str):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hashability, of the base64 form as equal to the base64 string."""
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        """To string."""
+        return f"TxBytes({len(self)} bytes)"
+
+
 class SuiSignature(SuiString):
     """Sui Base64 signature."""
 
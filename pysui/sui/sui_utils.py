@@ -20,7 +20,8 @@ import base64
 import binascii
 import subprocess
 import hashlib
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from types import NoneType
 from typing import Any, Iterable, Union
@@ -37,6 +38,8 @@ from pysui.sui.sui_constants import (
     SUI_BASE_ACTIVE,
     SUI_BASE_EXEC_PATH,
     DEFAULT_SUI_BINARY_PATH,
+    TRANSACTION_DATA_DIGEST_PREFIX,
+    TRANSACTION_DIGEST_BYTES_LEN,
 )
 
 import pysui.sui_move.module.deserialize as deser
@@ -51,6 +54,7 @@ from pysui.sui.sui_types.scalars import (
     SuiTransactionDigest,
     SuiTxBytes,
     SuiSignature,
+    TxBytes,
 )
 from pysui.sui.sui_types.address import SuiAddress, valid_sui_address
 from pysui.sui.sui_types.collections import BatchParameter, SuiArray, SuiMap
@@ -69,6 +73,9 @@ _UNPUBLISHED: str = "00000000000000000000000000000000000000000000000000000000000
 
 _SUI_BUILD: list[str] = ["move", "build"]
 
+# Worker threads reading, hashing and encoding package modules
+_PACKAGE_WORKERS: int = min(8, os.cpu_count() or 1)
+
 
 @dataclass
 @versionchanged(
@@ -124,12 +131,13 @@ def _module_bytes(module: Path) -> Union[ModuleReader, OSError]:
 def _modules_bytes(
     module_path: Path,
 ) -> Union[list[ModuleReader], SuiMiisingModuleByteCode, OSError]:
-    """."""
+    """Read the module readers of a bytecode folder on the worker pool."""
     mod_list = list(module_path.glob("*.mv"))
     if not mod_list:
         raise SuiMiisingModuleByteCode(f"{module_path} is empty")
     # Open and get the bytes representation of same
-    result_list: list[ModuleReader] = [_module_bytes(module) for module in mod_list]
+    with ThreadPoolExecutor(min(_PACKAGE_WORKERS, len(mod_list))) as pool:
+        result_list: list[ModuleReader] = list(pool.map(_module_bytes, mod_list))
     return result_list
 
 
@@ -156,21 +164,30 @@ def _build_dep_info(build_path: str) -> Union[CompiledPackage, Exception]:
     raise ValueError("Corrupt publish build information")
 
 
+def _module_digest(reader: ModuleReader) -> tuple[bytes, SuiString]:
+    """Hash and base64 encode the bytes of a module."""
+    mr_bytes = reader.getvalue()
+    return (
+        hashlib.blake2b(mr_bytes, digest_size=32).digest(),
+        SuiString(base64.b64encode(mr_bytes).decode()),
+    )
+
+
+@versionchanged(
+    version="0.63.0",
+    reason="Modules are hashed and encoded on a worker pool.",
+)
 @versionadded(
     version="0.20.0",
     reason="Sui move build introduced hashing the modules first.",
 )
 def _package_digest(package: CompiledPackage, readers: list[ModuleReader]) -> None:
     """Converts compiled module bytes for publishing and digest calculation."""
-    mod_strs: list = []
-    all_bytes: list = []
     # Get the bytes for digest and string for publishing
-    for mod_bytes in readers:
-        mr_bytes = mod_bytes.reader.getvalue()
-        hasher = hashlib.blake2b(digest_size=32)
-        hasher.update(mr_bytes)
-        all_bytes.append(hasher.digest())
-        mod_strs.append(SuiString(base64.b64encode(mr_bytes).decode()))
+    with ThreadPoolExecutor(min(_PACKAGE_WORKERS, max(len(readers), 1))) as pool:
+        digests = list(pool.map(_module_digest, readers))
+    all_bytes: list = [x[0] for x in digests]
+    mod_strs: list = [x[1] for x in digests]
     for dep_str in package.dependencies:
         all_bytes.append(binascii.unhexlify(dep_str[2:]))
 
@@ -182,6 +199,47 @@ def _package_digest(package: CompiledPackage, readers: list[ModuleReader]) -> No
     package.compiled_modules = mod_strs
 
 
+# Compiled packages by BuildInfo.yaml source_digest and build arguments
+_COMPILED_PACKAGES: dict[tuple[bytes, tuple[str, ...]], CompiledPackage] = {}
+# Package path and build arguments to the source fingerprint and source_digest last built
+_PACKAGE_SOURCES: dict[tuple[str, tuple[str, ...]], tuple[bytes, bytes]] = {}
+
+
+# Package manifest files fingerprinted with the sources folder
+_PACKAGE_MANIFESTS: tuple[str, ...] = ("Move.toml", "Move.lock")
+
+
+def _source_fingerprint(path_to_package: Path) -> bytes:
+    """Hash the paths and content of the package manifest, lock and source files."""
+    sources = [path_to_package.joinpath(x) for x in _PACKAGE_MANIFESTS]
+    sources.extend(sorted(path_to_package.joinpath("sources").rglob("*")))
+    hasher = hashlib.blake2b(digest_size=32)
+    for source in sources:
+        if source.is_file():
+            hasher.update(source.relative_to(path_to_package).as_posix().encode())
+            hasher.update(hashlib.blake2b(source.read_bytes(), digest_size=32).digest())
+    return hasher.digest()
+
+
+def _package_copy(package: CompiledPackage) -> CompiledPackage:
+    """Copy of a cached package, not sharing its lists."""
+    return replace(
+        package,
+        dependencies=list(package.dependencies),
+        compiled_modules=list(package.compiled_modules),
+    )
+
+
+def clear_package_cache() -> None:
+    """clear_package_cache Forget the compiled packages cached by publish_build."""
+    _COMPILED_PACKAGES.clear()
+    _PACKAGE_SOURCES.clear()
+
+
+@versionchanged(
+    version="0.63.0",
+    reason="Opt-in cache by source digest, unchanged packages are not rebuilt.",
+)
 @versionchanged(
     version="0.17.0",
     reason="Added the package digest that matches chain digest.",
@@ -189,10 +247,33 @@ def _package_digest(package: CompiledPackage, readers: list[ModuleReader]) -> No
 def publish_build(
     path_to_package: Path,
     args_list: list[str],
+    use_cache: bool = False,
 ) -> Union[CompiledPackage, Exception]:
-    """Build and collect module base64 strings and dependencies ObjectIDs."""
+    """Build and collect module base64 strings and dependencies ObjectIDs.
+
+    With use_cache the result is cached by the BuildInfo.yaml source_digest and
+    build arguments, and the package Move.toml, Move.lock and sources are
+    fingerprinted. A package whose files are unchanged since it was last built
+    returns the cached result, including its dependency ids, without compiling.
+    A rebuilt package whose source_digest is cached is not hashed again.
+    Changes to local dependencies outside of the package folder, such as
+    republishing one, are not detected, call `clear_package_cache` after
+    changing them.
+    """
     if os.environ[PYSUI_EXEC_ENV] == EMPEHMERAL_PATH:
         raise ValueError(f"Configuration does not support publishing")
+    source_key = (
+        str(Path(path_to_package).resolve()),
+        tuple(str(x) for x in args_list),
+    )
+    fingerprint = b""
+    if use_cache:
+        fingerprint = _source_fingerprint(Path(path_to_package))
+        known = _PACKAGE_SOURCES.get(source_key)
+        if known and known[0] == fingerprint:
+            cached = _COMPILED_PACKAGES.get((known[1], source_key[1]))
+            if cached:
+                return _package_copy(cached)
     # Compile the package
     path_to_package = _compile_project(path_to_package, args_list)
     # Find the build folder
@@ -214,9 +295,16 @@ def publish_build(
 
     # Construct initial package
     cpackage = _build_dep_info(build_subdir[0].path)
-    # Set module bytes as base64 strings and generate package digest
-    _package_digest(cpackage, _modules_bytes(byte_modules))
-    return cpackage
+    if not use_cache:
+        _package_digest(cpackage, _modules_bytes(byte_modules))
+        return cpackage
+    package_key = (cpackage.project_source_digest, source_key[1])
+    _PACKAGE_SOURCES[source_key] = (fingerprint, cpackage.project_source_digest)
+    if package_key not in _COMPILED_PACKAGES:
+        # Set module bytes as base64 strings and generate package digest
+        _package_digest(cpackage, _modules_bytes(byte_modules))
+        _COMPILED_PACKAGES[package_key] = cpackage
+    return _package_copy(_COMPILED_PACKAGES[package_key])
 
 
 @versionchanged(version="0.41.0", reason="Sui aliases configuration feature added")
@@ -336,6 +424,26 @@ def b58str_to_list(indata: str) -> list[int]:
     return [int(x) for x in decode_bytes]
 
 
+@versionadded(version="0.63.0", reason="Local transaction digest computation")
+def transaction_digest(tx_data: Union[TxBytes, bytes, bytearray, str]) -> str:
+    """transaction_digest Compute a transaction digest locally from serialized TransactionData.
+
+    The digest is the blake2b-256 hash of the `TransactionData::` prefix followed by the
+    TransactionData BCS bytes, base58 encoded. It is identical to the digest reported after
+    execution so submitted transactions can be tracked, and later confirmed in bulk
+    (e.g. GetMultipleTx with `transactionIds` filter), before the execution response arrives.
+
+    :param tx_data: Serialized TransactionData as TxBytes, raw bytes or base64 string
+    :type tx_data: Union[TxBytes, bytes, bytearray, str]
+    :return: The base58 transaction digest
+    :rtype: str
+    """
+    hasher = hashlib.blake2b(digest_size=TRANSACTION_DIGEST_BYTES_LEN)
+    hasher.update(TRANSACTION_DATA_DIGEST_PREFIX)
+    hasher.update(TxBytes.as_tx_bytes(tx_data).raw)
+    return base58.b58encode(hasher.digest()).decode()
+
+
 def int_to_listu8(byte_count: int, in_el: int) -> list[int]:
     """int_to_listu8 converts integer to array of u8 bytes.
 
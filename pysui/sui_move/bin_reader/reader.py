@@ -14,22 +14,34 @@
 """Byte reader class."""
 
 
-import io
+import struct
 from typing import Union
 
+_U16 = struct.Struct("<H").unpack_from
+_U32 = struct.Struct("<I").unpack_from
+_U64 = struct.Struct("<Q").unpack_from
+_FIXED_WIDTH = {2: _U16, 4: _U32, 8: _U64}
+
 
 class BinaryReader:
-    """BinaryReader manages loading and accessing areas of binary file."""
+    """BinaryReader manages loading and accessing areas of binary file.
+
+    The content is held in a memoryview read at an integer cursor, fixed width
+    integers are unpacked in place and uleb128 values decoded inline.
+    """
 
     def __init__(self, source: str, data: bytes) -> None:
         """__init__ Initialize reader.
 
-        :param binary_file: The path and file name to load
-        :type binary_file: str
+        :param source: The original source
+        :type source: str
+        :param data: The binary content
+        :type data: bytes
         """
         self.length = len(data)
-        self.reader = io.BytesIO(data)
+        self.view = memoryview(data)
         self.source = source
+        self._pos = 0
 
     def pos(self) -> int:
         """pos Report the current reader position.
@@ -37,7 +49,7 @@ class BinaryReader:
         :return: Current positiion of reader
         :rtype: int
         """
-        return self.reader.tell()
+        return self._pos
 
     def move_to(self, location: int, relative_to: int = 0) -> Union[int, ValueError]:
         """move_to Positions the reader to stream location.
@@ -50,31 +62,41 @@ class BinaryReader:
         :return: the previous location
         :rtype: Union[int, ValueError]
         """
-        current_loc = self.pos()
-        fail: bool = False
+        current_loc = self._pos
         match relative_to:
             case 0:
-                if location < 0 or location > self.length:
-                    fail = True
+                repos = location
             case 1:
                 repos = current_loc + location
-                if repos < 0 or repos > self.length:
-                    fail = True
             case 2:
                 repos = self.length + location
-                if repos < 0 or repos > self.length:
-                    fail = True
             case _:
-                fail = True
-        if fail:
+                repos = -1
+        if repos < 0 or repos > self.length:
             raise ValueError(f"Invalid location {location}. Max position is {self.length}")
-        self.reader.seek(location, relative_to)
+        self._pos = repos
         return current_loc
 
+    def getvalue(self) -> bytes:
+        """getvalue Return the entire content.
+
+        :return: The binary content
+        :rtype: bytes
+        """
+        return self.view.tobytes()
+
     def read(self, size: int = None) -> bytes:
-        """."""
-        size = size or 1
-        return self.reader.read(size)
+        """read Read size bytes, fewer if the end is reached.
+
+        :param size: The number of bytes to read, defaults to None (1)
+        :type size: int, optional
+        :return: The bytes read
+        :rtype: bytes
+        """
+        start = self._pos
+        end = min(start + (size or 1), self.length)
+        self._pos = end
+        return self.view[start:end].tobytes()
 
     def read_as_int(self, size: int = None) -> int:
         """read_as_int Read in size bytes and convert to int.
@@ -84,6 +106,15 @@ class BinaryReader:
         :return: The read bytes converted to little endien int
         :rtype: int
         """
+        pos = self._pos
+        size = size or 1
+        if pos + size <= self.length:
+            self._pos = pos + size
+            if size == 1:
+                return self.view[pos]
+            if size in _FIXED_WIDTH:
+                return _FIXED_WIDTH[size](self.view, pos)[0]
+            return int.from_bytes(self.view[pos : pos + size], "little")
         return int.from_bytes(self.read(size), "little")
 
     def read_as_bool(self) -> bool:
@@ -92,21 +123,22 @@ class BinaryReader:
 
     def read_uleb128(self) -> int:
         """read_uleb128 reads a uleb128 value from stream."""
-
-        def _decode(barray: bytearray) -> int:
-            """Decode the unsigned uleb128 expanded bytearray."""
-            res = 0
-            for i, value in enumerate(barray):
-                res = res + ((value & 0x7F) << (i * 7))
-            return res
-
-        array = bytearray()
-        while True:
-            inb = ord(self.read())
-            array.append(inb)
-            if (inb & 0x80) == 0:
-                break
-        return _decode(array)
+        view = self.view
+        pos = self._pos
+        try:
+            byte = view[pos]
+            pos += 1
+            result = byte & 0x7F
+            shift = 7
+            while byte & 0x80:
+                byte = view[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                shift += 7
+        except IndexError as exc:
+            raise ValueError(f"uleb128 at {self._pos} exceeds length {self.length}") from exc
+        self._pos = pos
+        return result
 
     def read_from_uleb_array(self) -> bytes:
         """read_from_uleb_array reads vector with uleb128 count.
@@ -118,9 +150,3 @@ class BinaryReader:
         if content_size == 0:
             return None
         return self.read(content_size)
-
-
-# if __name__ == "__main__":
-#     reader = BinaryReader("~/frankc01/sui-track/build/SuiTrack/bytecode_modules/base.mv")
-#     val = reader.read()
-#     print(val)
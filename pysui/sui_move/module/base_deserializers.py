@@ -13,6 +13,7 @@
 
 """Move module byte code raw deserializer."""
 
+from typing import Optional
 from pysui.sui_move.bin_reader.module_reader import ModuleReader
 from pysui.sui_move.model.common_types import (
     Flags,
@@ -166,6 +167,79 @@ def read_code_units(reader: ModuleReader) -> tuple[int, list[tuple[OpCode, list]
     return op_codes_count, instructions
 
 
+# Operand widths in bytes of instructions with fixed width operands, others
+# in _ULEB_OPERAND take one uleb128 and the vector pack/unpack a uleb128 and a u64
+_FIXED_OPERAND: dict[int, int] = {
+    OpCode.LdU8: 1,
+    OpCode.LdU16: 2,
+    OpCode.LdU32: 4,
+    OpCode.LdU64: 8,
+    OpCode.LdU128: 16,
+    OpCode.LdU256: 32,
+}
+_ULEB_OPERAND: frozenset[int] = frozenset(
+    {
+        OpCode.BrTrue,
+        OpCode.BrFalse,
+        OpCode.Branch,
+        OpCode.LdConst,
+        OpCode.CopyLoc,
+        OpCode.MoveLoc,
+        OpCode.StLoc,
+        OpCode.MutBorrowLoc,
+        OpCode.ImmBorrowLoc,
+        OpCode.MutBorrowField,
+        OpCode.ImmBorrowField,
+        OpCode.Call,
+        OpCode.Pack,
+        OpCode.Unpack,
+        OpCode.Exists,
+        OpCode.MutBorrowGlobal,
+        OpCode.ImmBorrowGlobal,
+        OpCode.MoveFrom,
+        OpCode.MoveTo,
+        OpCode.MutBorrowFieldGeneric,
+        OpCode.ImmBorrowFieldGeneric,
+        OpCode.CallGeneric,
+        OpCode.PackGeneric,
+        OpCode.UnpackGeneric,
+        OpCode.ExistsGeneric,
+        OpCode.MutBorrowGlobalGeneric,
+        OpCode.ImmBorrowGlobalGeneric,
+        OpCode.MoveFromGeneric,
+        OpCode.MoveToGeneric,
+        OpCode.VecLen,
+        OpCode.VecImmBorrow,
+        OpCode.VecMutBorrow,
+        OpCode.VecPushBack,
+        OpCode.VecPopBack,
+        OpCode.VecSwap,
+    }
+)
+_VECTOR_OPERAND: frozenset[int] = frozenset({OpCode.VecPack, OpCode.VecUnpack})
+_OPCODES: frozenset[int] = frozenset(OpCode)
+
+
+def skip_code_units(reader: ModuleReader) -> None:
+    """skip_code_units Moves the reader past a functions byte code instructions without decoding them.
+
+    :param reader: Stream reader
+    :type reader: ModuleReader
+    :raises ValueError: If an instruction is not a known OpCode
+    """
+    for _ in range(reader.read_uleb128()):
+        opcode = reader.read_as_int()
+        if opcode in _ULEB_OPERAND:
+            reader.read_uleb128()
+        elif opcode in _FIXED_OPERAND:
+            reader.move_to(_FIXED_OPERAND[opcode], 1)
+        elif opcode in _VECTOR_OPERAND:
+            reader.read_uleb128()
+            reader.move_to(8, 1)
+        elif opcode not in _OPCODES:
+            raise ValueError(f"{opcode} is not a valid OpCode")
+
+
 def deserialize_signatures(
     table_header: TableHeader,
     reader: ModuleReader,
@@ -480,13 +554,20 @@ def deserialize_function_handles(
 def deserialize_function_definition(
     table_header: TableHeader,
     reader: ModuleReader,
+    code_offsets: Optional[list[int]] = None,
 ) -> list[FunctionDefinition]:
     """deserialize_function_definition builds collection of FunctionDefinition types from it's table content.
 
+    When code_offsets is provided the function code units are skipped instead of
+    decoded and the position of each functions code units (-1 for native functions)
+    is appended to it for a later `read_code_units`.
+
     :param table_header: TableHeader for ModuleHandles
     :type table_header: TableHeader
     :param reader: Stream reader
     :type reader: ModuleReader
+    :param code_offsets: Collects code unit positions when skipping code units, defaults to None (decode)
+    :type code_offsets: Optional[list[int]], optional
     :return: All FunctionDefinitions found in StructDefinition content
     :rtype: list[FunctionDefinition]
     """
@@ -505,6 +586,14 @@ def deserialize_function_definition(
             aquires = []
         if flag.is_native():
             funcs.append(FunctionDefinition(f_index, visibility, flag, aquires))
+            if code_offsets is not None:
+                code_offsets.append(-1)
+            continue
+        if code_offsets is not None:
+            locals_cnt = reader.read_as_int()
+            code_offsets.append(reader.pos())
+            skip_code_units(reader)
+            funcs.append(FunctionDefinition(f_index, visibility, flag, aquires, locals_cnt))
             continue
         funcs.append(
             FunctionDefinition(f_index, visibility, flag, aquires, reader.read_as_int(), read_code_units(reader))
@@ -14,7 +14,8 @@
 """Move module byte code deserializer."""
 
 from dataclasses import dataclass, field
-from typing import Union
+from functools import partial
+from typing import Any, Union
 from enum import IntEnum, auto
 from pysui.sui_move.bin_reader.module_reader import ModuleReader
 from pysui.sui_move.model.bytecode_tables import (
@@ -49,6 +50,7 @@ from pysui.sui_move.module.base_deserializers import (
     deserialize_structure_field_handles,
     deserialize_structure_field_instantiations,
     deserialize_friends,
+    read_code_units,
 )
 
 
@@ -58,6 +60,7 @@ class Deserialize(IntEnum):
     MODULE_HANDLES = auto()
     MTS_HANDLES = auto()
     ALL = auto()
+    LAZY = auto()
 
 
 # pylint:disable=too-many-instance-attributes
@@ -175,6 +178,73 @@ _DESERIALIZE_JUMP: dict = {
 }
 
 
+# Attribute name to table type and deserializer
+_LAZY_TABLES: dict = {
+    att: (table_type, des_fn)
+    for table_type, (des_fn, att) in _DESERIALIZE_JUMP.items()
+    if att
+}
+
+
+class LazyModuleContent:
+    """LazyModuleContent is a RawModuleContent facade deserializing tables on demand.
+
+    Each table attribute (e.g. `identifiers`, `function_handles`) is deserialized
+    from the reader on first access and cached, tables never accessed are never
+    read. Function definitions are read without their code units, which are
+    decoded only when requested with `code_units`.
+    """
+
+    def __init__(self, reader: ModuleReader) -> None:
+        """__init__ Initialize the facade over a module reader.
+
+        :param reader: Byte reader
+        :type reader: ModuleReader
+        """
+        self._reader = reader
+        self._code_offsets: list[int] = []
+        self.magic: str = reader.MAGIC_WORD
+        self.version: int = reader.version
+        self.module_self: int = reader.self_index
+
+    def __getattr__(self, name: str) -> Any:
+        """Deserialize and cache a table on first access."""
+        if name not in _LAZY_TABLES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        table_type, des_fn = _LAZY_TABLES[name]
+        if table_type == TableType.FunctionDefinitions:
+            des_fn = partial(des_fn, code_offsets=self._code_offsets)
+        content = self._reader.build_content_for(table_type, des_fn) or []
+        setattr(self, name, content)
+        return content
+
+    def is_loaded(self, name: str) -> bool:
+        """is_loaded Check if a table attribute has been deserialized.
+
+        :param name: The table attribute name (e.g. 'identifiers')
+        :type name: str
+        :return: True if deserialized, False otherwise
+        :rtype: bool
+        """
+        return name in vars(self)
+
+    def code_units(self, index: int) -> tuple[int, list]:
+        """code_units Decode and cache the code units of a function definition.
+
+        :param index: The index of the function in function_definitions
+        :type index: int
+        :return: Tuple of opcode count for function and list of instructions, empty for native functions
+        :rtype: tuple[int, list]
+        """
+        func = self.function_definitions[index]
+        if not func.code_units and self._code_offsets[index] >= 0:
+            self._reader.move_to(self._code_offsets[index])
+            func.code_units = read_code_units(self._reader)
+        return func.code_units
+
+
 def _deserialize_raw_type(
     reader: ModuleReader, table_type: TableType, collector: RawModuleContent
 ) -> None:
@@ -197,18 +267,23 @@ def _deserialize_raw_type(
 
 def deserialize(
     reader: ModuleReader, form: Deserialize
-) -> Union[RawModuleContent, Exception]:
+) -> Union[RawModuleContent, LazyModuleContent, Exception]:
     """deserialize decomposes a move compiled module file into constituent table parts.
 
+    With the LAZY form no table is read until accessed on the returned
+    LazyModuleContent.
+
     :param reader: Byte reader
     :type reader: ModuleReader
     :param form: Granularity of tables to deserialize to
     :type form: Deserialize
     :raises ValueError: If there is no module_handles in the move file
     :return: Itemized table layout
-    :rtype: Union[RawModuleContent, Exception]
+    :rtype: Union[RawModuleContent, LazyModuleContent, Exception]
     """
     if reader.has_table(TableType.ModuleHandles):
+        if form == Deserialize.LAZY:
+            return LazyModuleContent(reader)
         contents = RawModuleContent(
             reader.MAGIC_WORD, reader.version, reader.self_index
         )
@@ -245,7 +320,7 @@ def reader_from_file(module: str) -> Union[ModuleReader, Exception]:
 
 def from_file(
     module: str, form: Deserialize = Deserialize.ALL
-) -> Union[RawModuleContent, Exception]:
+) -> Union[RawModuleContent, LazyModuleContent, Exception]:
     """from_file Deserialize the content of a module from file system.
 
     :param module: The sui module file path
@@ -253,14 +328,14 @@ def from_file(
     :param form: Defines how many tables to walk from module, defaults to Deserialize.ALL
     :type form: Deserialize, optional
     :return: Container of deserialized tables
-    :rtype: Union[RawModuleContent, Exception]
+    :rtype: Union[RawModuleContent, LazyModuleContent, Exception]
     """
     return deserialize(ModuleReader.read_from_file(module), form)
 
 
 def from_base64(
     in_base64: str, form: Deserialize = Deserialize.ALL
-) -> Union[RawModuleContent, Exception]:
+) -> Union[RawModuleContent, LazyModuleContent, Exception]:
     """from_base64 Deserialize the content of a module base64 representation.
 
     :param in_base64: The sui module base64 string
@@ -268,7 +343,7 @@ def from_base64(
     :param form: Defines how many tables to walk from module, defaults to Deserialize.ALL
     :type form: Deserialize, optional
     :return: Container of deserialized tables
-    :rtype: Union[RawModuleContent, Exception]
+    :rtype: Union[RawModuleContent, LazyModuleContent, Exception]
     """
     return deserialize(ModuleReader.read_from_base64(in_base64), form)
 
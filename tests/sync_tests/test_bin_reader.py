@@ -0,0 +1,112 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the Move binary reader primitives (no transactions)."""
+
+import pytest
+from pysui.sui_move.bin_reader.reader import BinaryReader
+
+# Values and their uleb128 encoding
+ULEB: list[tuple[int, bytes]] = [
+    (0, b"\x00"),
+    (127, b"\x7f"),
+    (128, b"\x80\x01"),
+    (300, b"\xac\x02"),
+    (624485, b"\xe5\x8e\x26"),
+    (2**32, b"\x80\x80\x80\x80\x10"),
+    (2**64 - 1, b"\xff" * 9 + b"\x01"),
+]
+DATA: bytes = bytes(range(1, 41))
+
+
+def test_uleb128():
+    """Single and multi-byte values decode and advance past their encoding."""
+    reader = BinaryReader("test", b"".join(x for _, x in ULEB) + b"\x2a")
+    for value, encoded in ULEB:
+        start = reader.pos()
+        assert reader.read_uleb128() == value
+        assert reader.pos() == start + len(encoded)
+    assert reader.read_as_int() == 42
+
+
+def test_uleb128_truncated():
+    """A uleb128 running past the end raises and leaves the position."""
+    for data in (b"", b"\x80", b"\x05\xff\xff"):
+        reader = BinaryReader("test", data)
+        if data:
+            reader.move_to(len(data) - min(len(data), 2))
+        start = reader.pos()
+        with pytest.raises(ValueError):
+            reader.read_uleb128()
+        assert reader.pos() == start
+
+
+@pytest.mark.parametrize("size", [None, 1, 2, 3, 4, 5, 8, 16, 32])
+def test_read_as_int(size):
+    """Fixed and odd width ints are little endian and advance by their width."""
+    reader = BinaryReader("test", DATA)
+    reader.move_to(3)
+    width = size or 1
+    assert reader.read_as_int(size) == int.from_bytes(DATA[3 : 3 + width], "little")
+    assert reader.pos() == 3 + width
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 8])
+def test_short_read_at_end(size):
+    """Reads past the end return the remaining bytes, as the former stream did."""
+    reader = BinaryReader("test", DATA)
+    reader.move_to(-1, 2)
+    assert reader.read_as_int(size) == DATA[-1]
+    assert reader.pos() == len(DATA)
+    assert reader.read_as_int(size) == 0
+
+    reader.move_to(-1, 2)
+    assert reader.read(size) == DATA[-1:]
+    assert reader.read(size) == b"" and reader.read() == b""
+    assert reader.pos() == len(DATA)
+
+
+def test_read_and_uleb_array():
+    """Reads return bytes, uleb arrays their content or None when empty."""
+    reader = BinaryReader("test", b"\x03abc\x00\x01")
+    assert reader.read_from_uleb_array() == b"abc"
+    assert reader.read_from_uleb_array() is None
+    assert reader.read_as_bool() and reader.pos() == 6
+    assert reader.getvalue() == b"\x03abc\x00\x01"
+
+
+def test_move_to():
+    """Positions from the start, current position and end, returning the last."""
+    reader = BinaryReader("test", DATA)
+    assert reader.move_to(10) == 0
+    assert reader.move_to(5, 1) == 10 and reader.pos() == 15
+    assert reader.move_to(-3, 1) == 15 and reader.pos() == 12
+    assert reader.move_to(-4, 2) == 12 and reader.pos() == len(DATA) - 4
+    assert reader.read_as_int(4) == int.from_bytes(DATA[-4:], "little")
+    assert reader.move_to(0, 2) == len(DATA) and reader.pos() == len(DATA)
+    assert reader.move_to(-len(DATA), 2) == len(DATA) and reader.pos() == 0
+
+
+@pytest.mark.parametrize(
+    "location, relative_to", [(-1, 0), (41, 0), (-1, 1), (41, 1), (1, 2), (-41, 2)]
+)
+def test_move_to_invalid(location, relative_to):
+    """Positions before the start or past the end raise and keep the position."""
+    reader = BinaryReader("test", DATA)
+    reader.move_to(0 if relative_to == 1 else 20)
+    start = reader.pos()
+    with pytest.raises(ValueError):
+        reader.move_to(location, relative_to)
+    assert reader.pos() == start
+    with pytest.raises(ValueError):
+        reader.move_to(0, 3)
@@ -0,0 +1,132 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing JSON RPC builder arguments and their validation (no transactions)."""
+
+from typing import Optional
+
+import pytest
+from pysui import ObjectID, SuiAddress
+from pysui.sui.sui_apidesc import (
+    SuiApi,
+    SuiApiParam,
+    SuiApiResult,
+    SuiJsonInteger,
+    SuiJsonString,
+)
+from pysui.sui.sui_builders.base_builder import _NativeTransactionBuilder, sui_builder
+from pysui.sui.sui_excepts import SuiRpcApiInvalidParameter
+import pysui.sui.sui_txn_validator as txn_validator
+from pysui.sui.sui_types.scalars import SuiInteger, SuiNullType
+
+OWNER: str = f"0x{'ab' * 32}"
+CURSOR: str = f"0x{'0c' * 32}"
+
+
+class _GetPage(_NativeTransactionBuilder):
+    """Builder with optional arguments."""
+
+    @sui_builder()
+    def __init__(
+        self,
+        *,
+        owner: SuiAddress,
+        cursor: Optional[ObjectID] = None,
+        limit: Optional[SuiInteger] = None,
+    ):
+        """__init__ Initialize builder."""
+        super().__init__("suix_getPage")
+
+
+class _GetOtherPage(_NativeTransactionBuilder):
+    """Builder with optional arguments, properties are set on first construction."""
+
+    @sui_builder()
+    def __init__(
+        self,
+        *,
+        owner: SuiAddress,
+        cursor: Optional[ObjectID] = None,
+        limit: Optional[SuiInteger] = None,
+    ):
+        """__init__ Initialize builder."""
+        super().__init__("suix_getOtherPage")
+
+
+def test_unpassed_argument_coerced():
+    """Setting an argument not passed to the builder coerces to its type."""
+    builder = _GetPage(owner=OWNER)
+    assert isinstance(builder.owner, SuiAddress)
+    assert isinstance(builder.cursor, SuiNullType)
+    builder.cursor = CURSOR
+    builder.limit = 10
+    assert isinstance(builder.cursor, ObjectID) and builder.cursor.value == CURSOR
+    assert isinstance(builder.limit, SuiInteger) and builder.limit.value == 10
+
+
+def test_coercion_independent_of_construction():
+    """Arguments coerce the same whichever arguments later builders pass."""
+    passed = _GetOtherPage(owner=OWNER, cursor=CURSOR, limit=5)
+    properties = {x: vars(_GetOtherPage)[x] for x in ("owner", "cursor", "limit")}
+    _GetOtherPage(owner=OWNER)
+    # Installed once, not replaced by later constructions
+    assert all(vars(_GetOtherPage)[x] is y for x, y in properties.items())
+    assert isinstance(passed.cursor, ObjectID)
+    passed.limit = 7
+    assert isinstance(passed.limit, SuiInteger) and passed.limit.value == 7
+    assert [type(x) for x in passed.params] == [SuiAddress, ObjectID, SuiInteger]
+
+
+def _page_api(cursor_required: bool = False) -> SuiApi:
+    """suix_getPage descriptor, as loaded from the RPC discovery."""
+    string = SuiJsonString("string", ["string"])
+    integer = SuiJsonInteger("integer", ["integer"], "uint", 0)
+    return SuiApi(
+        name="suix_getPage",
+        params=[
+            SuiApiParam("owner", string, True),
+            SuiApiParam("cursor", string, cursor_required),
+            SuiApiParam("limit", integer, False),
+        ],
+        result=SuiApiResult("Page", {}),
+    )
+
+
+def test_validation_plan_rebuilt(monkeypatch):
+    """The parameter plan is reused for a descriptor and rebuilt when it changes."""
+    monkeypatch.setattr(txn_validator, "_PARAMETER_PLANS", {})
+    builder = _GetPage(owner=OWNER, limit=3)
+    api = _page_api()
+    assert txn_validator._parameter_check(api, builder) == [OWNER, None, 3]
+    plan = txn_validator._PARAMETER_PLANS[("suix_getPage", _GetPage)]
+    assert plan[0] is api
+    txn_validator._parameter_check(api, builder)
+    assert txn_validator._PARAMETER_PLANS[("suix_getPage", _GetPage)] is plan
+
+    # Reloaded descriptors, even if equal, replace the plan
+    reloaded = _page_api()
+    assert reloaded == api
+    assert txn_validator._parameter_check(reloaded, builder) == [OWNER, None, 3]
+    assert txn_validator._PARAMETER_PLANS[("suix_getPage", _GetPage)][0] is reloaded
+    with pytest.raises(SuiRpcApiInvalidParameter):
+        txn_validator._parameter_check(_page_api(cursor_required=True), builder)
+    builder.cursor = CURSOR
+    assert txn_validator._parameter_check(_page_api(cursor_required=True), builder) == [
+        OWNER,
+        CURSOR,
+        3,
+    ]
+    shorter = _page_api()
+    shorter.params.pop()
+    with pytest.raises(SuiRpcApiInvalidParameter):
+        txn_validator._parameter_check(shorter, builder)
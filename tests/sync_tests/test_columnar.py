@@ -0,0 +1,230 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing columnar accumulation of query pages (no transactions)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_columnar import (
+    CheckpointColumns,
+    CoinColumns,
+    ColumnarPages,
+    EventColumns,
+    TransactionColumns,
+    _epoch_ms,
+    async_fetch_columns,
+    fetch_columns,
+)
+import pysui.sui.sui_pgql.pgql_columnar as pgql_columnar
+
+OWNER: str = f"0x{'ab' * 32}"
+
+
+def _cursor(end: str, has_next: bool) -> dict:
+    """PageCursor fragment result."""
+    return {"hasNextPage": has_next, "endCursor": end}
+
+
+def _checkpoint(seq: int, total: int) -> dict:
+    """StandardCheckpoint node, its first transaction page holding one digest."""
+    return {
+        "sequenceNumber": seq,
+        "digest": f"Checkpoint{seq}",
+        "timestamp": "2024-01-01T00:00:01.500Z",
+        "networkTotalTransactions": total,
+        "previousCheckpointDigest": f"Checkpoint{seq - 1}",
+        "transaction_blocks": {
+            "cursor": _cursor("tx", True),
+            "tx_digests": [{"digest": "Tx"}],
+        },
+    }
+
+
+def _checkpoints(end: str, has_next: bool, *nodes: dict) -> dict:
+    """GetCheckpoints result page."""
+    return {"checkpoints": {"cursor": _cursor(end, has_next), "checkpoints": nodes}}
+
+
+PAGES: list[dict] = [
+    _checkpoints("page1", True, _checkpoint(10, 100), _checkpoint(11, 104)),
+    _checkpoints("page2", False, _checkpoint(12, 111), _checkpoint(14, 120)),
+]
+
+
+class _Client:
+    """Client answering query nodes with raw pages, recording their cursors."""
+
+    def __init__(self, pages: list):
+        self.pages = list(pages)
+        self.cursors: list = []
+
+    def _next(self, with_node, encode_fn):
+        self.cursors.append(with_node.next_page)
+        page = self.pages.pop(0)
+        if page is None:
+            return SuiRpcResult(False, "TransportQueryError", "failed")
+        return SuiRpcResult(True, None, encode_fn(page))
+
+    def execute_query_node(self, *, with_node, encode_fn):
+        return self._next(with_node, encode_fn)
+
+
+class _AsyncClient(_Client):
+    """Asynchronous client answering query nodes with raw pages."""
+
+    async def execute_query_node(self, *, with_node, encode_fn):
+        return self._next(with_node, encode_fn)
+
+
+def test_epoch_ms():
+    """Timestamps parse with any fraction digits and offsets."""
+    base = 1704067212000
+    for timestamp, expected in (
+        ("2024-01-01T00:00:12Z", base),
+        ("2024-01-01T00:00:12.5Z", base + 500),
+        ("2024-01-01T00:00:12.05Z", base + 50),
+        ("2024-01-01T00:00:12.123456789Z", base + 123),
+        ("2024-01-01T02:00:12.5+02:00", base + 500),
+        ("2023-12-31T23:30:12-0030", base),
+        ("2024-01-01 00:00:12", base),
+        (None, 0),
+    ):
+        assert _epoch_ms(timestamp) == expected
+    with pytest.raises(ValueError):
+        _epoch_ms("2024-01-01")
+
+
+def test_columnar_abstract():
+    """Accumulators must provide the page extraction."""
+    with pytest.raises(TypeError):
+        ColumnarPages()
+
+
+def test_event_columns():
+    """Event strings are interned, timestamps are epoch milliseconds."""
+    node = {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "sendingModule": {"package": {"package_id": "0x2"}, "module_name": "coin"},
+        "type": {"event_type": "0x2::coin::Event"},
+        "sender": {"address": OWNER},
+        "json": {"value": 1},
+    }
+    columns = EventColumns(include_json=True)
+    cursor = columns.add_page(
+        {"events": {"cursor": _cursor("end", False), "events": [node, node]}}
+    )
+    assert not cursor.hasNextPage and cursor.endCursor == "end"
+    assert len(columns) == 2
+    data = columns.columns(use_numpy=False)
+    assert list(data["timestamp"]) == [1704067200000] * 2
+    assert list(data["module_name"]) == [0, 0]
+    assert columns.categories("module_name") == ["coin"]
+    assert data["json"] == [{"value": 1}] * 2
+    assert "json" not in EventColumns().columns(use_numpy=False)
+
+
+def test_transaction_coin_columns():
+    """Absent values intern as None and append as 0."""
+    columns = TransactionColumns()
+    columns.add_page(
+        {
+            "transactionBlocks": {
+                "cursor": _cursor("end", False),
+                "tx_blocks": [
+                    {
+                        "digest": "Tx1",
+                        "kind": {"tx_kind": "ProgrammableTransactionBlock"},
+                    },
+                    {"digest": "Tx2", "effects": {"status": "SUCCESS"}},
+                ],
+            }
+        }
+    )
+    data = columns.columns(use_numpy=False)
+    assert data["digest"] == ["Tx1", "Tx2"]
+    assert list(data["status"]) == [0, 1]
+    assert columns.categories("status") == [None, "SUCCESS"]
+    assert list(data["timestamp"]) == [0, 0]
+
+    columns = CoinColumns()
+    columns.add_page(
+        {
+            "qres": {
+                "coins": {
+                    "cursor": _cursor("end", False),
+                    "coin_objects": [
+                        {
+                            "coin_object_id": "0x1",
+                            "version": 7,
+                            "balance": str(2**63),
+                            "owner": {
+                                "obj_owner_kind": "AddressOwner",
+                                "owner": {"address_id": OWNER},
+                            },
+                        }
+                    ],
+                }
+            }
+        }
+    )
+    data = columns.columns(use_numpy=False)
+    assert list(data["balance"]) == [2**63]
+    assert columns.categories("owner") == [OWNER]
+    columns.clear()
+    assert len(columns) == 0 and not columns.categories("owner")
+
+
+def test_checkpoint_transaction_counts():
+    """Checkpoint counts come from network totals, not the first digest page."""
+    columns = CheckpointColumns()
+    for page in PAGES:
+        columns.add_page(page)
+    assert "transaction_count" not in columns.columns(use_numpy=False)
+    assert list(columns.columns(use_numpy=False)["timestamp"]) == [1704067201500] * 4
+    # Checkpoint 10 and 14 have no accumulated predecessor
+    assert columns.transaction_counts() == {11: 4, 12: 7}
+
+
+def test_fetch_columns():
+    """Pages are fetched with the previous page cursor until the last page."""
+    client = _Client(PAGES)
+    node = SimpleNamespace(next_page=None)
+    columns = fetch_columns(client, node, CheckpointColumns())
+    assert len(columns) == 4
+    assert client.cursors[0] is None
+    assert client.cursors[1].endCursor == "page1"
+    assert node.next_page is None
+
+    client = _AsyncClient(PAGES)
+    columns = asyncio.run(
+        async_fetch_columns(client, node, CheckpointColumns(), max_pages=1)
+    )
+    assert len(columns) == 2 and len(client.cursors) == 1
+
+    with pytest.raises(ValueError):
+        fetch_columns(_Client([PAGES[0], None]), node, CheckpointColumns())
+
+
+def test_numpy_absent(monkeypatch):
+    """NumPy export requires numpy."""
+    monkeypatch.setattr(pgql_columnar, "np", None)
+    columns = CheckpointColumns()
+    columns.add_page(PAGES[0])
+    assert isinstance(columns.columns()["digest"], list)
+    with pytest.raises(ImportError):
+        columns.columns(use_numpy=True)
+    with pytest.raises(ImportError):
+        columns.to_numpy()
@@ -0,0 +1,139 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing configuration key lookups and lazy keypairs (no transactions)."""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from pysui import SuiAddress, SuiConfig
+from pysui.abstracts.client_config import CrefType
+from pysui.abstracts.client_keypair import SignatureScheme
+from pysui.sui.sui_constants import PYSUI_CLIENT_CONFIG_ENV, PYSUI_EXEC_ENV
+from pysui.sui.sui_crypto import keypair_from_keystring
+
+RPC_URL: str = "http://127.0.0.1:9000"
+SCHEMES: list[SignatureScheme] = [
+    SignatureScheme.ED25519,
+    SignatureScheme.SECP256K1,
+    SignatureScheme.SECP256R1,
+]
+
+
+def _keystrings() -> list[str]:
+    """A keystring of each signature scheme."""
+    config = SuiConfig.user_config(rpc_url=RPC_URL)
+    for scheme in SCHEMES:
+        config.create_new_keypair_and_address(scheme=scheme)
+    return config.keystrings
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch) -> Path:
+    """Folder with a client.yaml and keystore, aliases generated on load."""
+    # Loading sets these, restored after the test
+    monkeypatch.setenv(PYSUI_CLIENT_CONFIG_ENV, "")
+    monkeypatch.setenv(PYSUI_EXEC_ENV, "")
+    keystrings = _keystrings()
+    keystore = tmp_path / "sui.keystore"
+    keystore.write_text(json.dumps(keystrings), encoding="utf8")
+    active = SuiAddress.from_bytes(keypair_from_keystring(keystrings[0]).to_bytes())
+    tmp_path.joinpath("client.yaml").write_text(
+        yaml.safe_dump(
+            {
+                "keystore": {"File": str(keystore)},
+                "envs": [{"alias": "localnet", "rpc": RPC_URL}],
+                "active_env": "localnet",
+                "active_address": active.address,
+            }
+        ),
+        encoding="utf8",
+    )
+    return tmp_path
+
+
+def test_lookup_address_alias(config_path):
+    """Each address, alias, keystring and public key resolves to its row."""
+    config = SuiConfig.pysui_config(str(config_path))
+    assert len(config.addresses) == len(SCHEMES)
+    for keystring in config.keystrings:
+        keypair = keypair_from_keystring(keystring)
+        address = SuiAddress.from_bytes(keypair.to_bytes()).address
+        alias = config.al4addr(address)
+        assert config.kp4add(address).serialize() == keystring
+        assert config.addr4al(alias).address == address
+        assert config.kp4al(alias).serialize() == keystring
+        assert config.al4kp(keypair) == config.al4pk(keypair.public_key) == alias
+        assert config.keypair_for_keystring(keystring).serialize() == keystring
+        assert (
+            config.keypair_for_publickey(keypair.public_key).serialize() == keystring
+        )
+    with pytest.raises(ValueError):
+        config.kp4add(f"0x{'0' * 64}")
+    with pytest.raises(ValueError):
+        config.addr4al("no-such-alias")
+
+
+def test_lazy_derivation(config_path):
+    """Keypairs loaded from the address index derive to the eager addresses."""
+    eager = SuiConfig.pysui_config(str(config_path))
+    assert Path(eager.write_address_index()).exists()
+    eager_keys = {x: y.serialize() for x, y in eager.addresses_and_keys.items()}
+
+    lazy = SuiConfig.pysui_config(str(config_path))
+    assert lazy.addresses == eager.addresses
+    assert all(
+        next(iter(x[CrefType.KPAIR].values())) is None for x in lazy._cref_matrix
+    )
+    address = lazy.addresses[1]
+    keypair = lazy.kp4add(address)
+    assert SuiAddress.from_bytes(keypair.to_bytes()).address == address
+    assert keypair.serialize() == eager_keys[address]
+    # Derived once, on first use
+    assert lazy.kp4add(address) is keypair
+    assert next(iter(lazy._cref_matrix[0][CrefType.KPAIR].values())) is None
+    assert {
+        x: y.serialize() for x, y in lazy.addresses_and_keys.items()
+    } == eager_keys
+
+
+def test_index_updates():
+    """Lookups follow added, renamed and removed rows."""
+    keystrings = _keystrings()
+    config = SuiConfig.user_config(rpc_url=RPC_URL, prv_keys=keystrings[:2])
+    first, second = config.addresses
+    old_alias = config.al4addr(second)
+
+    keystring = keystrings[2]
+    added = config.add_keypair_from_keystring(keystring=keystring)
+    added_alias = config.al4addr(added)
+    assert config.addr4al(added_alias).address == added.address
+    assert config.kp4add(added.address).serialize() == keystring
+
+    config.rename_alias(old_alias=old_alias, new_alias="renamed")
+    assert config.addr4al("renamed").address == second
+    with pytest.raises(ValueError):
+        config.addr4al(old_alias)
+
+    # Removing a row shifts the rows after it
+    first_alias = config.al4addr(first)
+    del config._cref_matrix[0]
+    assert config._cref_result_for(added.address, CrefType.ADDY, CrefType.INDEX) == 1
+    assert config.addr4al(added_alias).address == added.address
+    with pytest.raises(ValueError):
+        config.kp4add(first)
+    with pytest.raises(ValueError):
+        config.addr4al(first_alias)
+    assert config.kp4al("renamed").serialize() == keystrings[1]
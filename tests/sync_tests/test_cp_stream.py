@@ -0,0 +1,149 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the checkpoint ingestion stream (no transactions)."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_cp_stream import (
+    AsyncCheckpointStream,
+    CheckpointProgress,
+    FileCheckpointProgress,
+)
+import pysui.sui.sui_pgql.pgql_query as qn
+
+
+class _Client:
+    """Asynchronous client answering checkpoint range queries."""
+
+    def __init__(
+        self,
+        *,
+        delay: Optional[Callable[[int], float]] = None,
+        failures: Optional[dict[int, int]] = None,
+        latest: int = 0,
+    ):
+        self.delay = delay or (lambda start: 0)
+        self.failures = dict(failures or {})
+        self.latest = latest
+        self.stream: Optional[AsyncCheckpointStream] = None
+        self.requests: list[tuple[int, int]] = []
+        self.completed: list[int] = []
+        self.ahead: list[int] = []
+
+    async def execute_query_node(self, *, with_node):
+        if isinstance(with_node, qn.GetLatestCheckpointSequence):
+            return SuiRpcResult(
+                True, None, SimpleNamespace(sequence_number=self.latest)
+            )
+        start, count = with_node.start, with_node.count
+        self.requests.append((start, count))
+        if self.stream:
+            # Checkpoints claimed beyond the next to deliver
+            self.ahead.append(start + count - self.stream.next_sequence)
+        await asyncio.sleep(self.delay(start))
+        if self.failures.get(start):
+            self.failures[start] -= 1
+            return SuiRpcResult(False, "TransportQueryError", None)
+        self.completed.append(start)
+        return SuiRpcResult(
+            True,
+            None,
+            SimpleNamespace(
+                data=[
+                    SimpleNamespace(sequence_number=x)
+                    for x in range(start, start + count)
+                ]
+            ),
+        )
+
+
+async def _delivered(stream: AsyncCheckpointStream, pause: float = 0) -> list[int]:
+    """Sequence numbers in delivery order."""
+    sequences: list[int] = []
+    async for checkpoint in stream:
+        sequences.append(checkpoint.sequence_number)
+        await asyncio.sleep(pause)
+    return sequences
+
+
+def test_in_order_delivery():
+    """Windows completing out of order are delivered in sequence order."""
+    client = _Client(delay=lambda start: (12 - start) * 0.002)
+    stream = AsyncCheckpointStream(
+        client, start=0, end=11, workers=3, batch_size=2, poll_interval=0
+    )
+    assert asyncio.run(_delivered(stream)) == list(range(12))
+    assert client.completed != sorted(client.completed)
+    assert sorted(client.requests) == [(x, 2) for x in range(0, 12, 2)]
+    assert stream.progress.load() == 11 and stream.buffered == 0
+
+
+def test_resume_from_progress(tmp_path):
+    """Saved progress takes precedence over start, then the latest checkpoint."""
+    progress = FileCheckpointProgress(tmp_path / "progress")
+    assert progress.load() is None
+    progress.save(5)
+    client = _Client()
+    stream = AsyncCheckpointStream(
+        client, start=0, end=9, batch_size=3, progress=progress, save_every=2
+    )
+    assert asyncio.run(_delivered(stream)) == [6, 7, 8, 9]
+    assert min(client.requests) == (6, 3)
+    assert FileCheckpointProgress(tmp_path / "progress").load() == 9
+
+    stream = AsyncCheckpointStream(_Client(latest=20), end=21, batch_size=1)
+    assert asyncio.run(_delivered(stream)) == [20, 21]
+
+
+def test_bounded_window():
+    """Workers claim no further than max_buffered past delivery."""
+    client = _Client()
+    stream = AsyncCheckpointStream(
+        client, start=0, end=39, workers=4, batch_size=2, max_buffered=6
+    )
+    client.stream = stream
+    assert asyncio.run(_delivered(stream, pause=0.001)) == list(range(40))
+    assert max(client.ahead) <= 6
+    assert len(client.requests) == 20
+
+
+def test_failed_range_retries():
+    """A failed range is retried and the stream raises once retries run out."""
+    client = _Client(failures={4: 2})
+    stream = AsyncCheckpointStream(
+        client, start=0, end=7, batch_size=4, poll_interval=0, retries=2
+    )
+    assert asyncio.run(_delivered(stream)) == list(range(8))
+    assert client.requests.count((4, 4)) == 3
+
+    progress = CheckpointProgress()
+    client = _Client(failures={4: 3})
+    stream = AsyncCheckpointStream(
+        client,
+        start=0,
+        end=7,
+        workers=1,
+        batch_size=4,
+        poll_interval=0,
+        retries=2,
+        progress=progress,
+    )
+    with pytest.raises(ValueError):
+        asyncio.run(_delivered(stream))
+    assert client.requests.count((4, 4)) == 3
+    assert progress.load() == 3
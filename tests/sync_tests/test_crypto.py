@@ -24,6 +24,9 @@ from pysui.sui.sui_crypto import (
     keypair_from_keystring,
     recover_key_and_address,
 )
+from pysui.sui.sui_types import bcs
+from pysui.sui.sui_types.scalars import TxBytes
+from pysui.sui.sui_utils import transaction_digest
 
 
 KEYSTRING_LIST: list[str] = [
@@ -43,6 +46,11 @@ ADDRESS_OUT_LIST: list[str] = [
 ]
 
 
+# Serialized TransactionData and its digest
+TX_DATA_B64: str = "AAAEAAgAypo7AAAAAAAIAMqaOwAAAAABADREBHzUuo0veOkm9ajjcxYq1NxsLgXSYcC7/X4oFhoaoAUAAAAAAAAgETqmuazrgq7B72tOG6cWceUT75gM8kRFwBGLgqg0TqwAIKni2zhfBVzAIVo83iaLdicFNblEOAdRTxg76Gkmwhn0AgIBAgACAQAAAQEAAQIDAAAAAAMAAAEAAQMAqeLbOF8FXMAhWjzeJot2JwU1uUQ4B1FPGDvoaSbCGfQBATMSrQ+9XmatOs8Nr2zvl1ByFb9anfD2TqJE6569i++gBQAAAAAAACCluoNkyH4V37zDuDBiLgc+AsTvGv/xJ1WIMIN++yeywKni2zhfBVzAIVo83iaLdicFNblEOAdRTxg76Gkmwhn06AMAAAAAAABYtksAAAAAAAA="
+TX_DATA_DIGEST: str = "GJu8PLjoUPHP6HNE6VkmddEqBYStGp7WeEPfz9tVpvSU"
+
+
 def test_emphemeral_creates():
     """test_emphemeral_creates validate round trip in keystrings."""
     cref_matrix: list[list[dict]] = emphemeral_keys_and_addresses(KEYSTRING_LIST)
@@ -73,6 +81,35 @@ def test_signing():
     assert res.value == sktr
 
 
+def test_signing_tx_bytes():
+    """Test raw TxBytes signs identical to base64 string."""
+    tx_b64 = TX_DATA_B64
+    kp = keypair_from_keystring("AOM6UAQrFe7r9nNDGRlWwj1o7m1cGK6mDZ3efRJJmvcG")
+    tx_bytes = TxBytes(TxBytes.from_b64(tx_b64).raw)
+    assert tx_bytes == tx_b64
+    assert kp.new_sign_secure(tx_bytes).value == kp.new_sign_secure(tx_b64).value
+
+
+def test_tx_bytes_hash():
+    """Test TxBytes equal to its base64 string hashes alike."""
+    tx_bytes = TxBytes(TxBytes.from_b64(TX_DATA_B64).raw)
+    assert tx_bytes == TX_DATA_B64
+    assert hash(tx_bytes) == hash(TX_DATA_B64)
+    assert {TX_DATA_B64: 1}[tx_bytes] == 1
+    assert len({tx_bytes, TxBytes.from_b64(TX_DATA_B64), TX_DATA_B64}) == 1
+    assert tx_bytes != tx_bytes.raw
+
+
+def test_transaction_digest():
+    """Test local digest of well known transaction data."""
+    tx_bytes = TxBytes.from_b64(TX_DATA_B64)
+    assert transaction_digest(TX_DATA_B64) == TX_DATA_DIGEST
+    assert transaction_digest(tx_bytes) == TX_DATA_DIGEST
+    assert transaction_digest(tx_bytes.raw) == TX_DATA_DIGEST
+    tx_data = bcs.TransactionData.deserialize(tx_bytes.raw)
+    assert tx_data.digest() == TX_DATA_DIGEST
+
+
 def test_recover_same():
     """Test key recovery."""
     # Get a unique key
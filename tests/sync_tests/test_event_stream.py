@@ -0,0 +1,142 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing resumable event streams (no transactions)."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_event_stream import (
+    AsyncEventStream,
+    EventStream,
+    FileEventStreamProgress,
+)
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+EVENT_COUNT: int = 5
+PAGE_SIZE: int = 3
+
+
+def _event(index: int) -> pgql_type.EventGQL:
+    """Event at index, its cursor the position."""
+    return pgql_type.EventGQL(
+        "0x2", "pool", "0x2::pool::Swapped", "t", "{}", None, f"cursor{index}"
+    )
+
+
+class _Client:
+    """Client paging EVENT_COUNT events, failing the first queries."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.queries = 0
+
+    def execute_query_node(self, *, with_node) -> SuiRpcResult:
+        self.queries += 1
+        if self.failures:
+            self.failures -= 1
+            return SuiRpcResult(False, "HTTPX error: ReadTimeout")
+        cursor: Optional[str] = (
+            with_node.next_page.endCursor if with_node.next_page else None
+        )
+        start = int(cursor.removeprefix("cursor")) + 1 if cursor else 0
+        events = [_event(x) for x in range(start, min(start + PAGE_SIZE, EVENT_COUNT))]
+        return SuiRpcResult(
+            True,
+            None,
+            pgql_type.EventsGQL(
+                events,
+                pgql_type.PagingCursor(
+                    start + PAGE_SIZE < EVENT_COUNT,
+                    events[-1].event_cursor if events else cursor,
+                ),
+            ),
+        )
+
+
+class _AsyncClient(_Client):
+    """Asynchronous client paging EVENT_COUNT events."""
+
+    async def execute_query_node(self, *, with_node) -> SuiRpcResult:
+        return super().execute_query_node(with_node=with_node)
+
+
+def _stream(client: _Client, progress, **kwargs) -> EventStream:
+    """Stream polling without waits."""
+    return EventStream(
+        client,
+        event_filter={},
+        progress=progress,
+        min_interval=0.0,
+        max_interval=0.0,
+        **kwargs,
+    )
+
+
+def test_resume_after_crash(tmp_path):
+    """Events handled before a crash are not redelivered on resume."""
+    progress = FileEventStreamProgress(tmp_path / "progress.json")
+    handled: list[str] = []
+
+    def _crashing(event: pgql_type.EventGQL) -> None:
+        if event.event_cursor == "cursor1":
+            raise RuntimeError("handler crash")
+        handled.append(event.event_cursor)
+
+    with pytest.raises(RuntimeError):
+        _stream(_Client(), progress).run(_crashing)
+    assert handled == ["cursor0"]
+    assert progress.load() == {"cursor": "cursor0"}
+
+    resumed = _stream(_Client(), FileEventStreamProgress(tmp_path / "progress.json"))
+    resumed.run(lambda x: handled.append(x.event_cursor), max_polls=3)
+    assert handled == [f"cursor{x}" for x in range(EVENT_COUNT)]
+    assert resumed.cursor == f"cursor{EVENT_COUNT - 1}"
+
+
+def test_handler_stop():
+    """A handler returning False stops the stream after that event."""
+    handled: list[str] = []
+    stream = _stream(_Client(), None)
+    stream.run(lambda x: handled.append(x.event_cursor) or len(handled) < 2)
+    assert handled == ["cursor0", "cursor1"]
+    assert stream.cursor == "cursor1"
+
+
+def test_retry_failed_polls():
+    """Failed polls are retried, max_errors consecutive failures end the stream."""
+    handled: list[str] = []
+    client = _Client(failures=2)
+    _stream(client, None).run(lambda x: handled.append(x.event_cursor), max_polls=4)
+    assert handled == [f"cursor{x}" for x in range(EVENT_COUNT)]
+    with pytest.raises(ValueError):
+        _stream(_Client(failures=3), None, max_errors=3).run(lambda x: None)
+
+
+def test_async_stream():
+    """The asynchronous stream delivers to sync and async handlers."""
+    handled: list[str] = []
+
+    async def _handler(event: pgql_type.EventGQL) -> None:
+        handled.append(event.event_cursor)
+
+    stream = AsyncEventStream(
+        _AsyncClient(failures=1),
+        event_filter={},
+        min_interval=0.0,
+        max_interval=0.0,
+    )
+    asyncio.run(stream.run(_handler, max_polls=3))
+    assert handled == [f"cursor{x}" for x in range(EVENT_COUNT)]
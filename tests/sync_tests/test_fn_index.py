@@ -0,0 +1,294 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the offline function signature index (no transactions)."""
+
+import asyncio
+import copy
+from types import SimpleNamespace
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_builders.get_builders import GetFunction
+from pysui.sui.sui_pgql.pgql_fn_index import FunctionIndex
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txn.async_transaction import SuiTransactionAsync
+from pysui.sui.sui_txresults.package_meta import SuiMoveFunction
+from pysui.sui.sui_types import bcs
+from pysui.sui_move.bin_reader.module_reader import ModuleReader
+from pysui.sui_move.model.common_types import TableType
+
+PACKAGE: str = f"0x{'5'.zfill(64)}"
+FRAMEWORK: str = f"0x{'2'.zfill(64)}"
+SWAP: str = "0x5::pool::swap"
+PEEK: str = "0x5::pool::peek"
+
+
+def _uleb(value: int) -> bytes:
+    """ULEB128 encoding of value."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _string(value: str) -> bytes:
+    """Length prefixed utf-8 string."""
+    return _uleb(len(value)) + value.encode()
+
+
+def _module() -> bytes:
+    """Unpublished (0x0) pool module.
+
+    ``public entry fun swap<T: store>(&mut Pool, Coin<T>, u64, vector<u8>,
+    &mut TxContext): Coin<T>`` and ``public native fun peek(&Pool): (u64, bool)``
+    """
+    identifiers = ["pool", "Pool", "swap", "coin", "Coin", "peek"]
+    identifiers += ["tx_context", "TxContext"]
+    tables: list[tuple[TableType, bytes]] = [
+        # pool, coin and tx_context modules
+        (TableType.ModuleHandles, bytes([0, 0, 1, 3, 1, 6])),
+        # Pool (key, store), Coin<phantom T> (key, store) and TxContext (drop)
+        (
+            TableType.StructHandles,
+            bytes([0, 1, 0x0C, 0, 1, 4, 0x0C, 1, 0, 1, 2, 7, 0x02, 0]),
+        ),
+        (
+            TableType.FunctionHandles,
+            bytes([0, 2, 1, 2, 1, 0x04, 0, 5, 3, 4, 0]),
+        ),
+        (
+            TableType.Signatures,
+            bytes([0])
+            + bytes([5, 7, 8, 0, 0x0B, 1, 1, 9, 0, 3, 0x0A, 2, 7, 8, 2])
+            + bytes([1, 0x0B, 1, 1, 9, 0])
+            + bytes([1, 6, 8, 0])
+            + bytes([2, 3, 1]),
+        ),
+        (TableType.Identifiers, b"".join(_string(x) for x in identifiers)),
+        (
+            TableType.AddressIdentifiers,
+            bytes(32) + (2).to_bytes(32, "big"),
+        ),
+        # swap with a return instruction, peek native
+        (TableType.FunctionDefinitions, bytes([0, 1, 4, 0, 0, 1, 2, 1, 1, 2, 0])),
+    ]
+    headers = bytearray()
+    contents = bytearray()
+    for kind, content in tables:
+        headers += bytes([kind]) + _uleb(len(contents)) + _uleb(len(content))
+        contents += content
+    return b"".join(
+        [
+            bytes.fromhex(ModuleReader.MAGIC_WORD),
+            (6).to_bytes(4, "little"),
+            bytes([len(tables)]),
+            headers,
+            contents,
+            b"\x00",
+        ]
+    )
+
+
+def _datatype(package: str, module: str, name: str, type_parameters: list) -> dict:
+    """GraphQL datatype signature body."""
+    return {
+        "datatype": {
+            "package": package,
+            "module": module,
+            "type": name,
+            "typeParameters": type_parameters,
+        }
+    }
+
+
+COIN_T: dict = _datatype(FRAMEWORK, "coin", "Coin", [{"typeParameter": 0}])
+# GetFunction results
+SWAP_GQL: dict = {
+    "object": {
+        "asMovePackage": {
+            "module": {
+                "function": {
+                    "function_name": "swap",
+                    "isEntry": True,
+                    "visibility": "PUBLIC",
+                    "typeParameters": [{"constraints": ["STORE"]}],
+                    "returns": [{"signature": {"body": COIN_T}}],
+                    "parameters": [
+                        {
+                            "signature": {
+                                "ref": "&mut",
+                                "body": _datatype(PACKAGE, "pool", "Pool", []),
+                            }
+                        },
+                        {"signature": {"body": COIN_T}},
+                        {"signature": {"body": "u64"}},
+                        {"signature": {"body": {"vector": "u8"}}},
+                        {
+                            "signature": {
+                                "ref": "&mut",
+                                "body": _datatype(
+                                    FRAMEWORK, "tx_context", "TxContext", []
+                                ),
+                            }
+                        },
+                    ],
+                }
+            }
+        }
+    }
+}
+PEEK_GQL: dict = {
+    "object": {
+        "asMovePackage": {
+            "module": {
+                "function": {
+                    "function_name": "peek",
+                    "isEntry": False,
+                    "visibility": "PUBLIC",
+                    "typeParameters": [],
+                    "returns": [
+                        {"signature": {"body": "u64"}},
+                        {"signature": {"body": "bool"}},
+                    ],
+                    "parameters": [
+                        {
+                            "signature": {
+                                "ref": "&",
+                                "body": _datatype(PACKAGE, "pool", "Pool", []),
+                            }
+                        }
+                    ],
+                }
+            }
+        }
+    }
+}
+
+
+def _struct(package: str, module: str, name: str, type_arguments: list) -> dict:
+    """JSON RPC normalized struct."""
+    return {
+        "Struct": {
+            "address": package,
+            "module": module,
+            "name": name,
+            "typeArguments": type_arguments,
+        }
+    }
+
+
+# sui_getNormalizedMoveFunction result
+SWAP_NORMALIZED: dict = {
+    "visibility": "Public",
+    "isEntry": True,
+    "typeParameters": [{"abilities": ["Store"]}],
+    "parameters": [
+        {"MutableReference": _struct(PACKAGE, "pool", "Pool", [])},
+        _struct(FRAMEWORK, "coin", "Coin", [{"TypeParameter": 0}]),
+        "U64",
+        {"Vector": "U8"},
+        {"MutableReference": _struct(FRAMEWORK, "tx_context", "TxContext", [])},
+    ],
+    "return": [_struct(FRAMEWORK, "coin", "Coin", [{"TypeParameter": 0}])],
+}
+
+
+def _normalized() -> SuiMoveFunction:
+    """SuiMoveFunction of the swap result, from_dict updates its input."""
+    return SuiMoveFunction.from_dict(copy.deepcopy(SWAP_NORMALIZED))
+
+
+@pytest.fixture
+def index() -> FunctionIndex:
+    """Index of the pool module published at 0x5."""
+    index = FunctionIndex()
+    assert index.add_module(_module(), package="0x5") == "pool"
+    return index
+
+
+def test_index_matches_query(index):
+    """Indexed functions equal the GetFunction results and their summaries."""
+    assert len(index) == 2 and SWAP in index and PEEK in index
+    assert "0x0::pool::swap" not in index
+    for target, recorded in ((SWAP, SWAP_GQL), (PEEK, PEEK_GQL)):
+        expected = pgql_type.MoveFunctionGQL.from_query(recorded)
+        assert index.function(target) == expected
+        assert index.arg_summary(target) == expected.arg_summary()
+    summary = index.arg_summary(SWAP)
+    # TxContext is not an argument
+    assert len(summary.arg_list) == 4 and summary.returns == 1
+    assert index.function(f"{PACKAGE}::pool::swap") == index.function(SWAP)
+    assert index.function("0x5::pool::missing") is None
+    assert index.arg_summary("0x5::pool::missing") is None
+
+
+def test_unpublished_module(tmp_path):
+    """Without a package the module self address is kept."""
+    tmp_path.joinpath("pool.mv").write_bytes(_module())
+    index = FunctionIndex()
+    assert index.add_package(tmp_path) == ["pool"]
+    swap = index.function("0x0::pool::swap")
+    assert swap.parameters[0]["signature"]["body"]["datatype"]["package"] == (
+        f"0x{'0' * 64}"
+    )
+    assert swap.returns[0]["signature"]["body"] == COIN_T
+
+
+def test_normalized_function(index):
+    """The JSON RPC form equals the sui_getNormalizedMoveFunction result."""
+    expected = _normalized()
+    assert index.normalized_function(SWAP) == expected
+    peek = index.normalized_function(PEEK)
+    assert peek.visibility == "Public" and not peek.is_entry
+    assert [x.scalar_type for x in peek.returns] == ["U64", "Bool"]
+    assert peek.parameters[0].reference_type == "Reference"
+    assert index.normalized_function("0x5::pool::missing") is None
+
+
+class _Client:
+    """Asynchronous JSON RPC client answering GetFunction."""
+
+    def __init__(self):
+        self.config = SimpleNamespace(active_address=f"0x{'ab' * 32}")
+        self.protocol = SimpleNamespace(transaction_constraints=None)
+        self.current_gas_price = 1000
+        self.queried: list[str] = []
+
+    async def execute(self, builder):
+        assert isinstance(builder, GetFunction)
+        self.queried.append(builder.function_name.function_name)
+        return SuiRpcResult(True, None, _normalized())
+
+
+def test_async_transaction(index, monkeypatch):
+    """The asynchronous transaction resolves indexed targets without queries."""
+    monkeypatch.setattr(SuiTransactionAsync, "_MC_RESULT_CACHE", {})
+    client = _Client()
+    txn = SuiTransactionAsync(client=client, function_index=index)
+    assert txn.function_index is index
+    package, module, function, parameters, returns = asyncio.run(
+        txn._move_call_target_cache(SWAP)
+    )
+    assert package == bcs.Address.from_str(PACKAGE)
+    assert (module, function, returns) == ("pool", "swap", 1)
+    assert parameters == _normalized().parameters
+    assert client.queried == []
+    # Targets not indexed are queried
+    asyncio.run(txn._move_call_target_cache("0x6::pool::swap"))
+    assert client.queried == ["swap"]
@@ -0,0 +1,144 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing gas coin selection strategies (no transactions)."""
+
+import pytest
+import pysui.sui.sui_pgql.pgql_txb_gas as gd
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+OWNER: str = f"0x{'ab' * 32}"
+# Coin name, balance and version, b and c share a balance and d and e a version
+COINS: list[tuple[str, int, int]] = [
+    ("a", 100, 9),
+    ("b", 500, 3),
+    ("c", 500, 7),
+    ("d", 1000, 5),
+    ("e", 50, 5),
+    ("f", 2000, 12),
+]
+
+
+def _coin(name: str, balance: int, version: int) -> pgql_type.SuiCoinObjectGQL:
+    """Gas coin with the name as its object id."""
+    return pgql_type.SuiCoinObjectGQL.from_query(
+        {
+            "version": version,
+            "hasPublicTransfer": True,
+            "previousTransactionBlock": {"previous_transaction": "TxDigest"},
+            "owner": {"obj_owner_kind": "AddressOwner", "owner": {"address_id": OWNER}},
+            "contents": {"type": {"coin_type": "0x2::coin::Coin<0x2::sui::SUI>"}},
+            "object_digest": f"Digest{name}",
+            "balance": str(balance),
+            "coin_object_id": name,
+        }
+    )
+
+
+@pytest.fixture
+def recent(monkeypatch) -> dict[str, float]:
+    """Isolated recent gas selections at a fixed time."""
+    monkeypatch.setattr(gd, "_RECENT_GAS", {})
+    monkeypatch.setattr(gd.time, "monotonic", lambda: 1000.0)
+    return gd._RECENT_GAS
+
+
+def _select(budget: int, strategy: gd.GasSelection) -> list[str]:
+    """Names of the coins selected from COINS."""
+    index = gd.GasCoinIndex([_coin(*x) for x in COINS])
+    return [x.coin_object_id for x in index.select(budget, strategy)]
+
+
+@pytest.mark.parametrize(
+    "budget, expected",
+    [
+        # Smallest covering coin, of equal balances the first listed
+        (50, ["e"]),
+        (400, ["b"]),
+        (500, ["b"]),
+        (1500, ["f"]),
+        # Largest coin, then the best fit for the remainder
+        (2500, ["f", "b"]),
+        (3500, ["f", "d", "b"]),
+        (4150, ["f", "d", "c", "b", "a", "e"]),
+    ],
+)
+def test_best_fit(recent, budget, expected):
+    """BEST_FIT covers with one coin where it can."""
+    assert _select(budget, gd.GasSelection.BEST_FIT) == expected
+
+
+@pytest.mark.parametrize(
+    "budget, expected",
+    [
+        (50, ["f"]),
+        (2500, ["f", "d"]),
+        # Of equal balances the last listed
+        (3500, ["f", "d", "c"]),
+        (4000, ["f", "d", "c", "b"]),
+    ],
+)
+def test_fewest_coins(recent, budget, expected):
+    """FEWEST_COINS takes the largest coins first."""
+    assert _select(budget, gd.GasSelection.FEWEST_COINS) == expected
+
+
+@pytest.mark.parametrize(
+    "budget, expected",
+    [
+        (500, ["b"]),
+        # Of equal versions the smaller balance
+        (540, ["b", "e"]),
+        (600, ["b", "e", "d"]),
+        (2000, ["b", "e", "d", "c"]),
+        (4150, ["b", "e", "d", "c", "a", "f"]),
+    ],
+)
+def test_oldest_first(recent, budget, expected):
+    """OLDEST_FIRST takes the lowest versions first."""
+    assert _select(budget, gd.GasSelection.OLDEST_FIRST) == expected
+
+
+def test_least_contended(recent, monkeypatch):
+    """LEAST_CONTENDED skips recently selected coins until the window passes."""
+    picks = [_select(400, gd.GasSelection.LEAST_CONTENDED) for _ in range(5)]
+    # All covering coins contended, falls back to best fit
+    assert picks == [["b"], ["c"], ["d"], ["f"], ["b"]]
+    assert recent == {x: 1000.0 for x in "bcdf"}
+    # Selections by every strategy count as recent
+    assert _select(50, gd.GasSelection.BEST_FIT) == ["e"]
+    assert _select(50, gd.GasSelection.LEAST_CONTENDED) == ["a"]
+
+    monkeypatch.setattr(
+        gd.time, "monotonic", lambda: 1000.0 + gd._CONTENTION_WINDOW + 1
+    )
+    assert _select(400, gd.GasSelection.LEAST_CONTENDED) == ["b"]
+
+
+@pytest.mark.parametrize("strategy", list(gd.GasSelection))
+def test_insufficient(recent, strategy):
+    """Every strategy raises when the coins do not cover the budget."""
+    with pytest.raises(ValueError):
+        _select(4151, strategy)
+    assert recent == {}
+
+
+@pytest.mark.parametrize(
+    "strategy", [gd.GasSelection.BEST_FIT, gd.GasSelection.FEWEST_COINS]
+)
+def test_gas_coin_limit(recent, strategy):
+    """No more than the Sui limit of gas coins are selected."""
+    index = gd.GasCoinIndex([_coin(str(x), 1, x) for x in range(300)])
+    assert len(index.select(gd._MAX_GAS_COINS, strategy)) == gd._MAX_GAS_COINS
+    with pytest.raises(ValueError):
+        index.select(gd._MAX_GAS_COINS + 1, strategy)
@@ -0,0 +1,127 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing package import time (no transactions)."""
+
+import subprocess
+import sys
+
+# Client dependencies that must not load with the top level package
+HEAVY_MODULES: list[str] = [
+    "httpx",
+    "h2",
+    "websockets",
+    "canoser",
+    "dataclasses_json",
+    "yaml",
+    "gql",
+    "graphql",
+    "pysui.sui.sui_crypto",
+    "pysui.sui.sui_clients.sync_client",
+]
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Cumulative microseconds of each module imported by statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_lazy_top_level():
+    """import pysui does not load the clients or their dependencies."""
+    times = _import_times("import pysui")
+    assert "pysui" in times
+    for module in HEAVY_MODULES:
+        assert module not in times, f"{module} imported by 'import pysui'"
+
+
+def test_lazy_subpackages():
+    """Importing a light module does not load the clients."""
+    times = _import_times("import pysui.sui.sui_types.scalars")
+    for module in HEAVY_MODULES:
+        assert module not in times, f"{module} imported by pysui.sui.sui_types"
+
+
+def test_import_time():
+    """import pysui is a fraction of loading a client."""
+    lazy = _import_times("import pysui")["pysui"]
+    client = _import_times("from pysui import SyncClient")
+    assert lazy * 4 < client["pysui.sui.sui_clients.sync_client"]
+
+
+def test_lazy_attributes():
+    """Convenience names resolve on access, unknown names raise."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pysui, sys;"
+            "assert 'SyncClient' in dir(pysui);"
+            "assert pysui.SyncClient.__name__ == 'SuiClient';"
+            "assert 'pysui.sui.sui_clients.sync_client' in sys.modules;"
+            "assert not hasattr(pysui, 'NotAnAttribute')",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+STAR_IMPORTS: dict[str, list[str]] = {
+    "pysui": [
+        "SyncClient",
+        "AsyncClient",
+        "Subscribe",
+        "SuiConfig",
+        "SuiAddress",
+        "ObjectID",
+        "SuiRpcResult",
+        "handle_result",
+    ],
+    "pysui.sui": ["SuiApi", "SuiConfig", "validate_api", "SUI_COIN_DENOMINATOR"],
+    "pysui.sui.sui_clients": ["SuiRpcResult"],
+    "pysui.sui.sui_txn": ["SyncTransaction", "AsyncTransaction", "SignerBlock"],
+    "pysui.sui.sui_types": ["SuiAddress", "ObjectID", "SuiArray"],
+    "pysui.sui.sui_txresults": ["AddressOwner", "SuiCoinObject"],
+}
+
+
+def test_star_imports():
+    """Star imports of the packages bind their convenience names."""
+    for package, names in STAR_IMPORTS.items():
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-W",
+                "ignore",
+                "-c",
+                f"from {package} import *;"
+                f"missing = [x for x in {names!r} if x not in globals()];"
+                "assert not missing, missing;"
+                "assert 'lazy_attributes' not in globals()",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"{package}: {result.stderr}"
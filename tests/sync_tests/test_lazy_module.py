@@ -0,0 +1,205 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing lazy Move module deserialization (no transactions)."""
+
+import dataclasses
+from typing import Any
+
+import pytest
+from pysui.sui_move.bin_reader.module_reader import ModuleReader
+from pysui.sui_move.model.common_types import AbilitySet, TableType
+from pysui.sui_move.module.deserialize import (
+    Deserialize,
+    LazyModuleContent,
+    RawModuleContent,
+    _LAZY_TABLES,
+    deserialize,
+)
+
+SCALE: int = 24
+
+
+def _uleb(value: int) -> bytes:
+    """ULEB128 encoding of value."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _string(value: str) -> bytes:
+    """Length prefixed utf-8 string."""
+    return _uleb(len(value)) + value.encode()
+
+
+def _function(index: int) -> bytes:
+    """Function definition, every fifth native, the others with code."""
+    if index % 5 == 4:
+        return _uleb(index) + bytes([1, 2, 0])
+    # LdU64, BrTrue, Pop and Ret
+    code = b"\x06" + index.to_bytes(8, "little") + b"\x03" + _uleb(index)
+    code += b"\x01\x02"
+    return _uleb(index) + bytes([1, 4 if index % 2 else 0, 0, 0]) + _uleb(4) + code
+
+
+def _synthetic_module(scale: int) -> bytes:
+    """Module bytes shaped like benchmarks/bench_move_reader.py synthetic_module.
+
+    Adds function handles and definitions so code units are skipped and decoded.
+    """
+    tables: list[tuple[TableType, bytes]] = [
+        (
+            TableType.ModuleHandles,
+            b"".join(_uleb(x % 4) + _uleb(x) for x in range(scale // 4)),
+        ),
+        (
+            TableType.StructHandles,
+            b"".join(
+                _uleb(x % 16) + _uleb(x) + b"\x07" + _uleb(1) + b"\x03\x00"
+                for x in range(scale // 2)
+            ),
+        ),
+        (
+            TableType.FunctionHandles,
+            b"".join(
+                _uleb(x % 4) + _uleb(x) + _uleb(x) + _uleb(0) + b"\x00"
+                for x in range(scale)
+            ),
+        ),
+        (
+            TableType.Signatures,
+            b"".join(
+                b"\x03\x03" + b"\x06\x08" + _uleb(x) + b"\x0a\x02"
+                for x in range(scale)
+            ),
+        ),
+        (
+            TableType.Identifiers,
+            b"".join(_string(f"identifier_{x}") for x in range(scale)),
+        ),
+        (
+            TableType.AddressIdentifiers,
+            b"".join(x.to_bytes(32, "big") for x in range(1, 5)),
+        ),
+        (
+            TableType.FieldHandles,
+            b"".join(_uleb(x) + _uleb(x * 3) for x in range(scale)),
+        ),
+        (
+            TableType.FunctionDefinitions,
+            b"".join(_function(x) for x in range(scale)),
+        ),
+    ]
+    headers = bytearray()
+    contents = bytearray()
+    for kind, content in tables:
+        headers += bytes([kind]) + _uleb(len(contents)) + _uleb(len(content))
+        contents += content
+    return b"".join(
+        [
+            bytes.fromhex(ModuleReader.MAGIC_WORD),
+            (6).to_bytes(4, "little"),
+            bytes([len(tables)]),
+            headers,
+            contents,
+            b"\x00",
+        ]
+    )
+
+
+def _plain(value: Any) -> Any:
+    """Comparable form of table content, AbilitySet has no equality."""
+    if isinstance(value, AbilitySet):
+        return value.as_bitset
+    if dataclasses.is_dataclass(value):
+        return (
+            type(value).__name__,
+            [_plain(getattr(value, x.name)) for x in dataclasses.fields(value)],
+        )
+    if isinstance(value, (list, tuple)):
+        return [_plain(x) for x in value]
+    return value
+
+
+def _contents() -> tuple[LazyModuleContent, RawModuleContent]:
+    """Lazy and eager deserialization of the synthetic module."""
+    data = _synthetic_module(SCALE)
+    return (
+        deserialize(ModuleReader("lazy", data), Deserialize.LAZY),
+        deserialize(ModuleReader("eager", data), Deserialize.ALL),
+    )
+
+
+def test_tables_match_eager():
+    """Every table of the lazy content equals the eager deserialization."""
+    lazy, eager = _contents()
+    assert (lazy.magic, lazy.version, lazy.module_self) == (
+        eager.magic,
+        eager.version,
+        eager.module_self,
+    )
+    assert not any(lazy.is_loaded(x) for x in _LAZY_TABLES)
+    for name in _LAZY_TABLES:
+        if name == "function_definitions":
+            continue
+        assert _plain(getattr(lazy, name)) == _plain(getattr(eager, name)), name
+    # Tables absent from the module are empty
+    assert lazy.constants == [] and lazy.friends == []
+    assert len(lazy.function_handles) == len(lazy.identifiers) == SCALE
+
+
+def test_code_units_match_eager():
+    """Function definitions are read without code, decoded on request."""
+    lazy, eager = _contents()
+    functions = lazy.function_definitions
+    assert len(functions) == len(eager.function_definitions) == SCALE
+    assert all(not x.code_units for x in functions)
+    for index, expected in enumerate(eager.function_definitions):
+        code_units = lazy.code_units(index)
+        assert _plain(code_units) == _plain(expected.code_units)
+        assert lazy.code_units(index) is code_units
+        assert _plain(functions[index]) == _plain(expected)
+    # Native functions have no code
+    assert not lazy.code_units(4) and not eager.function_definitions[4].code_units
+    assert lazy.code_units(3)[0] == 4
+
+
+def test_tables_memoized(monkeypatch):
+    """A table is deserialized once, on first access, and only it."""
+    lazy, _ = _contents()
+    built: list[TableType] = []
+    build_content_for = ModuleReader.build_content_for
+
+    def _build_content_for(reader, table_type, des_fn):
+        built.append(table_type)
+        return build_content_for(reader, table_type, des_fn)
+
+    monkeypatch.setattr(ModuleReader, "build_content_for", _build_content_for)
+    identifiers = lazy.identifiers
+    assert lazy.identifiers is identifiers
+    assert built == [TableType.Identifiers]
+    assert lazy.is_loaded("identifiers") and not lazy.is_loaded("signatures")
+    _ = lazy.signatures, lazy.signatures, lazy.constants, lazy.constants
+    assert built == [
+        TableType.Identifiers,
+        TableType.Signatures,
+        TableType.ConstantPool,
+    ]
+    with pytest.raises(AttributeError):
+        _ = lazy.no_such_table
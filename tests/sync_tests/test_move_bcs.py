@@ -0,0 +1,153 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing local BCS decoding of Move values (no transactions)."""
+
+import asyncio
+import base64
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_move_bcs import MoveBcsDecoder, MoveLayoutCache
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+PACKAGE: str = f"0x{'ab' * 32}"
+SUI: str = f"0x{'2'.zfill(64)}"
+STD: str = f"0x{'1'.zfill(64)}"
+
+
+def _datatype(package: str, module: str, name: str) -> dict:
+    """OpenMoveType signature body of a struct without type parameters."""
+    return {
+        "datatype": {
+            "package": package,
+            "module": module,
+            "type": name,
+            "typeParameters": [],
+        }
+    }
+
+
+def _structure_result() -> SuiRpcResult:
+    """GetStructure result of PACKAGE::pair::Pair as returned by the client."""
+    fields = [
+        ("id", _datatype(SUI, "object", "UID")),
+        ("value", "u64"),
+        ("name", _datatype(STD, "string", "String")),
+    ]
+    query_result = {
+        "object": {
+            "asMovePackage": {
+                "module": {
+                    "struct": {
+                        "struct_name": "Pair",
+                        "abilities": ["KEY"],
+                        "fields": [
+                            {
+                                "field_name": name,
+                                "field_type": {
+                                    "signature": {"ref": None, "body": body}
+                                },
+                            }
+                            for name, body in fields
+                        ],
+                    }
+                }
+            }
+        }
+    }
+    return SuiRpcResult(
+        True, None, pgql_type.MoveStructureGQL.from_query(query_result)
+    )
+
+
+class _Client:
+    """Client answering every query with a GetStructure result."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def execute_query_node(self, *, with_node):
+        self.queries += 1
+        return _structure_result()
+
+
+class _AsyncClient(_Client):
+    """Asynchronous client answering every query with a GetStructure result."""
+
+    async def execute_query_node(self, *, with_node):
+        return super().execute_query_node(with_node=with_node)
+
+
+PAIR_BCS: bytes = bytes.fromhex("cd" * 32) + (42).to_bytes(8, "little") + b"\x04pair"
+PAIR_VALUE: dict = {"id": f"0x{'cd' * 32}", "value": 42, "name": "pair"}
+
+
+def test_register_result():
+    """A GetStructure result caches the struct layout."""
+    layouts = MoveLayoutCache()
+    layouts._register_result((PACKAGE, "pair", "Pair"), _structure_result())
+    assert (PACKAGE, "pair", "Pair") in layouts
+    assert [x for x, _ in layouts.fields(PACKAGE, "pair", "Pair")] == [
+        "id",
+        "value",
+        "name",
+    ]
+    with pytest.raises(ValueError):
+        layouts._register_result(
+            (PACKAGE, "pair", "Other"), SuiRpcResult(False, "not found")
+        )
+
+
+def test_fetch_and_decode():
+    """Layouts missing from the cache are fetched once by the client."""
+    client = _Client()
+    decoder = MoveBcsDecoder(MoveLayoutCache(client))
+    assert decoder.decode(f"{PACKAGE}::pair::Pair", PAIR_BCS) == PAIR_VALUE
+    assert decoder.decode_event(f"{PACKAGE}::pair::Pair", PAIR_BCS) == PAIR_VALUE
+    assert client.queries == 1
+
+
+def test_prefetch_async():
+    """Layouts are prefetched with the asynchronous client."""
+    layouts = MoveLayoutCache()
+    asyncio.run(layouts.prefetch_async(_AsyncClient(), [f"{PACKAGE}::pair::Pair"]))
+    decoder = MoveBcsDecoder(layouts)
+    assert decoder.decode(f"{PACKAGE}::pair::Pair", PAIR_BCS) == PAIR_VALUE
+
+
+def test_decode_event_bcs():
+    """Events queried with bcs decode to their contents."""
+    events = pgql_type.EventsGQL.from_query(
+        {
+            "events": {
+                "cursor": {"hasNextPage": False, "endCursor": None},
+                "events": [
+                    {
+                        "sendingModule": {
+                            "package": {"package_id": PACKAGE},
+                            "module_name": "pair",
+                        },
+                        "type": {"event_type": f"{PACKAGE}::pair::Pair"},
+                        "sender": {"address": PACKAGE},
+                        "timestamp": "2024-01-01T00:00:00Z",
+                        "json": PAIR_VALUE,
+                        "bcs": base64.b64encode(PAIR_BCS).decode(),
+                    }
+                ],
+            }
+        }
+    )
+    event = events.data[0]
+    decoder = MoveBcsDecoder(MoveLayoutCache(_Client()))
+    assert decoder.decode_event(event.event_type, event.bcs) == PAIR_VALUE
@@ -0,0 +1,209 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the object reference cache (no transactions)."""
+
+from typing import Optional
+
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_objref_cache import ObjectRefCache
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+OBJECT_A: str = f"0x{'0a' * 32}"
+OBJECT_B: str = f"0x{'0b' * 32}"
+OBJECT_C: str = f"0x{'0c' * 32}"
+
+
+def _state(object_id: str, version: int, owner_kind: Optional[str]) -> dict:
+    """Object state of an effects object change."""
+    state = {
+        "object_id": object_id,
+        "version": version,
+        "object_digest": f"digest{version}",
+    }
+    if owner_kind:
+        state["owner"] = {"obj_owner_kind": owner_kind}
+    return state
+
+
+def _executed(object_changes: list[dict]) -> SuiRpcResult:
+    """ExecuteTransaction result with the object changes."""
+    return SuiRpcResult(
+        True,
+        None,
+        pgql_type.ExecutionResultGQL(
+            "SUCCESS", 10, "digest", object_changes=object_changes
+        ),
+    )
+
+
+def _dry_run(object_changes: list[dict]) -> SuiRpcResult:
+    """DryRunTransaction result with the object changes."""
+    return SuiRpcResult(
+        True,
+        None,
+        pgql_type.DryRunResultGQL(
+            pgql_type.TransactionResultGQL(
+                None,
+                {},
+                {"objectChanges": {"nodes": object_changes}},
+                "ProgrammableTransactionBlock",
+            ),
+            [],
+        ),
+    )
+
+
+def test_committed_changes():
+    """Execution output states are cached, deleted and shared are dropped."""
+    cache = ObjectRefCache()
+    cache.put(OBJECT_B, 3, "digest3", "AddressOwner")
+    cache.put(OBJECT_C, 3, "digest3", "AddressOwner")
+    cache.observe(
+        _executed(
+            [
+                {"address": OBJECT_A, "output_state": _state(OBJECT_A, 10, "Shared")},
+                {
+                    "address": OBJECT_B,
+                    "output_state": _state(OBJECT_B, 10, "AddressOwner"),
+                },
+                {"address": OBJECT_C, "output_state": None, "deleted": True},
+            ]
+        )
+    )
+    assert OBJECT_A not in cache
+    assert cache.get(OBJECT_B).version == 10
+    assert cache.get(OBJECT_B).object_digest == "digest10"
+    assert OBJECT_C not in cache
+
+
+def test_dry_run_changes():
+    """Dry-run input states fill and refresh the cache."""
+    cache = ObjectRefCache()
+    cache.put(OBJECT_A, 3, "digest3", "AddressOwner")
+    cache.observe(
+        _dry_run(
+            [
+                {"address": OBJECT_A, "input_state": _state(OBJECT_A, 4, None)},
+                {
+                    "address": OBJECT_B,
+                    "input_state": _state(OBJECT_B, 5, "AddressOwner"),
+                },
+                {"address": OBJECT_C, "input_state": _state(OBJECT_C, 6, None)},
+            ]
+        )
+    )
+    assert len(cache) == 2
+    assert cache.get(OBJECT_A).version == 4
+    assert cache.get(OBJECT_A).owner_kind == "AddressOwner"
+    assert cache.get(OBJECT_B).version == 5
+    assert OBJECT_C not in cache
+
+
+def test_failed_request_invalidates():
+    """Objects named in a failed request are invalidated."""
+    cache = ObjectRefCache()
+    cache.put(OBJECT_A, 3, "digest3", "AddressOwner")
+    cache.put(OBJECT_B, 3, "digest3", "AddressOwner")
+    errors = [{"message": f"Object {OBJECT_A} version 3 is unavailable"}]
+    cache.observe(
+        SuiRpcResult(
+            False,
+            f"TransportQueryError {errors}",
+            pgql_type.ErrorGQL.from_query(errors),
+        )
+    )
+    assert OBJECT_A not in cache
+    assert OBJECT_B in cache
+
+
+def test_failed_transaction_invalidates():
+    """Objects named in a failed transaction are invalidated, its gas coin updated."""
+    cache = ObjectRefCache()
+    cache.put(OBJECT_A, 3, "digest3", "AddressOwner")
+    cache.put(OBJECT_B, 3, "digest3", "AddressOwner")
+    cache.put(OBJECT_C, 3, "digest3", "AddressOwner")
+    cache.observe(
+        SuiRpcResult(
+            True,
+            None,
+            pgql_type.ExecutionResultGQL(
+                "FAILURE",
+                10,
+                "digest",
+                errors=[f"Object {OBJECT_A} version 3 is not available"],
+                object_changes=[
+                    {
+                        "address": OBJECT_C,
+                        "output_state": _state(OBJECT_C, 10, "AddressOwner"),
+                    }
+                ],
+            ),
+        ),
+        pgql_type.ExecutionResultGQL.from_query,
+    )
+    assert OBJECT_A not in cache
+    assert cache.get(OBJECT_B).version == 3
+    assert cache.get(OBJECT_C).version == 10
+
+
+def test_execution_without_changes():
+    """An execution without object changes clears the cache."""
+    cache = ObjectRefCache()
+    cache.put(OBJECT_A, 3, "digest3", "AddressOwner")
+    cache.observe(
+        SuiRpcResult(True, None, pgql_type.ExecutionResultGQL("SUCCESS", 10, "digest"))
+    )
+    assert not len(cache)
+
+
+def test_observe_lazy_results():
+    """Only results of observed types are decoded."""
+    decoded: list[dict] = []
+
+    def _decode(in_data: dict) -> dict:
+        decoded.append(in_data)
+        return in_data
+
+    cache = ObjectRefCache()
+    result = SuiRpcResult(True, None, {"coins": {}}, decode_fn=_decode)
+    cache.observe(result, pgql_type.SuiCoinObjectsGQL.from_query)
+    assert not result.is_decoded() and not decoded
+
+    result = SuiRpcResult(
+        True,
+        None,
+        {
+            "executeTransactionBlock": {
+                "errors": None,
+                "effects": {
+                    "status": "SUCCESS",
+                    "lamportVersion": 10,
+                    "transactionBlock": {"digest": "digest"},
+                    "objectChanges": {
+                        "cursor": {"hasNextPage": False, "endCursor": None},
+                        "nodes": [
+                            {
+                                "address": OBJECT_A,
+                                "output_state": _state(OBJECT_A, 10, "AddressOwner"),
+                            }
+                        ],
+                    },
+                },
+            }
+        },
+        decode_fn=pgql_type.ExecutionResultGQL.from_query,
+    )
+    cache.observe(result, pgql_type.ExecutionResultGQL.from_query)
+    assert result.is_decoded()
+    assert cache.get(OBJECT_A).version == 10
@@ -0,0 +1,176 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing generated GraphQL result decoders (no transactions)."""
+
+import copy
+from typing import Any, Callable
+
+import pytest
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+
+ADDRESS: str = f"0x{'ab' * 32}"
+SUI_COIN: str = "0x2::coin::Coin<0x2::sui::SUI>"
+OWNERS: list[dict] = [
+    {"obj_owner_kind": "AddressOwner", "owner": {"address_id": ADDRESS}},
+    {"obj_owner_kind": "Shared", "initial_version": "3"},
+    {"obj_owner_kind": "Parent", "owner": {"parent_id": ADDRESS}},
+    {"obj_owner_kind": "Immutable"},
+]
+
+
+def _object_id(index: int) -> str:
+    """Deterministic object id."""
+    return f"0x{index:064x}"
+
+
+def _cursor() -> dict:
+    """Page cursor."""
+    return {"hasNextPage": True, "endCursor": "IAAAAAAAAAAAAAAAAA"}
+
+
+def _coin(index: int, owner: dict) -> dict:
+    """GetCoins result node, the version a string to coerce."""
+    return {
+        "version": str(100 + index),
+        "hasPublicTransfer": True,
+        "previousTransactionBlock": {"previous_transaction": f"Tx{index}"},
+        "owner": owner,
+        "contents": {"type": {"coin_type": SUI_COIN}},
+        "object_digest": f"Digest{index}",
+        "balance": str(1_000_000 + index),
+        "coin_object_id": _object_id(index),
+    }
+
+
+def _object(index: int, owner: dict) -> dict:
+    """GetMultipleObjects result node."""
+    return {
+        "bcs": "AQIDBAUGBwg=",
+        "version": 10 + index,
+        "object_digest": f"Digest{index}",
+        "object_id": _object_id(index),
+        "object_kind": "LIVE",
+        "owner": owner,
+        "storage_rebate": "988000",
+        "prior_transaction": {"previous_transaction_digest": f"Tx{index}"},
+        "as_move_content": {
+            "has_public_transfer": True,
+            "as_object": {
+                "content": {"id": _object_id(index), "value": str(index)},
+                "object_type_repr": {"object_type": "0x2::foo::Bar"},
+            },
+        },
+        "as_move_package": None,
+    }
+
+
+def _event(index: int) -> dict:
+    """GetEvents result node."""
+    return {
+        "sendingModule": {
+            "package": {"package_id": _object_id(2)},
+            "module_name": "pool",
+        },
+        "type": {"event_type": "0x2::pool::Swapped"},
+        "sender": {"address": ADDRESS},
+        "timestamp": "2024-03-01T12:00:00.000Z",
+        "json": {"amount_in": str(index)},
+    }
+
+
+PAGES: dict[str, tuple[dict, Callable[[dict], Any]]] = {
+    "coins": (
+        {
+            "qres": {
+                "coins": {
+                    "cursor": _cursor(),
+                    "coin_objects": [_coin(i, x) for i, x in enumerate(OWNERS)],
+                }
+            }
+        },
+        pgql_type.SuiCoinObjectsGQL.from_query,
+    ),
+    "objects": (
+        {
+            "objects": {
+                "cursor": _cursor(),
+                "objects_data": [_object(i, x) for i, x in enumerate(OWNERS)]
+                + [
+                    {
+                        "version": 9,
+                        "object_id": _object_id(9),
+                        "object_kind": "DELETED",
+                        "owner": None,
+                    }
+                ],
+            }
+        },
+        pgql_type.ObjectReadsGQL.from_query,
+    ),
+    "events": (
+        {
+            "events": {
+                "cursor": {"hasNextPage": False, "endCursor": None},
+                "events": [_event(i) for i in range(3)],
+                "event_cursors": [{"cursor": f"e{i}"} for i in range(3)],
+            }
+        },
+        pgql_type.EventsGQL.from_query,
+    ),
+    "transactions": (
+        {
+            "transactionBlocks": {
+                "cursor": _cursor(),
+                "tx_blocks": [
+                    {
+                        "digest": f"Tx{i}",
+                        "effects": {
+                            "status": "SUCCESS",
+                            "timestamp": "2024-03-01T12:00:00.000Z",
+                            "errors": None if i else ["failed"],
+                        },
+                        "kind": {"tx_kind": "ProgrammableTransactionBlock"},
+                    }
+                    for i in range(3)
+                ],
+            }
+        },
+        pgql_type.TransactionSummariesGQL.from_query,
+    ),
+}
+
+
+@pytest.mark.parametrize("page_name", PAGES)
+def test_generated_equals_from_dict(monkeypatch, page_name):
+    """Generated decoders produce the results of dataclasses_json from_dict."""
+    page, decode = PAGES[page_name]
+    generated = decode(copy.deepcopy(page))
+    monkeypatch.setattr(pgql_type, "_from_dict", lambda clz, x: clz.from_dict(x))
+    reflective = decode(copy.deepcopy(page))
+    assert generated.data and generated == reflective
+    assert [type(x) for x in generated.data] == [type(x) for x in reflective.data]
+
+
+def test_decoders_generated():
+    """High volume result types are not left to the from_dict fallback."""
+    for clz in (
+        pgql_type.PagingCursor,
+        pgql_type.SuiCoinObjectGQL,
+        pgql_type.SuiObjectOwnedShared,
+        pgql_type.ObjectReadGQL,
+        pgql_type.ObjectReadDeletedGQL,
+        pgql_type.EventGQL,
+        pgql_type.TransactionSummaryGQL,
+    ):
+        assert pgql_type._decoder_for(clz) != clz.from_dict
@@ -0,0 +1,141 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing package build collection for publishing (no transactions)."""
+
+import base64
+import hashlib
+from pathlib import Path
+
+import pytest
+import yaml
+from pysui.sui.sui_constants import PYSUI_EXEC_ENV
+from pysui.sui.sui_excepts import SuiMiisingModuleByteCode
+import pysui.sui.sui_utils as sui_utils
+
+DEPENDENCY: str = "2".zfill(64)
+PACKAGE_ID: str = "0".zfill(64)
+
+
+def _module(index: int) -> bytes:
+    """Smallest module the ModuleReader accepts, no tables."""
+    return bytes.fromhex("a11ceb0b") + (6).to_bytes(4, "little") + bytes([0, index])
+
+
+def _package(tmp_path: Path) -> Path:
+    """Package folder with a manifest and a source."""
+    package = tmp_path / "dancer"
+    package.joinpath("sources").mkdir(parents=True)
+    package.joinpath("Move.toml").write_text('[package]\nname = "dancer"\n')
+    package.joinpath("sources", "dancer.move").write_text("module dancer::dancer {}")
+    return package
+
+
+@pytest.fixture
+def builds(monkeypatch) -> list[Path]:
+    """Record the compiled packages, compiling into a faux build folder."""
+    compiled: list[Path] = []
+
+    def _compile_project(path_to_package: Path, args_list: list[str]) -> Path:
+        compiled.append(path_to_package)
+        build = path_to_package.joinpath("build", "dancer")
+        build.joinpath("bytecode_modules").mkdir(parents=True, exist_ok=True)
+        for index in range(3):
+            build.joinpath("bytecode_modules", f"m{index}.mv").write_bytes(
+                _module(index)
+            )
+        source_digest = hashlib.sha256(
+            path_to_package.joinpath("sources", "dancer.move").read_bytes()
+        ).hexdigest()
+        build.joinpath("BuildInfo.yaml").write_text(
+            yaml.safe_dump(
+                {
+                    "compiled_package_info": {
+                        "package_name": "Dancer",
+                        "address_alias_instantiation": {
+                            "dancer": PACKAGE_ID,
+                            "sui": DEPENDENCY,
+                        },
+                        "source_digest": source_digest,
+                    }
+                }
+            )
+        )
+        return path_to_package
+
+    monkeypatch.setenv(PYSUI_EXEC_ENV, "sui")
+    monkeypatch.setattr(sui_utils, "_compile_project", _compile_project)
+    sui_utils.clear_package_cache()
+    yield compiled
+    sui_utils.clear_package_cache()
+
+
+def test_package_digest(tmp_path, builds):
+    """Modules are encoded and hashed with the dependencies into the digest."""
+    package = sui_utils.publish_build(_package(tmp_path), [])
+    modules = [_module(x) for x in range(3)]
+    assert sorted(str(x) for x in package.compiled_modules) == sorted(
+        base64.b64encode(x).decode() for x in modules
+    )
+    hashes = [hashlib.blake2b(x, digest_size=32).digest() for x in modules]
+    hashes.append(bytes.fromhex(DEPENDENCY))
+    hasher = hashlib.blake2b(digest_size=32)
+    for block in sorted(hashes):
+        hasher.update(block)
+    assert package.package_digest == hasher.digest()
+    assert package.dependencies == [f"0x{DEPENDENCY}"]
+    assert package.project_id == f"0x{PACKAGE_ID}"
+
+
+def test_missing_modules(tmp_path):
+    """An empty bytecode folder raises."""
+    with pytest.raises(SuiMiisingModuleByteCode):
+        sui_utils._modules_bytes(tmp_path)
+
+
+def test_cache_opt_in(tmp_path, builds):
+    """Packages are compiled on every call unless use_cache is set."""
+    package_path = _package(tmp_path)
+    sui_utils.publish_build(package_path, [])
+    sui_utils.publish_build(package_path, [])
+    assert len(builds) == 2
+
+    first = sui_utils.publish_build(package_path, [], use_cache=True)
+    cached = sui_utils.publish_build(package_path, [], use_cache=True)
+    assert len(builds) == 3
+    assert cached == first and cached.dependencies is not first.dependencies
+    # Different build arguments are built separately
+    sui_utils.publish_build(package_path, ["--dev"], use_cache=True)
+    assert len(builds) == 4
+
+
+def test_cache_fingerprint(tmp_path, builds):
+    """Only the manifest, lock and sources invalidate the cached package."""
+    package_path = _package(tmp_path)
+    sui_utils.publish_build(package_path, [], use_cache=True)
+    for folder in (".git", "build", ".venv"):
+        package_path.joinpath(folder).mkdir(exist_ok=True)
+        package_path.joinpath(folder, "file").write_text(folder)
+    package_path.joinpath("README.md").write_text("readme")
+    sui_utils.publish_build(package_path, [], use_cache=True)
+    assert len(builds) == 1
+
+    package_path.joinpath("Move.lock").write_text("[move]\n")
+    sui_utils.publish_build(package_path, [], use_cache=True)
+    assert len(builds) == 2
+    package_path.joinpath("sources", "dancer.move").write_text("module dancer::b {}")
+    package = sui_utils.publish_build(package_path, [], use_cache=True)
+    assert len(builds) == 3
+    assert package.project_source_digest == hashlib.sha256(
+        b"module dancer::b {}"
+    ).digest()
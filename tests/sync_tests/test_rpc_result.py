@@ -0,0 +1,77 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing lazily decoded results (no transactions)."""
+
+import pytest
+from pysui import SuiRpcResult
+
+PAYLOAD: dict = {"coins": {"balance": "10", "owner": "0x1"}}
+
+
+class _Decoder:
+    """Decoder consuming its input as the GraphQL from_query decoders do."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: int = 0
+        self.fail = fail
+
+    def __call__(self, in_data: dict) -> int:
+        self.calls += 1
+        coins = in_data.pop("coins")
+        if self.fail:
+            raise KeyError("coin_objects")
+        return int(coins.pop("balance"))
+
+
+def test_lazy_decode():
+    """The payload is decoded once on first access of result_data."""
+    decoder = _Decoder()
+    payload = {"coins": dict(PAYLOAD["coins"])}
+    result = SuiRpcResult(True, None, payload, decode_fn=decoder)
+    assert result.is_ok() and not result.is_decoded() and decoder.calls == 0
+    assert result.raw_data is payload
+    assert result.result_data == 10
+    assert result.result_data == 10
+    assert decoder.calls == 1 and result.is_decoded()
+    # Decoding had a copy of the payload
+    assert payload == PAYLOAD
+
+
+def test_raw_data_after_decode():
+    """The raw payload is released once decoded and absent when eager."""
+    result = SuiRpcResult(
+        True, None, {"coins": {"balance": "1"}}, decode_fn=_Decoder()
+    )
+    _ = result.result_data
+    assert result.raw_data is None and result.decode_error is None
+
+    result = SuiRpcResult(True, None, 10)
+    assert result.is_decoded() and result.raw_data is None
+    assert result.result_data == 10
+
+
+def test_decode_failure():
+    """A failed decode keeps the payload and raises on every access."""
+    decoder = _Decoder(fail=True)
+    payload = {"coins": dict(PAYLOAD["coins"])}
+    result = SuiRpcResult(True, None, payload, decode_fn=decoder)
+    with pytest.raises(KeyError) as first:
+        _ = result.result_data
+    assert result.is_err() and not result.is_decoded()
+    assert result.result_string == "KeyError decoding result"
+    assert result.decode_error is first.value
+    assert result.raw_data == PAYLOAD
+    with pytest.raises(KeyError) as second:
+        _ = result.result_data
+    assert second.value is first.value and decoder.calls == 1
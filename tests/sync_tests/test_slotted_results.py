@@ -0,0 +1,280 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing slotted result variants (no transactions)."""
+
+import asyncio
+import copy
+import dataclasses
+import json
+import threading
+
+import pytest
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txresults.common import slotted_variant
+import pysui.sui.sui_txresults.single_tx as legacy_type
+
+ADDRESS: str = f"0x{'ab' * 32}"
+COIN_ID: str = f"0x{'0c' * 32}"
+SUI_COIN: str = "0x2::coin::Coin<0x2::sui::SUI>"
+
+LEGACY_COIN: dict = {
+    "coinType": "0x2::sui::SUI",
+    "coinObjectId": COIN_ID,
+    "version": "7",
+    "digest": "CoinDigest",
+    "balance": "1000",
+    "previousTransaction": "TxDigest",
+}
+LEGACY_OBJECT: dict = {
+    "objectId": COIN_ID,
+    "version": "7",
+    "digest": "CoinDigest",
+    "type": SUI_COIN,
+    "owner": {"AddressOwner": ADDRESS},
+    "previousTransaction": "TxDigest",
+    "storageRebate": "988000",
+    "content": {
+        "dataType": "moveObject",
+        "type": SUI_COIN,
+        "hasPublicTransfer": True,
+        "fields": {"balance": "1000", "id": {"id": COIN_ID}},
+    },
+}
+GQL_OWNERS: list[dict] = [
+    {"obj_owner_kind": "AddressOwner", "owner": {"address_id": ADDRESS}},
+    {"obj_owner_kind": "Shared", "initial_version": 3},
+    {"obj_owner_kind": "Parent", "owner": {"parent_id": ADDRESS}},
+    {"obj_owner_kind": "Immutable"},
+]
+OWNER_TYPES: dict[str, type] = {
+    "AddressOwner": pgql_type.SuiObjectOwnedAddress,
+    "Shared": pgql_type.SuiObjectOwnedShared,
+    "Parent": pgql_type.SuiObjectOwnedParent,
+    "Immutable": pgql_type.SuiObjectOwnedImmutable,
+}
+
+
+def _gql_coin(owner: dict) -> dict:
+    """A GetCoins result node."""
+    return {
+        "version": 7,
+        "hasPublicTransfer": True,
+        "previousTransactionBlock": {"previous_transaction": "TxDigest"},
+        "owner": owner,
+        "contents": {"type": {"coin_type": SUI_COIN}},
+        "object_digest": "CoinDigest",
+        "balance": "1000",
+        "coin_object_id": COIN_ID,
+    }
+
+
+def _gql_object(owner: dict) -> dict:
+    """A GetObject result node."""
+    return {
+        "bcs": "AQIDBAUGBwg=",
+        "version": 7,
+        "object_digest": "ObjectDigest",
+        "object_id": COIN_ID,
+        "object_kind": "LIVE",
+        "owner": owner,
+        "storage_rebate": "988000",
+        "prior_transaction": {"previous_transaction_digest": "TxDigest"},
+        "as_move_content": {
+            "has_public_transfer": True,
+            "as_object": {
+                "content": {"id": COIN_ID, "balance": "1000"},
+                "object_type_repr": {"object_type": SUI_COIN},
+            },
+        },
+        "as_move_package": None,
+    }
+
+
+EVENTS_PAGE: dict = {
+    "events": {
+        "cursor": {"hasNextPage": False, "endCursor": "cursor1"},
+        "events": [
+            {
+                "sendingModule": {
+                    "package": {"package_id": ADDRESS},
+                    "module_name": "pool",
+                },
+                "type": {"event_type": f"{ADDRESS}::pool::Swapped"},
+                "sender": {"address": ADDRESS},
+                "timestamp": "2024-03-01T12:00:00.000Z",
+                "json": {"amount": "1"},
+            }
+        ],
+        "event_cursors": [{"cursor": "cursor1"}],
+    }
+}
+
+
+@pytest.fixture
+def slotted_results():
+    """Decode GraphQL results as slotted variants for the test."""
+    with pgql_type.slotted_results():
+        yield
+
+
+def _check_variant(value: object, original: type) -> None:
+    """The value is a mutable slotted variant of original."""
+    assert type(value) is not original
+    assert isinstance(value, original)
+    assert not hasattr(value, "__dict__")
+    assert not type(value).__dataclass_params__.frozen
+
+
+def test_legacy_coin_constructors():
+    """A SuiCoinObject variant from each constructor equals SuiCoinObject."""
+    original = legacy_type.SuiCoinObject
+    # from_read_object sets owner, which is not a field
+    slotted = slotted_variant(original, extra_slots=("owner",))
+    object_read = legacy_type.ObjectRead.from_dict(copy.deepcopy(LEGACY_OBJECT))
+    built = [
+        (slotted(*LEGACY_COIN.values()), original(*LEGACY_COIN.values())),
+        (slotted.from_dict(LEGACY_COIN), original.from_dict(LEGACY_COIN)),
+        (
+            slotted.from_json(json.dumps(LEGACY_COIN)),
+            original.from_json(json.dumps(LEGACY_COIN)),
+        ),
+        (
+            slotted.from_read_object(object_read),
+            original.from_read_object(object_read),
+        ),
+    ]
+    for value, expected in built:
+        _check_variant(value, original)
+        assert value.to_dict() == expected.to_dict()
+        assert value == expected and expected == value
+        assert value.object_id == expected.object_id
+    assert built[-1][0].owner == built[-1][1].owner == ADDRESS
+    coin = built[0][0]
+    coin.version, coin.balance = "8", "900"
+    assert (coin.version, coin.balance) == ("8", "900")
+
+
+def test_legacy_object_constructors():
+    """An ObjectRead variant from each constructor equals ObjectRead."""
+    original = legacy_type.ObjectRead
+    slotted = slotted_variant(original)
+    for build in (
+        lambda clz: clz.from_dict(copy.deepcopy(LEGACY_OBJECT)),
+        lambda clz: clz.from_json(json.dumps(LEGACY_OBJECT)),
+        lambda clz: clz(
+            version="7",
+            object_id=COIN_ID,
+            owner=copy.deepcopy(LEGACY_OBJECT["owner"]),
+            content=copy.deepcopy(LEGACY_OBJECT["content"]),
+        ),
+    ):
+        value = build(slotted)
+        _check_variant(value, original)
+        assert value.to_dict() == build(original).to_dict()
+        assert value == build(original)
+        assert value.owner.address_owner == ADDRESS
+
+
+def test_gql_constructors(slotted_results):
+    """GraphQL results decode to mutable slotted variants."""
+    decoded: list[tuple[object, type]] = []
+    for owner in GQL_OWNERS:
+        owner_type = OWNER_TYPES[owner["obj_owner_kind"]]
+        coin = pgql_type.SuiCoinObjectGQL.from_query(_gql_coin(copy.deepcopy(owner)))
+        read = pgql_type.ObjectReadGQL.from_query(_gql_object(copy.deepcopy(owner)))
+        decoded += [
+            (coin, pgql_type.SuiCoinObjectGQL),
+            (read, pgql_type.ObjectReadGQL),
+        ]
+        # Owners keep their type, it is not an abstract base
+        assert type(coin.object_owner) is type(read.object_owner) is owner_type
+        coin.version, coin.balance = 8, "900"
+        assert (coin.version, coin.balance) == (8, "900")
+    deleted = pgql_type.ObjectReadGQL.from_query(
+        {"version": 7, "object_id": COIN_ID, "object_kind": "DELETED", "owner": None}
+    )
+    event = pgql_type.EventsGQL.from_query(copy.deepcopy(EVENTS_PAGE)).data[0]
+    assert event.event_cursor == "cursor1"
+    summary = pgql_type.TransactionSummaryGQL.from_query(
+        {"digest": "TxDigest", "status": "SUCCESS", "timestamp": "t", "tx_kind": "k"}
+    )
+    assert type(deleted) is pgql_type.ObjectReadDeletedGQL
+    decoded += [
+        (event, pgql_type.EventGQL),
+        (summary, pgql_type.TransactionSummaryGQL),
+    ]
+    for value, original in decoded:
+        _check_variant(value, original)
+        # Direct construction of the variant
+        variant = pgql_type._result_type(original, True)
+        assert type(value) is variant
+        fields = {x.name: getattr(value, x.name) for x in dataclasses.fields(value)}
+        assert variant(**fields) == value
+        _check_variant(variant.from_dict(value.to_dict()), original)
+
+
+def test_variant_equality():
+    """Variants compare equal to the original by field, either way round."""
+    original = legacy_type.SuiCoinObject.from_dict(LEGACY_COIN)
+    variant = slotted_variant(legacy_type.SuiCoinObject).from_dict(LEGACY_COIN)
+    frozen = slotted_variant(legacy_type.SuiCoinObject, frozen=True)
+    assert variant == original and original == variant
+    assert frozen.from_dict(LEGACY_COIN) == variant
+    assert variant != legacy_type.ObjectRead.from_dict(copy.deepcopy(LEGACY_OBJECT))
+    variant.balance = "900"
+    assert variant != original and original != variant
+
+    owner = GQL_OWNERS[0]
+    coin = pgql_type.SuiCoinObjectGQL.from_query(_gql_coin(copy.deepcopy(owner)))
+    with pgql_type.slotted_results():
+        slotted = pgql_type.SuiCoinObjectGQL.from_query(
+            _gql_coin(copy.deepcopy(owner))
+        )
+    assert type(slotted) is not type(coin)
+    assert slotted == coin and coin == slotted
+
+
+def test_setting_scope():
+    """The setting is restored on exit and not seen by other threads."""
+    assert not pgql_type._SLOTTED_RESULTS.get()
+    seen: list[bool] = []
+
+    def _decode() -> None:
+        seen.append(pgql_type._SLOTTED_RESULTS.get())
+
+    with pgql_type.slotted_results():
+        assert pgql_type._SLOTTED_RESULTS.get()
+        thread = threading.Thread(target=_decode)
+        thread.start()
+        thread.join()
+        with pgql_type.slotted_results(False):
+            assert not pgql_type._SLOTTED_RESULTS.get()
+        assert pgql_type._SLOTTED_RESULTS.get()
+    assert seen == [False]
+    assert not pgql_type._SLOTTED_RESULTS.get()
+
+    async def _tasks() -> list[bool]:
+        async def _set() -> bool:
+            pgql_type.set_slotted_results()
+            return pgql_type._SLOTTED_RESULTS.get()
+
+        async def _get() -> bool:
+            await asyncio.sleep(0)
+            return pgql_type._SLOTTED_RESULTS.get()
+
+        return await asyncio.gather(_set(), _get())
+
+    # Each task runs in a copy of the context
+    assert asyncio.run(_tasks()) == [True, False]
+    assert not pgql_type._SLOTTED_RESULTS.get()
@@ -0,0 +1,327 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing subscription dispatch and multiplexing (no transactions)."""
+
+import asyncio
+import itertools
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+import websockets
+from pysui.sui.sui_clients.subscribe import (
+    DispatchOptions,
+    DispatchOverflow,
+    EventData,
+    _Dispatcher,
+    _MuxSubscription,
+    _SubscriptionMux,
+)
+
+# Subscription builder returning received messages as the event
+BUILDER = SimpleNamespace(handle_return=lambda message: message)
+
+
+class _Handler:
+    """Handler recording event counters, held at a gate."""
+
+    def __init__(self, stop_at: Optional[int] = None):
+        self.handled: list[int] = []
+        self.gate = asyncio.Event()
+        self.stop_at = stop_at
+
+    async def handle(self, event: Any, subscription_id: int, counter: int) -> bool:
+        await self.gate.wait()
+        self.handled.append(counter)
+        return counter != self.stop_at
+
+
+def _dispatcher(
+    handler: _Handler, overflow: DispatchOverflow, queue_size: int = 2
+) -> _Dispatcher:
+    """Dispatcher with one worker."""
+    return _Dispatcher(
+        DispatchOptions(queue_size=queue_size, overflow=overflow),
+        BUILDER,
+        handler.handle,
+        EventData("test"),
+    )
+
+
+async def _put_all(dispatcher: _Dispatcher, count: int) -> None:
+    """Put count events, the first taken by the worker before the rest."""
+    await dispatcher.put({"event": 0})
+    await asyncio.sleep(0.01)
+    for index in range(1, count):
+        await dispatcher.put({"event": index})
+
+
+async def _drained(dispatcher: _Dispatcher, handler: _Handler, count: int) -> None:
+    """Open the gate and wait for count events to be handled."""
+    handler.gate.set()
+    while len(handler.handled) < count and not dispatcher.stopped.is_set():
+        await asyncio.sleep(0.01)
+    await dispatcher.close()
+
+
+def test_block():
+    """A full queue blocks the receiver until the handler catches up."""
+
+    async def _run():
+        handler = _Handler()
+        dispatcher = _dispatcher(handler, DispatchOverflow.BLOCK)
+        await _put_all(dispatcher, 3)
+        blocked = asyncio.create_task(dispatcher.put({"event": 3}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        assert dispatcher.metrics.depth == 2
+        await _drained(dispatcher, handler, 4)
+        assert blocked.done()
+        return handler, dispatcher
+
+    handler, dispatcher = asyncio.run(_run())
+    assert handler.handled == [0, 1, 2, 3]
+    assert dispatcher.metrics.max_depth == 2
+    assert dispatcher.metrics.dropped == 0
+
+
+def test_drop_oldest():
+    """A full queue drops its oldest event."""
+
+    async def _run():
+        handler = _Handler()
+        dispatcher = _dispatcher(handler, DispatchOverflow.DROP_OLDEST)
+        await _put_all(dispatcher, 5)
+        await _drained(dispatcher, handler, 3)
+        return handler, dispatcher
+
+    handler, dispatcher = asyncio.run(_run())
+    assert handler.handled == [0, 3, 4]
+    assert dispatcher.metrics.dropped == 2
+    assert dispatcher.metrics.received == 5
+
+
+def test_spill_order(tmp_path):
+    """Events spilled to disk are handled in receive order."""
+
+    async def _run():
+        handler = _Handler()
+        dispatcher = _Dispatcher(
+            DispatchOptions(
+                queue_size=2, overflow=DispatchOverflow.SPILL, spill_dir=str(tmp_path)
+            ),
+            BUILDER,
+            handler.handle,
+            EventData("test"),
+        )
+        await _put_all(dispatcher, 8)
+        assert dispatcher.metrics.depth == 7
+        await _drained(dispatcher, handler, 8)
+        return handler, dispatcher
+
+    handler, dispatcher = asyncio.run(_run())
+    assert handler.handled == list(range(8))
+    assert dispatcher.metrics.spilled == 5
+    assert dispatcher.metrics.dropped == 0
+
+
+def test_handler_stop():
+    """A handler returning False stops dispatch, queued events are discarded."""
+
+    async def _run():
+        handler = _Handler(stop_at=1)
+        dispatcher = _dispatcher(handler, DispatchOverflow.BLOCK, queue_size=10)
+        await _put_all(dispatcher, 4)
+        await _drained(dispatcher, handler, 4)
+        # Receiving after the stop does not block
+        await dispatcher.put({"event": 4})
+        return handler, dispatcher
+
+    handler, dispatcher = asyncio.run(_run())
+    assert handler.handled == [0, 1]
+    assert dispatcher.stopped.is_set()
+    assert dispatcher.failure is None
+
+
+def test_mux_queue_bound():
+    """Routing waits on a full subscription queue until it is unsubscribed."""
+
+    async def _run():
+        # Not connected, the subscription is routed as if subscribed
+        mux = _SubscriptionMux(SimpleNamespace(config=None), 0)
+        sub = _MuxSubscription("suix_subscribeEvent", [{}], 1)
+        mux._subs.add(sub)
+        sub.subscription_id = 7
+        mux._by_id[7] = sub
+        notification = {"params": {"subscription": 7, "result": {}}}
+        await mux._route(notification)
+        blocked = asyncio.create_task(mux._route(notification))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        await mux.unsubscribe(sub)
+        await asyncio.wait_for(blocked, 1)
+
+    asyncio.run(_run())
+
+
+class _RpcServer:
+    """Local websocket JSON-RPC server answering subscribe requests."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.connections: list = []
+        self.hold: Optional[asyncio.Event] = None
+        self._ids = itertools.count(100)
+
+    async def handler(self, websocket, *_) -> None:
+        self.connections.append(websocket)
+        async for raw_message in websocket:
+            request = json.loads(raw_message)
+            self.requests.append(request)
+            if "_subscribe" in request["method"] and self.hold:
+                await self.hold.wait()
+            result = next(self._ids) if "_subscribe" in request["method"] else True
+            await websocket.send(
+                json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result})
+            )
+
+    def subscribed(self) -> list[int]:
+        """Subscription ids of the subscribe requests, in order."""
+        return [
+            x["params"][0]["id"]
+            for x in self.requests
+            if "_subscribe" in x["method"]
+        ]
+
+    def unsubscribed(self) -> list[int]:
+        """Subscription ids of the unsubscribe requests, in order."""
+        return [
+            x["params"][0] for x in self.requests if "_unsubscribe" in x["method"]
+        ]
+
+
+async def _until(predicate: Callable[[], bool]) -> None:
+    """Wait up to 5 seconds for predicate."""
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition not reached")
+
+
+def _with_server(test: Callable) -> None:
+    """Run test with a local server and a mux connecting to it."""
+
+    async def _run():
+        server = _RpcServer()
+        async with websockets.serve(server.handler, "127.0.0.1", 0) as serving:
+            port = serving.sockets[0].getsockname()[1]
+            client = SimpleNamespace(
+                config=SimpleNamespace(socket_url=f"ws://127.0.0.1:{port}")
+            )
+            mux = _SubscriptionMux(client, 0)
+            try:
+                await test(server, mux)
+            finally:
+                if mux._task:
+                    mux._task.cancel()
+
+    asyncio.run(_run())
+
+
+def _sub(filter_id: int) -> _MuxSubscription:
+    """Event subscription with a filter identifying it to the server."""
+    return _MuxSubscription("suix_subscribeEvent", [{"id": filter_id}], 10)
+
+
+def test_mux_routing():
+    """Notifications are routed to subscriptions by subscription id."""
+
+    async def _test(server: _RpcServer, mux: _SubscriptionMux):
+        first, second = _sub(1), _sub(2)
+        await mux.subscribe(first)
+        await _until(lambda: first.subscription_id is not None)
+        await mux.subscribe(second)
+        await _until(lambda: second.subscription_id is not None)
+        assert len(server.connections) == 1
+        for sub_id in (second.subscription_id, first.subscription_id, 999):
+            await server.connections[0].send(
+                json.dumps({"params": {"subscription": sub_id, "result": sub_id}})
+            )
+        assert (await first.queue.get())["params"]["result"] == first.subscription_id
+        assert (await second.queue.get())["params"]["result"] == second.subscription_id
+        await asyncio.sleep(0.05)
+        assert first.queue.empty() and second.queue.empty()
+
+    _with_server(_test)
+
+
+def test_mux_resubscribe():
+    """Subscriptions are resubscribed when the connection drops."""
+
+    async def _test(server: _RpcServer, mux: _SubscriptionMux):
+        first, second = _sub(1), _sub(2)
+        await mux.subscribe(first)
+        await mux.subscribe(second)
+        await _until(lambda: len(server.subscribed()) == 2)
+        await server.connections[0].close()
+        await _until(lambda: len(server.subscribed()) == 4)
+        assert len(server.connections) == 2
+        assert sorted(server.subscribed()[2:]) == [1, 2]
+        await _until(lambda: mux._by_id.get(first.subscription_id) is first)
+        await server.connections[1].send(
+            json.dumps({"params": {"subscription": first.subscription_id}})
+        )
+        await asyncio.wait_for(first.queue.get(), 1)
+
+    _with_server(_test)
+
+
+def test_mux_close():
+    """Unsubscribing sends unsubscribe, the last closes the connection."""
+
+    async def _test(server: _RpcServer, mux: _SubscriptionMux):
+        first, second = _sub(1), _sub(2)
+        await mux.subscribe(first)
+        await mux.subscribe(second)
+        await _until(lambda: second.subscription_id is not None)
+        await mux.unsubscribe(first)
+        await _until(lambda: server.unsubscribed() == [first.subscription_id])
+        await mux.unsubscribe(second)
+        await asyncio.wait_for(mux._task, 2)
+        assert len(mux) == 0
+        assert server.connections[0].closed
+
+    _with_server(_test)
+
+
+def test_mux_late_subscribe_result():
+    """A subscription removed while subscribing is unsubscribed on its result."""
+
+    async def _test(server: _RpcServer, mux: _SubscriptionMux):
+        kept, removed = _sub(1), _sub(2)
+        await mux.subscribe(kept)
+        await _until(lambda: kept.subscription_id is not None)
+        server.hold = asyncio.Event()
+        await mux.subscribe(removed)
+        await _until(lambda: len(server.subscribed()) == 2)
+        await mux.unsubscribe(removed)
+        assert not server.unsubscribed()
+        server.hold.set()
+        await _until(lambda: len(server.unsubscribed()) == 1)
+        assert server.unsubscribed()[0] != kept.subscription_id
+        assert removed.subscription_id is None
+        assert list(mux._by_id) == [kept.subscription_id]
+
+    _with_server(_test)
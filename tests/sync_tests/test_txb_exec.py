@@ -0,0 +1,301 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the pipelined executor scheduling state (no transactions)."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_txb_exec import PipelinedExecutor, _uses_gas_coin
+import pysui.sui.sui_pgql.pgql_txb_exec as txb_exec
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_types import bcs
+
+PAYER: str = f"0x{'ab' * 32}"
+OBJECT_A: str = f"0x{'0a' * 32}"
+OBJECT_B: str = f"0x{'0b' * 32}"
+COIN: str = f"0x{'0c' * 32}"
+
+
+def _change(object_id: str, version: int) -> dict:
+    """ObjectChange node of a mutated object."""
+    return {
+        "address": object_id,
+        "deleted": False,
+        "created": False,
+        "output_state": {
+            "version": version,
+            "object_digest": f"digest{version}",
+            "object_id": object_id,
+            "object_kind": "LIVE",
+            "owner": {"obj_owner_kind": "AddressOwner"},
+        },
+    }
+
+
+def _coin(coin_id: str, balance: int) -> pgql_type.SuiCoinObjectGQL:
+    """A payer gas coin."""
+    return pgql_type.SuiCoinObjectGQL.from_query(
+        {
+            "version": 7,
+            "hasPublicTransfer": True,
+            "previousTransactionBlock": {"previous_transaction": "TxDigest"},
+            "owner": {
+                "obj_owner_kind": "AddressOwner",
+                "owner": {"address_id": PAYER},
+            },
+            "contents": {"type": {"coin_type": "0x2::coin::Coin<0x2::sui::SUI>"}},
+            "object_digest": "CoinDigest",
+            "balance": str(balance),
+            "coin_object_id": coin_id,
+        }
+    )
+
+
+def _transaction(
+    *object_ids: str, commands: Optional[list] = None
+) -> SimpleNamespace:
+    """Transaction stand in with owned object inputs and commands."""
+    return SimpleNamespace(
+        builder=SimpleNamespace(
+            objects_registry={x: "ImmOrOwnedObject" for x in object_ids},
+            commands=commands or [],
+        ),
+        client=None,
+    )
+
+
+class _Client:
+    """Asynchronous client answering object change page queries."""
+
+    def __init__(self, pages: list[SuiRpcResult]):
+        self.pages = pages
+
+    async def execute_query_node(self, *, with_node):
+        return self.pages.pop(0)
+
+
+def test_uses_gas_coin():
+    """Gas coin use is found in command arguments."""
+    split = bcs.Command(
+        "SplitCoin",
+        bcs.SplitCoin(bcs.Argument("GasCoin"), [bcs.Argument("Input", 0)]),
+    )
+    merge = bcs.Command(
+        "MergeCoins",
+        bcs.MergeCoins(bcs.Argument("Input", 0), [bcs.Argument("GasCoin")]),
+    )
+    transfer = bcs.Command(
+        "TransferObjects",
+        bcs.TransferObjects([bcs.Argument("Input", 1)], bcs.Argument("Input", 2)),
+    )
+    assert _uses_gas_coin(_transaction(commands=[transfer, split]))
+    assert _uses_gas_coin(_transaction(commands=[merge]))
+    assert not _uses_gas_coin(_transaction(commands=[transfer]))
+
+
+def test_release_keys(monkeypatch):
+    """Reservations and last users are released when their tasks finish."""
+
+    async def _run(self, txn, keys, deps, reserve):
+        if deps:
+            await asyncio.wait(deps)
+        return SuiRpcResult(True, None, None)
+
+    monkeypatch.setattr(PipelinedExecutor, "_run", _run)
+
+    async def _submit():
+        executor = PipelinedExecutor(client=None)
+        first = executor.submit(_transaction(OBJECT_A, OBJECT_B))
+        second = executor.submit(_transaction(OBJECT_A))
+        assert executor._reserved == {OBJECT_A, OBJECT_B}
+        assert executor._last_user == {OBJECT_A: second, OBJECT_B: first}
+        await first
+        assert executor._reserved == {OBJECT_A}
+        await executor.wait()
+        return executor
+
+    executor = asyncio.run(_submit())
+    assert not executor._reserved
+    assert not executor._last_user
+
+
+def test_object_changes_paging():
+    """Object changes past the first page are fetched by digest."""
+    result = pgql_type.ExecutionResultGQL.from_query(
+        {
+            "executeTransactionBlock": {
+                "errors": None,
+                "effects": {
+                    "status": "SUCCESS",
+                    "lamportVersion": 9,
+                    "transactionBlock": {"digest": "TxDigest"},
+                    "gasEffects": None,
+                    "objectChanges": {
+                        "cursor": {"hasNextPage": True, "endCursor": "page1"},
+                        "nodes": [_change(OBJECT_A, 9)],
+                    },
+                },
+            }
+        }
+    )
+    assert result.object_changes_cursor.endCursor == "page1"
+    page = pgql_type.ObjectChangesGQL.from_query(
+        {
+            "transactionBlock": {
+                "effects": {
+                    "objectChanges": {
+                        "cursor": {"hasNextPage": False, "endCursor": "page2"},
+                        "changes": [_change(OBJECT_B, 9)],
+                    }
+                }
+            }
+        }
+    )
+    executor = PipelinedExecutor(client=_Client([SuiRpcResult(True, None, page)]))
+    changes, complete = asyncio.run(executor._object_changes(result))
+    assert complete
+    assert [x["address"] for x in changes] == [OBJECT_A, OBJECT_B]
+
+    # Inputs missing from incomplete changes are invalidated
+    executor = PipelinedExecutor(
+        client=_Client([SuiRpcResult(False, "TransportQueryError", None)])
+    )
+    executor._object_refs[OBJECT_B] = (8, "digest8")
+    executor._gas_pools[PAYER] = {COIN: _coin(COIN, 1000)}
+    changes, complete = asyncio.run(executor._object_changes(result))
+    assert not complete
+    executor._apply_effects(
+        PAYER,
+        executor._gas_pools[PAYER][COIN],
+        {OBJECT_A, OBJECT_B},
+        (changes, complete),
+        None,
+        False,
+    )
+    assert executor.object_refs == {OBJECT_A: (9, "digest9")}
+    assert COIN in executor._gas_stale
+
+
+def test_object_refs_bounded():
+    """Least recently updated object references are dropped."""
+    executor = PipelinedExecutor(client=None, max_object_refs=1)
+    coin = _coin(COIN, 1000)
+    executor._gas_pools[PAYER] = {COIN: coin}
+    for object_id in (OBJECT_A, OBJECT_B):
+        executor._apply_effects(
+            PAYER, coin, {object_id}, ([_change(object_id, 9)], True), None, False
+        )
+    assert executor.object_refs == {OBJECT_B: (9, "digest9")}
+
+
+def test_acquire_refreshes_stale(monkeypatch):
+    """Released coins with unknown balance are refreshed before reuse."""
+    refreshed: list[list[str]] = []
+
+    def _get_gas_objects(client, gas_ids):
+        refreshed.append(gas_ids)
+        return [_coin(COIN, 10)]
+
+    monkeypatch.setattr(txb_exec.gd, "_get_gas_objects", _get_gas_objects)
+
+    async def _acquire():
+        executor = PipelinedExecutor(client=None, gas_budget="100")
+        executor._gas_pools[PAYER] = {COIN: _coin(COIN, 1000)}
+        executor._gas_stale.add(COIN)
+        return await executor._acquire_gas(_transaction(), PAYER, 0)
+
+    # The refreshed balance no longer covers the budget
+    with pytest.raises(ValueError):
+        asyncio.run(_acquire())
+    assert refreshed == [[COIN]]
+
+
+def test_refresh_releases_lock(monkeypatch):
+    """Gas coins are released while stale coins are being fetched."""
+    fetching = threading.Event()
+    fetched = threading.Event()
+
+    def _get_gas_objects(client, gas_ids):
+        fetching.set()
+        fetched.wait(5)
+        return [_coin(COIN, 10_000)]
+
+    monkeypatch.setattr(txb_exec.gd, "_get_gas_objects", _get_gas_objects)
+
+    async def _acquire():
+        executor = PipelinedExecutor(client=None, gas_budget="100")
+        busy = _coin(OBJECT_A, 1000)
+        executor._gas_pools[PAYER] = {COIN: _coin(COIN, 1000), OBJECT_A: busy}
+        executor._gas_busy.add(OBJECT_A)
+        executor._gas_stale.add(COIN)
+        acquiring = asyncio.create_task(executor._acquire_gas(_transaction(), PAYER, 0))
+        await asyncio.to_thread(fetching.wait, 5)
+        await asyncio.wait_for(executor._release_gas(busy), 1)
+        fetched.set()
+        return executor, await asyncio.wait_for(acquiring, 5)
+
+    executor, coin = asyncio.run(_acquire())
+    assert coin.coin_object_id == COIN and coin.balance == "10000"
+    assert executor._gas_busy == {COIN}
+    assert not executor._gas_stale
+
+
+class _Planner:
+    """Planner with a merge transaction planned every round."""
+
+    def __init__(self, rounds: int):
+        self.rounds = rounds
+        self.planned = 0
+
+    def plan_compaction(self, *, coin_type, target_count):
+        if self.planned == self.rounds:
+            return []
+        self.planned += 1
+        return [_transaction()]
+
+
+def test_compact_progress(monkeypatch):
+    """Compaction stops on failed merges and after max_rounds."""
+    statuses: list[str] = []
+
+    async def _execute_all(self, transactions):
+        return [
+            SuiRpcResult(
+                True, None, pgql_type.ExecutionResultGQL(statuses.pop(0), 9, "Tx")
+            )
+            for _ in transactions
+        ]
+
+    monkeypatch.setattr(PipelinedExecutor, "execute_all", _execute_all)
+    executor = PipelinedExecutor(client=None)
+
+    # Merges executed with a FAILURE status are not progress
+    statuses[:] = ["SUCCESS", "FAILURE", "SUCCESS"]
+    planner = _Planner(3)
+    results = asyncio.run(executor.compact_coins(planner=planner))
+    assert [x.result_data.status for x in results] == ["SUCCESS", "FAILURE"]
+
+    statuses[:] = ["SUCCESS"] * 5
+    planner = _Planner(5)
+    results = asyncio.run(executor.compact_coins(planner=planner, max_rounds=2))
+    assert len(results) == 2
+
+    statuses[:] = ["SUCCESS"] * 2
+    planner = _Planner(2)
+    results = asyncio.run(executor.compact_coins(planner=planner, max_rounds=2))
+    assert len(results) == 2 and planner.planned == 2
@@ -0,0 +1,299 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing transaction planner packing (no transactions)."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pysui import SuiRpcResult
+from pysui.sui.sui_pgql.pgql_txb_planner import (
+    TransactionPlanner,
+    _FAUX_DIGEST,
+    _TxnTally,
+    _is_sui_coin,
+)
+from pysui.sui.sui_pgql.pgql_txb_exec import PipelinedExecutor
+import pysui.sui.sui_pgql.pgql_types as pgql_type
+from pysui.sui.sui_txn.transaction_builder import ProgrammableTransactionBuilder
+from pysui.sui.sui_types import bcs
+
+SENDER: str = f"0x{'ab' * 32}"
+COIN_TYPE: str = "0x12::coin::COIN"
+SUI_LONG: str = f"0x{'2'.zfill(64)}::sui::SUI"
+
+
+def _constraints(**limits) -> pgql_type.TransactionConstraints:
+    """Generous constraints with the limits given."""
+    defaults = {
+        "max_arguments": 512,
+        "max_input_objects": 2048,
+        "max_num_transferred_move_object_ids": 2048,
+        "max_programmable_tx_commands": 1024,
+        "max_pure_argument_size": 16 * 1024,
+        "max_tx_size_bytes": 128 * 1024,
+        "max_type_arguments": 16,
+        "max_tx_gas": 50_000_000_000,
+    }
+    return pgql_type.TransactionConstraints(**(defaults | limits))
+
+
+def _coin(index: int, balance: int) -> pgql_type.SuiCoinObjectGQL:
+    """A sender coin."""
+    return pgql_type.SuiCoinObjectGQL.from_query(
+        {
+            "version": 7,
+            "hasPublicTransfer": True,
+            "previousTransactionBlock": {"previous_transaction": _FAUX_DIGEST},
+            "owner": {
+                "obj_owner_kind": "AddressOwner",
+                "owner": {"address_id": SENDER},
+            },
+            "contents": {"type": {"coin_type": "0x2::coin::Coin<0x2::sui::SUI>"}},
+            "object_digest": _FAUX_DIGEST,
+            "balance": str(balance),
+            "coin_object_id": f"0x{index:064x}",
+        }
+    )
+
+
+class _Client:
+    """Client with protocol constraints answering GetCoins queries."""
+
+    def __init__(self, constraints, coins=()):
+        self.protocol = SimpleNamespace(transaction_constraints=constraints)
+        self.current_gas_price = 1000
+        self.coin_types: list[str] = []
+        self.coins = list(coins)
+
+    def execute_query_node(self, *, with_node):
+        self.coin_types.append(with_node.coin_type)
+        return SuiRpcResult(
+            True,
+            None,
+            SimpleNamespace(data=self.coins, next_cursor=pgql_type.PagingCursor()),
+        )
+
+
+class _Planner(TransactionPlanner):
+    """Planner packing into builders, without a client configuration."""
+
+    def _new_tally(self) -> _TxnTally:
+        txn = SimpleNamespace(
+            builder=ProgrammableTransactionBuilder(),
+            gas=bcs.Argument("GasCoin"),
+            signer_block=SimpleNamespace(sender_str=SENDER),
+        )
+        return _TxnTally(txn, self._fixed_size, self._gas_coin_slots)
+
+
+def _pure(size: int):
+    """Operation with one pure input of size bytes."""
+    return lambda txn: txn.builder.input_pure(
+        bcs.BuilderArg("Pure", list(bytes(size)))
+    )
+
+
+def _objects(start: int, count: int):
+    """Operation merging count coins into the gas coin."""
+
+    def _merge(txn):
+        txn.builder.merge_coins(
+            txn.gas,
+            [
+                bcs.ObjectArg(
+                    "ImmOrOwnedObject", bcs.ObjectReference.from_gql_ref(_coin(x, 1))
+                )
+                for x in range(start, start + count)
+            ],
+        )
+
+    return _merge
+
+
+def test_sui_coin_type():
+    """SUI is recognized in short and long address form."""
+    assert _is_sui_coin("0x2::sui::SUI")
+    assert _is_sui_coin(SUI_LONG)
+    assert not _is_sui_coin(f"0x{'2'.zfill(64)}::coin::COIN")
+    assert not _is_sui_coin("0x12::sui::SUI")
+
+
+def test_try_add():
+    """Operations exceeding a constraint are rolled back."""
+    planner = _Planner(
+        client=_Client(_constraints(max_pure_argument_size=64, max_input_objects=4))
+    )
+    tally = planner._new_tally()
+    # The gas coin counts as an input object
+    assert tally.object_inputs == 1
+    assert planner._try_add(tally, _objects(0, 3)) is None
+    assert planner._try_add(tally, _objects(3, 1)) == "max_input_objects"
+    assert len(tally.txn.builder.inputs) == 3
+    assert len(tally.txn.builder.commands) == 1
+    # Pure arguments at the limit fail as in verify_transaction
+    assert planner._try_add(tally, _pure(64)) == "max_pure_argument_size"
+    assert planner._try_add(tally, _pure(63)) is None
+    assert planner._try_add(tally, _pure(10), keep=False) is None
+    assert len(tally.txn.builder.inputs) == 4
+    assert tally.operations == 2
+
+
+def test_fit_largest():
+    """The largest count that fits is added, operation errors mean fewer."""
+    planner = _Planner(client=_Client(_constraints(max_input_objects=6)))
+    tally = planner._new_tally()
+    assert planner._fit_largest(tally, 10, lambda n: _objects(0, n)) == 5
+
+    def _make(count: int):
+        if count > 2:
+            raise ValueError("Balance does not cover")
+        return _objects(0, count)
+
+    tally = planner._new_tally()
+    assert planner._fit_largest(tally, 4, _make) == 2
+    assert len(tally.txn.builder.inputs) == 2
+
+
+def test_plan_compaction():
+    """Merge groups leave gas coins and count the gas coin as an input."""
+    coins = [_coin(x, 100 + x) for x in range(1, 11)]
+    client = _Client(_constraints(max_input_objects=4), coins)
+    planner = _Planner(client=client)
+    txns = planner.plan_compaction(coin_type=SUI_LONG)
+    assert client.coin_types == [SUI_LONG]
+    # At most three coins beside the gas coin, a gas coin left per transaction
+    assert [len(x.builder.inputs) for x in txns] == [3, 3, 1]
+    merged = [
+        arg.value.value.ObjectID.to_address_str()
+        for txn in txns
+        for arg in txn.builder.inputs.values()
+    ]
+    assert merged == [x.coin_object_id for x in coins[:7]]
+
+    # Other coin types merge into their first coin
+    client = _Client(_constraints(max_input_objects=4), coins[:5])
+    txns = _Planner(client=client).plan_compaction(coin_type="0x12::coin::COIN")
+    assert [len(x.builder.inputs) for x in txns] == [3, 2]
+    # No input object left beside the gas coin
+    with pytest.raises(ValueError):
+        _Planner(client=_Client(_constraints(max_input_objects=1), coins)).plan(
+            [_objects(0, 1)]
+        )
+
+
+def test_payouts_coin_selection():
+    """Payout batches shrink when the coins can not cover them."""
+    # One coin per transaction beside the gas coin
+    coins = [_coin(1, 40), _coin(2, 35)]
+    client = _Client(_constraints(max_input_objects=2), coins)
+    chunks = _Planner(client=client).plan_payouts(
+        [(SENDER, 20), (SENDER, 20), (SENDER, 35)], coin_type="0x12::coin::COIN"
+    )
+    assert [len(x.recipients) for x in chunks] == [2, 1]
+    assert [x.coins[0].balance for x in chunks] == ["40", "35"]
+
+
+def _recipients(*amounts: int) -> list[tuple[str, int]]:
+    """Distinct recipients paid the amounts."""
+    return [(f"0x{index + 1:064x}", x) for index, x in enumerate(amounts)]
+
+
+def test_payouts_chunk_recovers():
+    """A short chunk does not lower the size of the chunks after it."""
+    coins = [_coin(1, 40), _coin(2, 60)]
+    client = _Client(_constraints(max_input_objects=2), coins)
+    chunks = _Planner(client=client).plan_payouts(
+        _recipients(30, 30, 10, 10, 10, 10), coin_type=COIN_TYPE
+    )
+    # No coin covers all, the next holds the four left
+    assert [len(x.recipients) for x in chunks] == [2, 4]
+    assert [(x.amount, x.coins[0].balance) for x in chunks] == [
+        (60, "60"),
+        (40, "40"),
+    ]
+
+
+def test_payouts_max_amount():
+    """SUI chunks are split from the gas coin and bounded by max_amount."""
+    planner = _Planner(client=_Client(_constraints()))
+    chunks = planner.plan_payouts(_recipients(10, 10, 10, 10, 10), max_amount=25)
+    assert [x.amount for x in chunks] == [20, 20, 10]
+    assert all(not x.coins for x in chunks)
+    assert [len(x.transaction.builder.commands) for x in chunks] == [3, 3, 2]
+    assert len(planner.plan_payouts(_recipients(10, 10, 10, 10, 10))) == 1
+    with pytest.raises(ValueError):
+        planner.plan_payouts(_recipients(10, 30), max_amount=25)
+
+
+def test_payouts_constraint_boundary():
+    """Chunks fill to each constraint exactly."""
+    recipients = _recipients(*range(1, 10))
+    # SplitCoins plus a transfer per recipient
+    planner = _Planner(client=_Client(_constraints(max_programmable_tx_commands=6)))
+    assert [len(x.recipients) for x in planner.plan_payouts(recipients)] == [4, 4, 1]
+    # One amount argument per recipient
+    planner = _Planner(client=_Client(_constraints(max_arguments=3)))
+    assert [len(x.recipients) for x in planner.plan_payouts(recipients)] == [3, 3, 3]
+
+    planner = _Planner(client=_Client(_constraints()))
+    tally = planner._new_tally()
+    planner._try_add(tally, planner._payout_operation(recipients[:3], []))
+    size = tally.size(len(tally.txn.builder.inputs), len(tally.txn.builder.commands))
+    for max_size, expected in ((size, [3, 3, 3]), (size - 1, [2, 2, 2, 2, 1])):
+        planner = _Planner(client=_Client(_constraints(max_tx_size_bytes=max_size)))
+        chunks = planner.plan_payouts(recipients)
+        assert [len(x.recipients) for x in chunks] == expected
+
+
+def test_bulk_pay(monkeypatch):
+    """Chunks are submitted with their reserve and results reported per recipient."""
+    submitted: list[tuple[object, int]] = []
+    statuses: list[str] = ["SUCCESS", "FAILURE", None]
+
+    async def _result(status):
+        if status is None:
+            return SuiRpcResult(False, "TransportQueryError", "failed")
+        return SuiRpcResult(
+            True,
+            None,
+            pgql_type.ExecutionResultGQL(status, 9, "Tx", errors=["abort"]),
+        )
+
+    def _submit(self, txn, *, reserve=0):
+        submitted.append((txn, reserve))
+        return _result(statuses.pop(0))
+
+    monkeypatch.setattr(PipelinedExecutor, "submit", _submit)
+    planner = _Planner(client=_Client(_constraints(max_arguments=2)))
+    recipients = _recipients(1, 2, 3, 4, 5)
+    results = asyncio.run(
+        PipelinedExecutor(client=None).bulk_pay(recipients, planner=planner)
+    )
+    assert [x[1] for x in submitted] == [3, 7, 5]
+    assert [(x.recipient, x.amount) for x in results] == recipients
+    assert [x.success for x in results] == [True, True, False, False, False]
+    assert results[2].error == "['abort']" and results[2].digest == "Tx"
+    assert results[4].error.startswith("TransportQueryError")
+
+    # Coin payouts fund from their coins, the gas coin reserves nothing
+    submitted.clear()
+    statuses[:] = ["SUCCESS"]
+    planner = _Planner(client=_Client(_constraints(), [_coin(1, 100)]))
+    results = asyncio.run(
+        PipelinedExecutor(client=None).bulk_pay(
+            recipients, planner=planner, coin_type=COIN_TYPE, max_amount=50
+        )
+    )
+    assert [x[1] for x in submitted] == [0] and all(x.success for x in results)